@@ -1,8 +1,13 @@
 """Portolan CLI - Publish and manage cloud-native geospatial data catalogs."""
 
-from portolan_cli.catalog import Catalog, CatalogExistsError
-from portolan_cli.cli import cli
-from portolan_cli.formats import FormatType, detect_format
+# First, so PORTOLAN_PROFILE_IMPORTS can time everything imported below.
+from portolan_cli.import_profile import install_from_env as _install_import_profiler
+
+_install_import_profiler()
+
+from portolan_cli.catalog import Catalog, CatalogExistsError  # noqa: E402
+from portolan_cli.cli import cli  # noqa: E402
+from portolan_cli.formats import FormatType, detect_format  # noqa: E402
 
 __all__ = [
     "Catalog",
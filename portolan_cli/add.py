@@ -14,14 +14,19 @@ All logic lives here; the CLI is a thin wrapper.
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
+import queue
 import shutil
-from collections.abc import Callable
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import click
 import pystac
@@ -83,6 +88,7 @@ from portolan_cli.finalization import (
 from portolan_cli.finalization import (
     finalize_items as finalize_items,  # noqa: PLC0414
 )
+from portolan_cli.finalization import finish_finalization
 from portolan_cli.formats import (
     FormatType,
     is_multilayer,
@@ -165,6 +171,7 @@ from portolan_cli.stac import (
 )
 from portolan_cli.stac_parquet import PARQUET_FILENAME
 from portolan_cli.sync.checksums import compute_checksum, file_fields
+from portolan_cli.tracing import traced
 from portolan_cli.viz.style import enrich_cog_assets
 
 if TYPE_CHECKING:
@@ -172,6 +179,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Where phase 2 runs prepare_item() when workers > 1: worker threads (GDAL reads
+# release the GIL) or worker processes (pystac item building, statistics and
+# bbox loops do not).
+PrepareExecutor = Literal["thread", "process"]
+
 # Error message patterns from geoparquet-io for non-geospatial CSV/TSV files.
 # These specific patterns indicate the file lacks geometry columns (not other errors
 # like permission denied, encoding issues, or memory errors).
@@ -925,8 +937,9 @@ class _PrepareOptions:
 
     Bundling these keeps the prep functions module-level (not a closure over
     ``add_files``) so nesting stays shallow and each helper is independently
-    unit-testable. The instance is read-only, so it is safe to share across
-    worker threads in the parallel path.
+    unit-testable. The instance is read-only and picklable, so it is safe to
+    share across worker threads or send to worker processes in the parallel
+    path.
     """
 
     catalog_root: Path
@@ -942,12 +955,14 @@ class _PrepareOptions:
 class _ProcessResult:
     """Accumulated output of phase 2 (per-item preparation).
 
-    ``prepared_items`` feed ``finalize_items``; ``deferred_non_geo`` plus the
-    ``source_to_*`` maps drive phase 3 (deferred non-geo companion assets);
-    ``failures`` are surfaced to the caller (Issue #175).
+    ``added`` holds what the pipeline's finalizer wrote; ``deferred_non_geo``
+    plus the ``source_to_*`` maps drive phase 3 (deferred non-geo companion
+    assets); ``failures`` are surfaced to the caller (Issue #175). Prepared
+    items themselves are not kept: each collection's are handed to the
+    finalizer as soon as it is complete.
     """
 
-    prepared_items: list[PreparedItem] = field(default_factory=list)
+    added: list[ItemInfo] = field(default_factory=list)
     failures: list[AddFailure] = field(default_factory=list)
     deferred_non_geo: list[tuple[Path, Path, str]] = field(default_factory=list)
     source_to_item_dir: dict[Path, tuple[Path, str, str]] = field(default_factory=dict)
@@ -1077,7 +1092,7 @@ def _record_prepared(
     coll_id: str,
     catalog_root: Path,
 ) -> None:
-    """Fold one file's prepared items into the running phase-2 accumulator.
+    """Record where one file's prepared items live, for phase 3.
 
     Maps the file's source dir to its item dir (item-level) or collection dir
     (collection-level, Issue #383) so phase 3 can place any deferred non-geo
@@ -1086,7 +1101,6 @@ def _record_prepared(
     source_dir = file_path.parent
     collection_dir = catalog_root / Path(*coll_id.split("/"))
     for prepared in prepared_list:
-        result.prepared_items.append(prepared)
         if prepared.is_collection_level_asset:
             # Collection-level: map source to collection dir (Issue #383)
             result.source_to_collection_dir[source_dir] = (collection_dir, coll_id)
@@ -1096,6 +1110,16 @@ def _record_prepared(
             result.source_to_item_dir[source_dir] = (item_dir, coll_id, prepared.item_id)
 
 
+_PrepareOutcome = tuple[list[PreparedItem], list[AddFailure], tuple[Path, Path, str] | None]
+
+# Files submitted to the prepare pool per worker ahead of the one being
+# consumed: enough to keep every worker busy, without queueing 10k futures.
+_PREPARE_WINDOW_PER_WORKER = 4
+# Complete collections waiting for the finalizer thread before the prepare
+# stage blocks on handing over the next one.
+_FINALIZE_QUEUE_SIZE = 4
+
+
 def _phase_process(
     files_to_process: list[tuple[Path, str]],
     opts: _PrepareOptions,
@@ -1103,55 +1127,269 @@ def _phase_process(
     workers: int,
     json_mode: bool,
     on_progress: Callable[[Path], None] | None,
+    executor: PrepareExecutor = "thread",
+    merge_strategy: MergeStrategy = MergeStrategy.SMART,
 ) -> _ProcessResult:
-    """Phase 2: prepare every collected file, sequentially or across workers.
+    """Phase 2: prepare every collected file and finalize collections as they complete.
 
     Each file is prepared independently (writes only its own item.json), so the
-    work parallelizes cleanly (Issue #281); results are folded into a single
-    ``_ProcessResult`` on the main thread. GDAL preparation dominates, so worker
-    threads overlap those reads.
+    work parallelizes cleanly (Issue #281). With ``executor="thread"`` worker
+    threads overlap GDAL reads; ``executor="process"`` also spreads the
+    GIL-bound Python (pystac, statistics, bbox loops) across cores.
+
+    Preparation and finalization are pipelined: once no file of a collection
+    (or of a collection nested in or around it) is outstanding, its prepared
+    items go to a finalizer thread through a bounded queue and are written with
+    ``finalize_items`` (still one write per collection) while later
+    collections are being prepared. The catalog-wide sweeps run once, after
+    the last collection.
     """
     result = _ProcessResult()
 
-    if workers == 1:
-        # Sequential execution (original behavior)
-        for file_path, coll_id in files_to_process:
-            if on_progress is not None:
-                on_progress(file_path)
-            prepared_list, failure_list, deferred = _prepare_single_file(file_path, coll_id, opts)
+    if workers > 1 and not json_mode:
+        from portolan_cli.output import info
+
+        info(f"Using {workers} parallel workers for {len(files_to_process)} files")
+
+    outstanding = Counter(coll_id for _, coll_id in files_to_process)
+    pending: dict[str, list[PreparedItem]] = {}
+    finalized: list[str] = []
+
+    with _CollectionFinalizer(opts.catalog_root, merge_strategy) as finalizer:
+        for file_path, coll_id, outcome in _iter_prepared(
+            files_to_process, opts, workers=workers, executor=executor, on_progress=on_progress
+        ):
+            prepared_list, failure_list, deferred = outcome
             _record_prepared(result, prepared_list, file_path, coll_id, opts.catalog_root)
             result.failures.extend(failure_list)
             if deferred is not None:
                 result.deferred_non_geo.append(deferred)
-        return result
+            for prepared in prepared_list:
+                pending.setdefault(prepared.collection_id, []).append(prepared)
+
+            outstanding[coll_id] -= 1
+            if outstanding[coll_id] == 0:
+                del outstanding[coll_id]
+                for ready_id in [c for c in pending if not _overlaps_any(c, outstanding)]:
+                    finalizer.submit(ready_id, pending.pop(ready_id))
+                    finalized.append(ready_id)
+
+        # Collections whose files all failed to prepare leave nothing pending;
+        # anything still here is ready now that every file is done.
+        for ready_id, items in pending.items():
+            finalizer.submit(ready_id, items)
+            finalized.append(ready_id)
+
+    result.added = finalizer.close()
+    if finalized:
+        finish_finalization(opts.catalog_root, finalized)
+    return result
+
 
-    # Parallel execution with ThreadPoolExecutor
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+def _overlaps_any(collection_id: str, others: Iterable[str]) -> bool:
+    """True if ``collection_id`` equals, contains or is nested in any of ``others``."""
+    return any(
+        other == collection_id
+        or other.startswith(f"{collection_id}/")
+        or collection_id.startswith(f"{other}/")
+        for other in others
+    )
 
-    from portolan_cli.output import info
 
-    if not json_mode:
-        info(f"Using {workers} parallel workers for {len(files_to_process)} files")
+class _CollectionFinalizer:
+    """Runs ``finalize_items`` for one collection at a time on a background thread.
 
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        future_to_file = {
-            executor.submit(_prepare_single_file, fp, cid, opts): (fp, cid)
-            for fp, cid in files_to_process
-        }
-        # Process results as they complete (main thread)
-        for future in as_completed(future_to_file):
-            file_path, coll_id = future_to_file[future]
-            prepared_list, failure_list, deferred = future.result()
+    ``submit`` blocks once ``_FINALIZE_QUEUE_SIZE`` collections are waiting,
+    which throttles preparation to the pace of finalization. Collections are
+    finalized one after another (never concurrently), as ``finalize_items``
+    rewrites shared parent catalogs. The first error stops finalization and is
+    re-raised by :meth:`close`.
+    """
+
+    def __init__(self, catalog_root: Path, merge_strategy: MergeStrategy) -> None:
+        self._catalog_root = catalog_root
+        self._merge_strategy = merge_strategy
+        self._queue: queue.Queue[tuple[str, list[PreparedItem]] | None] = queue.Queue(
+            maxsize=_FINALIZE_QUEUE_SIZE
+        )
+        self._added: list[ItemInfo] = []
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="add-finalize", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> _CollectionFinalizer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop()
+
+    def submit(self, collection_id: str, items: list[PreparedItem]) -> None:
+        self._queue.put((collection_id, items))
+
+    def close(self) -> list[ItemInfo]:
+        """Wait for every submitted collection and return what was added."""
+        self._stop()
+        if self._error is not None:
+            raise self._error
+        return self._added
+
+    def _stop(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        while (batch := self._queue.get()) is not None:
+            if self._error is not None:
+                continue
+            collection_id, items = batch
+            try:
+                self._added.extend(
+                    finalize_items(self._catalog_root, items, self._merge_strategy, finish=False)
+                )
+            except BaseException as err:
+                logger.debug("Finalizing %s failed: %s", collection_id, err)
+                self._error = err
+
+
+def _iter_prepared(
+    files_to_process: list[tuple[Path, str]],
+    opts: _PrepareOptions,
+    *,
+    workers: int,
+    executor: PrepareExecutor,
+    on_progress: Callable[[Path], None] | None,
+) -> Iterator[tuple[Path, str, _PrepareOutcome]]:
+    """Yield ``(file, collection_id, outcome)`` for each file as it is prepared.
+
+    Sequential when ``workers == 1``, else on a thread or process pool with at
+    most ``workers * _PREPARE_WINDOW_PER_WORKER`` files in flight.
+    ``on_progress`` always runs in this thread.
+    """
+    if workers == 1:
+        # Sequential execution (original behavior)
+        yield from _iter_prepared_serial(files_to_process, opts, on_progress=on_progress)
+        return
+
+    if executor == "process":
+        yield from _iter_prepared_in_processes(
+            files_to_process, opts, workers=workers, on_progress=on_progress
+        )
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for file_path, coll_id, future in _completed_prepares(
+            pool, files_to_process, opts, window=workers * _PREPARE_WINDOW_PER_WORKER
+        ):
+            outcome = future.result()
             # Call progress callback from the main thread (thread-safe) so the
             # CLI's AddProgressReporter works in parallel mode.
             if on_progress is not None:
                 on_progress(file_path)
-            _record_prepared(result, prepared_list, file_path, coll_id, opts.catalog_root)
-            result.failures.extend(failure_list)
-            if deferred is not None:
-                result.deferred_non_geo.append(deferred)
+            yield file_path, coll_id, outcome
 
-    return result
+
+def _completed_prepares(
+    pool: Executor,
+    files_to_process: list[tuple[Path, str]],
+    opts: _PrepareOptions,
+    *,
+    window: int,
+) -> Iterator[tuple[Path, str, Future[_PrepareOutcome]]]:
+    """Submit ``_prepare_single_file`` calls, at most ``window`` at a time.
+
+    Files are submitted in order and yielded as they complete; each completion
+    submits the next file.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    remaining = iter(files_to_process)
+    in_flight: dict[Future[_PrepareOutcome], tuple[Path, str]] = {}
+    for file_path, coll_id in itertools.islice(remaining, window):
+        in_flight[pool.submit(_prepare_single_file, file_path, coll_id, opts)] = (
+            file_path,
+            coll_id,
+        )
+    while in_flight:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            file_path, coll_id = in_flight.pop(future)
+            following = next(remaining, None)
+            if following is not None:
+                in_flight[pool.submit(_prepare_single_file, *following, opts)] = following
+            yield file_path, coll_id, future
+
+
+def _iter_prepared_serial(
+    files_to_process: list[tuple[Path, str]],
+    opts: _PrepareOptions,
+    *,
+    on_progress: Callable[[Path], None] | None,
+) -> Iterator[tuple[Path, str, _PrepareOutcome]]:
+    """Prepare files one at a time in the current process.
+
+    The ``workers == 1`` path, and the fallback used by
+    :func:`_iter_prepared_in_processes` when a process pool cannot start.
+    """
+    for file_path, coll_id in files_to_process:
+        if on_progress is not None:
+            on_progress(file_path)
+        yield file_path, coll_id, _prepare_single_file(file_path, coll_id, opts)
+
+
+def _iter_prepared_in_processes(
+    files_to_process: list[tuple[Path, str]],
+    opts: _PrepareOptions,
+    *,
+    workers: int,
+    on_progress: Callable[[Path], None] | None,
+) -> Iterator[tuple[Path, str, _PrepareOutcome]]:
+    """Prepare files concurrently with a ProcessPoolExecutor.
+
+    Mirrors ``convert._convert_files_parallel``: each worker runs
+    ``_prepare_single_file`` (which writes only that file's item.json) and
+    pickles its ``PreparedItem``s back, so finalization stays in this process.
+    A result that cannot come back (e.g. it failed to pickle) is recorded as
+    that file's failure.
+
+    If the pool itself cannot run (``BrokenProcessPool``), the files that have
+    not completed are prepared serially in this process instead.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    # Spawn, not fork: GDAL/rasterio run worker threads, and fork()-ing a
+    # multi-threaded process can deadlock the child (see convert.py).
+    mp_context = multiprocessing.get_context("spawn")
+    completed: set[tuple[Path, str]] = set()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+            for file_path, coll_id, future in _completed_prepares(
+                pool, files_to_process, opts, window=workers * _PREPARE_WINDOW_PER_WORKER
+            ):
+                try:
+                    outcome = future.result()
+                except BrokenProcessPool:
+                    # The pool itself died; fall back to serial below.
+                    raise
+                except Exception as err:
+                    logger.exception("Prepare worker failed for %s", file_path)
+                    outcome = ([], [AddFailure(path=file_path, error=str(err))], None)
+                completed.add((file_path, coll_id))
+                if on_progress is not None:
+                    on_progress(file_path)
+                yield file_path, coll_id, outcome
+    except BrokenProcessPool:
+        remaining = [entry for entry in files_to_process if entry not in completed]
+        logger.warning(
+            "Process pool unavailable; preparing %d remaining file(s) serially",
+            len(remaining),
+        )
+        yield from _iter_prepared_serial(remaining, opts, on_progress=on_progress)
 
 
 def _declare_file_extension_for_collections(affected_collections: set[Path]) -> None:
@@ -1236,6 +1474,7 @@ def _require_licenses(catalog_root: Path, collection_ids: set[str]) -> None:
             raise MissingLicenseError(f"collection '{coll_id}'", gap)
 
 
+@traced("add_files", measure=lambda r: (len(r[0]), 0))
 def add_files(
     *,
     paths: list[Path],
@@ -1251,6 +1490,7 @@ def add_files(
     reconvert: bool = False,
     skip_partitioning: bool = False,
     merge_strategy: MergeStrategy = MergeStrategy.SMART,
+    executor: PrepareExecutor = "thread",
 ) -> tuple[list[ItemInfo], list[Path], list[AddFailure]]:
     """Add files to a Portolan catalog.
 
@@ -1292,6 +1532,9 @@ def add_files(
         json_mode: If True, suppress progress bar output.
         force: If True, bypass change detection and re-process all files.
         reconvert: If True, re-convert from source files (requires force=True).
+        executor: With workers > 1, prepare files on worker threads
+            ("thread", default) or worker processes ("process"). Processes
+            also parallelize the pure-Python part of item preparation.
 
     Returns:
         Tuple of (added_items, skipped_paths, failures).
@@ -1328,22 +1571,19 @@ def add_files(
         batch_exclude_names=_batch_sibling_names([fp for fp, _ in files_to_process]),
     )
 
-    # Phase 2: Prepare each file (GDAL work), accumulating prepared items (Issue #281).
+    # Phase 2: Prepare each file (GDAL work) and batch-finalize each collection as
+    # soon as it is complete — ONE write per collection instead of O(n) (Issue #281).
     proc = _phase_process(
         files_to_process,
         opts,
         workers=workers,
         json_mode=json_mode,
         on_progress=on_progress,
+        executor=executor,
+        merge_strategy=merge_strategy,
     )
     failures = proc.failures
-
-    # Phase 2.5: Batch finalize — ONE write per collection instead of O(n) (Issue #281).
-    added: list[ItemInfo] = (
-        finalize_items(catalog_root, proc.prepared_items, merge_strategy)
-        if proc.prepared_items
-        else []
-    )
+    added = proc.added
 
     # Phase 3: Track deferred non-geo files as companion assets.
     affected_collections = _process_deferred_non_geo_files(
@@ -4,6 +4,7 @@ This module provides async primitives for high-throughput parallel operations:
 - AsyncIOExecutor: Semaphore-bounded concurrent task execution
 - AsyncProgressReporter: Thread-safe progress tracking for async operations
 - Circuit breaker pattern for resilience against cascading failures
+- ByteBudget: Global cap on bytes buffered in memory by concurrent transfers
 
 Used by push_async() and pull_async() for efficient cloud storage operations.
 
@@ -20,7 +21,8 @@ import asyncio
 import sys
 import threading
 import time
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Generic, TypeVar
 
@@ -279,6 +281,78 @@ class CircuitBreaker:
                 )
 
 
+# =============================================================================
+# Byte Budget
+# =============================================================================
+
+
+class ByteBudget:
+    """Async semaphore counted in bytes, bounding memory across transfers.
+
+    Every chunk a download holds in memory reserves its size first and gives it
+    back once the chunk is on disk, so peak buffered bytes stay at or below
+    ``capacity`` however many transfers run and however large the objects are.
+
+    A reservation larger than ``capacity`` is clamped to it: the oversized chunk
+    waits for an otherwise idle budget instead of deadlocking.
+
+    Example:
+        >>> budget = ByteBudget(64 * 1024 * 1024)
+        >>> async with budget.reserve(8 * 1024 * 1024):
+        ...     chunk = await fetch_next_chunk()
+        ...     write(chunk)
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the budget.
+
+        Args:
+            capacity: Maximum bytes that may be reserved at once.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"ByteBudget capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.peak_in_flight = 0
+        self._available = capacity
+        self._condition = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """Bytes currently reserved."""
+        return self.capacity - self._available
+
+    async def acquire(self, nbytes: int) -> int:
+        """Wait until ``nbytes`` (clamped to capacity) can be reserved.
+
+        Returns:
+            The number of bytes actually reserved; pass it to :meth:`release`.
+        """
+        granted = max(0, min(nbytes, self.capacity))
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._available >= granted)
+            self._available -= granted
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return granted
+
+    async def release(self, nbytes: int) -> None:
+        """Return bytes obtained from :meth:`acquire` and wake waiters."""
+        async with self._condition:
+            self._available = min(self.capacity, self._available + nbytes)
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def reserve(self, nbytes: int) -> AsyncIterator[int]:
+        """Hold ``nbytes`` of the budget for the duration of the block."""
+        granted = await self.acquire(nbytes)
+        try:
+            yield granted
+        finally:
+            await self.release(granted)
+
+
 # =============================================================================
 # Execution Result
 # =============================================================================
@@ -6,12 +6,12 @@ Version/Asset/SchemaInfo dataclasses.
 
 from __future__ import annotations
 
-import hashlib
 import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from portolan_cli.sync.checksums import compute_checksums
 from portolan_cli.versions import Asset, SchemaInfo, Version, parse_version
 
 if TYPE_CHECKING:
@@ -151,12 +151,15 @@ def build_assets(
     Returns:
         Tuple of (asset_dict, changes_list).
     """
+    digests = compute_checksums(
+        [Path(p) for p in assets_input.values() if Path(p).exists()]
+    ).digests
     asset_objects: dict[str, Asset] = {}
     changes: list[str] = []
     for name, path_str in assets_input.items():
         asset_path = Path(path_str)
         if asset_path.exists():
-            sha256 = _compute_sha256(asset_path)
+            sha256 = digests[asset_path]
             size_bytes = asset_path.stat().st_size
         else:
             sha256 = ""
@@ -168,12 +171,3 @@ def build_assets(
         )
         changes.append(name)
     return asset_objects, changes
-
-
-def _compute_sha256(path: Path) -> str:
-    """Compute SHA-256 hex digest of a file."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
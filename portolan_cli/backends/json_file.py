@@ -164,7 +164,7 @@ class JsonFileBackend:
         Returns:
             The newly created Version object.
         """
-        from portolan_cli.sync.checksums import compute_checksum
+        from portolan_cli.sync.checksums import compute_checksums
         from portolan_cli.versions import SPEC_VERSION
 
         versions_path = self._versions_path(collection)
@@ -182,12 +182,15 @@ class JsonFileBackend:
         # Use explicit version if provided, otherwise auto-compute
         next_version = version if version else self._compute_next_version(versions_file, breaking)
 
-        # Build asset objects with checksums
+        # Build asset objects with checksums, hashing every local file as one
+        # parallel batch rather than one file at a time.
+        local_paths = [Path(p) for p in assets.values() if Path(p).exists()]
+        digests = compute_checksums(local_paths).digests
         asset_objects: dict[str, Asset] = {}
         for name, path_str in assets.items():
             asset_path = Path(path_str)
             if asset_path.exists():
-                checksum = compute_checksum(asset_path)
+                checksum = digests[asset_path]
                 stat = asset_path.stat()
                 size_bytes = stat.st_size if asset_path.is_file() else 0
                 mtime = stat.st_mtime
@@ -14,7 +14,7 @@ import sys
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Literal, overload
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 from portolan_cli.agents_md import visible_stac_files
 from portolan_cli.errors import CatalogAlreadyExistsError
@@ -28,6 +28,11 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self
 
+if TYPE_CHECKING:
+    # Resolved lazily by the module __getattr__ below; declared here so type
+    # checkers see the real signature.
+    from portolan_cli.add import add_files as add_files
+
 
 # Cross-platform file locking (fcntl on Unix, msvcrt on Windows)
 if sys.platform == "win32":
@@ -1079,5 +1084,14 @@ class CatalogVersionsCorruptedError(Exception):
     pass
 
 
-# Re-export add_files for STAC-aligned imports (ADR terminology)
-from portolan_cli.add import add_files as add_files  # noqa: E402, F401, PLC0414
+def __getattr__(name: str) -> Any:
+    """Re-export add_files for STAC-aligned imports (ADR terminology).
+
+    Resolved on first access: portolan_cli.add pulls in pyarrow and rasterio,
+    which commands that only need catalog discovery should not pay for.
+    """
+    if name == "add_files":
+        from portolan_cli.add import add_files
+
+        return add_files
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,874 @@
+"""Local SQLite index of a catalog's collections, items and tracked assets.
+
+``list``, ``info`` and ``status`` used to rediscover the catalog on every call:
+parse each ``collection.json``, every item JSON it links and the full history
+in ``versions.json``. The index, ``.portolan/catalog-index.sqlite``, keeps what
+they read from those files:
+
+- per collection: title, description, item count, current version, asset
+  count and total tracked size;
+- per item: id, item JSON path, bbox (also in an R*Tree), datetime range
+  (also as epoch seconds), title, description, properties and asset hrefs;
+- per tracked asset of the current version: href, size and SHA-256.
+
+The JSON files stay the source of truth. A collection's rows are trusted only
+while the ``(size, mtime_ns, inode)`` stat of its ``collection.json``, its
+``versions.json`` and every organizing ``catalog.json`` below it that the item
+walk read is unchanged; Portolan writes them through an atomic rename, so
+every rewrite changes the inode. Reads that return items also check the
+stat of those item JSONs. On a mismatch the stale half is re-read in a single
+transaction, and only item JSONs whose own stat moved are parsed again.
+``add``, ``rm``, ``check --fix`` and ``pull`` refresh the collections they
+touched before returning, so the next read finds the rows current.
+
+As with the checksum cache, a file modified within ``MTIME_TOLERANCE_SECONDS``
+of now is never trusted by stat. The index is a cache: when it is unavailable
+(``PORTOLAN_CATALOG_INDEX=0``, no ``.portolan/`` directory, a locked or corrupt
+database) readers fall back to the files, and deleting it is always safe.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from portolan_cli.constants import MTIME_TOLERANCE_SECONDS, PORTOLAN_DIR
+from portolan_cli.json_io import read_json_file, read_json_files
+from portolan_cli.stac_parquet import _resolve_href
+from portolan_cli.versions import read_versions_head
+
+__all__ = [
+    "CATALOG_INDEX_ENV_VAR",
+    "CATALOG_INDEX_FILENAME",
+    "CatalogIndex",
+    "IndexedAsset",
+    "IndexedCollection",
+    "IndexedItem",
+    "bbox_corners",
+    "item_matches",
+    "item_time_range",
+    "open_catalog_index",
+    "parse_timestamp",
+    "properties_match",
+    "refresh_catalog_index",
+]
+
+logger = logging.getLogger(__name__)
+
+# Index database, inside the catalog's .portolan/ directory.
+CATALOG_INDEX_FILENAME = "catalog-index.sqlite"
+
+# Set to "0"/"false" to bypass the index and always read the JSON files.
+CATALOG_INDEX_ENV_VAR = "PORTOLAN_CATALOG_INDEX"
+
+# Stored as PRAGMA user_version; a database with another value is rebuilt.
+_CATALOG_INDEX_VERSION = 3
+
+# Stat token of a file that does not exist.
+_ABSENT = "absent"
+
+_SCHEMA = """
+CREATE TABLE collections (
+    collection_id TEXT PRIMARY KEY,
+    collection_stat TEXT,
+    versions_stat TEXT,
+    catalog_stats TEXT NOT NULL DEFAULT '{}',
+    has_collection_json INTEGER NOT NULL DEFAULT 0,
+    title TEXT,
+    description TEXT,
+    item_count INTEGER NOT NULL DEFAULT 0,
+    items_complete INTEGER NOT NULL DEFAULT 1,
+    versions_readable INTEGER NOT NULL DEFAULT 0,
+    current_version TEXT,
+    asset_count INTEGER NOT NULL DEFAULT 0,
+    total_size_bytes INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE items (
+    collection_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    direct INTEGER NOT NULL,
+    stat TEXT,
+    readable INTEGER NOT NULL,
+    item_id TEXT,
+    title TEXT,
+    description TEXT,
+    bbox TEXT,
+    minx REAL,
+    miny REAL,
+    maxx REAL,
+    maxy REAL,
+    start_datetime TEXT,
+    end_datetime TEXT,
+    asset_hrefs TEXT NOT NULL DEFAULT '[]',
+    start_ts REAL,
+    end_ts REAL,
+    properties TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (collection_id, position)
+);
+CREATE INDEX items_by_path ON items (collection_id, path);
+CREATE VIRTUAL TABLE item_bboxes USING rtree (id, minx, maxx, miny, maxy);
+CREATE TABLE assets (
+    collection_id TEXT NOT NULL,
+    asset_key TEXT NOT NULL,
+    href TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (collection_id, asset_key)
+);
+"""
+
+_ITEM_COLUMNS = (
+    "path, direct, stat, readable, item_id, title, description, bbox, "
+    "minx, miny, maxx, maxy, start_datetime, end_datetime, asset_hrefs, "
+    "start_ts, end_ts, properties"
+)
+
+_ITEM_PLACEHOLDERS = ", ".join("?" for _ in _ITEM_COLUMNS.split(","))
+
+# Everything but (collection_id, position), in _ITEM_COLUMNS order.
+_ItemRow = tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class IndexedCollection:
+    """Collection-level facts, as of the last refresh.
+
+    Attributes:
+        collection_id: Collection path relative to the catalog root.
+        has_collection_json: False for a directory that only has versions.json.
+        title: ``title`` from collection.json.
+        description: ``description`` from collection.json.
+        item_count: Items the collection owns, through organizing catalogs
+            (the same count as ``stac_parquet.count_items``).
+        versions_readable: Whether versions.json exists and parses.
+        current_version: ``current_version`` from versions.json.
+        asset_count: Assets in the current version.
+        total_size_bytes: Total size of the current version's assets.
+    """
+
+    collection_id: str
+    has_collection_json: bool
+    title: str | None
+    description: str | None
+    item_count: int
+    versions_readable: bool
+    current_version: str | None
+    asset_count: int
+    total_size_bytes: int
+
+
+@dataclass(frozen=True)
+class IndexedItem:
+    """An item the collection links, as read from its item JSON.
+
+    Attributes:
+        item_id: The item's ``id`` (the link's directory name when absent).
+        path: Item JSON path relative to the collection directory (POSIX).
+        bbox: The item's ``bbox`` as written, or None when it has none.
+        start_datetime: ``datetime`` or ``start_datetime`` property.
+        end_datetime: ``datetime`` or ``end_datetime`` property.
+        title: ``title`` property.
+        description: ``description`` property.
+        asset_hrefs: Asset hrefs in the item's asset order.
+    """
+
+    item_id: str
+    path: str
+    bbox: list[float] | None
+    start_datetime: str | None
+    end_datetime: str | None
+    title: str | None
+    description: str | None
+    asset_hrefs: list[str]
+
+
+@dataclass(frozen=True)
+class IndexedAsset:
+    """A tracked asset of the collection's current version."""
+
+    href: str
+    size_bytes: int
+    sha256: str
+
+
+def _catalog_index_enabled() -> bool:
+    value = os.environ.get(CATALOG_INDEX_ENV_VAR, "").strip().lower()
+    return value not in ("0", "false", "no", "off")
+
+
+def _stat_token(path: Path) -> str | None:
+    """``size:mtime_ns:inode`` of ``path``; ``_ABSENT`` if missing, None if untrusted."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return _ABSENT
+    except OSError:
+        return None
+    if time.time() - st.st_mtime < MTIME_TOLERANCE_SECONDS:
+        return None
+    return f"{st.st_size}:{st.st_mtime_ns}:{st.st_ino}"
+
+
+def bbox_corners(bbox: Any) -> tuple[float, float, float, float] | None:
+    """``(minx, miny, maxx, maxy)`` of a STAC bbox (2D or 3D), or None if malformed.
+
+    A bbox crossing the antimeridian (``minx > maxx``) spans every longitude,
+    which keeps intersection tests conservative.
+    """
+    if not isinstance(bbox, list) or not all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in bbox
+    ):
+        return None
+    if len(bbox) == 4:
+        minx, miny, maxx, maxy = bbox
+    elif len(bbox) == 6:
+        minx, miny, _minz, maxx, maxy, _maxz = bbox
+    else:
+        return None
+    if minx > maxx:
+        minx, maxx = -180.0, 180.0
+    return (float(minx), float(miny), float(maxx), float(maxy))
+
+
+def parse_timestamp(value: Any) -> float | None:
+    """Epoch seconds of an RFC 3339 string; naive values are taken as UTC."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00").replace("z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def item_time_range(properties: dict[str, Any]) -> tuple[Any, Any]:
+    """``(start, end)`` as written: ``datetime`` twice, else the start/end pair."""
+    start = end = properties.get("datetime")
+    if start is None:
+        start = properties.get("start_datetime")
+        end = properties.get("end_datetime")
+    return start, end
+
+
+def properties_match(properties: Mapping[str, Any], wanted: Mapping[str, Any]) -> bool:
+    """True when every ``wanted`` property is present with an equal value."""
+    return all(key in properties and properties[key] == value for key, value in wanted.items())
+
+
+def item_matches(
+    item: Any,
+    *,
+    bbox: tuple[float, float, float, float] | None = None,
+    start: float | None = None,
+    end: float | None = None,
+    properties: Mapping[str, Any] | None = None,
+) -> bool:
+    """Whether a parsed item JSON passes the search filters.
+
+    ``bbox`` (minx, miny, maxx, maxy) matches items whose bbox intersects it,
+    edges included. ``start``/``end`` (epoch seconds, either may be open)
+    match items whose time range overlaps them. ``properties`` match by
+    equality. An item lacking what a filter needs does not match it.
+    """
+    if not isinstance(item, dict):
+        return False
+    item_properties = item.get("properties", {})
+    if not isinstance(item_properties, dict):
+        return False
+    if bbox is not None:
+        corners = bbox_corners(item.get("bbox"))
+        if corners is None:
+            return False
+        minx, miny, maxx, maxy = corners
+        if minx > bbox[2] or maxx < bbox[0] or miny > bbox[3] or maxy < bbox[1]:
+            return False
+    if start is not None or end is not None:
+        item_start, item_end = (parse_timestamp(v) for v in item_time_range(item_properties))
+        if start is not None and (item_end is None or item_end < start):
+            return False
+        if end is not None and (item_start is None or item_start > end):
+            return False
+    return not properties or properties_match(item_properties, properties)
+
+
+def _item_row(path: str, direct: bool, stat: str | None, href: str, item: Any) -> _ItemRow:
+    """Index row for one item JSON; unreadable when it is not a usable item."""
+    unreadable = (path, direct, None, 0, *(None,) * 10, "[]", None, None, "{}")
+    if not isinstance(item, dict):
+        return unreadable
+    properties = item.get("properties", {})
+    assets = item.get("assets", {})
+    if not isinstance(properties, dict) or not isinstance(assets, dict):
+        return unreadable
+    if not all(isinstance(asset, dict) for asset in assets.values()):
+        return unreadable
+
+    fallback_id = href.split("/")[1] if "/" in href else href
+    bbox = item.get("bbox")
+    corners = bbox_corners(bbox) or (None, None, None, None)
+    start, end = item_time_range(properties)
+
+    return (
+        path,
+        direct,
+        stat,
+        1,
+        item.get("id", fallback_id),
+        properties.get("title"),
+        properties.get("description"),
+        None if "bbox" not in item else json.dumps(bbox),
+        *corners,
+        start if isinstance(start, str) else None,
+        end if isinstance(end, str) else None,
+        json.dumps([asset.get("href", "") for asset in assets.values()]),
+        parse_timestamp(start),
+        parse_timestamp(end),
+        json.dumps(properties),
+    )
+
+
+class CatalogIndex:
+    """An open catalog index. Use :func:`open_catalog_index` to get one.
+
+    Every read first checks the collection's stat tokens and refreshes what
+    changed, so callers never see rows older than the files. Methods return
+    None when the index cannot answer (the collection does not exist, or its
+    files could not be read or indexed); callers then read the files
+    themselves, with whatever errors that raises.
+    """
+
+    def __init__(self, catalog_root: Path, connection: sqlite3.Connection) -> None:
+        self.catalog_root = catalog_root
+        self._connection = connection
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> CatalogIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # -- reads ---------------------------------------------------------------
+
+    def collection_ids(self) -> list[str]:
+        """Collections that have rows in the index, sorted."""
+        rows = self._connection.execute(
+            "SELECT collection_id FROM collections ORDER BY collection_id"
+        )
+        return [collection_id for (collection_id,) in rows]
+
+    def collection(self, collection_id: str) -> IndexedCollection | None:
+        """Collection-level facts for ``collection_id``, refreshed if stale."""
+        if not self._refresh_quietly(collection_id):
+            return None
+        row = self._connection.execute(
+            "SELECT has_collection_json, title, description, item_count, "
+            "versions_readable, current_version, asset_count, total_size_bytes "
+            "FROM collections WHERE collection_id = ?",
+            (collection_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return IndexedCollection(
+            collection_id=collection_id,
+            has_collection_json=bool(row[0]),
+            title=row[1],
+            description=row[2],
+            item_count=row[3],
+            versions_readable=bool(row[4]),
+            current_version=row[5],
+            asset_count=row[6],
+            total_size_bytes=row[7],
+        )
+
+    def items(self, collection_id: str) -> list[IndexedItem] | None:
+        """Items linked directly from collection.json whose JSON exists, in link order.
+
+        None when any owned item JSON could not be read or is not an item.
+        """
+        if not self._refresh_quietly(collection_id, item_path=""):
+            return None
+        header = self._connection.execute(
+            "SELECT has_collection_json, items_complete FROM collections WHERE collection_id = ?",
+            (collection_id,),
+        ).fetchone()
+        if header is None or not header[0] or not header[1]:
+            return None
+        rows = self._connection.execute(
+            f"SELECT {_ITEM_COLUMNS} FROM items "
+            "WHERE collection_id = ? AND direct = 1 ORDER BY position",
+            (collection_id,),
+        )
+        return [_indexed_item(row) for row in rows]
+
+    def item(self, collection_id: str, path: str) -> IndexedItem | None:
+        """The owned item whose JSON is at ``path`` (relative to the collection)."""
+        if not self._refresh_quietly(collection_id, item_path=path):
+            return None
+        row = self._connection.execute(
+            f"SELECT {_ITEM_COLUMNS} FROM items "
+            "WHERE collection_id = ? AND path = ? AND readable = 1 ORDER BY position LIMIT 1",
+            (collection_id, path),
+        ).fetchone()
+        return None if row is None else _indexed_item(row)
+
+    def search(
+        self,
+        collection_id: str,
+        *,
+        bbox: tuple[float, float, float, float] | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        properties: Mapping[str, Any] | None = None,
+    ) -> list[IndexedItem] | None:
+        """Owned items matching every given filter, in link order.
+
+        ``bbox`` is answered by the R*Tree, the time range by the epoch-second
+        columns; see :func:`item_matches` for the exact semantics. Items whose
+        JSON is not a usable item are skipped. Every owned item JSON is
+        stat-checked first, as for :meth:`items`, so an item edited to match
+        (or no longer match) is answered from its new contents.
+
+        Returns:
+            The matches, or None when the collection has no collection.json or
+            could not be indexed.
+        """
+        if not self._refresh_quietly(collection_id, item_path=""):
+            return None
+        header = self._connection.execute(
+            "SELECT has_collection_json FROM collections WHERE collection_id = ?",
+            (collection_id,),
+        ).fetchone()
+        if header is None or not header[0]:
+            return None
+
+        rows = self._search_rows(collection_id, bbox, start, end)
+        return [
+            _indexed_item(row)
+            for row in rows
+            if not properties or properties_match(json.loads(row[17]), properties)
+        ]
+
+    def _search_rows(
+        self,
+        collection_id: str,
+        bbox: tuple[float, float, float, float] | None,
+        start: float | None,
+        end: float | None,
+    ) -> list[_ItemRow]:
+        query = f"SELECT {_ITEM_COLUMNS} FROM items WHERE collection_id = ? AND readable = 1"
+        params: list[Any] = [collection_id]
+        if bbox is not None:
+            minx, miny, maxx, maxy = bbox
+            # The R*Tree stores float32 boxes rounded outward, so it yields a
+            # superset; the REAL columns then decide exactly.
+            query += (
+                " AND rowid IN (SELECT id FROM item_bboxes"
+                " WHERE minx <= ? AND maxx >= ? AND miny <= ? AND maxy >= ?)"
+                " AND minx <= ? AND maxx >= ? AND miny <= ? AND maxy >= ?"
+            )
+            params += [maxx, minx, maxy, miny] * 2
+        if start is not None:
+            query += " AND end_ts >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND start_ts <= ?"
+            params.append(end)
+        return self._connection.execute(query + " ORDER BY position", params).fetchall()
+
+    def assets(self, collection_id: str) -> dict[str, IndexedAsset] | None:
+        """Tracked assets of the current version, keyed as in versions.json.
+
+        Empty when versions.json has no versions yet; None when it is missing
+        or unreadable.
+        """
+        collection = self.collection(collection_id)
+        if collection is None or not collection.versions_readable:
+            return None
+        rows = self._connection.execute(
+            "SELECT asset_key, href, size_bytes, sha256 FROM assets "
+            "WHERE collection_id = ? ORDER BY asset_key",
+            (collection_id,),
+        )
+        return {key: IndexedAsset(href, size, sha256) for key, href, size, sha256 in rows}
+
+    # -- refresh -------------------------------------------------------------
+
+    def refresh(
+        self, collection_id: str, *, force: bool = False, item_path: str | None = None
+    ) -> None:
+        """Bring ``collection_id``'s rows in line with its files, in one transaction.
+
+        Args:
+            collection_id: Collection path relative to the catalog root.
+            force: Re-read collection.json and versions.json even when their
+                stat is unchanged. Item JSONs are still only re-read when their
+                own stat moved.
+            item_path: Also check the stat of this item JSON (relative to the
+                collection), or of every indexed item JSON when ``""``. Reads
+                that return item rows pass it, so an edited item is never
+                served from a stale row.
+
+        Raises:
+            OSError, ValueError: A file could not be read or parsed; nothing
+                is written.
+            sqlite3.Error: The database is locked or unusable.
+        """
+        collection_dir = self.catalog_root / collection_id
+        collection_stat = _stat_token(collection_dir / "collection.json")
+        versions_stat = _stat_token(collection_dir / "versions.json")
+
+        stored = self._connection.execute(
+            "SELECT collection_stat, versions_stat, catalog_stats FROM collections "
+            "WHERE collection_id = ?",
+            (collection_id,),
+        ).fetchone()
+        fresh_collection = fresh_versions = False
+        if stored is not None and not force:
+            fresh_collection = (
+                collection_stat is not None
+                and collection_stat == stored[0]
+                and _catalogs_fresh(collection_dir, json.loads(stored[2]))
+            )
+            fresh_versions = versions_stat is not None and versions_stat == stored[1]
+        if fresh_collection and item_path is not None:
+            fresh_collection = self._items_fresh(collection_id, collection_dir, item_path)
+        if fresh_collection and fresh_versions:
+            return
+        if collection_stat == _ABSENT and versions_stat == _ABSENT and stored is None:
+            return
+
+        with self._transaction():
+            if collection_stat == _ABSENT and versions_stat == _ABSENT:
+                self._forget(collection_id)
+                return
+            self._connection.execute(
+                "INSERT OR IGNORE INTO collections (collection_id) VALUES (?)", (collection_id,)
+            )
+            if not fresh_collection:
+                self._index_collection_json(collection_id, collection_dir, collection_stat)
+            if not fresh_versions:
+                self._index_versions(collection_id, collection_dir, versions_stat)
+
+    def _items_fresh(self, collection_id: str, collection_dir: Path, item_path: str) -> bool:
+        query = "SELECT path, stat FROM items WHERE collection_id = ?"
+        params: tuple[str, ...] = (collection_id,)
+        if item_path:
+            query += " AND path = ?"
+            params += (item_path,)
+        return all(
+            stat is not None and _stat_token(collection_dir / path) == stat
+            for path, stat in self._connection.execute(query, params)
+        )
+
+    def _refresh_quietly(self, collection_id: str, item_path: str | None = None) -> bool:
+        try:
+            self.refresh(collection_id, item_path=item_path)
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            logger.debug("Catalog index cannot answer for %s: %s", collection_id, exc)
+            return False
+        return True
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def _delete_items(self, collection_id: str) -> None:
+        self._connection.execute(
+            "DELETE FROM item_bboxes WHERE id IN (SELECT rowid FROM items WHERE collection_id = ?)",
+            (collection_id,),
+        )
+        self._connection.execute("DELETE FROM items WHERE collection_id = ?", (collection_id,))
+
+    def _forget(self, collection_id: str) -> None:
+        self._delete_items(collection_id)
+        for table in ("collections", "assets"):
+            self._connection.execute(
+                f"DELETE FROM {table} WHERE collection_id = ?", (collection_id,)
+            )
+
+    def _index_collection_json(
+        self, collection_id: str, collection_dir: Path, stat: str | None
+    ) -> None:
+        rows: list[_ItemRow] = []
+        data: dict[str, Any] = {}
+        owned: list[tuple[str, Path, bool]] = []
+        catalogs: dict[str, str | None] = {}
+        if stat != _ABSENT:
+            loaded = read_json_file(collection_dir / "collection.json")
+            if not isinstance(loaded, dict):
+                raise ValueError(f"collection.json of {collection_id} is not an object")
+            data = loaded
+            owned = _owned_items(collection_dir, data, catalogs)
+            rows = self._item_rows(collection_id, collection_dir, owned)
+
+        self._delete_items(collection_id)
+        self._connection.executemany(
+            f"INSERT INTO items (collection_id, position, {_ITEM_COLUMNS}) "
+            f"VALUES (?, ?, {_ITEM_PLACEHOLDERS})",
+            ((collection_id, position, *row) for position, row in enumerate(rows)),
+        )
+        self._connection.execute(
+            "INSERT INTO item_bboxes (id, minx, maxx, miny, maxy) "
+            "SELECT rowid, minx, maxx, miny, maxy FROM items "
+            "WHERE collection_id = ? AND readable = 1 AND minx IS NOT NULL",
+            (collection_id,),
+        )
+        self._connection.execute(
+            "UPDATE collections SET collection_stat = ?, catalog_stats = ?, "
+            "has_collection_json = ?, title = ?, description = ?, item_count = ?, "
+            "items_complete = ? WHERE collection_id = ?",
+            (
+                stat,
+                json.dumps(catalogs),
+                stat != _ABSENT,
+                data.get("title"),
+                data.get("description"),
+                len(owned),
+                all(row[3] for row in rows),
+                collection_id,
+            ),
+        )
+
+    def _item_rows(
+        self, collection_id: str, collection_dir: Path, owned: list[tuple[str, Path, bool]]
+    ) -> list[_ItemRow]:
+        """Rows for the owned items on disk, reusing those whose stat is unchanged."""
+        previous = {
+            row[0]: row
+            for row in self._connection.execute(
+                f"SELECT {_ITEM_COLUMNS} FROM items WHERE collection_id = ?", (collection_id,)
+            )
+        }
+        slots: list[_ItemRow | None] = []
+        pending: list[tuple[int, str, str | None, str, Path, bool]] = []
+        for href, item_path, direct in owned:
+            stat = _stat_token(item_path)
+            if stat == _ABSENT:
+                continue
+            path = Path(os.path.relpath(item_path, collection_dir)).as_posix()
+            kept = previous.get(path)
+            if stat is not None and kept is not None and kept[2] == stat:
+                slots.append((path, direct, *kept[2:]))
+            else:
+                pending.append((len(slots), path, stat, href, item_path, direct))
+                slots.append(None)
+
+        loaded = read_json_files((entry[4] for entry in pending), strict=False)
+        for (slot, path, stat, href, _item_path, direct), (_, item) in zip(
+            pending, loaded, strict=True
+        ):
+            slots[slot] = _item_row(path, direct, stat, href, item)
+        return [row for row in slots if row is not None]
+
+    def _index_versions(self, collection_id: str, collection_dir: Path, stat: str | None) -> None:
+        readable = False
+        current_version: str | None = None
+        assets: dict[str, Any] = {}
+        if stat != _ABSENT:
+            try:
+                head = read_versions_head(collection_dir / "versions.json")
+            except (OSError, ValueError) as exc:
+                logger.debug("Indexing %s without versions.json: %s", collection_id, exc)
+            else:
+                readable = True
+                current_version = head.current_version
+                if head.latest is not None:
+                    assets = head.latest.assets
+
+        self._connection.execute("DELETE FROM assets WHERE collection_id = ?", (collection_id,))
+        self._connection.executemany(
+            "INSERT INTO assets (collection_id, asset_key, href, size_bytes, sha256) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                (collection_id, key, asset.href, asset.size_bytes, asset.sha256)
+                for key, asset in assets.items()
+            ),
+        )
+        self._connection.execute(
+            "UPDATE collections SET versions_stat = ?, versions_readable = ?, "
+            "current_version = ?, asset_count = ?, total_size_bytes = ? WHERE collection_id = ?",
+            (
+                stat,
+                readable,
+                current_version,
+                len(assets),
+                sum(asset.size_bytes for asset in assets.values()),
+                collection_id,
+            ),
+        )
+
+
+def _owned_items(
+    collection_dir: Path, data: dict[str, Any], catalogs: dict[str, str | None]
+) -> list[tuple[str, Path, bool]]:
+    """``(href, path, direct)`` for every item the collection owns, in link order.
+
+    Same walk as ``stac_parquet.owned_item_hrefs``; ``direct`` marks items
+    linked from collection.json itself rather than from an organizing catalog.
+    The stat token of every organizing catalog.json the walk reaches is
+    recorded in ``catalogs``, keyed by its path relative to the collection.
+    """
+    return list(_linked_items(collection_dir, collection_dir, data, catalogs))
+
+
+def _linked_items(
+    collection_dir: Path, base_dir: Path, data: dict[str, Any], catalogs: dict[str, str | None]
+) -> Iterator[tuple[str, Path, bool]]:
+    for link in data.get("links", []):
+        href = link.get("href", "")
+        if not isinstance(href, str) or not href:
+            continue
+        rel = link.get("rel")
+        if rel == "item":
+            yield href, _resolve_href(base_dir, href), base_dir is collection_dir
+        elif rel == "child":
+            child_path = _resolve_href(base_dir, href)
+            if child_path.name != "catalog.json":
+                continue
+            stat = _stat_token(child_path)
+            catalogs[Path(os.path.relpath(child_path, collection_dir)).as_posix()] = stat
+            if stat == _ABSENT:
+                continue
+            child = read_json_file(child_path)
+            if not isinstance(child, dict):
+                raise ValueError(f"{child_path} is not an object")
+            yield from _linked_items(collection_dir, child_path.parent, child, catalogs)
+
+
+def _catalogs_fresh(collection_dir: Path, catalogs: dict[str, str | None]) -> bool:
+    """Whether every organizing catalog.json recorded by the item walk is unchanged."""
+    return all(
+        stat is not None and _stat_token(collection_dir / path) == stat
+        for path, stat in catalogs.items()
+    )
+
+
+def _indexed_item(row: _ItemRow) -> IndexedItem:
+    path, _direct, _stat, _readable, item_id, title, description, bbox = row[:8]
+    start, end, asset_hrefs = row[12:15]
+    return IndexedItem(
+        item_id=item_id,
+        path=path,
+        bbox=None if bbox is None else json.loads(bbox),
+        start_datetime=start,
+        end_datetime=end,
+        title=title,
+        description=description,
+        asset_hrefs=json.loads(asset_hrefs),
+    )
+
+
+def _schema_version(connection: sqlite3.Connection) -> int:
+    (version,) = connection.execute("PRAGMA user_version").fetchone()
+    return int(version)
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+    try:
+        if _schema_version(connection) != _CATALOG_INDEX_VERSION:
+            connection.execute("BEGIN IMMEDIATE")
+            if _schema_version(connection) == _CATALOG_INDEX_VERSION:
+                # Another process created it while this one waited for the lock
+                connection.execute("COMMIT")
+                return connection
+            # Virtual tables first: dropping one also drops its shadow tables
+            tables = connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "ORDER BY sql LIKE 'CREATE VIRTUAL TABLE%' DESC"
+            ).fetchall()
+            for (table,) in tables:
+                connection.execute(f"DROP TABLE IF EXISTS {table}")
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    connection.execute(statement)
+            connection.execute(f"PRAGMA user_version = {_CATALOG_INDEX_VERSION}")
+            connection.execute("COMMIT")
+    except BaseException:
+        connection.close()
+        raise
+    return connection
+
+
+def open_catalog_index(catalog_root: Path, *, create: bool = True) -> CatalogIndex | None:
+    """Open the index of the catalog at ``catalog_root``.
+
+    Args:
+        catalog_root: Catalog root (the directory holding ``.portolan/``).
+        create: Create the database when it does not exist yet.
+
+    Returns:
+        The open index, or None when it is disabled, the directory is not a
+        catalog, or the database cannot be opened. A corrupt database is
+        deleted and recreated once.
+    """
+    if not _catalog_index_enabled():
+        return None
+    portolan_dir = catalog_root / PORTOLAN_DIR
+    if not portolan_dir.is_dir():
+        return None
+    path = portolan_dir / CATALOG_INDEX_FILENAME
+    if not create and not path.exists():
+        return None
+
+    for attempt in range(2):
+        try:
+            return CatalogIndex(catalog_root, _connect(path))
+        except sqlite3.DatabaseError as exc:
+            if attempt or isinstance(exc, sqlite3.OperationalError):
+                logger.debug("Catalog index unavailable at %s: %s", path, exc)
+                return None
+            logger.debug("Rebuilding corrupt catalog index %s: %s", path, exc)
+            try:
+                path.unlink()
+            except OSError:
+                return None
+    return None
+
+
+def refresh_catalog_index(catalog_root: Path, collection_ids: Iterable[str] | None) -> None:
+    """Refresh the index rows of collections a command just changed.
+
+    Called by the commands that write catalog files, after they wrote them;
+    ``collection_ids=None`` refreshes every indexed collection, for commands
+    that may touch any of them (``check --fix``). A catalog whose index was
+    never built is left alone (the first read builds it), and a failure is
+    logged, never raised: the files are already written, and a stale row is
+    caught by the stat check on the next read anyway.
+    """
+    index = open_catalog_index(catalog_root, create=False)
+    if index is None:
+        return
+    with index:
+        if collection_ids is None:
+            try:
+                collection_ids = index.collection_ids()
+            except sqlite3.Error as exc:
+                logger.debug("Could not list indexed collections: %s", exc)
+                return
+        for collection_id in collection_ids:
+            try:
+                index.refresh(collection_id, force=True)
+            except (OSError, ValueError, sqlite3.Error) as exc:
+                logger.debug("Could not refresh catalog index for %s: %s", collection_id, exc)
@@ -12,20 +12,26 @@ from __future__ import annotations
 import fnmatch
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from portolan_cli.catalog_index import CatalogIndex, open_catalog_index
 from portolan_cli.config import get_ignored_files
 from portolan_cli.formats import FORMAT_DISPLAY_NAMES, FormatType, _detect_json_type
-from portolan_cli.versions import read_versions
+from portolan_cli.versions import read_versions_head
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads scanning item directories in one collection
+_MAX_SCAN_WORKERS = 16
+
 
 class AssetStatus(Enum):
     """Tracking status for an asset."""
@@ -215,10 +221,9 @@ def _get_tracked_assets(versions_path: Path) -> set[str]:
     if not versions_path.exists():
         return set()
     try:
-        versions_file = read_versions(versions_path)
-        if versions_file.versions:
-            current_version = versions_file.versions[-1]
-            return set(current_version.assets.keys())
+        latest = read_versions_head(versions_path).latest
+        if latest is not None:
+            return set(latest.assets.keys())
     except (ValueError, json.JSONDecodeError):
         pass
     return set()
@@ -312,12 +317,15 @@ def _scan_item_directory(
 def _scan_collection_directory(
     col_dir: Path,
     ignored_patterns: list[str],
+    index: CatalogIndex | None = None,
 ) -> CollectionInfo:
     """Scan a collection directory and return all items with status.
 
     Args:
         col_dir: Path to the collection directory.
         ignored_patterns: List of glob patterns to ignore.
+        index: Catalog index to read the tracked asset keys from, instead of
+            parsing versions.json.
 
     Returns:
         CollectionInfo with all items and their assets.
@@ -325,33 +333,45 @@ def _scan_collection_directory(
     collection_id = col_dir.name
     is_initialized = (col_dir / "collection.json").exists()
     versions_path = col_dir / "versions.json"
-    tracked_assets = _get_tracked_assets(versions_path)
-
-    items: list[ItemInfo] = []
+    indexed_assets = index.assets(collection_id) if index is not None else None
+    if indexed_assets is not None:
+        tracked_assets = set(indexed_assets)
+    else:
+        tracked_assets = _get_tracked_assets(versions_path)
 
     # Scan subdirectories as items
     try:
-        for entry in sorted(col_dir.iterdir()):
-            if not entry.is_dir():
-                continue
-
+        item_dirs = [
+            entry
+            for entry in sorted(col_dir.iterdir())
             # Skip hidden directories
-            if entry.name.startswith("."):
-                continue
-
-            item_info = _scan_item_directory(
-                entry,
-                collection_id,
-                versions_path,
-                tracked_assets,
-                ignored_patterns,
-            )
-
-            # Only include items that have assets
-            if item_info.assets:
-                items.append(item_info)
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
     except OSError as e:
         logger.debug("Cannot scan collection directory %s: %s", col_dir, e)
+        item_dirs = []
+
+    def scan(item_dir: Path) -> ItemInfo:
+        return _scan_item_directory(
+            item_dir,
+            collection_id,
+            versions_path,
+            tracked_assets,
+            ignored_patterns,
+        )
+
+    # Item directories are independent and I/O-bound (listing, stat, and the
+    # JSON head probe for .json assets), so they are scanned on a thread pool;
+    # map() keeps them in sorted order.
+    workers = max(1, min(_MAX_SCAN_WORKERS, os.cpu_count() or 1, len(item_dirs)))
+    if workers == 1:
+        scanned = [scan(item_dir) for item_dir in item_dirs]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            scanned = list(executor.map(scan, item_dirs))
+
+    # Only include items that have assets
+    items = [item_info for item_info in scanned if item_info.assets]
 
     return CollectionInfo(
         collection_id=collection_id,
@@ -385,6 +405,7 @@ def list_catalog_contents(
     ignored_patterns = get_ignored_files(catalog_root)
 
     collections: list[CollectionInfo] = []
+    index = open_catalog_index(catalog_root)
 
     # Scan all subdirectories
     try:
@@ -400,12 +421,15 @@ def list_catalog_contents(
             if collection_id and entry.name != collection_id:
                 continue
 
-            col_info = _scan_collection_directory(entry, ignored_patterns)
+            col_info = _scan_collection_directory(entry, ignored_patterns, index)
 
             # Include collection if it has items or is initialized
             if col_info.items or col_info.is_initialized:
                 collections.append(col_info)
     except OSError as e:
         logger.debug("Cannot scan catalog root %s: %s", catalog_root, e)
+    finally:
+        if index is not None:
+            index.close()
 
     return CatalogListResult(collections=collections)
@@ -0,0 +1,537 @@
+"""Checksum and size helpers for catalog assets.
+
+SHA-256 digests of files inside a catalog are remembered in
+``.portolan/checksum-cache.json``, keyed by the file's catalog-relative path and
+validated against its ``(size, mtime_ns, inode)`` stat tuple. A ``check``
+followed by a ``push`` therefore reads each unchanged asset's bytes once, not
+once per command. Files outside any catalog are always hashed from their bytes.
+
+Catalog-wide passes hash through :func:`compute_checksums`, which spreads files
+over a thread pool. ``hashlib`` releases the GIL while it digests a buffer, so
+with multi-MiB reads the pool keeps every core busy instead of one.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rashid.api import SHA2_256, encode_multihash
+
+from portolan_cli.constants import (
+    MAX_CATALOG_SEARCH_DEPTH,
+    MTIME_TOLERANCE_SECONDS,
+    PORTOLAN_DIR,
+)
+from portolan_cli.json_io import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# Digest cache file, inside the catalog's .portolan/ directory.
+CHECKSUM_CACHE_FILENAME = "checksum-cache.json"
+
+# Bumped whenever the cache file layout changes; a mismatched file is ignored.
+_CHECKSUM_CACHE_VERSION = 1
+
+# Set to "0"/"false" to bypass the digest cache and always hash from bytes.
+CHECKSUM_CACHE_ENV_VAR = "PORTOLAN_CHECKSUM_CACHE"
+
+# (size, mtime_ns, inode) — the stat tuple a cached digest is valid for.
+_StatKey = tuple[int, int, int]
+
+# Bytes handed to each hashlib update. hashlib drops the GIL for the duration of
+# an update, so a large read is what lets parallel workers actually run in
+# parallel; 8 KiB reads spent most of their time in the interpreter instead.
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Worker ceiling for compute_checksums when the caller does not choose one.
+_MAX_HASH_WORKERS = 32
+
+# User-defined object metadata carrying an uploaded object's SHA-256
+# (x-amz-meta-*, x-goog-meta-*, x-ms-meta-* on the wire). Push compares it with
+# the local digest to skip objects already in the bucket; downloads verify the
+# bytes they stream against it.
+CHECKSUM_METADATA_KEY = "portolan-sha256"
+
+
+def multihash_sha256(digest_hex: str) -> str:
+    """Encode a hex SHA-256 digest as a hex multihash for ``file:checksum``.
+
+    The STAC file extension types ``file:checksum`` as a multihash — the hash
+    function and digest length travel with the digest — so a bare hex digest (or
+    a ``sha256:``-prefixed one) is not a valid value (issue #654).
+
+    The encoding comes from rashid, which also decodes the value when
+    ``portolan check`` verifies it.
+
+    Args:
+        digest_hex: Hex-encoded SHA-256 digest, as returned by
+            :func:`compute_checksum`.
+
+    Returns:
+        The digest with the sha2-256 multihash prefix.
+
+    Raises:
+        ValueError: If ``digest_hex`` is not a 64-character hex string.
+    """
+    if len(digest_hex) != 64:
+        raise ValueError(f"Not a 64-character SHA-256 hex digest: {digest_hex!r}")
+    try:
+        digest = bytes.fromhex(digest_hex)
+    except ValueError as exc:
+        raise ValueError(f"Not a 64-character SHA-256 hex digest: {digest_hex!r}") from exc
+    return encode_multihash(SHA2_256, digest)
+
+
+def compute_checksum(path: Path) -> str:
+    """Compute SHA-256 checksum of a file securely.
+
+    Security: Validates the resolved path is a regular file to prevent
+    symlink attacks (MAJOR #5 - symlink security vulnerability).
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Hex-encoded SHA-256 checksum.
+
+    Raises:
+        ValueError: If path is not a regular file (e.g., symlink to directory,
+            device file, or other non-regular file).
+        FileNotFoundError: If path does not exist.
+    """
+    # Resolve symlinks and check it's a regular file (MAJOR #5)
+    resolved = path.resolve()
+    if not resolved.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    if not resolved.is_file():
+        raise ValueError(f"Not a regular file: {path} (resolves to {resolved})")
+
+    digest, _bytes_read = _checksum_resolved(resolved)
+    return digest
+
+
+def _checksum_resolved(resolved: Path) -> tuple[str, int | None]:
+    """Digest of an already-validated regular file, and the bytes read for it.
+
+    The byte count is ``None`` when the digest came from the catalog's cache.
+    """
+    stat_key = _stat_key(resolved)
+    cache = _cache_for(resolved)
+    if cache is not None:
+        cached = cache.get(resolved, stat_key)
+        if cached is not None:
+            return cached, None
+
+    digest = _hash_file(resolved, stat_key[0])
+    # Re-stat after reading: a file rewritten mid-hash must not be cached
+    # under either its old or its new stat tuple.
+    if cache is not None and _stat_key(resolved) == stat_key:
+        cache.put(resolved, stat_key, digest)
+    return digest, stat_key[0]
+
+
+def _hash_file(path: Path, size_hint: int) -> str:
+    """Stream ``path`` through SHA-256 and return the hex digest.
+
+    Reads into one reusable buffer of up to ``HASH_CHUNK_SIZE`` bytes, sized
+    down for small files so a batch of sidecars does not allocate 4 MiB each.
+    """
+    sha256 = hashlib.sha256()
+    buffer = bytearray(max(1, min(HASH_CHUNK_SIZE, size_hint)))
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while read := f.readinto(buffer):
+            sha256.update(view[:read])
+    return sha256.hexdigest()
+
+
+@dataclass
+class ChecksumBatch:
+    """Result of :func:`compute_checksums`.
+
+    Attributes:
+        digests: Hex SHA-256 per input path, keyed by the path as given.
+        bytes_hashed: Bytes actually read; cache hits contribute nothing.
+        cache_hits: Files whose digest came from the catalog's digest cache.
+        elapsed_seconds: Wall time for the whole batch.
+    """
+
+    digests: dict[Path, str] = field(default_factory=dict)
+    bytes_hashed: int = 0
+    cache_hits: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def throughput_bytes_per_second(self) -> float:
+        """Hashing throughput over the batch's wall time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_hashed / self.elapsed_seconds
+
+
+def compute_checksums(paths: Iterable[Path], *, max_workers: int | None = None) -> ChecksumBatch:
+    """Compute SHA-256 checksums for many files at once on a thread pool.
+
+    Same contract per file as :func:`compute_checksum` (symlinks resolved, only
+    regular files accepted, the catalog's digest cache consulted), but the reads
+    and digests overlap across ``max_workers`` threads. Duplicate paths are
+    hashed once.
+
+    Args:
+        paths: Files to hash.
+        max_workers: Thread count. Defaults to the CPU count, capped at 32.
+
+    Returns:
+        The digests plus the byte count, cache hits and wall time, so callers
+        can report throughput.
+
+    Raises:
+        ValueError: If a path is not a regular file.
+        FileNotFoundError: If a path does not exist. As with a serial loop, the
+            first failing path in input order is the one raised.
+    """
+    started = time.perf_counter()
+    unique = list(dict.fromkeys(paths))
+
+    resolved_paths: list[Path] = []
+    for path in unique:
+        resolved = path.resolve()
+        if not resolved.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+        if not resolved.is_file():
+            raise ValueError(f"Not a regular file: {path} (resolves to {resolved})")
+        resolved_paths.append(resolved)
+
+    workers = max_workers or min(_MAX_HASH_WORKERS, os.cpu_count() or 1)
+    workers = max(1, min(workers, len(resolved_paths)))
+    if workers == 1:
+        results = [_checksum_resolved(resolved) for resolved in resolved_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_checksum_resolved, resolved_paths))
+
+    batch = ChecksumBatch()
+    for path, (digest, bytes_read) in zip(unique, results, strict=True):
+        batch.digests[path] = digest
+        if bytes_read is None:
+            batch.cache_hits += 1
+        else:
+            batch.bytes_hashed += bytes_read
+    batch.elapsed_seconds = time.perf_counter() - started
+    logger.debug(
+        "Hashed %d file(s) (%d from cache): %d bytes in %.3fs (%.1f MiB/s, %d worker(s))",
+        len(unique),
+        batch.cache_hits,
+        batch.bytes_hashed,
+        batch.elapsed_seconds,
+        batch.throughput_bytes_per_second / (1024 * 1024),
+        workers,
+    )
+    return batch
+
+
+def _stat_key(path: Path) -> _StatKey:
+    st = path.stat()
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+class _DigestCache:
+    """SHA-256 digests of one catalog's files, persisted under ``.portolan/``.
+
+    An entry is trusted only while the file's ``(size, mtime_ns, inode)`` is
+    unchanged. Entries are never recorded for a file modified within
+    ``MTIME_TOLERANCE_SECONDS`` of now: a write landing in the same mtime tick
+    as the hash would otherwise leave a stale digest that looks valid.
+    """
+
+    def __init__(self, catalog_root: Path) -> None:
+        self.catalog_root = catalog_root
+        self.path = catalog_root / PORTOLAN_DIR / CHECKSUM_CACHE_FILENAME
+        self._entries: dict[str, tuple[_StatKey, str]] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self.catalog_root).as_posix()
+
+    def _load(self) -> dict[str, tuple[_StatKey, str]]:
+        if self._entries is None:
+            self._entries = _read_cache_file(self.path)
+        return self._entries
+
+    def get(self, path: Path, stat_key: _StatKey) -> str | None:
+        with self._lock:
+            entry = self._load().get(self._key(path))
+        if entry is None or entry[0] != stat_key:
+            return None
+        return entry[1]
+
+    def put(self, path: Path, stat_key: _StatKey, digest: str) -> None:
+        mtime_seconds = stat_key[1] / 1_000_000_000
+        if time.time() - mtime_seconds < MTIME_TOLERANCE_SECONDS:
+            return
+        with self._lock:
+            self._load()[self._key(path)] = (stat_key, digest)
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write new entries back, merged over whatever is on disk now.
+
+        Another process may have flushed since this one loaded, so its entries
+        are kept and this process's entries win on conflict. Skipped silently
+        when the catalog's ``.portolan/`` has gone away.
+        """
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            if not self.path.parent.is_dir():
+                return
+            merged = _read_cache_file(self.path)
+            merged.update(self._entries)
+            payload = {
+                "version": _CHECKSUM_CACHE_VERSION,
+                "entries": {
+                    key: [size, mtime_ns, inode, digest]
+                    for key, ((size, mtime_ns, inode), digest) in sorted(merged.items())
+                },
+            }
+            try:
+                write_json_atomic(self.path, payload)
+            except OSError as exc:
+                logger.debug("Could not write checksum cache %s: %s", self.path, exc)
+                return
+            self._entries = merged
+            self._dirty = False
+
+
+def _read_cache_file(path: Path) -> dict[str, tuple[_StatKey, str]]:
+    """Parse a cache file, treating a missing or malformed one as empty."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CHECKSUM_CACHE_VERSION:
+        return {}
+    raw_entries = data.get("entries")
+    if not isinstance(raw_entries, dict):
+        return {}
+
+    entries: dict[str, tuple[_StatKey, str]] = {}
+    for key, value in raw_entries.items():
+        if (
+            isinstance(value, list)
+            and len(value) == 4
+            and all(isinstance(v, int) for v in value[:3])
+            and isinstance(value[3], str)
+            and len(value[3]) == 64
+        ):
+            entries[key] = ((value[0], value[1], value[2]), value[3])
+    return entries
+
+
+_caches: dict[Path, _DigestCache] = {}
+_catalog_root_by_dir: dict[Path, Path | None] = {}
+_registry_lock = threading.Lock()
+
+
+def _checksum_cache_enabled() -> bool:
+    value = os.environ.get(CHECKSUM_CACHE_ENV_VAR, "").strip().lower()
+    return value not in ("0", "false", "no", "off")
+
+
+def _find_catalog_root(directory: Path) -> Path | None:
+    """Nearest ancestor of ``directory`` holding ``.portolan/config.yaml``.
+
+    Memoized per directory: every asset in a collection shares the lookup.
+    """
+    with _registry_lock:
+        if directory in _catalog_root_by_dir:
+            return _catalog_root_by_dir[directory]
+
+    root: Path | None = None
+    candidate = directory
+    for _ in range(MAX_CATALOG_SEARCH_DEPTH):
+        if (candidate / PORTOLAN_DIR / "config.yaml").is_file():
+            root = candidate
+            break
+        if candidate.parent == candidate:
+            break
+        candidate = candidate.parent
+
+    with _registry_lock:
+        _catalog_root_by_dir[directory] = root
+    return root
+
+
+def _cache_for(resolved: Path) -> _DigestCache | None:
+    """The digest cache of the catalog containing ``resolved``, if any."""
+    if not _checksum_cache_enabled():
+        return None
+    root = _find_catalog_root(resolved.parent)
+    if root is None:
+        return None
+    with _registry_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = _caches[root] = _DigestCache(root)
+    return cache
+
+
+def flush_checksum_cache() -> None:
+    """Persist newly computed digests for every catalog touched so far.
+
+    Registered with :mod:`atexit`, so a CLI run saves its digests on the way
+    out; long-running callers may flush earlier.
+    """
+    with _registry_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.flush()
+
+
+def clear_checksum_cache() -> None:
+    """Drop every in-memory cache and catalog-root lookup (without flushing)."""
+    with _registry_lock:
+        _caches.clear()
+        _catalog_root_by_dir.clear()
+
+
+atexit.register(flush_checksum_cache)
+
+
+def file_fields_from(digest_hex: str, size: int) -> dict[str, Any]:
+    """Build the STAC file-extension fields for bytes that are already measured.
+
+    Takes the digest and the size rather than a path, because a FileGDB asset is
+    a directory: :func:`compute_dir_checksum` and :func:`compute_dir_size` measure
+    it, and :func:`compute_checksum` would reject it as a non-regular file.
+
+    Args:
+        digest_hex: Hex-encoded SHA-256 digest of the asset's bytes.
+        size: Byte count to publish as ``file:size``.
+
+    Returns:
+        The ``file:size`` and ``file:checksum`` pair, ready to merge into an asset.
+
+    Raises:
+        ValueError: If ``digest_hex`` is not a 64-character hex string.
+    """
+    return {"file:size": size, "file:checksum": multihash_sha256(digest_hex)}
+
+
+def file_fields(path: Path) -> dict[str, Any]:
+    """Build the STAC file-extension fields for a regular file, from its bytes.
+
+    PORTO-CORE-030 makes a published ``file:size``/``file:checksum`` a claim about
+    the bytes the asset's href resolves to, so always read them from the file as it
+    stands rather than carrying a value forward from an earlier write.
+
+    Args:
+        path: Path to the asset file.
+
+    Returns:
+        The ``file:size`` and ``file:checksum`` pair, ready to merge into an asset.
+
+    Raises:
+        ValueError: If ``path`` is not a regular file.
+        FileNotFoundError: If ``path`` does not exist.
+    """
+    return file_fields_from(compute_checksum(path), path.stat().st_size)
+
+
+def compute_dir_checksum(path: Path) -> str:
+    """Compute a stable fingerprint for a directory by hashing its contents' metadata.
+
+    Used for directory-format assets such as FileGDB (.gdb). Rather than reading
+    all bytes (expensive for large catalogs), hashes the sorted list of
+    (relative_path, size, mtime) tuples for every file inside the directory.
+    This detects file additions, removals, and modifications within the directory.
+
+    Directories are not checksummed by content — the fingerprint is based on the
+    metadata of all contained files (recursively). This is consistent with how
+    ``is_current()`` uses mtime as a fast-path gate before falling back to this
+    checksum.
+
+    Args:
+        path: Path to the directory.
+
+    Returns:
+        Hex-encoded SHA-256 fingerprint of the directory contents.
+
+    Raises:
+        ValueError: If path is not a directory.
+        FileNotFoundError: If path does not exist.
+    """
+    resolved = path.resolve()
+    if not resolved.exists():
+        raise FileNotFoundError(f"Directory not found: {path}")
+    if not resolved.is_dir():
+        raise ValueError(f"Not a directory: {path} (resolves to {resolved})")
+
+    sha256 = hashlib.sha256()
+    # Collect (relative_path, size, mtime) for all files, sorted for determinism.
+    entries: list[tuple[str, int, float]] = []
+    try:
+        for fpath in sorted(resolved.rglob("*")):
+            if not fpath.is_file():
+                continue
+            rel_path = fpath.relative_to(resolved).as_posix()
+            try:
+                stat = fpath.stat()
+                entries.append((rel_path, stat.st_size, stat.st_mtime))
+            except OSError:
+                # Skip files we can't stat (e.g., broken symlinks inside .gdb)
+                entries.append((rel_path, -1, -1.0))
+    except OSError as exc:
+        raise ValueError(f"Cannot read directory contents: {path}") from exc
+
+    for rel_path, size, mtime in entries:
+        sha256.update(f"{rel_path}\x00{size}\x00{mtime:.6f}\n".encode())
+    return sha256.hexdigest()
+
+
+def compute_dir_size(path: Path) -> int:
+    """Compute total size of all files in a directory.
+
+    Used for directory-format assets such as FileGDB (.gdb) to populate
+    the STAC file:size field.
+
+    Args:
+        path: Path to the directory.
+
+    Returns:
+        Total size in bytes of all files in the directory.
+
+    Raises:
+        ValueError: If path is not a directory.
+        FileNotFoundError: If path does not exist.
+    """
+    resolved = path.resolve()
+    if not resolved.exists():
+        raise FileNotFoundError(f"Directory not found: {path}")
+    if not resolved.is_dir():
+        raise ValueError(f"Not a directory: {path} (resolves to {resolved})")
+
+    total_size = 0
+    try:
+        for fpath in resolved.rglob("*"):
+            if fpath.is_file():
+                try:
+                    total_size += fpath.stat().st_size
+                except OSError:
+                    pass
+    except OSError as exc:
+        raise ValueError(f"Cannot read directory contents: {path}") from exc
+
+    return total_size
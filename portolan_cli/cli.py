@@ -2,6 +2,12 @@
 
 The CLI is a thin wrapper around the Python API (see catalog.py).
 All business logic lives in the library; the CLI handles user interaction.
+
+Modules that pull in pyarrow, rasterio, geopandas or pystac (add, stac,
+metadata.fix, the validation adapter) are imported inside the commands that
+use them, so ``portolan --help`` and light subcommands such as ``config get``
+start without loading them. tests/benchmark/test_cli_startup_benchmark.py
+guards this.
 """
 
 from __future__ import annotations
@@ -11,20 +17,22 @@ import os
 import sys
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NoReturn
 
 if TYPE_CHECKING:
+    from portolan_cli.add import AddFailure, PrepareExecutor
     from portolan_cli.backends.protocol import VersioningBackend
+    from portolan_cli.convert import ConversionResult
     from portolan_cli.extract.arcgis.report import ExtractionReport
     from portolan_cli.extract.arcgis.url_parser import ParsedArcGISURL
+    from portolan_cli.metadata.fix import FixReport
     from portolan_cli.sync.pull import PullResult
 
 import click
 from rashid.model import Severity as RashidSeverity
 
-from portolan_cli.add import AddFailure, add_files
 from portolan_cli.add_progress import AddProgressReporter, count_files
 from portolan_cli.catalog import find_catalog_root
 from portolan_cli.catalog_list import (
@@ -33,10 +41,10 @@ from portolan_cli.catalog_list import (
     list_catalog_contents,
 )
 from portolan_cli.collection_id import resolve_collection_id
-from portolan_cli.convert import ConversionResult
 from portolan_cli.discovery import get_sidecars
 from portolan_cli.emit import emit_error, emit_success
 from portolan_cli.errors import MissingLicenseError
+from portolan_cli.input_hardening import InputValidationError, validate_safe_path
 from portolan_cli.json_output import ErrorDetail, error_envelope, success_envelope
 from portolan_cli.licensing import (
     CLI_LICENSE_REMEDIATION,
@@ -44,7 +52,6 @@ from portolan_cli.licensing import (
     OTHER_LICENSE,
     license_gap,
 )
-from portolan_cli.metadata.fix import FixReport
 from portolan_cli.output import detail, error, success, warn
 from portolan_cli.output import info as info_output
 from portolan_cli.query import ItemInfo
@@ -71,18 +78,9 @@ from portolan_cli.scan.output import (
     render_tree_view,
 )
 from portolan_cli.scan.progress import ScanProgressReporter, count_directories
-from portolan_cli.stac import MergeStrategy
+from portolan_cli.scan.snapshot import resolve_incremental
 from portolan_cli.status import CollectionStatus, get_collection_status
 from portolan_cli.temporal import FLEXIBLE_DATETIME
-from portolan_cli.validation import (
-    InputValidationError,
-    annotate_survivors,
-    build_check_payload,
-    build_fix_payload,
-    remediation_for,
-    run_check,
-    validate_safe_path,
-)
 
 
 def format_size(size_bytes: int) -> str:
@@ -361,13 +359,27 @@ def resolve_aws_region(
     default="text",
     help="Output format (json for machine parsing, text for humans).",
 )
+@click.option(
+    "--profile-report",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Write per-phase wall time, CPU time, bytes, file counts and peak RSS "
+    "as JSON to this file when the command finishes.",
+)
 @click.pass_context
-def cli(ctx: click.Context, output_format: str) -> None:
+def cli(ctx: click.Context, output_format: str, profile_report: Path | None) -> None:
     """Portolan - Publish and manage cloud-native geospatial data catalogs."""
     # Store format in context for subcommands
     ctx.ensure_object(dict)
     ctx.obj["format"] = output_format
 
+    if profile_report is not None:
+        from portolan_cli import tracing
+
+        tracing.start_trace()
+        command = ctx.invoked_subcommand
+        ctx.call_on_close(lambda: tracing.write_report(profile_report, command=command))
+
     # Note: .env loading moved to individual commands after catalog path resolution
     # to ensure correct .env is loaded when --catalog/--portolan-dir is used.
     # See load_dotenv_and_warn_sensitive() helper.
@@ -882,6 +894,175 @@ def list_cmd(
         _list_tree_output_with_status(result)
 
 
+# =============================================================================
+# Query command
+# =============================================================================
+
+
+def _parse_query_datetime(value: str) -> tuple[datetime | None, datetime | None]:
+    """Parse a STAC-style ``--datetime``: an instant or ``start/end``, ``..`` open.
+
+    A bare date as the end bound covers that whole day.
+
+    Raises:
+        ValueError: If a bound is not an ISO 8601 date or datetime.
+    """
+    bounds = value.split("/")
+    if len(bounds) > 2:
+        raise ValueError("expected an instant or 'start/end'")
+    parsed = [
+        None
+        if bound in ("", "..")
+        else datetime.fromisoformat(bound.replace("Z", "+00:00").replace("z", "+00:00"))
+        for bound in bounds
+    ]
+    start, end = parsed[0], parsed[-1]
+    if end is not None and len(bounds[-1]) == len("YYYY-MM-DD"):
+        end += timedelta(days=1, microseconds=-1)
+    return start, end
+
+
+def _parse_query_filter(value: str) -> tuple[str, Any]:
+    """Split ``key=value``; the value is read as JSON when it parses, else as text."""
+    key, sep, raw = value.partition("=")
+    if not sep or not key:
+        raise ValueError(f"expected key=value, got {value!r}")
+    try:
+        return key, json.loads(raw)
+    except ValueError:
+        return key, raw
+
+
+@cli.command("query")
+@click.option(
+    "--bbox",
+    default=None,
+    help="Match items intersecting 'min_x,min_y,max_x,max_y'.",
+)
+@click.option(
+    "--datetime",
+    "datetime_range",
+    default=None,
+    help="Match items overlapping an instant or 'start/end' ('..' for open).",
+)
+@click.option(
+    "--filter",
+    "filters",
+    multiple=True,
+    help="Match items whose property equals a value, as key=value (repeatable).",
+)
+@click.option(
+    "--collection",
+    "-c",
+    help="Search one collection only.",
+)
+@click.option(
+    "--catalog",
+    "catalog_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Path to catalog root (default: auto-detect by walking up from cwd).",
+)
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON.")
+@click.pass_context
+def query_cmd(
+    ctx: click.Context,
+    bbox: str | None,
+    datetime_range: str | None,
+    filters: tuple[str, ...],
+    collection: str | None,
+    catalog_path: Path | None,
+    json_output: bool,
+) -> None:
+    """Find items by location, time and properties.
+
+    Filters combine: an item is listed when it matches all of them. Lookups
+    go through the local catalog index, so they stay fast on large catalogs.
+
+    \b
+    Examples:
+        portolan query --bbox -74.3,40.5,-73.7,40.9
+        portolan query --datetime 2024-01-01/2024-06-30
+        portolan query --datetime 2024-01-01/..  -c imagery
+        portolan query --filter platform=sentinel-2a --filter gsd=10
+        portolan query --bbox 0,0,10,10 --json
+    """
+    from portolan_cli.query import search_items
+
+    use_json = should_output_json(ctx, json_output)
+
+    if catalog_path is None:
+        catalog_path = require_catalog_root(use_json, "query")
+
+    parsed_bbox: tuple[float, float, float, float] | None = None
+    if bbox is not None:
+        try:
+            values = [float(v) for v in bbox.split(",")]
+        except ValueError as err:
+            emit_error("query", "UsageError", f"Invalid --bbox: {err}", use_json=use_json)
+            raise SystemExit(1) from err
+        if len(values) != 4:
+            emit_error(
+                "query",
+                "UsageError",
+                "--bbox must have 4 comma-separated values: min_x,min_y,max_x,max_y",
+                use_json=use_json,
+            )
+            raise SystemExit(1)
+        parsed_bbox = (values[0], values[1], values[2], values[3])
+
+    start = end = None
+    if datetime_range is not None:
+        try:
+            start, end = _parse_query_datetime(datetime_range)
+        except ValueError as err:
+            emit_error("query", "UsageError", f"Invalid --datetime: {err}", use_json=use_json)
+            raise SystemExit(1) from err
+
+    properties: dict[str, Any] = {}
+    for raw_filter in filters:
+        try:
+            key, value = _parse_query_filter(raw_filter)
+        except ValueError as err:
+            emit_error("query", "UsageError", f"Invalid --filter: {err}", use_json=use_json)
+            raise SystemExit(1) from err
+        properties[key] = value
+
+    items = search_items(
+        catalog_path,
+        bbox=parsed_bbox,
+        start=start,
+        end=end,
+        properties=properties,
+        collection_id=collection,
+    )
+
+    data = {
+        "items": [
+            {
+                "id": item.item_id,
+                "collection": item.collection_id,
+                "bbox": item.bbox,
+                "datetime": item.datetime.isoformat() if item.datetime else None,
+                "title": item.title,
+                "assets": item.asset_paths,
+            }
+            for item in items
+        ],
+        "count": len(items),
+    }
+    if emit_success("query", data, use_json=use_json):
+        return
+
+    if not items:
+        info_output("No matching items")
+        return
+    for item in items:
+        label = f" - {item.title}" if item.title else ""
+        info_output(f"{item.collection_id}/{item.item_id}{label}")
+    detail(f"{len(items)} item(s)")
+
+
 # =============================================================================
 # Status command (Issue #389 - git-like version management)
 # =============================================================================
@@ -958,16 +1139,32 @@ def status_cmd(
             info_output("No collections found")
         return
 
+    # One manifest GET replaces a versions.json fetch per collection.
+    remote_manifest = None
+    if remote_url and len(collections) > 1:
+        from portolan_cli.sync.manifest import read_remote_manifest
+
+        remote_manifest = read_remote_manifest(remote_url)
+
     # Get status for each collection
+    from portolan_cli.catalog_index import open_catalog_index
+
     statuses: list[CollectionStatus] = []
-    for coll in collections:
-        status = get_collection_status(
-            catalog_root=catalog_path,
-            collection=coll,
-            offline=offline,
-            remote_url=remote_url,
-        )
-        statuses.append(status)
+    index = open_catalog_index(catalog_path)
+    try:
+        for coll in collections:
+            status = get_collection_status(
+                catalog_root=catalog_path,
+                collection=coll,
+                offline=offline,
+                remote_url=remote_url,
+                remote_manifest=remote_manifest,
+                index=index,
+            )
+            statuses.append(status)
+    finally:
+        if index is not None:
+            index.close()
 
     if not emit_success(
         "status", {"collections": [s.to_dict() for s in statuses]}, use_json=use_json
@@ -1095,7 +1292,7 @@ def info_cmd(
                 _output_catalog_info(catalog_result, use_json=use_json)
             elif (target / "collection.json").exists():
                 # It's a collection
-                collection_result = inspect_collection(target)
+                collection_result = inspect_collection(target, catalog_root=catalog_path)
                 _output_collection_info(collection_result, use_json=use_json)
             else:
                 # Directory exists but isn't a catalog or collection
@@ -1148,6 +1345,8 @@ def _print_finding(finding: Any, requirement: str) -> None:
 
 def _print_findings(report: Any, *, verbose: bool) -> None:
     """Print findings grouped by severity, worst first."""
+    from portolan_cli.validation import remediation_for
+
     groups = (
         ("Errors", report.errors),
         ("Warnings", report.warnings),
@@ -1438,6 +1637,8 @@ def _fix_json_section(
     data: dict[str, Any] = {}
 
     if metadata_fix_report is not None:
+        from portolan_cli.metadata.fix import FixReport
+
         if not isinstance(metadata_fix_report, FixReport):
             raise TypeError(f"Expected FixReport, got {type(metadata_fix_report).__name__}")
         data["metadata_fix"] = metadata_fix_report.to_dict()
@@ -1466,6 +1667,8 @@ def _output_fix_human(
     """
     # Output metadata fix results
     if metadata_fix_report is not None:
+        from portolan_cli.metadata.fix import FixReport
+
         if not isinstance(metadata_fix_report, FixReport):
             raise TypeError(f"Expected FixReport, got {type(metadata_fix_report).__name__}")
 
@@ -1573,6 +1776,8 @@ def _execute_check_workflow(
     ``--dry-run`` reports what the fixers would change, writes nothing, and
     skips the re-check: with no writes there is nothing new to find.
     """
+    from portolan_cli.validation import annotate_survivors, build_check_payload, run_check
+
     validate_metadata = _should_validate(path, run_metadata=run_metadata, fix=fix)
     check_kwargs: dict[str, Any] = {
         "data": data,
@@ -1818,7 +2023,9 @@ def _run_fix_and_repairs(
     Returns:
         The JSON ``fix`` section and whether a fix failed.
     """
+    from portolan_cli.metadata.fix import FixReport
     from portolan_cli.scan.check import resolve_catalog_root_for_check
+    from portolan_cli.validation import build_fix_payload
     from portolan_cli.validation.fixers import apply_fixers
 
     fixer_report = FixReport()
@@ -1848,6 +2055,11 @@ def _run_fix_and_repairs(
         workers=workers,
     )
 
+    if not dry_run:
+        from portolan_cli.catalog_index import refresh_catalog_index
+
+        refresh_catalog_index(resolve_catalog_root_for_check(path) or path, None)
+
     if not use_json:
         _output_fix_human(
             metadata_fix_report=fixer_report,
@@ -2122,6 +2334,27 @@ def _handle_fix_mode(
     is_flag=True,
     help="Treat warnings as errors (exit 1 on any warning or error)",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Directories listed concurrently ahead of the scan (default: 8; use 1 for "
+    "sequential). Helps most on network filesystems.",
+)
+@click.option(
+    "--probe-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Processes validating COGs and reading Parquet footers (default: one per "
+    "CPU core; use 1 to inspect inline).",
+)
+@click.option(
+    "--incremental/--no-incremental",
+    default=None,
+    help="Reuse directory listings and format checks from the previous scan for "
+    "unchanged paths (default: scan.incremental setting, off)",
+)
 @click.pass_context
 def scan(
     ctx: click.Context,
@@ -2138,6 +2371,9 @@ def scan(
     fix: bool,
     dry_run: bool,
     strict: bool,
+    workers: int | None,
+    probe_workers: int | None,
+    incremental: bool | None,
 ) -> None:
     """Scan a directory for geospatial files and potential issues.
 
@@ -2170,6 +2406,8 @@ def scan(
         portolan scan /data --fix --dry-run
 
         portolan scan /data --fix
+
+        portolan scan /data --incremental    # Only re-check what changed
     """
     use_json = should_output_json(ctx, json_output)
 
@@ -2195,6 +2433,9 @@ def scan(
         show_all=show_all,
         suggest_collections=suggest_collections,
         strict=strict,
+        incremental=resolve_incremental(path, incremental),
+        workers=workers,
+        probe_workers=probe_workers,
     )
 
     # Pre-count directories only when progress will be displayed
@@ -2946,6 +3187,38 @@ def _resolve_catalog_root_for_add(
     return detected_root
 
 
+def _validate_add_workers(
+    workers: int,
+    executor: str,
+    *,
+    reconvert: bool,
+    force: bool,
+    use_json: bool,
+) -> PrepareExecutor:
+    """Validate the add options that shape how files are processed.
+
+    Args:
+        workers: Value of --workers.
+        executor: Value of --executor, in any case.
+        reconvert: Whether --reconvert was passed.
+        force: Whether --force was passed.
+        use_json: Whether to output errors as JSON.
+
+    Returns:
+        The executor add_files runs --workers on.
+
+    Raises:
+        SystemExit: If --workers is below 1 or --reconvert lacks --force.
+    """
+    if workers < 1:
+        emit_error("add", "UsageError", "--workers must be at least 1", use_json=use_json)
+        raise SystemExit(1)
+    if reconvert and not force:
+        emit_error("add", "UsageError", "--reconvert requires --force", use_json=use_json)
+        raise SystemExit(1)
+    return "process" if executor.lower() == "process" else "thread"
+
+
 def _validate_item_id_usage(
     item_id: str | None,
     paths: tuple[Path, ...],
@@ -3071,6 +3344,16 @@ def _check_partition_prompt(
         "Default is 1 (sequential). Use higher values for large catalogs."
     ),
 )
+@click.option(
+    "--executor",
+    type=click.Choice(["thread", "process"], case_sensitive=False),
+    default="thread",
+    help=(
+        "How --workers run: 'thread' (default) overlaps file reads; 'process' "
+        "also spreads item building across CPU cores, which helps most when "
+        "adding many small files."
+    ),
+)
 @click.option(
     "--stac-geoparquet",
     "generate_parquet",
@@ -3144,6 +3427,7 @@ def add_cmd(
     catalog_path: Path | None,
     item_datetime: datetime | None,
     workers: int,
+    executor: str,
     generate_parquet: bool,
     generate_pmtiles: bool,
     force_pmtiles: bool,
@@ -3206,12 +3490,13 @@ def add_cmd(
             partitioning.prompt: true/false (default: true)
             partitioning.threshold_gb: size in GB (default: 2.0)
     """
-    use_json = should_output_json(ctx, json_output)
+    from portolan_cli.add import add_files
+    from portolan_cli.stac import MergeStrategy
 
-    # Validate --reconvert requires --force
-    if reconvert and not force:
-        emit_error("add", "UsageError", "--reconvert requires --force", use_json=use_json)
-        raise SystemExit(1)
+    use_json = should_output_json(ctx, json_output)
+    prepare_executor = _validate_add_workers(
+        workers, executor, reconvert=reconvert, force=force, use_json=use_json
+    )
 
     # Resolve and validate catalog root (git-style auto-detection)
     catalog_root = _resolve_catalog_root_for_add(catalog_path, use_json)
@@ -3292,6 +3577,7 @@ def add_cmd(
                 reconvert=reconvert,
                 skip_partitioning=skip_partitioning,
                 merge_strategy=MergeStrategy(merge_strategy),
+                executor=prepare_executor,
             )
     except MissingLicenseError as err:
         # Issue #686: a collection with no license fails PTL-LIC-001/002 the moment
@@ -7604,6 +7890,7 @@ def version() -> None:
         list      List all versions of a collection
         rollback  Rollback to a previous version (iceberg only)
         prune     Remove old versions (iceberg only)
+        compact   Store versions.json as deltas between snapshots
     """
 
 
@@ -8059,6 +8346,91 @@ def prune(
                 detail(f"  {v.version}  {timestamp}")
 
 
+@version.command()
+@click.argument("collection", required=False)
+@click.option(
+    "--checkpoint-interval",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Store a full snapshot every N versions (default: 32).",
+)
+@click.option(
+    "--catalog",
+    "catalog_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Path to catalog root (default: auto-detect).",
+)
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON.")
+@click.pass_context
+def compact(
+    ctx: click.Context,
+    collection: str | None,
+    checkpoint_interval: int | None,
+    catalog_path: Path | None,
+    json_output: bool,
+) -> None:
+    """Rewrite versions.json to store changes between snapshots.
+
+    Most versions then record only the assets that changed since the one
+    before them, with a full snapshot every --checkpoint-interval versions.
+    Every version keeps its assets. The file is marked spec 1.1.0 and
+    later writes keep the layout; Portolan releases older than that cannot
+    read it. --checkpoint-interval 1 restores full snapshots. Compacts
+    every collection when COLLECTION is omitted.
+
+    \b
+    Examples:
+        portolan version compact                       # All collections
+        portolan version compact boundaries
+        portolan version compact boundaries --checkpoint-interval 8
+    """
+    from portolan_cli.sync.push import discover_collections
+    from portolan_cli.versions import VERSIONS_CHECKPOINT_INTERVAL, compact_versions
+
+    use_json = should_output_json(ctx, json_output)
+
+    if catalog_path is None:
+        catalog_path = require_catalog_root(use_json, "version compact")
+
+    collections = [collection] if collection else discover_collections(catalog_path)
+
+    results = []
+    for coll in collections:
+        try:
+            result = compact_versions(
+                catalog_path / coll / "versions.json",
+                checkpoint_interval=checkpoint_interval or VERSIONS_CHECKPOINT_INTERVAL,
+            )
+        except (FileNotFoundError, ValueError) as e:
+            emit_error("version compact", type(e).__name__, f"{coll}: {e}", use_json=use_json)
+            raise SystemExit(1) from None
+        results.append((coll, result))
+
+    if not emit_success(
+        "version compact",
+        {
+            "collections": [
+                {
+                    "collection": coll,
+                    "versions": result.version_count,
+                    "bytes_before": result.bytes_before,
+                    "bytes_after": result.bytes_after,
+                }
+                for coll, result in results
+            ]
+        },
+        use_json=use_json,
+    ):
+        if not results:
+            info_output("No collections found")
+        for coll, result in results:
+            success(
+                f"Compacted '{coll}': {format_size(result.bytes_before)} -> "
+                f"{format_size(result.bytes_after)} ({result.version_count} versions)"
+            )
+
+
 # =============================================================================
 # STAC GeoParquet Command
 # =============================================================================
@@ -69,6 +69,7 @@ KNOWN_SETTINGS: frozenset[str] = frozenset(
         "pmtiles.attribution",  # Attribution HTML for tiles
         "pmtiles.src_crs",  # Override source CRS if metadata is incorrect
         "push.exclude",  # Glob patterns to exclude from metadata sync (Issue #426)
+        "scan.incremental",  # Reuse the previous scan's listings and format probes
         "tabular.enabled",  # Track non-geo tabular data as collection assets (Issue #432)
         "tabular.convert",  # Convert CSV/TSV/Excel to Parquet (default: true)
     }
@@ -104,6 +105,7 @@ DEFAULT_SETTINGS: dict[str, Any] = {
     "pmtiles.precision": 6,  # Coordinate decimal precision
     "pmtiles.attribution": None,  # None = geoparquet-io default
     "pmtiles.src_crs": None,  # None = use metadata CRS
+    "scan.incremental": False,  # Full scan unless opted in
     # Push exclusion patterns for metadata sync (Issue #426)
     # These files/directories are never synced to remote storage.
     # Note: Security-critical patterns (.env, .git/, .portolan/) are also
@@ -40,6 +40,7 @@ from portolan_cli.formats import (
     detect_format,
     get_cloud_native_status,
 )
+from portolan_cli.tracing import traced
 from portolan_cli.viz.thumbnail import (
     ThumbnailConfig,
     generate_vector_thumbnail,
@@ -1007,6 +1008,7 @@ def _validate_cog(path: Path) -> str | None:
 # Note: GEOSPATIAL_EXTENSIONS imported from portolan_cli.constants
 
 
+@traced("convert_directory", measure=lambda r: (r.total, 0))
 def convert_directory(
     path: Path,
     output_dir: Path | None = None,
@@ -341,7 +341,9 @@ JUNK_DIRS: frozenset[str] = frozenset(
     }
 )
 
-STAC_FILENAMES: frozenset[str] = frozenset({"catalog.json", "collection.json", "versions.json"})
+STAC_FILENAMES: frozenset[str] = frozenset(
+    {"catalog.json", "collection.json", "versions.json", "portolan-manifest.json"}
+)
 
 STYLE_FILENAMES: frozenset[str] = frozenset({"style.json"})
 
@@ -24,6 +24,9 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import time
+from collections.abc import Container, Iterable
 from pathlib import Path, PurePath
 from typing import Any
 
@@ -31,9 +34,10 @@ import pystac
 from pystac.layout import AsIsLayoutStrategy
 
 from portolan_cli.config import load_merged_metadata
+from portolan_cli.constants import MTIME_TOLERANCE_SECONDS, PORTOLAN_DIR
 from portolan_cli.formats import FormatType
 from portolan_cli.humanize import humanize_slug
-from portolan_cli.json_io import write_json_atomic
+from portolan_cli.json_io import read_json_files, write_json_atomic
 from portolan_cli.metadata import extract_geoparquet_metadata
 from portolan_cli.metadata.geoparquet import GeoParquetMetadata
 from portolan_cli.preparation import PreparedItem
@@ -56,6 +60,7 @@ from portolan_cli.stac import (
     update_catalog_provenance,
     update_collection_summaries,
 )
+from portolan_cli.tracing import traced
 from portolan_cli.utils import href_root, relative_href
 from portolan_cli.versions import (
     Asset,
@@ -74,11 +79,19 @@ logger = logging.getLogger(__name__)
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _deduplicate_collection_item_links(collection: pystac.Collection) -> None:
+def _deduplicate_collection_item_links(
+    collection: pystac.Collection,
+    at_rest: dict[str, dict[str, Any]] | None = None,
+) -> None:
     """De-duplicate item links in a PySTAC collection.
 
     PySTAC adds duplicate links when the same item is added multiple times.
     This modifies collection.links in place.
+
+    Args:
+        collection: The collection whose links to de-duplicate.
+        at_rest: Items read by :func:`_read_items_at_rest`. Their unresolved
+            links are keyed by item ID, as a resolved link would be.
     """
     seen_item_ids: set[str] = set()
     unique_links: list[pystac.Link] = []
@@ -88,6 +101,8 @@ def _deduplicate_collection_item_links(collection: pystac.Collection) -> None:
             target = link.target
             if isinstance(target, pystac.Item):
                 item_id_key = target.id
+            elif at_rest and isinstance(target, str) and target in at_rest:
+                item_id_key = at_rest[target]["id"]
             else:
                 # If target is a string (href), use it directly
                 item_id_key = str(target) if target else ""
@@ -185,6 +200,7 @@ def _fix_item_links(
     collection_json_path: Path,
     catalog_root: Path,
     collection_dir: Path,
+    at_rest: Container[str] = (),
 ) -> None:
     """Repoint the structural links of every item this collection owns.
 
@@ -203,6 +219,8 @@ def _fix_item_links(
         collection_json_path: The saved ``collection.json``, read for item links.
         catalog_root: Directory holding the root ``catalog.json``.
         collection_dir: Directory holding ``collection.json``.
+        at_rest: Hrefs of items this save left alone because their links are
+            already correct; they are not rewritten.
     """
     if not collection_json_path.exists():
         return
@@ -212,25 +230,29 @@ def _fix_item_links(
         if link.get("rel") != "item":
             continue
         href = link.get("href", "")
-        if not href:
+        if not href or href in at_rest:
             continue
         item_path = (collection_dir / href).resolve()
         if not item_path.exists():
             continue
 
         item_data = json.loads(item_path.read_text(encoding="utf-8"))
-        item_dir = item_path.parent
-        item_links: list[dict[str, Any]] = item_data.setdefault("links", [])
-        collection_href = relative_href(item_dir, collection_dir / "collection.json")
-
-        _set_structural_link(
-            item_links, "root", relative_href(item_dir, catalog_root / "catalog.json")
-        )
-        _set_structural_link(item_links, "parent", collection_href)
-        _set_structural_link(item_links, "collection", collection_href)
+        _relink_item(item_data, item_path.parent, catalog_root, collection_dir)
         write_json_atomic(item_path, item_data)
 
 
+def _relink_item(
+    item_data: dict[str, Any], item_dir: Path, catalog_root: Path, collection_dir: Path
+) -> None:
+    """Set the root, parent and collection links :func:`_fix_item_links` writes."""
+    item_links: list[dict[str, Any]] = item_data.setdefault("links", [])
+    collection_href = relative_href(item_dir, collection_dir / "collection.json")
+
+    _set_structural_link(item_links, "root", relative_href(item_dir, catalog_root / "catalog.json"))
+    _set_structural_link(item_links, "parent", collection_href)
+    _set_structural_link(item_links, "collection", collection_href)
+
+
 def _update_catalog_links(catalog_root: Path, collection_id: str) -> None:
     """Ensure the catalog tree has a child link down to this collection.
 
@@ -259,6 +281,7 @@ def _save_collection_with_links(
     collection_dir: Path,
     catalog_root: Path,
     collection_id: str,
+    at_rest: dict[str, dict[str, Any]] | None = None,
 ) -> None:
     """Save collection and fix links.
 
@@ -267,15 +290,24 @@ def _save_collection_with_links(
         collection_dir: Collection directory path.
         catalog_root: Catalog root path.
         collection_id: Collection identifier.
+        at_rest: Items read by :func:`_read_items_at_rest`. Their links stay
+            unresolved, so ``save`` writes only the other items.
     """
-    _deduplicate_collection_item_links(collection)
+    _deduplicate_collection_item_links(collection, at_rest)
+    if at_rest is not None:
+        # normalize_hrefs resolves these unless told to skip unresolved links,
+        # and a resolved link takes its title from the catalog it points at.
+        for link in collection.links:
+            if link.rel in (pystac.RelType.ROOT, pystac.RelType.PARENT) and not link.is_resolved():
+                link.resolve_stac_object(root=collection.get_root())
     collection.set_self_href(str(collection_dir / "collection.json"))
-    collection.normalize_hrefs(href_root(collection_dir), strategy=AsIsLayoutStrategy())
+    layout, skip = AsIsLayoutStrategy(), at_rest is not None
+    collection.normalize_hrefs(href_root(collection_dir), strategy=layout, skip_unresolved=skip)
     collection.save(catalog_type=pystac.CatalogType.SELF_CONTAINED)
 
     collection_json_path = collection_dir / "collection.json"
     _fix_collection_links(collection_json_path, catalog_root, collection_dir)
-    _fix_item_links(collection_json_path, catalog_root, collection_dir)
+    _fix_item_links(collection_json_path, catalog_root, collection_dir, at_rest or ())
     _update_catalog_links(catalog_root, collection_id)
 
     # Scaffold AGENTS.md and add the rel="agents" link (rashid PTL-FIL-002).
@@ -286,12 +318,262 @@ def _save_collection_with_links(
     ensure_agents_md(collection_json_path)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Items at rest
+# ─────────────────────────────────────────────────────────────────────────────
+
+FAST_FINALIZE_ENV_VAR = "PORTOLAN_FAST_FINALIZE"
+
+# Items verified at rest, inside the collection's .portolan/ directory.
+AT_REST_INDEX_FILENAME = "items-at-rest.json"
+
+# Bumped whenever the index layout changes; a mismatched file is ignored.
+_AT_REST_INDEX_VERSION = 1
+
+# (size, mtime_ns, inode) — the stat an item had when it was verified.
+_StatKey = tuple[int, int, int]
+
+
+def _fast_finalize_enabled() -> bool:
+    value = os.environ.get(FAST_FINALIZE_ENV_VAR, "").strip().lower()
+    return value not in ("0", "false", "no", "off")
+
+
+def _read_items_at_rest(
+    collection: pystac.Collection,
+    collection_dir: Path,
+    catalog_root: Path,
+) -> dict[str, dict[str, Any]] | None:
+    """Read the collection's existing items as JSON, when saving would not change them.
+
+    Finalizing through PySTAC resolves every linked item, summarizes it, and
+    saves and relinks it, so adding one file to a collection of thousands
+    rewrote thousands of item files (issue #281 batched the collection writes,
+    not these). An item that already is what that round trip writes can be
+    summarized from its JSON and left alone, and the collection comes out the
+    same.
+
+    Whether an item is at rest is PySTAC's call (:func:`_saves_unchanged`), which
+    costs about what saving it does. Verdicts are kept in
+    ``.portolan/items-at-rest.json`` against each item's ``(size, mtime_ns,
+    inode)``, so an unchanged item is checked once, not on every finalize. Every
+    item is still read: summaries and the extent are computed from all of them.
+
+    Links the batch added, and existing links to a file the batch replaced, are
+    in memory already; the latter are pointed at the new item, as PySTAC's
+    resolution cache would do.
+
+    Args:
+        collection: The collection, with this batch's items added.
+        collection_dir: Directory holding ``collection.json``.
+        catalog_root: Catalog root path.
+
+    Returns:
+        Item JSON keyed by the href of its unresolved link, or None when any
+        item would be rewritten (or the collection has children), which needs
+        the PySTAC path.
+    """
+    if not _fast_finalize_enabled():
+        return None
+    if collection.get_child_links():
+        return None
+    extension_rels = pystac.EXTENSION_HOOKS.get_extended_object_links(collection)
+    if set(extension_rels) & {link.rel for link in collection.links}:
+        return None
+    # Items are re-rooted on the catalog the collection's root link resolves to
+    root = collection.get_root()
+    root_href = root.get_self_href() if root is not None else None
+    if root is None or root_href is None:
+        return None
+    if Path(os.path.normpath(root_href)) != catalog_root / "catalog.json":
+        return None
+    # The save below makes the root self-contained, which decides how item
+    # links are written; set it first so verified items match that save.
+    root.catalog_type = pystac.CatalogType.SELF_CONTAINED
+
+    paths = _unresolved_item_paths(collection)
+    context = _at_rest_context(collection, root)
+    known = _read_at_rest_index(collection_dir, context)
+    verified: dict[str, _StatKey] = {}
+    items: dict[str, dict[str, Any]] = {}
+    try:
+        for href, (item_path, data) in zip(paths, read_json_files(paths.values()), strict=True):
+            stat_key = _at_rest_stat(
+                data, item_path, known.get(href), collection, collection_dir, catalog_root
+            )
+            if stat_key is None:
+                logger.debug("Item %s would be rewritten; finalizing through PySTAC", item_path)
+                return None
+            # A file written in the same mtime tick as this stat could change
+            # without its stat doing so; only older files are remembered.
+            if time.time() - stat_key[1] / 1e9 >= MTIME_TOLERANCE_SECONDS:
+                verified[href] = stat_key
+            items[href] = data
+    except (OSError, ValueError):
+        return None
+    if verified != known:
+        _write_at_rest_index(collection_dir, context, verified)
+    return items
+
+
+def _unresolved_item_paths(collection: pystac.Collection) -> dict[str, Path]:
+    """Map the href of each unresolved item link to the file it points at.
+
+    A link to a file this batch replaced is pointed at the new in-memory item
+    instead, as PySTAC's resolution cache would do, and left out.
+    """
+    added: dict[str, pystac.Item] = {}
+    for link in collection.get_item_links():
+        target = link.target
+        if isinstance(target, pystac.Item) and target.self_href is not None:
+            added[os.path.normpath(target.self_href)] = target
+
+    paths: dict[str, Path] = {}
+    for link in collection.get_item_links():
+        if not isinstance(link.target, str):
+            continue
+        path = os.path.normpath(link.get_absolute_href() or link.target)
+        if path in added:
+            link.target = added[path]
+        else:
+            paths[link.target] = Path(path)
+    return paths
+
+
+def _at_rest_stat(
+    data: Any,
+    item_path: Path,
+    known: _StatKey | None,
+    collection: pystac.Collection,
+    collection_dir: Path,
+    catalog_root: Path,
+) -> _StatKey | None:
+    """The item's stat key if it is at rest, else None.
+
+    An item whose stat matches ``known``, its key in the at-rest index, is
+    not checked again.
+
+    Raises:
+        OSError: If the item cannot be stat'ed.
+    """
+    st = item_path.stat()
+    stat_key = (st.st_size, st.st_mtime_ns, st.st_ino)
+    if known == stat_key or _saves_unchanged(
+        data, item_path, collection, collection_dir, catalog_root
+    ):
+        return stat_key
+    return None
+
+
+def _saves_unchanged(
+    data: Any,
+    item_path: Path,
+    collection: pystac.Collection,
+    collection_dir: Path,
+    catalog_root: Path,
+) -> bool:
+    """Whether resolving, saving and relinking the item writes ``data`` back.
+
+    Runs the PySTAC path for one item without writing it: resolved through an
+    item link owned by ``collection`` (which migrates it and sets its root and
+    parent), serialized as ``save`` does, then relinked by
+    :func:`_relink_item`. What PySTAC changes on the way is left to PySTAC.
+    """
+    if not isinstance(data, dict) or data.get("collection") != collection.id:
+        return False
+    link = pystac.Link(pystac.RelType.ITEM, str(item_path), media_type=pystac.MediaType.JSON)
+    link.set_owner(collection)
+    try:
+        item = link.resolve_stac_object(root=collection.get_root()).target
+    except pystac.STACError:
+        return False
+    if not isinstance(item, pystac.Item):
+        return False
+    try:
+        written = json.loads(json.dumps(item.to_dict(include_self_link=False)))
+    finally:
+        # Resolution cached the item on the root; the save must not find it there
+        item.set_root(None)
+    _relink_item(written, item_path.parent, catalog_root, collection_dir)
+    return bool(written == data)
+
+
+def _at_rest_context(collection: pystac.Collection, root: pystac.Catalog) -> list[Any]:
+    """What an at-rest verdict depends on besides the item; a change voids the index."""
+    return [pystac.__version__, collection.id, collection.title, root.title]
+
+
+def _read_at_rest_index(collection_dir: Path, context: list[Any]) -> dict[str, _StatKey]:
+    """Load the verified items, treating a missing, malformed or stale index as empty."""
+    path = collection_dir / PORTOLAN_DIR / AT_REST_INDEX_FILENAME
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _AT_REST_INDEX_VERSION:
+        return {}
+    if data.get("context") != context:
+        return {}
+    try:
+        return {
+            str(href): (int(size), int(mtime_ns), int(inode))
+            for href, (size, mtime_ns, inode) in data["items"].items()
+        }
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return {}
+
+
+def _write_at_rest_index(
+    collection_dir: Path, context: list[Any], verified: dict[str, _StatKey]
+) -> None:
+    path = collection_dir / PORTOLAN_DIR / AT_REST_INDEX_FILENAME
+    try:
+        write_json_atomic(
+            path,
+            {
+                "version": _AT_REST_INDEX_VERSION,
+                "context": context,
+                "items": {href: list(key) for href, key in sorted(verified.items())},
+            },
+        )
+    except OSError as exc:
+        logger.debug("Could not write %s: %s", path, exc)
+
+
+def _linked_items(
+    collection: pystac.Collection, at_rest: dict[str, dict[str, Any]]
+) -> list[pystac.Item | dict[str, Any]]:
+    """The collection's items in link order: in-memory ones, else their JSON."""
+    items: list[pystac.Item | dict[str, Any]] = []
+    for link in collection.get_item_links():
+        target = link.target
+        items.append(target if isinstance(target, pystac.Item) else at_rest[str(target)])
+    return items
+
+
+def _item_properties(item: pystac.Item | dict[str, Any]) -> dict[str, Any]:
+    if isinstance(item, pystac.Item):
+        return item.properties
+    properties: dict[str, Any] = item["properties"]
+    return properties
+
+
+def _item_assets(item: pystac.Item | dict[str, Any]) -> list[dict[str, Any]]:
+    """The item's assets as dicts of their extension fields, ``file:size`` among them."""
+    if isinstance(item, pystac.Item):
+        return [asset.extra_fields for asset in item.assets.values()]
+    return list(item["assets"].values())
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Spatial extent recomputation
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _gather_collection_bboxes(collection: pystac.Collection) -> list[list[float]]:
+def _gather_collection_bboxes(
+    collection: pystac.Collection,
+    at_rest: dict[str, dict[str, Any]] | None = None,
+) -> list[list[float]]:
     """Collect all candidate bboxes for a collection's spatial extent (issue #516).
 
     Gathers bboxes from linked items, collection-level assets (``proj:bbox``),
@@ -300,6 +582,8 @@ def _gather_collection_bboxes(collection: pystac.Collection) -> list[list[float]
 
     Args:
         collection: The pystac Collection to read bboxes from.
+        at_rest: Items read by :func:`_read_items_at_rest`, which stand in for
+            the targets of their unresolved links.
 
     Returns:
         List of bboxes (each a ``[minx, miny, maxx, maxy]`` list).
@@ -307,11 +591,17 @@ def _gather_collection_bboxes(collection: pystac.Collection) -> list[list[float]
     all_bboxes: list[list[float]] = []
 
     # Get bboxes from linked items
-    for link in collection.links:
-        if link.rel == "item" and hasattr(link, "target") and link.target is not None:
-            item = link.target
-            if hasattr(item, "bbox") and item.bbox is not None:
-                all_bboxes.append(list(item.bbox))
+    if at_rest is not None:
+        for item in _linked_items(collection, at_rest):
+            bbox = item.bbox if isinstance(item, pystac.Item) else item.get("bbox")
+            if bbox is not None:
+                all_bboxes.append(list(bbox))
+    else:
+        for link in collection.links:
+            if link.rel == "item" and hasattr(link, "target") and link.target is not None:
+                target = link.target
+                if hasattr(target, "bbox") and target.bbox is not None:
+                    all_bboxes.append(list(target.bbox))
 
     # Get bboxes from collection-level assets (if they have proj:bbox)
     if collection.assets:
@@ -330,7 +620,10 @@ def _gather_collection_bboxes(collection: pystac.Collection) -> list[list[float]
     return all_bboxes
 
 
-def _recompute_collection_extent_with_multibbox(collection: pystac.Collection) -> None:
+def _recompute_collection_extent_with_multibbox(
+    collection: pystac.Collection,
+    at_rest: dict[str, dict[str, Any]] | None = None,
+) -> None:
     """Recompute collection spatial extent with anti-meridian handling (issue #516).
 
     Collects all item and asset bboxes from the collection and recomputes the
@@ -341,10 +634,11 @@ def _recompute_collection_extent_with_multibbox(collection: pystac.Collection) -
 
     Args:
         collection: The pystac Collection to update.
+        at_rest: Items read by :func:`_read_items_at_rest`.
     """
     from portolan_cli.bbox import compute_bbox_union
 
-    all_bboxes = _gather_collection_bboxes(collection)
+    all_bboxes = _gather_collection_bboxes(collection, at_rest)
     if not all_bboxes:
         return  # No bboxes to process
 
@@ -1061,13 +1355,22 @@ def _finalize_collection(
     # Add partition extension if any items have partition metadata (Issue #232/#443)
     _emit_partition_warnings(collection, collection_dir, items)
 
+    # Existing items a save would leave unchanged are read as JSON and not
+    # resolved, re-saved and relinked through PySTAC; None if any would change.
+    at_rest = _read_items_at_rest(collection, collection_dir, catalog_root)
+    linked = _linked_items(collection, at_rest) if at_rest is not None else None
+
     # Compute collection summaries from items
     # Moved here from push.py for separation of concerns - summaries are now
     # available immediately after add, not just after push.
-    update_collection_summaries(collection)
+    update_collection_summaries(
+        collection, None if linked is None else [_item_properties(i) for i in linked]
+    )
 
     # Declare the file extension the assets use (Issue #501, narrowed by #654)
-    declare_file_extension(collection)
+    declare_file_extension(
+        collection, None if linked is None else [a for i in linked for a in _item_assets(i)]
+    )
 
     # Add extension declarations based on summaries (Issue #336)
     # Collections should declare extensions used by their items
@@ -1075,10 +1378,10 @@ def _finalize_collection(
         add_collection_extensions_from_summaries(collection, collection.summaries.to_dict())
 
     # Issue #516: Recompute spatial extent with anti-meridian handling
-    _recompute_collection_extent_with_multibbox(collection)
+    _recompute_collection_extent_with_multibbox(collection, at_rest)
 
     # Save collection.json ONCE for all items in this collection
-    _save_collection_with_links(collection, collection_dir, catalog_root, collection_id)
+    _save_collection_with_links(collection, collection_dir, catalog_root, collection_id, at_rest)
 
     # Route version snapshot to the active backend (plugin or file)
     _publish_collection_version(catalog_root, collection_id, collection_dir, collection, items)
@@ -1096,10 +1399,13 @@ def _finalize_collection(
     ]
 
 
+@traced("finalize_items", measure=lambda r: (len(r), 0))
 def finalize_items(
     catalog_root: Path,
     prepared: list[PreparedItem],
     merge_strategy: MergeStrategy = MergeStrategy.SMART,
+    *,
+    finish: bool = True,
 ) -> list[ItemInfo]:
     """Finalize prepared items by writing versions.json and collection.json.
 
@@ -1110,6 +1416,9 @@ def finalize_items(
         catalog_root: Root directory of the catalog.
         prepared: List of PreparedItem objects from prepare_item().
         merge_strategy: How to merge auto-detected metadata with existing values.
+        finish: Run :func:`finish_finalization` for the written collections.
+            A caller finalizing one collection at a time passes False and
+            calls it once after the last one.
 
     Returns:
         List of ItemInfo for each finalized item.
@@ -1128,6 +1437,19 @@ def finalize_items(
     for collection_id, items in by_collection.items():
         results.extend(_finalize_collection(catalog_root, collection_id, items, merge_strategy))
 
+    if finish:
+        finish_finalization(catalog_root, by_collection)
+
+    return results
+
+
+def finish_finalization(catalog_root: Path, collection_ids: Iterable[str]) -> None:
+    """Catalog-wide sweeps run once after a batch of collections is written.
+
+    Args:
+        catalog_root: Root directory of the catalog.
+        collection_ids: The collections the batch wrote.
+    """
     # Issue #502: backfill human-readable titles onto child/item links so STAC
     # Browser renders names without fetching every child. Done once per batch
     # (O(catalog), not per-collection) after all collections are written.
@@ -1150,4 +1472,6 @@ def finalize_items(
     # time itself. Needs the whole tree, so it runs after the last collection.
     update_catalog_provenance(catalog_root)
 
-    return results
+    from portolan_cli.catalog_index import refresh_catalog_index
+
+    refresh_catalog_index(catalog_root, collection_ids)
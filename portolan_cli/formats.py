@@ -12,13 +12,20 @@ Additionally, it provides cloud-native status classification (see issue #10):
 
 from __future__ import annotations
 
+import codecs
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, Any
 
 from portolan_cli import extension_registry as _reg
+from portolan_cli.constants import MTIME_TOLERANCE_SECONDS
 
 if TYPE_CHECKING:
     from portolan_cli.conversion_config import ConversionOverrides
@@ -104,21 +111,7 @@ def is_valid_parquet(path: Path) -> bool:
     Returns:
         True if the file is a valid Parquet file, False if corrupted or not Parquet.
     """
-    try:
-        import pyarrow.parquet as pq
-    except ImportError:
-        logger.warning(
-            "pyarrow not installed; cannot validate Parquet. Install with: pip install pyarrow"
-        )
-        return False
-
-    try:
-        # Just read metadata - fast and validates the file structure
-        pq.read_metadata(str(path))
-        return True
-    except Exception:
-        # File is corrupted or not a valid Parquet file
-        return False
+    return probe(path).valid_parquet
 
 
 def is_geoparquet(path: Path) -> bool:
@@ -135,23 +128,7 @@ def is_geoparquet(path: Path) -> bool:
         Note: Returns False for both non-geo Parquet AND invalid/corrupted files.
         Use is_valid_parquet() first if you need to distinguish these cases.
     """
-    try:
-        import pyarrow.parquet as pq
-    except ImportError:
-        logger.warning(
-            "pyarrow not installed; cannot detect GeoParquet metadata. "
-            "Install with: pip install pyarrow"
-        )
-        return False
-
-    try:
-        metadata = pq.read_metadata(str(path))
-        schema_metadata = metadata.schema.to_arrow_schema().metadata or {}
-        # GeoParquet files have 'geo' key in schema metadata
-        return b"geo" in schema_metadata
-    except Exception:
-        logger.exception("Failed to read Parquet metadata from %s", path)
-        return False
+    return probe(path).geoparquet
 
 
 def is_cloud_optimized_geotiff(path: Path, *, quiet: bool = True) -> bool:
@@ -163,29 +140,18 @@ def is_cloud_optimized_geotiff(path: Path, *, quiet: bool = True) -> bool:
     Args:
         path: Path to the TIFF file.
         quiet: If True, suppress rio-cogeo's warning output to stdout.
-            Default is True to avoid polluting JSON output.
+            Default is True to avoid polluting JSON output. Quiet checks
+            share the cached ``probe()`` result.
 
     Returns:
         True if the file is a valid COG, False otherwise.
     """
-    try:
-        from rio_cogeo.cogeo import cog_validate
-    except ImportError:
-        logger.warning(
-            "rio-cogeo not installed; cannot validate COG. Install with: pip install rio-cogeo"
-        )
-        return False
-
-    try:
-        # Use quiet=True to suppress rio-cogeo's warning output to stdout
-        is_valid, _errors, _warnings = cog_validate(str(path), quiet=quiet)
-        return is_valid
-    except Exception:
-        logger.exception("Failed to validate COG for %s", path)
-        return False
+    if not quiet:
+        return _validate_cog(path, quiet=False)
+    return probe(path).cog is True
 
 
-def get_cloud_native_status(path: Path) -> FormatInfo:
+def get_cloud_native_status(path: Path, *, probed: FormatProbe | None = None) -> FormatInfo:
     """Determine cloud-native status and format info for a file.
 
     Classifies a file as CLOUD_NATIVE, CONVERTIBLE, or UNSUPPORTED based on
@@ -194,6 +160,8 @@ def get_cloud_native_status(path: Path) -> FormatInfo:
 
     Args:
         path: Path to the file to classify.
+        probed: ``probe(path)``, if the caller already has it. Content
+            inspection otherwise goes through ``probe()`` itself.
 
     Returns:
         FormatInfo with status, display name, target format, and error message.
@@ -227,51 +195,59 @@ def get_cloud_native_status(path: Path) -> FormatInfo:
             error_message=None,
         )
 
-    # Check for cloud-native formats (extension-based)
-    if extension in CLOUD_NATIVE_EXTENSIONS:
-        display_name = FORMAT_DISPLAY_NAMES.get(extension, extension.upper().lstrip("."))
-        return FormatInfo(
-            status=CloudNativeStatus.CLOUD_NATIVE,
-            display_name=display_name,
-            target_format=None,
-            error_message=None,
-        )
+    if extension in _PROBED_EXTENSIONS:
+        return _probed_format_info(extension, probed or probe(path))
 
-    # Check Parquet files - need content inspection for geo metadata
+    by_extension = _extension_format_info(extension)
+    if by_extension is not None:
+        return by_extension
+
+    # Unknown format - treat as unsupported
+    if extension:
+        error_msg = f"Unknown format '{extension}' is not supported."
+    else:
+        error_msg = "File has no extension and format could not be detected."
+    return FormatInfo(
+        status=CloudNativeStatus.UNSUPPORTED,
+        display_name=extension.upper().lstrip(".") if extension else "Unknown",
+        target_format=None,
+        error_message=error_msg,
+    )
+
+
+# Extensions whose status depends on the file's content rather than its name.
+_PROBED_EXTENSIONS: frozenset[str] = frozenset({".parquet", ".tif", ".tiff", ".json"})
+
+
+def _probed_format_info(extension: str, probed: FormatProbe) -> FormatInfo:
+    """Classify a ``_PROBED_EXTENSIONS`` file from its content probe."""
+    # Parquet: first check the file is valid at all (not corrupted), then
+    # whether it carries geo metadata.
     if extension == ".parquet":
-        # First check if the file is a valid Parquet (not corrupted)
-        if not is_valid_parquet(path):
+        if not probed.valid_parquet:
             return FormatInfo(
                 status=CloudNativeStatus.UNSUPPORTED,
                 display_name="Corrupted Parquet",
                 target_format=None,
                 error_message="File has .parquet extension but is not a valid Parquet file",
             )
-        if is_geoparquet(path):
-            return FormatInfo(
-                status=CloudNativeStatus.CLOUD_NATIVE,
-                display_name="GeoParquet",
-                target_format=None,
-                error_message=None,
-            )
         # Plain Parquet is also cloud-native (just not geo-aware)
         return FormatInfo(
             status=CloudNativeStatus.CLOUD_NATIVE,
-            display_name="Parquet",
+            display_name="GeoParquet" if probed.geoparquet else "Parquet",
             target_format=None,
             error_message=None,
         )
 
-    # Check TIFF files - need content inspection for COG validation
+    # TIFF: COG validation; a non-COG TIFF is convertible
     if extension in (".tif", ".tiff"):
-        if is_cloud_optimized_geotiff(path):
+        if probed.cog:
             return FormatInfo(
                 status=CloudNativeStatus.CLOUD_NATIVE,
                 display_name="COG",
                 target_format=None,
                 error_message=None,
             )
-        # Non-COG TIFF is convertible
         return FormatInfo(
             status=CloudNativeStatus.CONVERTIBLE,
             display_name="TIFF",
@@ -279,71 +255,65 @@ def get_cloud_native_status(path: Path) -> FormatInfo:
             error_message=None,
         )
 
-    # Check for unsupported formats (before convertible to catch .laz)
-    if extension in UNSUPPORTED_EXTENSIONS:
-        display_name = FORMAT_DISPLAY_NAMES.get(extension, extension.upper().lstrip("."))
-        error_message = UNSUPPORTED_ERROR_MESSAGES.get(
-            extension,
-            f"{display_name} is not yet supported. Support coming soon.",
-        )
-        return FormatInfo(
-            status=CloudNativeStatus.UNSUPPORTED,
-            display_name=display_name,
-            target_format=None,
-            error_message=error_message,
-        )
-
-    # Check for convertible vector formats
-    if extension in CONVERTIBLE_VECTOR_EXTENSIONS:
-        display_name = FORMAT_DISPLAY_NAMES.get(extension, extension.upper().lstrip("."))
+    # .json files might be GeoJSON
+    if probed.json_type == FormatType.VECTOR:
         return FormatInfo(
             status=CloudNativeStatus.CONVERTIBLE,
-            display_name=display_name,
+            display_name="GeoJSON",
             target_format="GeoParquet",
             error_message=None,
         )
+    # .json file doesn't appear to be GeoJSON - provide clear message
+    return FormatInfo(
+        status=CloudNativeStatus.UNSUPPORTED,
+        display_name="JSON",
+        target_format=None,
+        error_message=(
+            "JSON file does not appear to be GeoJSON. "
+            "Rename to .geojson if it contains geospatial data, "
+            "or use a supported format."
+        ),
+    )
+
+
+def _extension_format_info(extension: str) -> FormatInfo | None:
+    """Classify a file from its extension alone, or None if it is not listed."""
+    display_name = FORMAT_DISPLAY_NAMES.get(extension, extension.upper().lstrip("."))
 
-    # Check for convertible raster formats
-    if extension in CONVERTIBLE_RASTER_EXTENSIONS:
-        display_name = FORMAT_DISPLAY_NAMES.get(extension, extension.upper().lstrip("."))
+    # Check for cloud-native formats (extension-based)
+    if extension in CLOUD_NATIVE_EXTENSIONS:
         return FormatInfo(
-            status=CloudNativeStatus.CONVERTIBLE,
+            status=CloudNativeStatus.CLOUD_NATIVE,
             display_name=display_name,
-            target_format="COG",
+            target_format=None,
             error_message=None,
         )
 
-    # Check for .json files (might be GeoJSON)
-    if extension == ".json":
-        if _detect_json_type(path) == FormatType.VECTOR:
-            return FormatInfo(
-                status=CloudNativeStatus.CONVERTIBLE,
-                display_name="GeoJSON",
-                target_format="GeoParquet",
-                error_message=None,
-            )
-        # .json file doesn't appear to be GeoJSON - provide clear message
+    # Check for unsupported formats (before convertible to catch .laz)
+    if extension in UNSUPPORTED_EXTENSIONS:
+        error_message = UNSUPPORTED_ERROR_MESSAGES.get(
+            extension,
+            f"{display_name} is not yet supported. Support coming soon.",
+        )
         return FormatInfo(
             status=CloudNativeStatus.UNSUPPORTED,
-            display_name="JSON",
+            display_name=display_name,
             target_format=None,
-            error_message=(
-                "JSON file does not appear to be GeoJSON. "
-                "Rename to .geojson if it contains geospatial data, "
-                "or use a supported format."
-            ),
+            error_message=error_message,
         )
 
-    # Unknown format - treat as unsupported
-    if extension:
-        error_msg = f"Unknown format '{extension}' is not supported."
+    # Check for convertible vector and raster formats
+    if extension in CONVERTIBLE_VECTOR_EXTENSIONS:
+        target_format: str | None = "GeoParquet"
+    elif extension in CONVERTIBLE_RASTER_EXTENSIONS:
+        target_format = "COG"
     else:
-        error_msg = "File has no extension and format could not be detected."
+        return None
     return FormatInfo(
-        status=CloudNativeStatus.UNSUPPORTED,
-        display_name=extension.upper().lstrip(".") if extension else "Unknown",
-        target_format=None,
-        error_message=error_msg,
+        status=CloudNativeStatus.CONVERTIBLE,
+        display_name=display_name,
+        target_format=target_format,
+        error_message=None,
     )
 
 
@@ -452,6 +422,233 @@ VECTOR_EXTENSIONS: frozenset[str] = _reg.extensions_where(routes_as="vector")
 RASTER_EXTENSIONS: frozenset[str] = _reg.extensions_where(routes_as="raster")
 
 
+# =============================================================================
+# Single-Open Format Probe
+# =============================================================================
+
+
+class FileSignature(Enum):
+    """Container format identified from a file's leading magic bytes."""
+
+    PARQUET = "parquet"
+    TIFF = "tiff"
+    OTHER = "other"
+
+
+class _DeferredCog:
+    """``FormatProbe.cog``: a bool, None, or a validation run on first access.
+
+    rio-cogeo validation reads the TIFF's IFDs and is by far the costliest
+    check a probe makes, while most probes of a TIFF only need its signature.
+    As a data descriptor this keeps ``cog=`` a constructor argument and part of
+    equality, yet lets ``_probe_file`` pass the check instead of its result.
+    """
+
+    def __set_name__(self, _owner: type, name: str) -> None:
+        self._attr = f"_{name}"
+
+    def __get__(self, obj: object, _objtype: type | None = None) -> bool | None:
+        if obj is None:
+            return None  # The dataclass field default
+        value: bool | Callable[[], bool] | None = obj.__dict__[self._attr]
+        if callable(value):
+            value = bool(value())
+            obj.__dict__[self._attr] = value
+        return value
+
+    def __set__(self, obj: object, value: bool | Callable[[], bool] | None) -> None:
+        obj.__dict__[self._attr] = value
+
+
+@dataclass(frozen=True)
+class FormatProbe:
+    """Everything content inspection learns about a file from one open.
+
+    Attributes:
+        signature: Container identified from the leading magic bytes.
+        valid_parquet: PyArrow could read the Parquet footer.
+        geoparquet: The Parquet footer carries GeoParquet ``geo`` metadata.
+        cog: Result of rio-cogeo validation for TIFFs; None for other files.
+            Computed on first access.
+        json_type: VECTOR if the text prefix holds GeoJSON type tokens (and no
+            ``stac_version``), UNKNOWN otherwise.
+    """
+
+    signature: FileSignature
+    valid_parquet: bool = False
+    geoparquet: bool = False
+    cog: _DeferredCog = _DeferredCog()
+    json_type: FormatType = FormatType.UNKNOWN
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to JSON-compatible primitives."""
+        return {
+            "signature": self.signature.value,
+            "valid_parquet": self.valid_parquet,
+            "geoparquet": self.geoparquet,
+            "cog": self.cog,
+            "json_type": self.json_type.value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FormatProbe:
+        """Inverse of :meth:`to_dict`.
+
+        Raises:
+            KeyError, ValueError: If ``data`` is not a serialized probe.
+        """
+        return cls(
+            signature=FileSignature(data["signature"]),
+            valid_parquet=bool(data["valid_parquet"]),
+            geoparquet=bool(data["geoparquet"]),
+            cog=None if data["cog"] is None else bool(data["cog"]),
+            json_type=FormatType(data["json_type"]),
+        )
+
+
+# Leading bytes read by probe(): covers the magic and the GeoJSON sniff window.
+_PROBE_HEAD_BYTES = 8192
+
+_PARQUET_MAGIC = b"PAR1"
+# Classic and BigTIFF, little- and big-endian.
+_TIFF_MAGIC: frozenset[bytes] = frozenset({b"II*\x00", b"MM\x00*", b"II+\x00", b"MM\x00+"})
+
+# GeoJSON type tokens searched for in the file prefix.
+_GEOJSON_TYPE_TOKENS: tuple[str, ...] = tuple(
+    token
+    for geojson_type in (
+        "FeatureCollection",
+        "Feature",
+        "Point",
+        "MultiPoint",
+        "LineString",
+        "MultiLineString",
+        "Polygon",
+        "MultiPolygon",
+        "GeometryCollection",
+    )
+    for token in (f'"type":"{geojson_type}"', f'"type": "{geojson_type}"')
+)
+
+# Probes kept per process, keyed by (path, size, mtime_ns, inode).
+_PROBE_CACHE_MAX_ENTRIES = 65_536
+_probe_cache: OrderedDict[tuple[str, int, int, int], FormatProbe] = OrderedDict()
+_probe_cache_lock = threading.Lock()
+
+
+def probe(path: Path) -> FormatProbe:
+    """Inspect a file's content once and return an immutable format record.
+
+    Opens the file a single time: the leading 8KB give the magic bytes and
+    the GeoJSON sniff window, and a Parquet footer is read through the same
+    handle. TIFFs are additionally validated by rio-cogeo, which opens the
+    file itself, when the record's ``cog`` is first read. Unreadable files
+    yield a record with every check negative.
+
+    Results are cached per process while the file's ``(size, mtime_ns,
+    inode)`` is unchanged, so scan, check, add and info share one inspection
+    per file. As with the checksum cache, files modified within
+    ``MTIME_TOLERANCE_SECONDS`` of now are not cached: a rewrite landing in
+    the same mtime tick would otherwise return a stale record.
+
+    Args:
+        path: File to inspect.
+
+    Returns:
+        The file's FormatProbe.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return FormatProbe(FileSignature.OTHER)
+    key = (os.fspath(path), st.st_size, st.st_mtime_ns, st.st_ino)
+    with _probe_cache_lock:
+        cached = _probe_cache.get(key)
+        if cached is not None:
+            _probe_cache.move_to_end(key)
+            return cached
+
+    result = _probe_file(path)
+    if time.time() - st.st_mtime_ns / 1_000_000_000 >= MTIME_TOLERANCE_SECONDS:
+        with _probe_cache_lock:
+            _probe_cache[key] = result
+            if len(_probe_cache) > _PROBE_CACHE_MAX_ENTRIES:
+                _probe_cache.popitem(last=False)
+    return result
+
+
+def _probe_file(path: Path) -> FormatProbe:
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_PROBE_HEAD_BYTES)
+            if head[:4] == _PARQUET_MAGIC:
+                valid, geo = _read_parquet_footer(f, path)
+                return FormatProbe(FileSignature.PARQUET, valid_parquet=valid, geoparquet=geo)
+    except OSError:
+        return FormatProbe(FileSignature.OTHER)
+
+    if head[:4] in _TIFF_MAGIC:
+        return FormatProbe(FileSignature.TIFF, cog=lambda: _validate_cog(path, quiet=True))
+    return FormatProbe(FileSignature.OTHER, json_type=_json_type_from_prefix(head))
+
+
+def _read_parquet_footer(f: IO[bytes], path: Path) -> tuple[bool, bool]:
+    """Return (readable, has geo metadata) for the Parquet file open as ``f``."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        logger.warning(
+            "pyarrow not installed; cannot validate Parquet. Install with: pip install pyarrow"
+        )
+        return False, False
+
+    try:
+        metadata = pq.read_metadata(f)
+    except Exception:
+        # File is corrupted or not a valid Parquet file
+        return False, False
+    try:
+        schema_metadata = metadata.schema.to_arrow_schema().metadata or {}
+    except Exception:
+        logger.exception("Failed to read Parquet metadata from %s", path)
+        return True, False
+    # GeoParquet files have 'geo' key in schema metadata
+    return True, b"geo" in schema_metadata
+
+
+def _validate_cog(path: Path, *, quiet: bool) -> bool:
+    try:
+        from rio_cogeo.cogeo import cog_validate
+    except ImportError:
+        logger.warning(
+            "rio-cogeo not installed; cannot validate COG. Install with: pip install rio-cogeo"
+        )
+        return False
+
+    try:
+        # Use quiet=True to suppress rio-cogeo's warning output to stdout
+        is_valid, _errors, _warnings = cog_validate(str(path), quiet=quiet)
+        return bool(is_valid)
+    except Exception:
+        logger.exception("Failed to validate COG for %s", path)
+        return False
+
+
+def _json_type_from_prefix(head: bytes) -> FormatType:
+    try:
+        # A multi-byte character may straddle the end of the window.
+        prefix = codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        # Binary file with .json extension
+        return FormatType.UNKNOWN
+    # STAC metadata has stac_version - NOT GeoJSON
+    if "stac_version" in prefix:
+        return FormatType.UNKNOWN
+    if any(token in prefix for token in _GEOJSON_TYPE_TOKENS):
+        return FormatType.VECTOR
+    return FormatType.UNKNOWN
+
+
 def detect_format(path: Path) -> FormatType:
     """Detect whether a file is vector, raster, or unknown.
 
@@ -617,8 +814,8 @@ def is_multilayer(path: Path) -> bool:
 def _detect_json_type(path: Path) -> FormatType:
     """Check if a .json file is GeoJSON.
 
-    Uses prefix reading (first 8KB) to avoid OOM on large files.
-    Searches for GeoJSON type tokens without full JSON parsing.
+    Looks for GeoJSON type tokens in the first 8KB (see ``probe()``) instead of
+    parsing the whole file, to avoid OOM on large files.
 
     STAC items/collections/catalogs are NOT GeoJSON even though they have
     "type": "Feature". They are identified by "stac_version".
@@ -629,38 +826,4 @@ def _detect_json_type(path: Path) -> FormatType:
     Returns:
         VECTOR if GeoJSON, UNKNOWN otherwise.
     """
-    # GeoJSON type tokens to search for in file prefix
-    geojson_tokens = (
-        '"type":"FeatureCollection"',
-        '"type": "FeatureCollection"',
-        '"type":"Feature"',
-        '"type": "Feature"',
-        '"type":"Point"',
-        '"type": "Point"',
-        '"type":"MultiPoint"',
-        '"type": "MultiPoint"',
-        '"type":"LineString"',
-        '"type": "LineString"',
-        '"type":"MultiLineString"',
-        '"type": "MultiLineString"',
-        '"type":"Polygon"',
-        '"type": "Polygon"',
-        '"type":"MultiPolygon"',
-        '"type": "MultiPolygon"',
-        '"type":"GeometryCollection"',
-        '"type": "GeometryCollection"',
-    )
-    try:
-        # Read only first 8KB to avoid OOM on large files
-        with open(path, encoding="utf-8") as f:
-            prefix = f.read(8192)
-            # STAC metadata has stac_version - NOT GeoJSON
-            if "stac_version" in prefix:
-                return FormatType.UNKNOWN
-            if any(token in prefix for token in geojson_tokens):
-                return FormatType.VECTOR
-    except (OSError, UnicodeDecodeError):
-        # OSError: permission denied, file not found, etc.
-        # UnicodeDecodeError: binary file with .json extension
-        pass
-    return FormatType.UNKNOWN
+    return probe(path).json_type
@@ -0,0 +1,180 @@
+"""Per-module import timing for the running command (PORTOLAN_PROFILE_IMPORTS).
+
+With ``PORTOLAN_PROFILE_IMPORTS`` set, ``portolan_cli/__init__.py`` installs a
+meta-path finder before anything else is imported. Every module loaded from
+then on is timed, and at exit the command line is reported with the modules
+that cost the most, like ``python -X importtime`` but scoped to portolan:
+
+    PORTOLAN_PROFILE_IMPORTS=1 portolan list          # table on stderr
+    PORTOLAN_PROFILE_IMPORTS=imports.json portolan list  # JSON report
+
+Modules already imported by the interpreter before portolan_cli are not seen.
+This module imports only the standard library, since it runs before the rest
+of the package.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib.abc
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+PROFILE_IMPORTS_ENV_VAR = "PORTOLAN_PROFILE_IMPORTS"
+
+# Rows printed in the stderr table; the JSON report lists every module.
+_REPORT_TOP_N = 25
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """Timing of one module's execution.
+
+    Attributes:
+        module: Fully qualified module name.
+        self_seconds: Time spent in the module's own body.
+        cumulative_seconds: Self time plus the imports it triggered.
+    """
+
+    module: str
+    self_seconds: float
+    cumulative_seconds: float
+
+
+class _TimedLoader:
+    """Delegates to a module's real loader, timing ``exec_module``."""
+
+    def __init__(self, loader: Any, profiler: ImportProfiler) -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        create = getattr(self._loader, "create_module", None)
+        return create(spec) if create is not None else None
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler._timed_exec(self._loader, module)
+
+    def __getattr__(self, name: str) -> Any:
+        # get_source, is_package, get_resource_reader, ...
+        return getattr(self._loader, name)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Meta-path finder that wraps each found module's loader with a timer.
+
+    Args:
+        clock: Monotonic seconds; ``time.perf_counter`` unless a test supplies one.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.records: list[ImportRecord] = []
+        self._clock = clock
+        # Per thread: child-import time accumulated by each module being executed
+        self._local = threading.local()
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Any = None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find = getattr(finder, "find_spec", None)
+            if find is None:
+                continue
+            spec: ModuleSpec | None = find(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)  # type: ignore[assignment]
+        return spec
+
+    def _timed_exec(self, loader: Any, module: ModuleType) -> None:
+        stack: list[float] = self._local.__dict__.setdefault("stack", [])
+        stack.append(0.0)
+        start = self._clock()
+        try:
+            loader.exec_module(module)
+        finally:
+            cumulative = self._clock() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += cumulative
+            self.records.append(ImportRecord(module.__name__, cumulative - children, cumulative))
+
+    def report(self, command: str) -> dict[str, Any]:
+        """Build the JSON-compatible report, most expensive modules first."""
+        records = sorted(self.records, key=lambda r: r.self_seconds, reverse=True)
+        return {
+            "command": command,
+            "module_count": len(records),
+            "total_seconds": sum(r.self_seconds for r in records),
+            "modules": [
+                {
+                    "module": r.module,
+                    "self_seconds": r.self_seconds,
+                    "cumulative_seconds": r.cumulative_seconds,
+                }
+                for r in records
+            ],
+        }
+
+
+def format_report(report: dict[str, Any], *, top_n: int = _REPORT_TOP_N) -> list[str]:
+    """Render a report as table lines for stderr."""
+    lines = [
+        f"Import profile for `{report['command']}`: {report['module_count']} modules, "
+        f"{report['total_seconds'] * 1000:.0f} ms",
+        f"{'self ms':>10} {'cumulative ms':>14}  module",
+    ]
+    for row in report["modules"][:top_n]:
+        lines.append(
+            f"{row['self_seconds'] * 1000:>10.1f} {row['cumulative_seconds'] * 1000:>14.1f}  "
+            f"{row['module']}"
+        )
+    return lines
+
+
+def _write_report(profiler: ImportProfiler, destination: str) -> None:
+    report = profiler.report(" ".join(["portolan", *sys.argv[1:]]))
+    if destination.lower().endswith(".json"):
+        # Stdlib-only like this module, and loaded long before exit
+        from portolan_cli.json_io import write_json_atomic
+
+        write_json_atomic(Path(destination), report)
+        return
+    for line in format_report(report):
+        print(line, file=sys.stderr)
+
+
+def install_from_env() -> ImportProfiler | None:
+    """Start profiling imports if ``PORTOLAN_PROFILE_IMPORTS`` asks for it.
+
+    A value ending in ``.json`` names the file the report is written to; any
+    other value except ``0``/``false``/``no``/``off`` prints it to stderr.
+
+    Returns:
+        The installed profiler, or None when profiling is off.
+    """
+    value = os.environ.get(PROFILE_IMPORTS_ENV_VAR, "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return None
+    if any(isinstance(finder, ImportProfiler) for finder in sys.meta_path):
+        return None
+    profiler = ImportProfiler()
+    sys.meta_path.insert(0, profiler)
+    atexit.register(_write_report, profiler, value)
+    return profiler
@@ -15,11 +15,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from portolan_cli.catalog_index import IndexedCollection, open_catalog_index
 from portolan_cli.formats import FormatType, detect_format
 from portolan_cli.metadata.cog import extract_cog_metadata
 from portolan_cli.metadata.geoparquet import extract_geoparquet_metadata
 from portolan_cli.stac_parquet import count_items
-from portolan_cli.versions import read_versions
+from portolan_cli.versions import read_versions_head
 
 
 @dataclass
@@ -335,19 +336,12 @@ def _lookup_version(path: Path, catalog_root: Path) -> str | None:
         return None
 
     try:
-        versions_file = read_versions(versions_path)
+        head = read_versions_head(versions_path)
     except (ValueError, FileNotFoundError):
         return None
 
-    if versions_file.current_version is None:
-        return None
-
     # Check if file is in the current version's assets
-    current_version_obj = next(
-        (v for v in versions_file.versions if v.version == versions_file.current_version),
-        None,
-    )
-
+    current_version_obj = head.current
     if current_version_obj is None:
         return None
 
@@ -359,19 +353,59 @@ def _lookup_version(path: Path, catalog_root: Path) -> str | None:
     for asset_name, _asset in current_version_obj.assets.items():
         # Check item-scoped key format (new format)
         if item_id and asset_name == f"{item_id}/{filename}":
-            return f"v{versions_file.current_version}"
+            return f"v{head.current_version}"
         # Check legacy format (just filename)
         if asset_name == filename:
-            return f"v{versions_file.current_version}"
+            return f"v{head.current_version}"
 
     return None
 
 
-def inspect_collection(collection_path: Path) -> CollectionInfo:
+def _indexed_collection(
+    collection_path: Path, catalog_root: Path | None
+) -> IndexedCollection | None:
+    if catalog_root is None:
+        return None
+    try:
+        collection_id = collection_path.resolve().relative_to(catalog_root.resolve()).as_posix()
+    except ValueError:
+        return None
+    index = open_catalog_index(catalog_root)
+    if index is None:
+        return None
+    with index:
+        return index.collection(collection_id)
+
+
+def _count_items_and_size(collection_path: Path) -> tuple[int, int]:
+    # Count items the collection owns, descending organizing catalogs (core.md:168-170)
+    item_count = count_items(collection_path)
+
+    # Calculate total size from versions.json
+    total_size = 0
+    versions_path = collection_path / "versions.json"
+    if versions_path.exists():
+        try:
+            current = read_versions_head(versions_path).latest
+            if current is not None:
+                total_size = sum(asset.size_bytes for asset in current.assets.values())
+        except (ValueError, FileNotFoundError):
+            pass
+    return item_count, total_size
+
+
+def inspect_collection(
+    collection_path: Path, *, catalog_root: Path | None = None
+) -> CollectionInfo:
     """Inspect a STAC collection and extract metadata.
 
+    With ``catalog_root``, the item count and total size come from the catalog
+    index (see ``catalog_index``) instead of walking item links and reading the
+    whole version history.
+
     Args:
         collection_path: Path to the collection directory.
+        catalog_root: Optional root of the catalog the collection belongs to.
 
     Returns:
         CollectionInfo with collection metadata.
@@ -385,20 +419,12 @@ def inspect_collection(collection_path: Path) -> CollectionInfo:
 
     data = json.loads(collection_json_path.read_text(encoding="utf-8"))
 
-    # Count items the collection owns, descending organizing catalogs (core.md:168-170)
-    item_count = count_items(collection_path)
-
-    # Calculate total size from versions.json
-    total_size = 0
-    versions_path = collection_path / "versions.json"
-    if versions_path.exists():
-        try:
-            versions_file = read_versions(versions_path)
-            if versions_file.versions:
-                current = versions_file.versions[-1]
-                total_size = sum(asset.size_bytes for asset in current.assets.values())
-        except (ValueError, FileNotFoundError):
-            pass
+    indexed = _indexed_collection(collection_path, catalog_root)
+    if indexed is not None:
+        item_count = indexed.item_count
+        total_size = indexed.total_size_bytes
+    else:
+        item_count, total_size = _count_items_and_size(collection_path)
 
     # Extract bbox from extent
     bbox = None
@@ -1,22 +1,123 @@
-"""Atomic JSON writing shared by every module that persists STAC/Portolan JSON.
+"""JSON reading and atomic writing shared by every module that handles STAC/Portolan JSON.
 
 One helper, :func:`write_json_atomic`, so that every JSON file Portolan writes
 lands the same way: UTF-8, two-space indent, unescaped non-ASCII, a trailing
 newline, and an atomic ``os.replace`` so an interrupted write can never leave a
 half-written ``collection.json`` behind.
 
-Deliberately stdlib-only, so validation and generation paths alike can import it
-without dragging ``click``/``rich``/``config`` into a leaf module.
+On the read side, :func:`read_json_files` is the shared loader for
+catalog-wide traversals (listing items, building ``items.parquet``, metadata
+scans): it reads files ahead on a thread pool and yields them in order, so a
+100k-item catalog is I/O-parallel instead of one ``open`` at a time.
+
+Deliberately stdlib-only (``orjson`` is used when importable, never required),
+so validation and generation paths alike can import it without dragging
+``click``/``rich``/``config`` into a leaf module.
 """
 
 from __future__ import annotations
 
 import json
 import os
+import re
 import tempfile
+from collections import deque
+from collections.abc import Generator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:  # Optional fast decoder; comes in transitively with stac-geoparquet
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+# Upper bound on loader threads: reads release the GIL, decoding does not, so
+# past this more threads only add contention.
+_MAX_READ_WORKERS = 16
+
+# Files read ahead per worker; bounds memory to a few dozen documents per
+# thread however large the catalog is.
+_READ_AHEAD_PER_WORKER = 4
+
+# orjson reads integers wider than 64 bits as floats instead of rejecting
+# them; any such literal has at least 20 digits, so documents with a run that
+# long go to the standard library (a false positive only costs speed).
+_LONG_DIGIT_RUN = re.compile(rb"\d{20}")
+
+
+def loads_json(data: bytes) -> Any:
+    """Decode a JSON document, with ``orjson`` when it is installed.
+
+    Results match :func:`json.loads`: documents ``orjson`` would read
+    differently (integers wider than 64 bits) or rejects while the standard
+    library accepts them (``NaN``) are decoded with :mod:`json`, which also
+    raises the usual :class:`json.JSONDecodeError` for documents that are
+    genuinely malformed.
+    """
+    if orjson is not None and _LONG_DIGIT_RUN.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def read_json_file(path: Path) -> Any:
+    """Read and decode one JSON file (see :func:`loads_json`)."""
+    return loads_json(path.read_bytes())
+
+
+def _read_json_or_none(path: Path) -> Any:
+    try:
+        return read_json_file(path)
+    except (OSError, ValueError):
+        return None
+
+
+def read_json_files(
+    paths: Iterable[Path], *, max_workers: int | None = None, strict: bool = True
+) -> Generator[tuple[Path, Any], None, None]:
+    """Read many JSON files on a thread pool, yielding them in input order.
+
+    A bounded window of files is read ahead while the caller consumes earlier
+    ones, so the result streams: memory stays proportional to the window, not
+    to the catalog, and ``paths`` may itself be a lazy iterator.
+
+    Args:
+        paths: Files to read.
+        max_workers: Thread count. Defaults to ``os.cpu_count()`` capped at
+            ``_MAX_READ_WORKERS``; ``1`` reads inline.
+        strict: When True, a missing, unreadable or malformed file raises its
+            ``OSError``/``ValueError`` at that file's position in the stream,
+            as a serial loop would. When False, such files yield ``None``.
+
+    Yields:
+        ``(path, document)`` tuples, one per input path.
+    """
+    load = read_json_file if strict else _read_json_or_none
+    workers = max_workers or min(_MAX_READ_WORKERS, os.cpu_count() or 1)
+    if workers == 1:
+        for path in paths:
+            yield path, load(path)
+        return
+
+    window: deque[tuple[Path, Future[Any]]] = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="json-read") as executor:
+        try:
+            for path in paths:
+                window.append((path, executor.submit(load, path)))
+                if len(window) >= workers * _READ_AHEAD_PER_WORKER:
+                    head, future = window.popleft()
+                    yield head, future.result()
+            while window:
+                head, future = window.popleft()
+                yield head, future.result()
+        finally:
+            # Early exit (an error, or the caller stopping): drop unread files
+            for _, future in window:
+                future.cancel()
+
 
 def write_json_atomic(path: Path, data: Any) -> None:
     """Serialize ``data`` to ``path`` as JSON, atomically.
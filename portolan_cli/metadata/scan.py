@@ -23,6 +23,7 @@ from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from portolan_cli.json_io import read_json_files
 from portolan_cli.metadata.detection import (
     check_file_metadata,
     detect_changes,
@@ -158,12 +159,47 @@ def _scan_collection(collection_dir: Path, report: MetadataReport) -> None:
         if result is not None:
             report.results.append(result)
 
-    for sub in _iter_significant_subdirs(collection_dir):
-        _scan_collection_child(sub, collection_dir, registered, report)
+    _scan_children(collection_dir, collection_dir, registered, report)
 
     _emit_orphans(collection_dir, registered, report)
 
 
+def _item_json_path(child: Path) -> Path | None:
+    """The item JSON of ``child`` if it is an item directory, else None."""
+    if (child / "catalog.json").exists() or (child / "collection.json").exists():
+        return None
+    item_json_path = child / f"{child.name}.json"
+    return item_json_path if item_json_path.exists() else None
+
+
+def _scan_children(
+    parent: Path,
+    collection_dir: Path,
+    registered: set[Path],
+    report: MetadataReport,
+) -> None:
+    """Scan the significant subdirectories of ``parent`` in sorted order.
+
+    The item JSON of every item directory among them is read ahead on the
+    shared JSON loader's thread pool, so a collection of thousands of items is
+    not read one file at a time; results are consumed in the same order.
+    """
+    children = [(sub, _item_json_path(sub)) for sub in _iter_significant_subdirs(parent)]
+    items = read_json_files(
+        (item_json_path for _sub, item_json_path in children if item_json_path is not None),
+        strict=False,
+    )
+    try:
+        for sub, item_json_path in children:
+            if item_json_path is None:
+                _scan_collection_child(sub, collection_dir, registered, report)
+            else:
+                _, item = next(items)
+                _scan_item(item_json_path, item, sub, collection_dir, registered, report)
+    finally:
+        items.close()
+
+
 def _scan_collection_child(
     child: Path,
     collection_dir: Path,
@@ -174,8 +210,7 @@ def _scan_collection_child(
         # Pattern 2 sub-catalog under a collection: organize items by year,
         # theme, etc. The DATA-OWNING unit is still `collection_dir`, so
         # versions.json + item assets are resolved against it.
-        for grandchild in _iter_significant_subdirs(child):
-            _scan_collection_child(grandchild, collection_dir, registered, report)
+        _scan_children(child, collection_dir, registered, report)
         _emit_orphans(child, registered, report)
         return
 
@@ -187,11 +222,8 @@ def _scan_collection_child(
         _scan_collection(child, report)
         return
 
+    # Item directories (``<child>/<child>.json``) are handled by _scan_children
     item_id = child.name
-    item_json_path = child / f"{item_id}.json"
-    if item_json_path.exists():
-        _scan_item(item_json_path, child, collection_dir, registered, report)
-        return
 
     # Heuristic: a subdir is treated as an item-needing-JSON only if it
     # contains a data file whose stem matches the dir name (the convention
@@ -221,14 +253,14 @@ def _scan_collection_child(
 
 def _scan_item(
     item_json_path: Path,
+    item: Any,
     item_dir: Path,
     collection_dir: Path,
     registered: set[Path],
     report: MetadataReport,
 ) -> None:
     registered.add(item_json_path.resolve())
-    item = _safe_read_json(item_json_path)
-    if item is None:
+    if not isinstance(item, dict):
         return
 
     for asset in item.get("assets", {}).values():
@@ -1,22 +1,36 @@
-"""Catalog query API: list items, get item info, freshness checks."""
+"""Catalog query API: list and search items, get item info, freshness checks."""
 
 from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
+from rashid.catalog import is_absolute_href
+
+from portolan_cli.catalog_index import (
+    CatalogIndex,
+    IndexedItem,
+    item_matches,
+    item_time_range,
+    open_catalog_index,
+    parse_timestamp,
+)
 from portolan_cli.constants import (
     MTIME_TOLERANCE_SECONDS,
 )
 from portolan_cli.formats import (
     FormatType,
 )
+from portolan_cli.json_io import read_json_files
+from portolan_cli.stac_parquet import PARQUET_FILENAME, owned_item_hrefs
 from portolan_cli.sync.checksums import compute_checksum, compute_dir_checksum
 from portolan_cli.versions import (
-    read_versions,
+    read_versions_head,
 )
 
 logger = logging.getLogger(__name__)
@@ -47,6 +61,49 @@ class ItemInfo:
     datetime: datetime | None = None
 
 
+def _format_type(asset_hrefs: list[str]) -> FormatType:
+    """Format of an item, from the extension of its last data asset."""
+    format_type = FormatType.UNKNOWN
+    for href in asset_hrefs:
+        if href.endswith(".parquet"):
+            format_type = FormatType.VECTOR
+        elif href.endswith(".tif"):
+            format_type = FormatType.RASTER
+    return format_type
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    timestamp = parse_timestamp(value)
+    return None if timestamp is None else datetime.fromtimestamp(timestamp, timezone.utc)
+
+
+def _item_info(collection_id: str, item: IndexedItem) -> ItemInfo:
+    return ItemInfo(
+        item_id=item.item_id,
+        collection_id=collection_id,
+        format_type=_format_type(item.asset_hrefs),
+        bbox=item.bbox if item.bbox is not None else [0, 0, 0, 0],
+        asset_paths=item.asset_hrefs,
+        title=item.title,
+        description=item.description,
+        datetime=_parse_datetime(item.start_datetime),
+    )
+
+
+def _item_info_from_json(collection_id: str, item_id: str, item_data: dict[str, Any]) -> ItemInfo:
+    asset_paths = [asset.get("href", "") for asset in item_data.get("assets", {}).values()]
+    return ItemInfo(
+        item_id=item_data.get("id", item_id),
+        collection_id=collection_id,
+        format_type=_format_type(asset_paths),
+        bbox=item_data.get("bbox", [0, 0, 0, 0]),
+        asset_paths=asset_paths,
+        title=item_data.get("properties", {}).get("title"),
+        description=item_data.get("properties", {}).get("description"),
+        datetime=_parse_datetime(item_time_range(item_data.get("properties", {}))[0]),
+    )
+
+
 def list_items(
     catalog_root: Path,
     collection_id: str | None = None,
@@ -66,6 +123,17 @@ def list_items(
     if not catalog_path.exists():
         return []
 
+    index = open_catalog_index(catalog_root)
+    try:
+        return _list_items(catalog_root, collection_id, index)
+    finally:
+        if index is not None:
+            index.close()
+
+
+def _list_items(
+    catalog_root: Path, collection_id: str | None, index: CatalogIndex | None
+) -> list[ItemInfo]:
     items: list[ItemInfo] = []
 
     # Scan root-level directories for collections
@@ -87,9 +155,15 @@ def list_items(
         if not collection_path.exists():
             continue
 
+        indexed = index.items(col_id) if index is not None else None
+        if indexed is not None:
+            items.extend(_item_info(col_id, item) for item in indexed)
+            continue
+
         # Load collection to get items
         collection_data = json.loads(collection_path.read_text(encoding="utf-8"))
 
+        linked: list[tuple[str, Path]] = []
         for link in collection_data.get("links", []):
             if link.get("rel") != "item":
                 continue
@@ -99,39 +173,209 @@ def list_items(
             # href is like ./item-id/item-id.json
             item_id = item_href.split("/")[1] if "/" in item_href else item_href
 
-            # Load item
             item_path = col_dir / item_href.removeprefix("./")
-            if not item_path.exists():
+            if item_path.exists():
+                linked.append((item_id, item_path))
+
+        # Load items on the shared thread pool, in link order
+        loaded = read_json_files(item_path for _item_id, item_path in linked)
+        for (item_id, _item_path), (_, item_data) in zip(linked, loaded, strict=True):
+            items.append(_item_info_from_json(col_id, item_id, item_data))
+
+    return items
+
+
+def search_items(
+    catalog_root: Path,
+    *,
+    bbox: tuple[float, float, float, float] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    properties: Mapping[str, Any] | None = None,
+    collection_id: str | None = None,
+) -> list[ItemInfo]:
+    """Find the items matching every given filter.
+
+    Collections are those reachable through the child links of the root
+    catalog.json. Each is answered from the catalog index when it is
+    available, else from its items.parquet mirror when that is current, else
+    by reading the item JSONs. Item JSONs that cannot be read are skipped.
+
+    Args:
+        catalog_root: Root directory of the catalog.
+        bbox: ``(min_x, min_y, max_x, max_y)``; matches items whose bbox
+            intersects it, edges included.
+        start: Matches items whose time range ends at or after it.
+        end: Matches items whose time range starts at or before it.
+            Naive datetimes are taken as UTC.
+        properties: Item properties that must be present with equal values.
+        collection_id: Optional collection to search alone.
+
+    Returns:
+        Matching items, by collection and then in link order.
+    """
+    catalog_path = catalog_root / "catalog.json"
+    if not catalog_path.exists():
+        return []
+
+    start_ts = _epoch_seconds(start)
+    end_ts = _epoch_seconds(end)
+    wanted = dict(properties) if properties else None
+
+    items: list[ItemInfo] = []
+    index = open_catalog_index(catalog_root)
+    try:
+        for col_id in _linked_collections(catalog_root):
+            if collection_id and col_id != collection_id:
+                continue
+            indexed = (
+                index.search(col_id, bbox=bbox, start=start_ts, end=end_ts, properties=wanted)
+                if index is not None
+                else None
+            )
+            if indexed is not None:
+                items.extend(_item_info(col_id, item) for item in indexed)
                 continue
 
-            item_data = json.loads(item_path.read_text(encoding="utf-8"))
-
-            # Determine format from assets
-            format_type = FormatType.UNKNOWN
-            asset_paths: list[str] = []
-            for _asset_key, asset in item_data.get("assets", {}).items():
-                href = asset.get("href", "")
-                asset_paths.append(href)
-                if href.endswith(".parquet"):
-                    format_type = FormatType.VECTOR
-                elif href.endswith(".tif"):
-                    format_type = FormatType.RASTER
-
-            items.append(
-                ItemInfo(
-                    item_id=item_data.get("id", item_id),
-                    collection_id=col_id,
-                    format_type=format_type,
-                    bbox=item_data.get("bbox", [0, 0, 0, 0]),
-                    asset_paths=asset_paths,
-                    title=item_data.get("properties", {}).get("title"),
-                    description=item_data.get("properties", {}).get("description"),
+            col_dir = catalog_root / col_id
+            owned = owned_item_hrefs(col_dir / "collection.json")
+            matched: Iterable[Any] | None = _search_items_parquet(col_dir, owned, bbox)
+            if matched is None:
+                matched = (
+                    item_data
+                    for _item_path, item_data in read_json_files(
+                        (path for _href, path in owned), strict=False
+                    )
                 )
+            items.extend(
+                _item_info_from_json(col_id, str(item_data.get("id", "")), item_data)
+                for item_data in matched
+                if item_matches(item_data, bbox=bbox, start=start_ts, end=end_ts, properties=wanted)
             )
-
+    finally:
+        if index is not None:
+            index.close()
     return items
 
 
+def _epoch_seconds(value: datetime | None) -> float | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _linked_collections(catalog_root: Path) -> list[str]:
+    """Catalog-relative paths of the collections linked from the root catalog.
+
+    Follows ``child`` links depth-first: a child collection.json is a
+    collection, a child catalog.json a sub-catalog to descend into.
+    """
+    collections: list[str] = []
+    seen: set[Path] = set()
+    pending = [catalog_root / "catalog.json"]
+    while pending:
+        node_path = pending.pop()
+        try:
+            node = json.loads(node_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        children: list[Path] = []
+        for link in node.get("links", []) if isinstance(node, dict) else []:
+            href = link.get("href") if isinstance(link, dict) else None
+            if link.get("rel") != "child" or not isinstance(href, str) or is_absolute_href(href):
+                continue
+            child = (node_path.parent / href).resolve()
+            if child in seen or not child.is_relative_to(catalog_root.resolve()):
+                continue
+            seen.add(child)
+            if child.name == "collection.json":
+                relative = child.parent.relative_to(catalog_root.resolve()).as_posix()
+                collections.append(relative)
+            else:
+                children.append(child)
+        # Reversed so sub-catalogs are visited in link order
+        pending.extend(reversed(children))
+    return collections
+
+
+# Top-level item fields in items.parquet; every other column is a property.
+_PARQUET_ITEM_FIELDS = frozenset(
+    {
+        "type",
+        "stac_version",
+        "stac_extensions",
+        "id",
+        "geometry",
+        "bbox",
+        "links",
+        "assets",
+        "collection",
+    }
+)
+
+
+def _search_items_parquet(
+    collection_dir: Path,
+    owned: list[tuple[str, Path]],
+    bbox: tuple[float, float, float, float] | None,
+) -> list[dict[str, Any]] | None:
+    """Candidate items from a current items.parquet, the bbox pushed down to Arrow.
+
+    The mirror is current when it holds one row per owned item and no item
+    JSON is newer than it. Rows come back as item-shaped dicts for
+    :func:`item_matches` to filter exactly.
+
+    Returns:
+        The candidates, or None when there is no current mirror or pyarrow.
+    """
+    parquet_path = collection_dir / PARQUET_FILENAME
+    try:
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    try:
+        parquet_mtime = parquet_path.stat().st_mtime_ns
+        if any(item_path.stat().st_mtime_ns > parquet_mtime for _href, item_path in owned):
+            return None
+        parquet_file = pq.ParquetFile(parquet_path)
+        if parquet_file.metadata.num_rows != len(owned):
+            return None
+        bbox_type = parquet_file.schema_arrow.field("bbox").type
+        if [field.name for field in bbox_type] != ["xmin", "ymin", "xmax", "ymax"]:
+            return None
+        filters = None
+        if bbox is not None:
+            minx, miny, maxx, maxy = bbox
+            filters = (
+                (pc.field("bbox", "xmin") <= maxx)
+                & (pc.field("bbox", "xmax") >= minx)
+                & (pc.field("bbox", "ymin") <= maxy)
+                & (pc.field("bbox", "ymax") >= miny)
+            )
+        rows = pq.read_table(parquet_path, filters=filters).to_pylist()
+    except (OSError, KeyError, ValueError, TypeError):
+        return None
+    return [_item_from_parquet_row(row) for row in rows]
+
+
+def _item_from_parquet_row(row: dict[str, Any]) -> dict[str, Any]:
+    bbox = row.get("bbox")
+    properties = {
+        key: value.isoformat().replace("+00:00", "Z") if isinstance(value, datetime) else value
+        for key, value in row.items()
+        if key not in _PARQUET_ITEM_FIELDS
+    }
+    return {
+        "id": row.get("id"),
+        "bbox": [bbox["xmin"], bbox["ymin"], bbox["xmax"], bbox["ymax"]] if bbox else None,
+        "properties": properties,
+        "assets": {key: asset for key, asset in (row.get("assets") or {}).items() if asset},
+    }
+
+
 def get_item_info(
     catalog_root: Path,
     stac_id: str,
@@ -159,28 +403,15 @@ def get_item_info(
     if not item_path.exists():
         raise KeyError(f"Item not found: {stac_id}")
 
-    item_data = json.loads(item_path.read_text(encoding="utf-8"))
-
-    # Determine format from assets
-    format_type = FormatType.UNKNOWN
-    asset_paths: list[str] = []
-    for asset in item_data.get("assets", {}).values():
-        href = asset.get("href", "")
-        asset_paths.append(href)
-        if href.endswith(".parquet"):
-            format_type = FormatType.VECTOR
-        elif href.endswith(".tif"):
-            format_type = FormatType.RASTER
+    index = open_catalog_index(catalog_root)
+    if index is not None:
+        with index:
+            indexed = index.item(collection_id, f"{item_id}/{item_id}.json")
+        if indexed is not None:
+            return _item_info(collection_id, indexed)
 
-    return ItemInfo(
-        item_id=item_data.get("id", item_id),
-        collection_id=collection_id,
-        format_type=format_type,
-        bbox=item_data.get("bbox", [0, 0, 0, 0]),
-        asset_paths=asset_paths,
-        title=item_data.get("properties", {}).get("title"),
-        description=item_data.get("properties", {}).get("description"),
-    )
+    item_data = json.loads(item_path.read_text(encoding="utf-8"))
+    return _item_info_from_json(collection_id, item_id, item_data)
 
 
 def is_current(
@@ -206,12 +437,10 @@ def is_current(
     if not versions_path.exists():
         return False
 
-    versions_file = read_versions(versions_path)
-    if not versions_file.versions:
+    current_version = read_versions_head(versions_path).latest
+    if current_version is None:
         return False
 
-    current_version = versions_file.versions[-1]
-
     # Look for this file in current version assets
     # Try explicit key first, then item-scoped key, then filename, then converted name
     asset = None
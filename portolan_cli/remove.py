@@ -175,9 +175,25 @@ def remove_files(
             )
             (removed if was_removed else skipped).append(file_path)
 
+    if removed and not dry_run:
+        _refresh_index_for(removed, catalog_root)
+
     return removed, skipped
 
 
+def _refresh_index_for(removed: list[Path], catalog_root: Path) -> None:
+    """Refresh the catalog index rows of the collections ``removed`` belonged to."""
+    from portolan_cli.catalog_index import refresh_catalog_index
+
+    root = catalog_root.resolve()
+    collection_ids = {
+        collection_dir.relative_to(root).as_posix()
+        for file_path in removed
+        if (collection_dir := _resolve_collection_dir(file_path, catalog_root)) is not None
+    }
+    refresh_catalog_index(catalog_root, sorted(collection_ids))
+
+
 def _remove_from_versions(file_path: Path, versions_path: Path) -> None:
     """Remove a file from version tracking via the active backend.
 
@@ -24,6 +24,7 @@ from enum import Enum
 from pathlib import Path
 
 from portolan_cli import extension_registry as _reg
+from portolan_cli.formats import probe
 
 # =============================================================================
 # Extension Mappings (DERIVED from extension_registry — the single source,
@@ -73,7 +74,8 @@ def is_geoparquet(path: Path) -> bool:
 
     This is a fast check that only reads the Parquet footer (O(1) metadata read),
     not the actual data. It looks for the 'geo' key in the schema metadata which
-    is required by the GeoParquet specification.
+    is required by the GeoParquet specification. The result is shared with the
+    rest of the CLI through the ``formats.probe()`` cache.
 
     Args:
         path: Path to the Parquet file.
@@ -82,26 +84,7 @@ def is_geoparquet(path: Path) -> bool:
         True if the file has GeoParquet metadata, False otherwise.
         Returns False on any read errors (file not found, invalid format, etc.).
     """
-    try:
-        import pyarrow as pa
-        import pyarrow.parquet as pq
-
-        # Only read schema metadata, not data — this is fast (reads footer only)
-        schema = pq.read_schema(path)
-
-        # GeoParquet requires a 'geo' key in schema metadata
-        if schema.metadata is None:
-            return False
-
-        return b"geo" in schema.metadata
-
-    except (OSError, ValueError, pa.lib.ArrowInvalid):
-        # File not found, not valid parquet, corrupted, etc. means not GeoParquet
-        return False
-    except Exception:
-        # Catch-all for unexpected pyarrow errors, but re-raise system-exiting
-        # exceptions (KeyboardInterrupt, SystemExit are BaseException, not Exception)
-        return False
+    return probe(path).geoparquet
 
 
 class FileCategory(Enum):
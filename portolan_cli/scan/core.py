@@ -24,10 +24,15 @@ Phase 1 MVP features:
 
 from __future__ import annotations
 
+import heapq
+import logging
 import os
 import re
-from collections import defaultdict
+import threading
+from collections import defaultdict, deque
 from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -49,11 +54,11 @@ from portolan_cli.constants import PARQUET_EXTENSION, WINDOWS_RESERVED_NAMES
 from portolan_cli.formats import (
     CloudNativeStatus,
     FormatInfo,
+    FormatProbe,
     FormatType,
-    _detect_json_type,
     get_cloud_native_status,
     is_geoparquet,
-    is_valid_parquet,
+    probe,
 )
 from portolan_cli.scan.classify import (
     STAC_FILENAMES,
@@ -71,6 +76,10 @@ from portolan_cli.scan.detect import (
 )
 from portolan_cli.scan.fix import ProposedFix
 from portolan_cli.scan.infer import CollectionSuggestion
+from portolan_cli.scan.snapshot import ScanSnapshot
+from portolan_cli.tracing import traced
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # Constants
@@ -114,6 +123,27 @@ INVALID_CHAR_PATTERN: re.Pattern[str] = re.compile(r"[\s()\[\]\x00-\x1f\x7f]|[^\
 
 # WINDOWS_RESERVED_NAMES imported from portolan_cli.constants
 
+# Threads listing directories ahead of the walk. Each scandir on NFS/SMB is a
+# network round trip, so overlapping them matters far more than CPU count.
+DEFAULT_SCAN_WORKERS: int = 8
+
+# Prefetched listings held per worker before the walk catches up; bounds memory
+# on directories with very many subdirectories.
+_PREFETCH_LISTINGS_PER_WORKER: int = 16
+
+# Extensions whose content inspection (COG validation, Parquet footer parsing)
+# is CPU-heavy enough to hand to the probe process pool. GeoJSON sniffing reads
+# 8KB and stays inline: shipping it to a process would cost more than it saves.
+_POOLED_PROBE_EXTENSIONS: frozenset[str] = frozenset({PARQUET_EXTENSION, ".tif", ".tiff"})
+
+# Files needing a pooled probe before spawning the pool pays off; smaller
+# scans inspect inline.
+_PROBE_POOL_MIN_FILES: int = 32
+
+# Discovered files held per probe process ahead of aggregation; bounds memory
+# and how far discovery runs ahead.
+_PROBE_WINDOW_PER_WORKER: int = 8
+
 
 # =============================================================================
 # Enums
@@ -195,11 +225,26 @@ class ScanOptions:
     # NEW: Strict mode (Phase 4)
     strict: bool = False  # Treat warnings as errors
 
+    # Reuse listings and format probes recorded by the previous scan
+    incremental: bool = False
+
+    # Threads listing directories ahead of the walk (None = default, 1 = off)
+    workers: int | None = None
+
+    # Processes inspecting file contents (None = one per core, 1 = inline)
+    probe_workers: int | None = None
+
     def __post_init__(self) -> None:
         """Validate options."""
         if self.unsafe_fix and not self.fix:
             msg = "--unsafe-fix requires --fix"
             raise ValueError(msg)
+        if self.workers is not None and self.workers < 1:
+            msg = "workers must be at least 1"
+            raise ValueError(msg)
+        if self.probe_workers is not None and self.probe_workers < 1:
+            msg = "probe_workers must be at least 1"
+            raise ValueError(msg)
 
 
 @dataclass(frozen=True)
@@ -409,6 +454,10 @@ class _ScanContext:
     special_formats: list[SpecialFormat] = field(default_factory=list)
     # Progress callback (called for each directory scanned)
     progress_callback: Callable[[], None] | None = None
+    # Incremental mode: previous scan's listings/probes, and (size, mtime_ns)
+    # of each discovered file to validate them against
+    snapshot: ScanSnapshot | None = None
+    file_stats: dict[Path, tuple[int, int]] = field(default_factory=dict)
 
 
 # =============================================================================
@@ -508,7 +557,7 @@ def _infer_collection_id_from_relative_path(relative_path: str) -> str:
     return "/".join(non_partition_segments)
 
 
-def _get_format_info(path: Path, ext: str) -> FormatInfo:
+def _get_format_info(path: Path, ext: str, probed: FormatProbe | None = None) -> FormatInfo:
     """Get cloud-native status and format info for a file.
 
     This is a lightweight wrapper around get_cloud_native_status() that
@@ -517,12 +566,13 @@ def _get_format_info(path: Path, ext: str) -> FormatInfo:
     Args:
         path: Path to the file.
         ext: File extension (lowercase).
+        probed: The file's format probe, if already taken.
 
     Returns:
         FormatInfo with status, display_name, target_format, and error_message.
     """
     try:
-        return get_cloud_native_status(path)
+        return get_cloud_native_status(path, probed=probed)
     except (FileNotFoundError, IsADirectoryError):
         # Return a fallback for edge cases
         from portolan_cli.formats import FormatInfo as FI
@@ -535,6 +585,32 @@ def _get_format_info(path: Path, ext: str) -> FormatInfo:
         )
 
 
+def _probe(ctx: _ScanContext, path: Path, name: str, compute: Callable[[], Any]) -> Any:
+    """Run a content probe, reusing the snapshot's result for an unchanged file."""
+    stat_key = ctx.file_stats.get(path)
+    if ctx.snapshot is None or stat_key is None:
+        return compute()
+    return ctx.snapshot.probe(path, stat_key, name, compute)
+
+
+def _format_probe(
+    ctx: _ScanContext, path: Path, inspected: FormatProbe | None = None
+) -> FormatProbe:
+    """``formats.probe`` through the snapshot: one open per changed file.
+
+    ``inspected`` is the probe pool's result for ``path``, if it took one.
+    """
+    if ctx.snapshot is None or path not in ctx.file_stats:
+        return inspected or probe(path)
+    try:
+        return FormatProbe.from_dict(
+            _probe(ctx, path, "format", lambda: (inspected or probe(path)).to_dict())
+        )
+    except (KeyError, TypeError, ValueError):
+        # Malformed snapshot entry; inspect the file again.
+        return inspected or probe(path)
+
+
 def _make_skipped_file(
     ctx: _ScanContext,
     path: Path,
@@ -1067,13 +1143,163 @@ def _gather_filegdb_metadata(path: Path) -> dict[str, Any]:
     }
 
 
+def _list_directory(ctx: _ScanContext, directory: Path) -> list[Any]:
+    """List ``directory``, replaying the snapshot's listing when it is unchanged.
+
+    Returns ``os.DirEntry`` objects, or equivalent ``CachedDirEntry`` objects.
+    Symlinked entries are never cached, so replay is limited to scans that do
+    not follow symlinks.
+    """
+    snapshot = ctx.snapshot
+    if snapshot is None or ctx.options.follow_symlinks:
+        return list(os.scandir(directory))
+
+    # Taken before listing: an entry added mid-scandir then moves the mtime on.
+    mtime_ns = os.stat(directory).st_mtime_ns
+    cached = snapshot.listing(directory, mtime_ns)
+    if cached is not None:
+        return cached
+    entries = list(os.scandir(directory))
+    snapshot.record_listing(directory, mtime_ns, entries)
+    return entries
+
+
+def _prefetch_listing(ctx: _ScanContext, directory: Path) -> list[Any]:
+    """List ``directory`` and warm the per-entry caches the walk will read.
+
+    ``os.DirEntry`` caches ``is_dir``/``is_file``/``stat`` results, so calling
+    them here moves those syscalls onto the prefetch thread. Errors are left
+    for the walk, which repeats the call and reports them in order.
+    """
+    entries = _list_directory(ctx, directory)
+    options = ctx.options
+    follow = options.follow_symlinks
+    for entry in entries:
+        if not options.include_hidden and _is_hidden(entry.name):
+            continue
+        try:
+            if entry.is_symlink() and not follow:
+                continue
+            entry.is_dir(follow_symlinks=follow)
+            if entry.is_file(follow_symlinks=follow):
+                entry.stat(follow_symlinks=follow)
+        except OSError:
+            continue
+    return entries
+
+
+class _ListingPrefetcher:
+    """Lists directories on a thread pool ahead of the depth-first walk.
+
+    Directories wait in a heap keyed by their depth-first position, and each
+    pool task lists whichever waiting directory comes first, so threads work
+    on what the walk needs next. A thread that lists a directory queues its
+    plain subdirectories itself, so the listing frontier runs ahead of the
+    walk rather than one level at a time. The walk also requests every
+    directory it decides to descend into (symlinked ones included), and a
+    directory it reaches before any thread claimed it is listed inline.
+
+    Everything with an observable effect (issues, symlink-loop tracking,
+    yield order) stays on the walking thread, so results match a sequential
+    scan exactly.
+    """
+
+    def __init__(self, ctx: _ScanContext, workers: int, max_depth: int | None) -> None:
+        self._ctx = ctx
+        self._max_depth = max_depth
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan-list")
+        self._lock = threading.Lock()
+        self._waiting: list[tuple[tuple[int, ...], int, Path]] = []
+        self._queued: set[Path] = set()
+        self._claimed: dict[Path, Future[list[Any]]] = {}
+        self._max_claimed = workers * _PREFETCH_LISTINGS_PER_WORKER
+        self._closed = False
+
+    def request(self, directory: Path, key: tuple[int, ...], depth: int) -> None:
+        """Queue ``directory``, found at depth-first position ``key``."""
+        with self._lock:
+            if self._closed or directory in self._queued or directory in self._claimed:
+                return
+            heapq.heappush(self._waiting, (key, depth, directory))
+            self._queued.add(directory)
+            self._executor.submit(self._list_next)
+
+    def take(self, directory: Path) -> list[Any]:
+        """Return ``directory``'s listing, listing it now if no thread has started.
+
+        Raises:
+            OSError: Whatever ``os.scandir`` raised for ``directory``.
+        """
+        with self._lock:
+            future = self._claimed.pop(directory, None)
+            if future is None:
+                self._queued.discard(directory)
+        if future is None:
+            return _list_directory(self._ctx, directory)
+        return future.result()
+
+    def _list_next(self) -> None:
+        with self._lock:
+            while self._waiting:
+                key, depth, directory = heapq.heappop(self._waiting)
+                # Entries the walk already took inline are left in the heap.
+                if directory in self._queued:
+                    break
+            else:
+                return
+            self._queued.discard(directory)
+            future: Future[list[Any]] = Future()
+            future.set_running_or_notify_cancel()
+            self._claimed[directory] = future
+
+        try:
+            entries = _prefetch_listing(self._ctx, directory)
+            # Before publishing: once the walk takes this listing it may list
+            # a child inline, and a later request would list it again.
+            self._queue_subdirectories(entries, key, depth + 1)
+        except BaseException as exc:
+            future.set_exception(exc)
+            return
+        future.set_result(entries)
+
+    def _queue_subdirectories(self, entries: list[Any], key: tuple[int, ...], depth: int) -> None:
+        """Speculatively queue plain subdirectories the walk will descend into.
+
+        Symlinks and FileGDB candidates are left to the walk, which requests
+        them after its own checks; so is everything once ``_max_claimed``
+        listings are waiting to be taken.
+        """
+        if self._max_depth is not None and depth > self._max_depth:
+            return
+        if len(self._claimed) >= self._max_claimed:
+            return
+        include_hidden = self._ctx.options.include_hidden
+        for index, entry in enumerate(entries):
+            name = entry.name
+            if (not include_hidden and _is_hidden(name)) or name.lower().endswith(".gdb"):
+                continue
+            try:
+                if entry.is_symlink() or not entry.is_dir(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            self.request(Path(entry.path), (*key, index), depth)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
 def _discover_files(
     ctx: _ScanContext,
 ) -> Iterator[tuple[Path, int]]:
     """Discover files using os.walk with depth control.
 
-    Yields (file_path, file_size) tuples for all files found.
-    Uses os.walk for performance as recommended in design doc.
+    Yields (file_path, file_size) tuples for all files found, depth-first in
+    directory listing order. With more than one worker, directory listings
+    are prefetched concurrently (see ``_ListingPrefetcher``); the order and
+    the issues reported are the same either way.
     """
     root = ctx.root
     options = ctx.options
@@ -1085,8 +1311,19 @@ def _discover_files(
     else:
         effective_max_depth = options.max_depth
 
-    def _walk_with_depth(start: Path, current_depth: int = 0) -> Iterator[tuple[Path, int]]:
-        """Walk directory with depth tracking."""
+    workers = options.workers or DEFAULT_SCAN_WORKERS
+    prefetcher = None
+    if workers > 1 and effective_max_depth != 0:
+        prefetcher = _ListingPrefetcher(ctx, workers, effective_max_depth)
+
+    def _walk_with_depth(
+        start: Path, current_depth: int = 0, key: tuple[int, ...] = ()
+    ) -> Iterator[tuple[Path, int]]:
+        """Walk directory with depth tracking.
+
+        ``key`` is the directory's depth-first position: the index of each
+        path component within its parent's listing.
+        """
         # Check depth limit BEFORE incrementing counter
         if effective_max_depth is not None and current_depth > effective_max_depth:
             return
@@ -1097,7 +1334,10 @@ def _discover_files(
             ctx.progress_callback()
 
         try:
-            entries = list(os.scandir(start))
+            if prefetcher is not None:
+                entries = prefetcher.take(start)
+            else:
+                entries = _list_directory(ctx, start)
         except PermissionError:
             ctx.issues.append(
                 ScanIssue(
@@ -1111,9 +1351,9 @@ def _discover_files(
             )
             return
 
-        dirs_to_process = []
+        dirs_to_process: list[tuple[Path, tuple[int, ...]]] = []
 
-        for entry in entries:
+        for index, entry in enumerate(entries):
             name = entry.name
 
             # Skip hidden if not included
@@ -1150,11 +1390,17 @@ def _discover_files(
                     yield (path, size)
                 else:
                     # Queue regular directory for later processing
-                    dirs_to_process.append(path)
+                    dirs_to_process.append((path, (*key, index)))
+                    if prefetcher is not None and (
+                        effective_max_depth is None or current_depth < effective_max_depth
+                    ):
+                        prefetcher.request(path, (*key, index), current_depth + 1)
             elif is_file:
                 try:
-                    size = entry.stat(follow_symlinks=options.follow_symlinks).st_size
-                    yield (path, size)
+                    st = entry.stat(follow_symlinks=options.follow_symlinks)
+                    if ctx.snapshot is not None:
+                        ctx.file_stats[path] = (st.st_size, st.st_mtime_ns)
+                    yield (path, st.st_size)
                 except OSError as e:
                     # Emit warning for stat failures (e.g., race conditions, permission issues)
                     ctx.issues.append(
@@ -1171,14 +1417,131 @@ def _discover_files(
 
         # Process subdirectories (if recursive)
         if options.recursive:
-            for subdir in dirs_to_process:
-                yield from _walk_with_depth(subdir, current_depth + 1)
+            for subdir, subdir_key in dirs_to_process:
+                yield from _walk_with_depth(subdir, current_depth + 1, subdir_key)
 
-    yield from _walk_with_depth(root)
+    try:
+        yield from _walk_with_depth(root)
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
 
 
-def _process_file(ctx: _ScanContext, path: Path, size: int) -> None:
-    """Process a single discovered file or FileGDB directory."""
+def _needs_pooled_probe(ctx: _ScanContext, path: Path, size: int) -> bool:
+    """Whether ``_process_file`` will run a CPU-heavy content probe on ``path``."""
+    # Zero-byte files are skipped before any inspection
+    if size == 0 or path.suffix.lower() not in _POOLED_PROBE_EXTENSIONS:
+        return False
+    stat_key = ctx.file_stats.get(path)
+    if ctx.snapshot is not None and stat_key is not None:
+        return not ctx.snapshot.has_probe(path, stat_key, "format")
+    return True
+
+
+def _start_probe_pool(workers: int) -> Executor:
+    """Start the process pool ``_inspect_files`` hands probes to."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Spawn, not fork: GDAL/rasterio run worker threads, and fork()-ing a
+    # multi-threaded process can deadlock the child (see convert_directory).
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+@dataclass
+class _PendingFile:
+    """A discovered file waiting in the probe window."""
+
+    path: Path
+    size: int
+    pooled: bool
+    future: Future[FormatProbe] | None = None
+
+
+def _inspect_files(
+    ctx: _ScanContext, files: Iterator[tuple[Path, int]]
+) -> Iterator[tuple[Path, int, FormatProbe | None]]:
+    """Run content probes for discovered files on a process pool, in order.
+
+    Discovery streams into a bounded window; Parquet and TIFF files in it are
+    probed by worker processes while the files ahead of them are aggregated.
+    Files come out in discovery order with their probe (None when the probe
+    is left to ``_process_file``), so the scan result is identical to an
+    inline scan. The pool is only spawned once ``_PROBE_POOL_MIN_FILES``
+    files needing a probe have turned up, and a pool that breaks (e.g. a restricted container
+    without ``/dev/shm``) degrades to inline probing.
+    """
+    workers = ctx.options.probe_workers or os.cpu_count() or 1
+    if workers == 1:
+        for path, size in files:
+            yield path, size, None
+        return
+
+    window_size = max(_PROBE_POOL_MIN_FILES, workers * _PROBE_WINDOW_PER_WORKER)
+    window: deque[_PendingFile] = deque()
+    pool: Executor | None = None
+    pool_failed = False
+    pooled_seen = 0
+
+    def submit(pending: _PendingFile) -> None:
+        nonlocal pool_failed
+        if pool is None or pool_failed:
+            return
+        try:
+            pending.future = pool.submit(probe, pending.path)
+        except BrokenProcessPool:
+            logger.warning("Probe process pool unavailable; inspecting files inline")
+            pool_failed = True
+
+    def resolve(pending: _PendingFile) -> tuple[Path, int, FormatProbe | None]:
+        nonlocal pool_failed
+        if pending.future is None:
+            return pending.path, pending.size, None
+        try:
+            return pending.path, pending.size, pending.future.result()
+        except BrokenProcessPool:
+            if not pool_failed:
+                logger.warning("Probe process pool unavailable; inspecting files inline")
+            pool_failed = True
+        except Exception:
+            # Probed again inline, where the error surfaces as in a serial scan
+            logger.debug("Pooled probe failed for %s", pending.path, exc_info=True)
+        return pending.path, pending.size, None
+
+    try:
+        for path, size in files:
+            pending = _PendingFile(path, size, _needs_pooled_probe(ctx, path, size))
+            window.append(pending)
+            if pending.pooled:
+                pooled_seen += 1
+                if pool is None and pooled_seen >= _PROBE_POOL_MIN_FILES:
+                    pool = _start_probe_pool(workers)
+                    for queued in window:
+                        if queued.pooled:
+                            submit(queued)
+                else:
+                    submit(pending)
+            while window and (
+                len(window) > window_size
+                or not window[0].pooled
+                or (window[0].future is not None and window[0].future.done())
+            ):
+                yield resolve(window.popleft())
+        while window:
+            yield resolve(window.popleft())
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _process_file(
+    ctx: _ScanContext, path: Path, size: int, inspected: FormatProbe | None = None
+) -> None:
+    """Process a single discovered file or FileGDB directory.
+
+    ``inspected`` is the file's format probe when ``_inspect_files`` already
+    took it.
+    """
     # Check for FileGDB directory FIRST - these are yielded by _discover_files
     # as directories to be treated as single assets
     # Issue #154: FileGDBs should be added to ready list (not special_formats)
@@ -1215,6 +1578,8 @@ def _process_file(ctx: _ScanContext, path: Path, size: int) -> None:
     ext = path.suffix.lower()
     name = path.name
     parent = path.parent
+    # Content inspection for .parquet/.json/.tif, shared by every check below
+    probed: FormatProbe | None = None
 
     # Check for zero-byte file first
     if _check_zero_byte_file(ctx, path, size):
@@ -1247,7 +1612,8 @@ def _process_file(ctx: _ScanContext, path: Path, size: int) -> None:
     # Handle .parquet specially - must check if it's GeoParquet
     if ext == PARQUET_EXTENSION:
         # First check if it's a valid Parquet file at all (not corrupted)
-        if not is_valid_parquet(path):
+        probed = _format_probe(ctx, path, inspected)
+        if not probed.valid_parquet:
             # File has .parquet extension but is corrupted or not a valid Parquet
             ctx.skipped.append(
                 SkippedFile(
@@ -1259,7 +1625,7 @@ def _process_file(ctx: _ScanContext, path: Path, size: int) -> None:
                 )
             )
             return
-        if not is_geoparquet(path):
+        if not probed.geoparquet:
             # Regular Parquet (tabular data), not a geospatial asset
             # Create SkippedFile directly since classify_file can't detect non-geo parquet
             ctx.skipped.append(
@@ -1306,7 +1672,8 @@ def _process_file(ctx: _ScanContext, path: Path, size: int) -> None:
                 )
             )
             return
-        if _detect_json_type(path) != FormatType.VECTOR:
+        probed = _format_probe(ctx, path, inspected)
+        if probed.json_type != FormatType.VECTOR:
             # Plain JSON, not GeoJSON - skip with informative message
             # We override classify_file here because we have specific knowledge:
             # we inspected the content and determined it's not GeoJSON.
@@ -1335,7 +1702,10 @@ def _process_file(ctx: _ScanContext, path: Path, size: int) -> None:
     inferred_collection_id = _infer_collection_id_from_relative_path(relative_path)
 
     # Get format info for cloud-native status and display name
-    format_info = _get_format_info(path, ext)
+    if probed is None and ext in (".tif", ".tiff"):
+        # COG status needs the TIFF header
+        probed = _format_probe(ctx, path, inspected)
+    format_info = _get_format_info(path, ext, probed)
 
     # Create scanned file
     scanned = ScannedFile(
@@ -1364,6 +1734,10 @@ def _process_file(ctx: _ScanContext, path: Path, size: int) -> None:
             ctx.shapefile_sidecars[key] = set()
 
 
+@traced(
+    "scan_directory",
+    measure=lambda r: (len(r.ready) + len(r.skipped), sum(f.size_bytes for f in r.ready)),
+)
 def scan_directory(
     path: Path,
     options: ScanOptions | None = None,
@@ -1405,10 +1779,15 @@ def scan_directory(
 
     # Create scan context
     ctx = _ScanContext(root=path, options=options, progress_callback=progress_callback)
+    if options.incremental:
+        ctx.snapshot = ScanSnapshot.for_scan_root(path)
+
+    # Discover, inspect and process files
+    for file_path, file_size, inspected in _inspect_files(ctx, _discover_files(ctx)):
+        _process_file(ctx, file_path, file_size, inspected)
 
-    # Discover and process files
-    for file_path, file_size in _discover_files(ctx):
-        _process_file(ctx, file_path, file_size)
+    if ctx.snapshot is not None:
+        ctx.snapshot.save()
 
     # Check incomplete shapefiles
     for scanned in ctx.ready:
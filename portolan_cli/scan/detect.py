@@ -94,12 +94,12 @@ def is_filegdb(path: Path) -> bool:
     Returns:
         True if path is a FileGDB directory.
     """
-    # Must be a directory
-    if not path.is_dir():
+    # Must end with .gdb (checked first: it costs no syscall)
+    if not path.name.lower().endswith(".gdb"):
         return False
 
-    # Must end with .gdb
-    if not path.name.lower().endswith(".gdb"):
+    # Must be a directory
+    if not path.is_dir():
         return False
 
     # Check for FileGDB internal structure
@@ -0,0 +1,292 @@
+"""Persisted scan snapshot that lets a repeat scan skip unchanged work.
+
+A full scan lists every directory and opens every candidate file to classify
+it: Parquet footers are read to tell GeoParquet from tabular Parquet, JSON
+prefixes are sniffed for GeoJSON, TIFF headers are read for COG status. On a
+large share almost none of that changes between runs.
+
+With incremental scanning on, the scan records two things in
+``.portolan/scan-snapshot.json`` of the enclosing catalog:
+
+- per directory, its ``mtime_ns`` and the names of the files and
+  subdirectories it held. Creating, deleting or renaming an entry updates the
+  directory's mtime, so an unchanged mtime means the listing can be replayed
+  instead of calling ``scandir`` again.
+- per file, its ``(size, mtime_ns)`` and the result of each content probe the
+  classifier ran on it. A file whose stat is unchanged is not opened again.
+
+Every directory is still visited and every file still stat'ed: a change deep
+in the tree only touches its own directory's mtime, and editing a file in
+place does not touch its directory's at all. What the snapshot saves is the
+listings and the file opens, which dominate on network shares.
+
+As with the checksum cache, nothing modified within ``MTIME_TOLERANCE_SECONDS``
+of now is recorded, since a change landing in the same mtime tick would leave
+an entry that looks valid. Listings are only cached when symlinks are not
+followed; a followed symlink's target can change without any mtime moving.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from portolan_cli.constants import MTIME_TOLERANCE_SECONDS, PORTOLAN_DIR
+from portolan_cli.json_io import write_json_atomic
+
+__all__ = [
+    "SCAN_SNAPSHOT_FILENAME",
+    "CachedDirEntry",
+    "ScanSnapshot",
+    "resolve_incremental",
+]
+
+logger = logging.getLogger(__name__)
+
+# Snapshot file, inside the catalog's .portolan/ directory.
+SCAN_SNAPSHOT_FILENAME = "scan-snapshot.json"
+
+# Bumped whenever the layout changes or a probe's meaning changes; a
+# mismatched file is ignored and the next scan starts from scratch.
+_SCAN_SNAPSHOT_VERSION = 2
+
+# (size, mtime_ns) of a file.
+_StatKey = tuple[int, int]
+
+# (mtime_ns, entries) of a directory; subdirectory names carry a trailing "/".
+_DirRecord = tuple[int, tuple[str, ...]]
+
+# (size, mtime_ns, probe name -> JSON-serializable result) of a file.
+_FileRecord = tuple[int, int, dict[str, Any]]
+
+
+class CachedDirEntry:
+    """Stand-in for ``os.DirEntry`` replayed from a cached listing.
+
+    Only plain files and directories are ever cached, so ``is_symlink`` is
+    always False. ``stat`` goes to the filesystem, since a file's size and
+    mtime are not covered by its directory's mtime, and is then cached like
+    ``os.DirEntry.stat``.
+    """
+
+    __slots__ = ("_is_dir", "_stat", "name", "path")
+
+    def __init__(self, directory: str, name: str, is_dir: bool) -> None:
+        self.name = name
+        self.path = os.path.join(directory, name)
+        self._is_dir = is_dir
+        self._stat: os.stat_result | None = None
+
+    def is_symlink(self) -> bool:
+        return False
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        return self._is_dir
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        return not self._is_dir
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        # Never a symlink, so following or not yields the same result.
+        if self._stat is None:
+            self._stat = os.stat(self.path, follow_symlinks=follow_symlinks)
+        return self._stat
+
+
+def resolve_incremental(scan_root: Path, cli_value: bool | None = None) -> bool:
+    """Whether to scan ``scan_root`` incrementally: CLI > env var > config > off.
+
+    Reads the ``scan.incremental`` setting of the catalog enclosing
+    ``scan_root``, if any.
+    """
+    from portolan_cli.catalog import find_catalog_root
+    from portolan_cli.config import coerce_bool, get_setting
+
+    value = get_setting(
+        "scan.incremental", cli_value=cli_value, catalog_path=find_catalog_root(scan_root)
+    )
+    return coerce_bool(value, default=False)
+
+
+def _is_settled(mtime_ns: int) -> bool:
+    return time.time() - mtime_ns / 1_000_000_000 >= MTIME_TOLERANCE_SECONDS
+
+
+class ScanSnapshot:
+    """Directory listings and probe results of one scan root.
+
+    Listings may be looked up and recorded from the scan's prefetch threads;
+    each call touches a single dict key, which the GIL keeps consistent.
+
+    Lookups read the snapshot loaded from disk; every listing and probe used
+    by the current scan is carried into a fresh snapshot, so :meth:`save`
+    drops entries for paths that no longer exist or were not visited.
+    """
+
+    def __init__(self, path: Path, scan_root: Path) -> None:
+        self.path = path
+        self.scan_root = scan_root
+        self._root_key = str(scan_root.resolve())
+        self._old_dirs, self._old_files = _read_snapshot_file(self.path, self._root_key)
+        self._dirs: dict[str, _DirRecord] = {}
+        self._files: dict[str, _FileRecord] = {}
+
+    @classmethod
+    def for_scan_root(cls, scan_root: Path) -> ScanSnapshot | None:
+        """Open the snapshot of the catalog enclosing ``scan_root``.
+
+        Returns:
+            The snapshot, or None when ``scan_root`` is not inside a catalog.
+        """
+        from portolan_cli.catalog import find_catalog_root
+
+        catalog_root = find_catalog_root(scan_root)
+        if catalog_root is None:
+            logger.debug("Incremental scan disabled: %s is not inside a catalog", scan_root)
+            return None
+        return cls(catalog_root / PORTOLAN_DIR / SCAN_SNAPSHOT_FILENAME, scan_root)
+
+    def _key(self, path: Path | str) -> str:
+        return Path(path).relative_to(self.scan_root).as_posix()
+
+    def listing(self, directory: Path, mtime_ns: int) -> list[CachedDirEntry] | None:
+        """Replay ``directory``'s cached listing if its mtime is unchanged."""
+        key = self._key(directory)
+        record = self._old_dirs.get(key)
+        if record is None or record[0] != mtime_ns or not _is_settled(mtime_ns):
+            return None
+        self._dirs[key] = record
+        base = str(directory)
+        return [
+            CachedDirEntry(base, name.removesuffix("/"), name.endswith("/")) for name in record[1]
+        ]
+
+    def record_listing(
+        self, directory: Path, mtime_ns: int, entries: list[os.DirEntry[str]]
+    ) -> None:
+        """Remember ``directory``'s plain files and subdirectories, in scandir order.
+
+        Args:
+            directory: The directory that was listed.
+            mtime_ns: Its mtime, taken *before* the listing.
+            entries: The entries ``os.scandir`` returned.
+        """
+        if not _is_settled(mtime_ns):
+            return
+        names: list[str] = []
+        for entry in entries:
+            try:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    names.append(f"{entry.name}/")
+                elif entry.is_file(follow_symlinks=False):
+                    names.append(entry.name)
+            except OSError:
+                # An entry we cannot classify would be dropped from replays.
+                return
+        self._dirs[self._key(directory)] = (mtime_ns, tuple(names))
+
+    def probe(self, path: Path, stat_key: _StatKey, name: str, compute: Callable[[], Any]) -> Any:
+        """Return probe ``name`` for ``path``, running ``compute`` only if it changed.
+
+        Args:
+            path: File the probe inspects.
+            stat_key: ``(size, mtime_ns)`` of the file as discovered by this scan.
+            name: Probe identifier, unique per kind of inspection.
+            compute: Runs the probe; must return a JSON-serializable value.
+        """
+        key = self._key(path)
+        record = self._files.get(key)
+        if record is None or record[:2] != stat_key:
+            record = (stat_key[0], stat_key[1], {})
+            if _is_settled(stat_key[1]):
+                self._files[key] = record
+        results = record[2]
+        if name not in results:
+            old = self._old_files.get(key)
+            if old is not None and old[:2] == stat_key and name in old[2]:
+                results[name] = old[2][name]
+            else:
+                results[name] = compute()
+        return results[name]
+
+    def has_probe(self, path: Path, stat_key: _StatKey, name: str) -> bool:
+        """Whether :meth:`probe` would answer ``name`` for ``path`` without computing."""
+        key = self._key(path)
+        for record in (self._files.get(key), self._old_files.get(key)):
+            if record is not None and record[:2] == stat_key and name in record[2]:
+                return True
+        return False
+
+    def save(self) -> None:
+        """Replace the snapshot file with what this scan used.
+
+        Skipped silently when the catalog's ``.portolan/`` has gone away.
+        """
+        if not self.path.parent.is_dir():
+            return
+        payload = {
+            "version": _SCAN_SNAPSHOT_VERSION,
+            "root": self._root_key,
+            "directories": {
+                key: [mtime_ns, list(names)]
+                for key, (mtime_ns, names) in sorted(self._dirs.items())
+            },
+            "files": {
+                key: [size, mtime_ns, probes]
+                for key, (size, mtime_ns, probes) in sorted(self._files.items())
+                if probes
+            },
+        }
+        try:
+            write_json_atomic(self.path, payload)
+        except OSError as exc:
+            logger.debug("Could not write scan snapshot %s: %s", self.path, exc)
+
+
+def _read_snapshot_file(
+    path: Path, root_key: str
+) -> tuple[dict[str, _DirRecord], dict[str, _FileRecord]]:
+    """Parse a snapshot file for ``root_key``, treating anything else as empty."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != _SCAN_SNAPSHOT_VERSION
+        or data.get("root") != root_key
+    ):
+        return {}, {}
+    raw_dirs = data.get("directories")
+    raw_files = data.get("files")
+    if not isinstance(raw_dirs, dict) or not isinstance(raw_files, dict):
+        return {}, {}
+
+    dirs: dict[str, _DirRecord] = {}
+    for key, value in raw_dirs.items():
+        if (
+            isinstance(value, list)
+            and len(value) == 2
+            and isinstance(value[0], int)
+            and isinstance(value[1], list)
+            and all(isinstance(n, str) for n in value[1])
+        ):
+            dirs[key] = (value[0], tuple(value[1]))
+
+    files: dict[str, _FileRecord] = {}
+    for key, value in raw_files.items():
+        if (
+            isinstance(value, list)
+            and len(value) == 3
+            and all(isinstance(v, int) for v in value[:2])
+            and isinstance(value[2], dict)
+        ):
+            files[key] = (value[0], value[1], value[2])
+    return dirs, files
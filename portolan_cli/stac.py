@@ -16,7 +16,7 @@ from collections.abc import Iterable, Sequence
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 import pystac
 from pystac.summaries import Summarizer, SummaryStrategy
@@ -1623,7 +1623,16 @@ SUMMARIZED_FIELDS: dict[str, SummaryStrategy] = {
 }
 
 
-def update_collection_summaries(collection: pystac.Collection) -> None:
+class _ItemProperties(NamedTuple):
+    """An item reduced to the one attribute ``Summarizer`` reads."""
+
+    properties: dict[str, Any]
+
+
+def update_collection_summaries(
+    collection: pystac.Collection,
+    item_properties: Iterable[dict[str, Any]] | None = None,
+) -> None:
     """Update collection summaries from item properties.
 
     Uses PySTAC's Summarizer with hybrid field detection:
@@ -1634,26 +1643,37 @@ def update_collection_summaries(collection: pystac.Collection) -> None:
 
     Args:
         collection: The collection to update summaries for.
+        item_properties: The ``properties`` of every item, in link order, for a
+            caller that read the item JSONs itself. By default the collection's
+            items are resolved to get them.
     """
-    items = list(collection.get_items(recursive=True))
-    if not items:
+    if item_properties is None:
+        item_properties = (item.properties for item in collection.get_items(recursive=True))
+    properties = list(item_properties)
+    if not properties:
         return
 
     # Build field strategies: explicit + auto-detected extension prefixes
     field_strategies = dict(SUMMARIZED_FIELDS)
 
     # Auto-detect extension-prefixed fields from items (not in explicit list)
-    for item in items:
-        for key in item.properties:
+    for item_props in properties:
+        for key in item_props:
             if ":" in key and key not in field_strategies:
                 # Extension-prefixed field, default to ARRAY (distinct values)
                 field_strategies[key] = SummaryStrategy.ARRAY
 
+    # The Summarizer reads nothing from an item but its ``properties``
     summarizer = Summarizer(field_strategies)
-    collection.summaries = summarizer.summarize(items)
+    collection.summaries = summarizer.summarize(
+        cast("list[pystac.Item]", [_ItemProperties(p) for p in properties])
+    )
 
 
-def declare_file_extension(collection: pystac.Collection) -> None:
+def declare_file_extension(
+    collection: pystac.Collection,
+    item_assets: Iterable[dict[str, Any]] | None = None,
+) -> None:
     """Declare the STAC file extension when an asset under the collection uses it.
 
     Scope is the collection *and* its items: the extension a collection declares
@@ -1668,8 +1688,10 @@ def declare_file_extension(collection: pystac.Collection) -> None:
 
     Args:
         collection: The collection to declare the extension on.
+        item_assets: The asset dicts of every item, for a caller that read the
+            item JSONs itself. By default the collection's items are resolved.
     """
-    if not _any_asset_declares_file_fields(collection):
+    if not _any_asset_declares_file_fields(collection, item_assets):
         return
 
     file_ext_url = EXTENSION_URLS["file"]
@@ -1679,10 +1701,15 @@ def declare_file_extension(collection: pystac.Collection) -> None:
         collection.stac_extensions.append(file_ext_url)
 
 
-def _any_asset_declares_file_fields(collection: pystac.Collection) -> bool:
+def _any_asset_declares_file_fields(
+    collection: pystac.Collection,
+    item_assets: Iterable[dict[str, Any]] | None = None,
+) -> bool:
     """Whether any asset on the collection or its items carries ``file:size``."""
     if any(_has_file_size(asset) for asset in collection.assets.values()):
         return True
+    if item_assets is not None:
+        return any(_is_file_size(asset.get("file:size")) for asset in item_assets)
     return any(
         _has_file_size(asset)
         for item in collection.get_items(recursive=True)
@@ -1698,6 +1725,11 @@ def _has_file_size(asset: pystac.Asset) -> bool:
     make the collection claim an extension it does not use.
     """
     size = asset.extra_fields.get("file:size") if asset.extra_fields else None
+    return _is_file_size(size)
+
+
+def _is_file_size(size: Any) -> bool:
+    """Whether a ``file:size`` value is a usable size (see :func:`_has_file_size`)."""
     if isinstance(size, bool):
         return False
     if isinstance(size, int):
@@ -26,22 +26,37 @@ Usage:
 
 from __future__ import annotations
 
-import hashlib
+import base64
 import json
+import os
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from rashid.catalog import is_absolute_href
 
-from portolan_cli.constants import ROLE_COLLECTION_MIRROR
-from portolan_cli.json_io import write_json_atomic
+from portolan_cli.constants import PORTOLAN_DIR, ROLE_COLLECTION_MIRROR
+from portolan_cli.json_io import read_json_files, write_json_atomic
 from portolan_cli.output import info, warn
-from portolan_cli.sync.checksums import file_fields
+from portolan_cli.sync.checksums import compute_checksum, compute_checksums, file_fields_from
 
 # Constants
 PARQUET_FILENAME = "items.parquet"
 PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
 
+# Items per record batch when streaming items.parquet. Bounds generation
+# memory; each batch becomes one row group.
+ITEMS_PARQUET_BATCH_SIZE = 8192
+
+# Per-row-group item hashes behind incremental mirror updates, kept in the
+# collection's .portolan/ directory, which push never uploads.
+MIRROR_INDEX_FILENAME = "items-mirror.json"
+
+# Bumped whenever the index layout changes; a mismatched file forces a rebuild.
+_MIRROR_INDEX_VERSION = 1
+
 
 def _resolve_href(base_dir: Path, href: str) -> Path:
     """Resolve a STAC link href against the directory holding the linking object."""
@@ -140,17 +155,20 @@ def has_mirror_asset(collection_path: Path) -> bool:
     )
 
 
-def _load_item_dicts(collection_path: Path) -> list[dict[str, Any]]:
-    """Load all STAC item dictionaries from a collection.
+def _owned_item_paths(collection_path: Path) -> list[Path]:
+    """Paths of every item a collection owns, checked to exist.
+
+    Only paths are collected here; the items themselves are read one at a
+    time while the mirror is written.
 
     Args:
         collection_path: Path to collection directory.
 
     Returns:
-        List of STAC item dictionaries.
+        Item JSON paths in link order.
 
     Raises:
-        ValueError: If no items found.
+        ValueError: If no items found, or a link points at a missing item.
     """
     collection_json_path = collection_path / "collection.json"
     owned = owned_item_hrefs(collection_json_path)
@@ -158,15 +176,7 @@ def _load_item_dicts(collection_path: Path) -> list[dict[str, Any]]:
     if not owned:
         raise ValueError(f"No items found in collection at {collection_path}")
 
-    items = []
-    missing_hrefs = []
-
-    for href, item_path in owned:
-        if item_path.exists():
-            item_data = json.loads(item_path.read_text(encoding="utf-8"))
-            items.append(item_data)
-        else:
-            missing_hrefs.append(href)
+    missing_hrefs = [href for href, item_path in owned if not item_path.exists()]
 
     # Fail fast on stale links - items.parquet must be in sync with collection.json
     if missing_hrefs:
@@ -178,21 +188,313 @@ def _load_item_dicts(collection_path: Path) -> list[dict[str, Any]]:
             f"Missing items: {missing_list}"
         )
 
-    if not items:
-        raise ValueError(f"No items found in collection at {collection_path}")
+    return [item_path for _href, item_path in owned]
+
+
+def _write_items_ndjson(item_paths: Iterable[Path], ndjson_path: Path) -> None:
+    """Copy item JSON files into one newline-delimited file, streaming as they are read."""
+    with ndjson_path.open("w", encoding="utf-8") as f:
+        for _item_path, item in read_json_files(item_paths):
+            f.write(json.dumps(item, separators=(",", ":")))
+            f.write("\n")
+
 
-    return items
+def _item_key(collection_path: Path, item_path: Path) -> str:
+    """An item's path relative to its collection, as recorded in the mirror index."""
+    return Path(os.path.relpath(item_path, collection_path)).as_posix()
+
+
+@dataclass
+class _MirrorIndex:
+    """Which item, at which content hash, sits in each row group of items.parquet.
+
+    Attributes:
+        batch_size: Batch size the mirror was written with.
+        parquet_stat: ``(size, mtime_ns)`` of items.parquet when it was
+            written; any other file at that path is not the one indexed.
+        row_groups: Per row group, the ``(item key, sha256)`` of each row.
+    """
+
+    batch_size: int
+    parquet_stat: tuple[int, int]
+    row_groups: list[list[tuple[str, str]]]
+
+
+def _read_mirror_index(collection_path: Path) -> _MirrorIndex | None:
+    """Load the mirror index, treating a missing or malformed one as absent."""
+    path = collection_path / PORTOLAN_DIR / MIRROR_INDEX_FILENAME
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _MIRROR_INDEX_VERSION:
+        return None
+    try:
+        size, mtime_ns = data["parquet"]
+        return _MirrorIndex(
+            batch_size=int(data["batch_size"]),
+            parquet_stat=(int(size), int(mtime_ns)),
+            row_groups=[
+                [(str(key), str(sha)) for key, sha in group] for group in data["row_groups"]
+            ],
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
 
 
-def generate_items_parquet(collection_path: Path) -> Path:
+def _write_mirror_index(
+    collection_path: Path, batch_size: int, row_groups: list[list[tuple[str, str]]]
+) -> None:
+    st = (collection_path / PARQUET_FILENAME).stat()
+    write_json_atomic(
+        collection_path / PORTOLAN_DIR / MIRROR_INDEX_FILENAME,
+        {
+            "version": _MIRROR_INDEX_VERSION,
+            "batch_size": batch_size,
+            "parquet": [st.st_size, st.st_mtime_ns],
+            "row_groups": [[list(row) for row in group] for group in row_groups],
+        },
+    )
+
+
+def _split_rows(
+    rows: list[tuple[str, str]], row_group_sizes: Iterable[int]
+) -> list[list[tuple[str, str]]]:
+    groups: list[list[tuple[str, str]]] = []
+    start = 0
+    for size in row_group_sizes:
+        groups.append(rows[start : start + size])
+        start += size
+    return groups
+
+
+def _conform_batch(batch: Any, schema: Any) -> Any | None:
+    """Cast a record batch to an existing mirror's schema, or None if it does not fit.
+
+    It fits only when the mirror's schema already covers every column and
+    nested field of the batch. Arrow's struct cast silently drops fields the
+    target lacks, so a new asset key or property must trigger a rebuild rather
+    than a cast.
+    """
+    import pyarrow as pa
+
+    unified = pa.unify_schemas([schema, batch.schema], promote_options="permissive")
+    if not unified.equals(schema, check_metadata=False):
+        return None
+    columns = []
+    for field in schema:
+        index = batch.schema.get_field_index(field.name)
+        if index == -1:
+            columns.append(pa.nulls(batch.num_rows, field.type))
+        else:
+            columns.append(batch.column(index).cast(field.type))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def _arrow_paths(fields: Iterable[Any], prefix: str = "") -> set[str]:
+    """Dotted paths of every column and nested struct field in ``fields``.
+
+    List levels are elided, so a field of a list of structs shares its path
+    with the same field of a plain struct.
+    """
+    import pyarrow as pa
+
+    paths: set[str] = set()
+    for field in fields:
+        path = f"{prefix}{field.name}"
+        paths.add(path)
+        value_type = field.type
+        while (
+            pa.types.is_list(value_type)
+            or pa.types.is_large_list(value_type)
+            or (pa.types.is_fixed_size_list(value_type))
+        ):
+            value_type = value_type.value_type
+        if pa.types.is_struct(value_type):
+            paths |= _arrow_paths(value_type, f"{path}.")
+    return paths
+
+
+def _field_path(path_in_schema: str) -> list[str]:
+    """Split a Parquet column path, dropping the ``list.element`` levels."""
+    segments = path_in_schema.split(".")
+    parts: list[str] = []
+    position = 0
+    while position < len(segments):
+        if segments[position] == "list" and segments[position + 1 : position + 2] in (
+            ["element"],
+            ["item"],
+        ):
+            position += 2
+            continue
+        parts.append(segments[position])
+        position += 1
+    return parts
+
+
+def _populated_paths(metadata: Any, row_groups: int) -> set[str]:
+    """Paths with at least one value in the first ``row_groups`` row groups.
+
+    Read from the column-chunk null counts in the footer, in the same dotted
+    form as :func:`_arrow_paths`. Chunks without statistics, which pyarrow
+    writes only for null-typed columns such as an always-empty ``links``,
+    count as populated.
+    """
+    paths: set[str] = set()
+    for number in range(row_groups):
+        group = metadata.row_group(number)
+        for position in range(group.num_columns):
+            column = group.column(position)
+            stats = column.statistics
+            if stats is not None and stats.has_null_count:
+                if stats.null_count >= column.num_values:
+                    continue
+            parts = _field_path(column.path_in_schema)
+            paths.update(".".join(parts[: end + 1]) for end in range(len(parts)))
+    return paths
+
+
+def _drops_columns(schema: Any, pending_schema: Any, metadata: Any, kept: int) -> bool:
+    """Whether some column of ``schema`` would hold no values after an update.
+
+    The incremental path keeps the mirror's schema, so a property or asset
+    key carried only by items that were edited or removed would otherwise
+    stay behind as an all-null column that a full rebuild would not write.
+    """
+    populated = _populated_paths(metadata, kept) | _arrow_paths(pending_schema)
+    return not _arrow_paths(schema) <= populated
+
+
+def _update_items_parquet(
+    collection_path: Path,
+    rows: list[tuple[str, str, Path]],
+    batch_size: int,
+    partial_path: Path,
+) -> list[list[tuple[str, str]]] | None:
+    """Rewrite items.parquet from the first row group whose items changed.
+
+    A full rebuild writes items in link order, ``batch_size`` per row group.
+    The leading row groups that still hold exactly the same items, in the same
+    order and with unchanged hashes, are therefore copied across as Arrow data,
+    with no JSON parsing or conversion. Everything after them is converted
+    again in ``batch_size`` chunks, so rows and row-group boundaries come out
+    as a full rebuild would write them. Appending an item, the common case,
+    re-serializes only the tail row group.
+
+    Args:
+        collection_path: Collection directory.
+        rows: ``(item key, sha256, path)`` for every owned item, in link order.
+        batch_size: Items per new row group.
+        partial_path: Where to write the new mirror; the caller renames it.
+
+    Returns:
+        The new row-group layout, the existing layout when nothing changed
+        (and nothing was written), or None when a full rebuild is needed: no
+        usable index, more than half the items would be converted again, the
+        converted items no longer fit the mirror's schema, or a column is
+        left with no values (its last item was edited or removed).
+    """
+    import pyarrow.parquet as pq
+    import stac_geoparquet.arrow
+
+    output_path = collection_path / PARQUET_FILENAME
+    index = _read_mirror_index(collection_path)
+    if index is None or index.batch_size != batch_size or not output_path.is_file():
+        return None
+    st = output_path.stat()
+    if (st.st_size, st.st_mtime_ns) != index.parquet_stat:
+        return None
+
+    expected = _split_rows(
+        [(key, sha) for key, sha, _path in rows], _batch_sizes(len(rows), batch_size)
+    )
+    if index.row_groups == expected:
+        return index.row_groups
+    kept = 0
+    for group, wanted in zip(index.row_groups, expected, strict=False):
+        if group != wanted or len(group) != batch_size:
+            break
+        kept += 1
+    pending = rows[kept * batch_size :]
+    if len(pending) > len(rows) // 2:
+        return None
+
+    parquet_file = pq.ParquetFile(output_path)
+    metadata = parquet_file.metadata
+    if metadata.num_row_groups != len(index.row_groups) or any(
+        metadata.row_group(number).num_rows != len(group)
+        for number, group in enumerate(index.row_groups)
+    ):
+        return None
+    schema = _written_schema(parquet_file)
+
+    with tempfile.TemporaryDirectory(prefix="portolan-items-") as tmp:
+        ndjson_path = Path(tmp) / "items.ndjson"
+        _write_items_ndjson([path for _key, _sha, path in pending], ndjson_path)
+        reader = stac_geoparquet.arrow.parse_stac_ndjson_to_arrow(
+            ndjson_path, chunk_size=batch_size
+        )
+        if _drops_columns(schema, reader.schema, metadata, kept):
+            return None
+        with pq.ParquetWriter(partial_path, schema) as writer:
+            for number in range(kept):
+                writer.write_table(parquet_file.read_row_group(number).cast(schema))
+            for batch in reader:
+                conformed = _conform_batch(batch, schema)
+                if conformed is None:
+                    return None
+                writer.write_batch(conformed)
+    return expected
+
+
+def _written_schema(parquet_file: Any) -> Any:
+    """The Arrow schema a Parquet file was written with.
+
+    ``ParquetFile.schema_arrow`` renames list children to ``element``; writing
+    with it would change the footer relative to a full rebuild, which keeps
+    Arrow's ``item``. The original schema is stored under ``ARROW:schema``.
+    """
+    import pyarrow as pa
+
+    stored = (parquet_file.metadata.metadata or {}).get(b"ARROW:schema")
+    if stored is None:
+        return parquet_file.schema_arrow
+    return pa.ipc.read_schema(pa.py_buffer(base64.b64decode(stored)))
+
+
+def _batch_sizes(count: int, batch_size: int) -> list[int]:
+    """Row-group sizes of ``count`` items written ``batch_size`` at a time."""
+    return [min(batch_size, count - start) for start in range(0, count, batch_size)]
+
+
+def generate_items_parquet(
+    collection_path: Path, *, batch_size: int = ITEMS_PARQUET_BATCH_SIZE
+) -> Path:
     """Generate items.parquet from STAC items in a collection.
 
     Uses stac-geoparquet to convert all STAC items to GeoParquet format,
     enabling efficient spatial/temporal queries.
 
+    The items are streamed rather than loaded as one list: each item JSON is
+    copied into a temporary NDJSON file, which stac-geoparquet reads twice in
+    chunks of ``batch_size`` items, once to infer a schema that covers every
+    item and once to convert each chunk to a record batch written as its own
+    row group. Peak memory therefore depends on ``batch_size``, not on how
+    many items the collection has. The mirror is written beside the target
+    and renamed into place, so a failed run leaves any previous mirror intact.
+
+    Regeneration is incremental. The SHA-256 of every item in each row group
+    is kept in ``.portolan/items-mirror.json`` inside the collection (never
+    pushed), and item hashes come from the catalog's checksum cache, so an
+    unchanged item costs a stat. An unchanged collection is not rewritten at
+    all, and otherwise only the row groups from the first changed, added or
+    removed item onwards are re-serialized (see :func:`_update_items_parquet`),
+    giving the same rows and row groups as a full rebuild.
+
     Args:
         collection_path: Path to collection directory containing collection.json
             and item subdirectories.
+        batch_size: Items per record batch (and Parquet row group).
 
     Returns:
         Path to generated items.parquet file.
@@ -208,19 +510,37 @@ def generate_items_parquet(collection_path: Path) -> Path:
             "stac-geoparquet is required for items.parquet generation. "
             "Install with: pip install stac-geoparquet"
         ) from e
+    import pyarrow.parquet as pq
 
-    # Load all item dictionaries
-    items = _load_item_dicts(collection_path)
-
-    # Convert to Arrow using stac-geoparquet
-    # parse_stac_items_to_arrow returns a RecordBatchReader
-    record_batch_reader = stac_geoparquet.arrow.parse_stac_items_to_arrow(items)
-    table = record_batch_reader.read_all()
+    item_paths = _owned_item_paths(collection_path)
+    digests = compute_checksums(item_paths).digests
+    rows = [(_item_key(collection_path, path), digests[path], path) for path in item_paths]
 
-    # Write to parquet with GeoParquet metadata
     output_path = collection_path / PARQUET_FILENAME
-    stac_geoparquet.arrow.to_parquet(table, output_path)
+    partial_path = collection_path / f".{PARQUET_FILENAME}.partial"
+    try:
+        layout = _update_items_parquet(collection_path, rows, batch_size, partial_path)
+        if layout is None:
+            partial_path.unlink(missing_ok=True)
+            with tempfile.TemporaryDirectory(prefix="portolan-items-") as tmp:
+                ndjson_path = Path(tmp) / "items.ndjson"
+                _write_items_ndjson(item_paths, ndjson_path)
+                # Writes GeoParquet metadata and one row group per batch
+                stac_geoparquet.arrow.parse_stac_ndjson_to_parquet(
+                    ndjson_path, partial_path, chunk_size=batch_size
+                )
+            metadata = pq.read_metadata(partial_path)
+            layout = _split_rows(
+                [(key, sha) for key, sha, _path in rows],
+                (metadata.row_group(n).num_rows for n in range(metadata.num_row_groups)),
+            )
+        if not partial_path.exists():
+            return output_path  # no item changed
+        os.replace(partial_path, output_path)
+    finally:
+        partial_path.unlink(missing_ok=True)
 
+    _write_mirror_index(collection_path, batch_size, layout)
     return output_path
 
 
@@ -272,21 +592,45 @@ def stamp_file_fields(asset: dict[str, Any], base_dir: Path) -> bool:
         Whether the asset changed, so the caller writes collection.json only when
         there is something to write.
     """
-    href = asset.get("href")
-    if not isinstance(href, str) or not href or is_absolute_href(href):
-        return False
+    return stamp_file_fields_many([asset], base_dir)
 
-    path = _resolve_href(base_dir, href)
-    if not path.exists():
-        return _strip_file_fields(asset)
-    if not path.is_file():
-        return False
 
-    fields = file_fields(path)
-    if all(asset.get(name) == value for name, value in fields.items()):
-        return False
-    asset.update(fields)
-    return True
+def stamp_file_fields_many(assets: Iterable[dict[str, Any]], base_dir: Path) -> bool:
+    """:func:`stamp_file_fields` for several assets, hashed as one parallel batch.
+
+    Same rules per asset; the difference is that every readable file goes
+    through a single :func:`~portolan_cli.sync.checksums.compute_checksums`
+    call, so a collection's styles (or a catalog's assets) hash concurrently.
+
+    Args:
+        assets: STAC asset dicts, each mutated in place.
+        base_dir: Directory holding the collection.json that owns the assets.
+
+    Returns:
+        Whether any asset changed.
+    """
+    changed = False
+    to_hash: list[tuple[dict[str, Any], Path]] = []
+    for asset in assets:
+        href = asset.get("href")
+        if not isinstance(href, str) or not href or is_absolute_href(href):
+            continue
+        path = _resolve_href(base_dir, href)
+        if not path.exists():
+            changed = _strip_file_fields(asset) or changed
+        elif path.is_file():
+            to_hash.append((asset, path))
+
+    if not to_hash:
+        return changed
+
+    digests = compute_checksums(path for _asset, path in to_hash).digests
+    for asset, path in to_hash:
+        fields = file_fields_from(digests[path], path.stat().st_size)
+        if any(asset.get(name) != value for name, value in fields.items()):
+            asset.update(fields)
+            changed = True
+    return changed
 
 
 def _declares_file_fields(assets: Any) -> bool:
@@ -310,11 +654,8 @@ def _items_declare_file_fields(collection_json_path: Path) -> bool:
     for a collection that has already lost every ``file:`` field of its own —
     the rare case, not the routine one.
     """
-    for _href, item_path in owned_item_hrefs(collection_json_path):
-        try:
-            item = json.loads(item_path.read_text(encoding="utf-8"))
-        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
-            continue
+    item_paths = (item_path for _href, item_path in owned_item_hrefs(collection_json_path))
+    for _item_path, item in read_json_files(item_paths, strict=False):
         if isinstance(item, dict) and _declares_file_fields(item.get("assets")):
             return True
     return False
@@ -544,7 +885,7 @@ def track_parquet_in_versions(
     Raises:
         FileNotFoundError: If items.parquet doesn't exist.
     """
-    from portolan_cli.versions import read_versions, track_generated_assets
+    from portolan_cli.versions import read_versions_head, track_generated_assets
 
     parquet_path = collection_path / PARQUET_FILENAME
     versions_path = collection_path / "versions.json"
@@ -553,13 +894,11 @@ def track_parquet_in_versions(
         raise FileNotFoundError(f"items.parquet not found at {parquet_path}")
 
     if versions_path.exists():
-        versions_file = read_versions(versions_path)
-        if versions_file.versions:
-            tracked = versions_file.versions[-1].assets.get(PARQUET_FILENAME)
-            if tracked is not None:
-                sha256 = hashlib.sha256(parquet_path.read_bytes()).hexdigest()
-                if tracked.sha256 == sha256:
-                    return
+        latest = read_versions_head(versions_path).latest
+        if latest is not None:
+            tracked = latest.assets.get(PARQUET_FILENAME)
+            if tracked is not None and tracked.sha256 == compute_checksum(parquet_path):
+                return
 
     track_generated_assets(
         collection_path,
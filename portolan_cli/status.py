@@ -9,12 +9,17 @@ Provides git-like status output showing:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from portolan_cli.sync.checksums import compute_checksum
-from portolan_cli.versions import VersionsFile, read_versions
+from portolan_cli.versions import Version, VersionsFile, read_versions_head
+
+if TYPE_CHECKING:
+    from portolan_cli.catalog_index import CatalogIndex
+    from portolan_cli.sync.manifest import RemoteManifest
 
 
 @dataclass
@@ -106,13 +111,25 @@ def detect_modified_files(
     Returns:
         List of filenames that have different checksums than versions.json.
     """
-    if not versions_file.versions:
-        return []
+    return _detect_modified(collection_path, _tracked_checksums(versions_file))
+
+
+def _tracked_checksums(versions_file: VersionsFile) -> dict[str, str]:
+    """Asset name -> SHA-256 for the current version (empty without versions)."""
+    return _asset_checksums(versions_file.versions[-1] if versions_file.versions else None)
+
+
+def _asset_checksums(version: Version | None) -> dict[str, str]:
+    """Asset name -> SHA-256 for ``version`` (empty for None)."""
+    if version is None:
+        return {}
+    return {name: asset.sha256 for name, asset in version.assets.items()}
 
-    current_version = versions_file.versions[-1]
+
+def _detect_modified(collection_path: Path, tracked: Mapping[str, str]) -> list[str]:
     modified = []
 
-    for asset_name, asset in current_version.assets.items():
+    for asset_name, sha256 in tracked.items():
         file_path = collection_path / asset_name
         if not file_path.exists():
             # Missing files are handled by detect_deleted_files
@@ -120,7 +137,7 @@ def detect_modified_files(
 
         try:
             current_checksum = compute_checksum(file_path)
-            if current_checksum != asset.sha256:
+            if current_checksum != sha256:
                 modified.append(asset_name)
         except OSError:
             # Can't compute checksum, treat as modified
@@ -144,13 +161,13 @@ def detect_deleted_files(
     Returns:
         List of filenames that are in versions.json but missing from disk.
     """
-    if not versions_file.versions:
-        return []
+    return _detect_deleted(collection_path, _tracked_checksums(versions_file))
+
 
-    current_version = versions_file.versions[-1]
+def _detect_deleted(collection_path: Path, tracked: Mapping[str, str]) -> list[str]:
     deleted = []
 
-    for asset_name in current_version.assets:
+    for asset_name in tracked:
         file_path = collection_path / asset_name
         if not file_path.exists():
             deleted.append(asset_name)
@@ -199,12 +216,11 @@ def detect_untracked_files(
     Returns:
         List of data filenames on disk but not in versions.json.
     """
-    if not versions_file.versions:
-        # No versions = everything is untracked
-        tracked: set[str] = set()
-    else:
-        tracked = set(versions_file.versions[-1].assets.keys())
+    # No versions = everything is untracked
+    return _detect_untracked(collection_path, _tracked_checksums(versions_file))
+
 
+def _detect_untracked(collection_path: Path, tracked: Mapping[str, str]) -> list[str]:
     untracked = []
     for file_path in collection_path.iterdir():
         if not file_path.is_file():
@@ -233,6 +249,8 @@ def get_collection_status(
     *,
     offline: bool = False,
     remote_url: str | None = None,
+    remote_manifest: RemoteManifest | None = None,
+    index: CatalogIndex | None = None,
 ) -> CollectionStatus:
     """Get status for a single collection.
 
@@ -241,6 +259,10 @@ def get_collection_status(
         collection: Collection ID/path relative to catalog root.
         offline: If True, skip remote version check.
         remote_url: Optional remote URL for fetching remote versions.json.
+        remote_manifest: Remote catalog manifest, if the caller loaded one.
+            A collection listed there needs no versions.json fetch.
+        index: Catalog index to read the current version and tracked
+            checksums from, instead of parsing versions.json.
 
     Returns:
         CollectionStatus with local/remote versions and file changes.
@@ -248,14 +270,21 @@ def get_collection_status(
     collection_path = catalog_root / collection
     versions_path = collection_path / "versions.json"
 
-    # Read local versions.json
+    # Read local versions.json, through the index when there is one
     local_version: str | None = None
-    versions_file: VersionsFile | None = None
-
-    if versions_path.exists():
+    tracked: dict[str, str] | None = None
+
+    if index is not None and (indexed := index.collection(collection)) is not None:
+        # None here means versions.json is missing or unreadable
+        indexed_assets = index.assets(collection)
+        if indexed_assets is not None:
+            local_version = indexed.current_version
+            tracked = {name: asset.sha256 for name, asset in indexed_assets.items()}
+    elif versions_path.exists():
         try:
-            versions_file = read_versions(versions_path)
-            local_version = versions_file.current_version
+            head = read_versions_head(versions_path)
+            local_version = head.current_version
+            tracked = _asset_checksums(head.latest)
         except (ValueError, FileNotFoundError):
             pass
 
@@ -264,15 +293,19 @@ def get_collection_status(
     deleted_files: list[str] = []
     untracked_files: list[str] = []
 
-    if versions_file is not None:
-        modified_files = detect_modified_files(collection_path, versions_file)
-        deleted_files = detect_deleted_files(collection_path, versions_file)
-        untracked_files = detect_untracked_files(collection_path, versions_file)
+    if tracked is not None:
+        modified_files = _detect_modified(collection_path, tracked)
+        deleted_files = _detect_deleted(collection_path, tracked)
+        untracked_files = _detect_untracked(collection_path, tracked)
 
     # Fetch remote version (unless offline)
     remote_version: str | None = None
     if not offline and remote_url:
-        remote_version = _fetch_remote_version(remote_url, collection)
+        manifest_entry = remote_manifest.collections.get(collection) if remote_manifest else None
+        if manifest_entry is not None:
+            remote_version = manifest_entry.current_version
+        else:
+            remote_version = _fetch_remote_version(remote_url, collection)
 
     return CollectionStatus(
         collection=collection,
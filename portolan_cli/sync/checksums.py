@@ -1,199 +1,40 @@
-"""Checksum and size helpers for catalog assets."""
-
-from __future__ import annotations
-
-import hashlib
-import logging
-from pathlib import Path
-from typing import Any
-
-from rashid.api import SHA2_256, encode_multihash
-
-logger = logging.getLogger(__name__)
-
-
-def multihash_sha256(digest_hex: str) -> str:
-    """Encode a hex SHA-256 digest as a hex multihash for ``file:checksum``.
-
-    The STAC file extension types ``file:checksum`` as a multihash — the hash
-    function and digest length travel with the digest — so a bare hex digest (or
-    a ``sha256:``-prefixed one) is not a valid value (issue #654).
-
-    The encoding comes from rashid, which also decodes the value when
-    ``portolan check`` verifies it.
-
-    Args:
-        digest_hex: Hex-encoded SHA-256 digest, as returned by
-            :func:`compute_checksum`.
-
-    Returns:
-        The digest with the sha2-256 multihash prefix.
-
-    Raises:
-        ValueError: If ``digest_hex`` is not a 64-character hex string.
-    """
-    if len(digest_hex) != 64:
-        raise ValueError(f"Not a 64-character SHA-256 hex digest: {digest_hex!r}")
-    try:
-        digest = bytes.fromhex(digest_hex)
-    except ValueError as exc:
-        raise ValueError(f"Not a 64-character SHA-256 hex digest: {digest_hex!r}") from exc
-    return encode_multihash(SHA2_256, digest)
-
-
-def compute_checksum(path: Path) -> str:
-    """Compute SHA-256 checksum of a file securely.
-
-    Security: Validates the resolved path is a regular file to prevent
-    symlink attacks (MAJOR #5 - symlink security vulnerability).
-
-    Args:
-        path: Path to the file.
-
-    Returns:
-        Hex-encoded SHA-256 checksum.
-
-    Raises:
-        ValueError: If path is not a regular file (e.g., symlink to directory,
-            device file, or other non-regular file).
-        FileNotFoundError: If path does not exist.
-    """
-    # Resolve symlinks and check it's a regular file (MAJOR #5)
-    resolved = path.resolve()
-    if not resolved.exists():
-        raise FileNotFoundError(f"File not found: {path}")
-    if not resolved.is_file():
-        raise ValueError(f"Not a regular file: {path} (resolves to {resolved})")
-
-    sha256 = hashlib.sha256()
-    with open(resolved, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
-
-
-def file_fields_from(digest_hex: str, size: int) -> dict[str, Any]:
-    """Build the STAC file-extension fields for bytes that are already measured.
-
-    Takes the digest and the size rather than a path, because a FileGDB asset is
-    a directory: :func:`compute_dir_checksum` and :func:`compute_dir_size` measure
-    it, and :func:`compute_checksum` would reject it as a non-regular file.
-
-    Args:
-        digest_hex: Hex-encoded SHA-256 digest of the asset's bytes.
-        size: Byte count to publish as ``file:size``.
-
-    Returns:
-        The ``file:size`` and ``file:checksum`` pair, ready to merge into an asset.
-
-    Raises:
-        ValueError: If ``digest_hex`` is not a 64-character hex string.
-    """
-    return {"file:size": size, "file:checksum": multihash_sha256(digest_hex)}
-
-
-def file_fields(path: Path) -> dict[str, Any]:
-    """Build the STAC file-extension fields for a regular file, from its bytes.
-
-    PORTO-CORE-030 makes a published ``file:size``/``file:checksum`` a claim about
-    the bytes the asset's href resolves to, so always read them from the file as it
-    stands rather than carrying a value forward from an earlier write.
-
-    Args:
-        path: Path to the asset file.
-
-    Returns:
-        The ``file:size`` and ``file:checksum`` pair, ready to merge into an asset.
-
-    Raises:
-        ValueError: If ``path`` is not a regular file.
-        FileNotFoundError: If ``path`` does not exist.
-    """
-    return file_fields_from(compute_checksum(path), path.stat().st_size)
-
-
-def compute_dir_checksum(path: Path) -> str:
-    """Compute a stable fingerprint for a directory by hashing its contents' metadata.
-
-    Used for directory-format assets such as FileGDB (.gdb). Rather than reading
-    all bytes (expensive for large catalogs), hashes the sorted list of
-    (relative_path, size, mtime) tuples for every file inside the directory.
-    This detects file additions, removals, and modifications within the directory.
-
-    Directories are not checksummed by content — the fingerprint is based on the
-    metadata of all contained files (recursively). This is consistent with how
-    ``is_current()`` uses mtime as a fast-path gate before falling back to this
-    checksum.
-
-    Args:
-        path: Path to the directory.
-
-    Returns:
-        Hex-encoded SHA-256 fingerprint of the directory contents.
-
-    Raises:
-        ValueError: If path is not a directory.
-        FileNotFoundError: If path does not exist.
-    """
-    resolved = path.resolve()
-    if not resolved.exists():
-        raise FileNotFoundError(f"Directory not found: {path}")
-    if not resolved.is_dir():
-        raise ValueError(f"Not a directory: {path} (resolves to {resolved})")
-
-    sha256 = hashlib.sha256()
-    # Collect (relative_path, size, mtime) for all files, sorted for determinism.
-    entries: list[tuple[str, int, float]] = []
-    try:
-        for fpath in sorted(resolved.rglob("*")):
-            if not fpath.is_file():
-                continue
-            rel_path = fpath.relative_to(resolved).as_posix()
-            try:
-                stat = fpath.stat()
-                entries.append((rel_path, stat.st_size, stat.st_mtime))
-            except OSError:
-                # Skip files we can't stat (e.g., broken symlinks inside .gdb)
-                entries.append((rel_path, -1, -1.0))
-    except OSError as exc:
-        raise ValueError(f"Cannot read directory contents: {path}") from exc
-
-    for rel_path, size, mtime in entries:
-        sha256.update(f"{rel_path}\x00{size}\x00{mtime:.6f}\n".encode())
-    return sha256.hexdigest()
-
-
-def compute_dir_size(path: Path) -> int:
-    """Compute total size of all files in a directory.
-
-    Used for directory-format assets such as FileGDB (.gdb) to populate
-    the STAC file:size field.
-
-    Args:
-        path: Path to the directory.
-
-    Returns:
-        Total size in bytes of all files in the directory.
-
-    Raises:
-        ValueError: If path is not a directory.
-        FileNotFoundError: If path does not exist.
-    """
-    resolved = path.resolve()
-    if not resolved.exists():
-        raise FileNotFoundError(f"Directory not found: {path}")
-    if not resolved.is_dir():
-        raise ValueError(f"Not a directory: {path} (resolves to {resolved})")
-
-    total_size = 0
-    try:
-        for fpath in resolved.rglob("*"):
-            if fpath.is_file():
-                try:
-                    total_size += fpath.stat().st_size
-                except OSError:
-                    pass
-    except OSError as exc:
-        raise ValueError(f"Cannot read directory contents: {path}") from exc
-
-    return total_size
+"""Checksum and size helpers for catalog assets.
+
+This module re-exports :mod:`portolan_cli.checksums`, which sits outside the
+sync layer so that foundational modules such as ``versions`` can hash files
+without importing ``sync``.
+"""
+
+from portolan_cli.checksums import (
+    CHECKSUM_CACHE_ENV_VAR,
+    CHECKSUM_CACHE_FILENAME,
+    CHECKSUM_METADATA_KEY,
+    HASH_CHUNK_SIZE,
+    ChecksumBatch,
+    clear_checksum_cache,
+    compute_checksum,
+    compute_checksums,
+    compute_dir_checksum,
+    compute_dir_size,
+    file_fields,
+    file_fields_from,
+    flush_checksum_cache,
+    multihash_sha256,
+)
+
+__all__ = [
+    "CHECKSUM_CACHE_ENV_VAR",
+    "CHECKSUM_CACHE_FILENAME",
+    "CHECKSUM_METADATA_KEY",
+    "HASH_CHUNK_SIZE",
+    "ChecksumBatch",
+    "clear_checksum_cache",
+    "compute_checksum",
+    "compute_checksums",
+    "compute_dir_checksum",
+    "compute_dir_size",
+    "file_fields",
+    "file_fields_from",
+    "flush_checksum_cache",
+    "multihash_sha256",
+]
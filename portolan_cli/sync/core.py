@@ -17,15 +17,19 @@ from __future__ import annotations
 import asyncio
 import json
 import tempfile
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from portolan_cli.async_utils import get_default_concurrency, run_async
 from portolan_cli.catalog import CatalogState, detect_state, init_catalog
 from portolan_cli.output import detail, error, info, success, warn
 from portolan_cli.scan.check import CheckReport, check_directory
-from portolan_cli.scan.core import ScanResult, scan_directory
+from portolan_cli.scan.core import ScanOptions, ScanResult, scan_directory
+from portolan_cli.scan.snapshot import resolve_incremental
 from portolan_cli.sync.download import download_file
+from portolan_cli.sync.manifest import MANIFEST_LINK_REL, read_remote_manifest
 from portolan_cli.sync.pull import PullError, PullResult, pull
 from portolan_cli.sync.push import PushConflictError, PushResult, push_async
 
@@ -158,22 +162,43 @@ def _fetch_remote_catalog_json(
             tmp_path.unlink()
 
 
+@dataclass
+class RemoteDiscovery:
+    """Collections found in a remote catalog, and what finding them cost.
+
+    Attributes:
+        collections: Collection paths relative to the catalog root, in link order.
+        requests: Number of catalog.json / manifest GETs issued.
+        levels: Catalog levels fetched (1 for a flat catalog).
+        elapsed_seconds: Wall time of the discovery.
+        from_manifest: True if collections came from portolan-manifest.json.
+    """
+
+    collections: list[str]
+    requests: int
+    levels: int
+    elapsed_seconds: float
+    from_manifest: bool = False
+
+
 def list_remote_collections(
     remote_url: str,
     *,
     profile: str | None = None,
     max_depth: int = 10,
+    concurrency: int | None = None,
 ) -> list[str]:
     """List all collections available in a remote catalog.
 
-    Recursively fetches catalog.json files and parses STAC child links
-    to discover collection names. Handles nested catalog structures (nested catalogs with flat collections).
+    Thin wrapper around discover_remote_collections() that reports the
+    request count and wall time of the discovery.
 
     Args:
         remote_url: Remote catalog URL (e.g., s3://bucket/catalog).
         profile: AWS profile name (for S3).
         max_depth: Maximum recursion depth to prevent infinite loops.
             Default is 10, which should handle most reasonable hierarchies.
+        concurrency: Maximum concurrent catalog.json fetches. None = default.
 
     Returns:
         List of collection names found in the catalog (including nested).
@@ -181,16 +206,76 @@ def list_remote_collections(
     Raises:
         CloneError: If unable to fetch or parse the catalog.
     """
-    # Track visited URLs to detect circular references
-    visited_urls: set[str] = set()
-
-    return _list_remote_collections_recursive(
-        remote_url=remote_url,
-        profile=profile,
-        max_depth=max_depth,
-        current_depth=0,
-        visited_urls=visited_urls,
-        path_prefix="",  # Start with empty prefix at root
+    discovery = discover_remote_collections(
+        remote_url, profile=profile, max_depth=max_depth, concurrency=concurrency
+    )
+    source = "manifest" if discovery.from_manifest else f"{discovery.levels} level(s)"
+    detail(
+        f"Discovered {len(discovery.collections)} collection(s) with "
+        f"{discovery.requests} request(s) ({source}) in {discovery.elapsed_seconds:.2f}s"
+    )
+    return discovery.collections
+
+
+def discover_remote_collections(
+    remote_url: str,
+    *,
+    profile: str | None = None,
+    max_depth: int = 10,
+    concurrency: int | None = None,
+) -> RemoteDiscovery:
+    """Discover the collections of a remote catalog.
+
+    When the root catalog.json links a ``portolan-manifest.json`` (written by a
+    catalog-wide push), collections are read from it in one more GET.
+    Otherwise, walks STAC child links breadth-first: every catalog.json on a
+    level is fetched concurrently, so discovery takes about one round trip per
+    level of nesting rather than one per catalog. Handles nested catalog
+    structures (nested catalogs with flat collections).
+
+    Args:
+        remote_url: Remote catalog URL (e.g., s3://bucket/catalog).
+        profile: AWS profile name (for S3).
+        max_depth: Maximum nesting depth to prevent runaway walks.
+        concurrency: Maximum concurrent catalog.json fetches. None = default.
+
+    Returns:
+        RemoteDiscovery with the collections and request/timing statistics.
+
+    Raises:
+        CloneError: If unable to fetch or parse a catalog.
+    """
+    started = time.perf_counter()
+    root_catalog = _fetch_remote_catalog_json(remote_url, profile=profile)
+    requests = 1
+
+    links = root_catalog.get("links", [])
+    if any(isinstance(link, dict) and link.get("rel") == MANIFEST_LINK_REL for link in links):
+        requests += 1
+        manifest = read_remote_manifest(remote_url, profile=profile, catalog_data=root_catalog)
+        if manifest is not None:
+            return RemoteDiscovery(
+                collections=list(manifest.collections),
+                requests=requests,
+                levels=1,
+                elapsed_seconds=time.perf_counter() - started,
+                from_manifest=True,
+            )
+
+    collections, walk_requests, levels = run_async(
+        _walk_remote_catalogs(
+            remote_url,
+            root_catalog,
+            profile=profile,
+            max_depth=max_depth,
+            concurrency=concurrency or get_default_concurrency(),
+        )
+    )
+    return RemoteDiscovery(
+        collections=collections,
+        requests=requests + walk_requests,
+        levels=levels,
+        elapsed_seconds=time.perf_counter() - started,
     )
 
 
@@ -247,90 +332,90 @@ def _extract_catalog_url_from_href(base_url: str, href: str) -> str:
     return full_url
 
 
-def _list_remote_collections_recursive(
+async def _walk_remote_catalogs(
     remote_url: str,
+    root_catalog: dict[str, Any],
     *,
     profile: str | None,
     max_depth: int,
-    current_depth: int,
-    visited_urls: set[str],
-    path_prefix: str = "",
-) -> list[str]:
-    """Recursively list collections from a catalog and its subcatalogs.
+    concurrency: int,
+) -> tuple[list[str], int, int]:
+    """Breadth-first walk of child links below an already-fetched root catalog.
 
-    Internal recursive helper for list_remote_collections.
+    Internal helper for discover_remote_collections. Each level's subcatalogs
+    are fetched together, at most ``concurrency`` at a time; the blocking
+    fetches run in worker threads.
 
-    Args:
-        path_prefix: The accumulated path from the root catalog to this point.
-            Used to construct full collection paths like "climate/hittekaart".
+    Returns:
+        (collections, catalog.json requests issued, levels walked). Collections
+        are in depth-first link order, as a serial walk would list them.
     """
-    # Normalize URL for visited check
-    normalized_url = remote_url.rstrip("/")
-
-    # Check for circular reference
-    if normalized_url in visited_urls:
-        return []
-
-    # Check depth limit
-    if current_depth >= max_depth:
+    if max_depth <= 0:
         warn(f"Maximum catalog depth ({max_depth}) reached at {remote_url}")
-        return []
-
-    # Mark as visited
-    visited_urls.add(normalized_url)
-
-    # Fetch this catalog
-    catalog_data = _fetch_remote_catalog_json(remote_url, profile=profile)
-
-    collections: list[str] = []
-
-    # Parse STAC links to find child collections and subcatalogs
-    links = catalog_data.get("links", [])
-    for link in links:
-        if link.get("rel") != "child":
-            continue
-
-        href = link.get("href", "")
-        if not href:
-            continue
-
-        # Determine if this is a subcatalog or a collection
-        if href.endswith("catalog.json"):
-            # This is a subcatalog - recurse into it
-            subcatalog_url = _extract_catalog_url_from_href(remote_url, href)
-
-            # Extract the subcatalog directory name to build the path prefix
-            # e.g., "./climate/catalog.json" -> "climate"
-            subcatalog_dir = _extract_subcatalog_dir_from_href(href)
-            new_prefix = f"{path_prefix}{subcatalog_dir}/" if subcatalog_dir else path_prefix
-
-            nested_collections = _list_remote_collections_recursive(
-                remote_url=subcatalog_url,
-                profile=profile,
-                max_depth=max_depth,
-                current_depth=current_depth + 1,
-                visited_urls=visited_urls,
-                path_prefix=new_prefix,
-            )
-            collections.extend(nested_collections)
+        return [], 0, 0
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(url: str) -> dict[str, Any]:
+        async with semaphore:
+            return await asyncio.to_thread(_fetch_remote_catalog_json, url, profile=profile)
+
+    # Each collection is keyed by the link indices leading to it, so sorting
+    # the keys restores depth-first order regardless of fetch completion order.
+    found: list[tuple[tuple[int, ...], str]] = []
+    visited_urls = {remote_url.rstrip("/")}
+
+    # (catalog url, path prefix, order key) for every catalog on the current level
+    frontier: list[tuple[str, str, tuple[int, ...]]] = [(remote_url, "", ())]
+    catalogs = [root_catalog]
+    requests = 0
+    depth = 0
+
+    while True:
+        next_frontier: list[tuple[str, str, tuple[int, ...]]] = []
+        for (catalog_url, path_prefix, key), catalog_data in zip(frontier, catalogs, strict=True):
+            for index, link in enumerate(catalog_data.get("links", [])):
+                if link.get("rel") != "child":
+                    continue
+
+                href = link.get("href", "")
+                if not href:
+                    continue
+
+                if href.endswith("catalog.json"):
+                    # A subcatalog - queue it for the next level
+                    subcatalog_url = _extract_catalog_url_from_href(catalog_url, href)
+                    normalized_url = subcatalog_url.rstrip("/")
+                    if normalized_url in visited_urls:
+                        continue  # circular or repeated reference
+                    if depth + 1 >= max_depth:
+                        warn(f"Maximum catalog depth ({max_depth}) reached at {subcatalog_url}")
+                        continue
+                    visited_urls.add(normalized_url)
+
+                    # e.g., "./climate/catalog.json" -> "climate/"
+                    subcatalog_dir = _extract_subcatalog_dir_from_href(href)
+                    new_prefix = (
+                        f"{path_prefix}{subcatalog_dir}/" if subcatalog_dir else path_prefix
+                    )
+                    next_frontier.append((subcatalog_url, new_prefix, (*key, index)))
+                else:
+                    # A collection.json, or a collection link without the .json
+                    # suffix (backwards compatibility)
+                    collection_name = _extract_collection_name_from_href(href)
+                    if collection_name:
+                        found.append(((*key, index), f"{path_prefix}{collection_name}"))
 
-        elif href.endswith("collection.json"):
-            # This is an actual collection - extract the name with full path
-            collection_name = _extract_collection_name_from_href(href)
-            if collection_name:
-                # Prepend path prefix for nested collections
-                full_path = f"{path_prefix}{collection_name}" if path_prefix else collection_name
-                collections.append(full_path)
+        if not next_frontier:
+            break
 
-        else:
-            # Unknown link type - could be a collection without .json suffix
-            # Try to extract a name anyway (backwards compatibility)
-            collection_name = _extract_collection_name_from_href(href)
-            if collection_name:
-                full_path = f"{path_prefix}{collection_name}" if path_prefix else collection_name
-                collections.append(full_path)
+        depth += 1
+        frontier = next_frontier
+        catalogs = list(await asyncio.gather(*(fetch(url) for url, _, _ in frontier)))
+        requests += len(frontier)
 
-    return collections
+    found.sort()
+    return [name for _, name in found], requests, depth + 1
 
 
 def _extract_subcatalog_dir_from_href(href: str) -> str:
@@ -522,7 +607,8 @@ def _step_scan(catalog_root: Path) -> tuple[ScanResult | None, str | None]:
     """Execute scan step. Returns (scan_result, error_msg)."""
     info(f"Scanning {catalog_root}...")
     try:
-        scan_result = scan_directory(catalog_root)
+        options = ScanOptions(incremental=resolve_incremental(catalog_root))
+        scan_result = scan_directory(catalog_root, options)
 
         if scan_result.has_errors:
             warn(f"Scan found {scan_result.error_count} issue(s)")
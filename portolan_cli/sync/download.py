@@ -54,11 +54,14 @@ Note:
 
 from __future__ import annotations
 
+import asyncio
 import fnmatch
+import hashlib
 import time
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Protocol
 
 import obstore as obs
 from obstore.store import (
@@ -70,15 +73,44 @@ from obstore.store import (
     S3Store,
 )
 
+from portolan_cli.async_utils import (
+    AdaptiveConcurrencyManager,
+    AsyncIOExecutor,
+    ByteBudget,
+    CircuitBreakerError,
+    get_default_chunk_concurrency,
+    run_async,
+)
 from portolan_cli.output import detail, error, info, success, warn
+from portolan_cli.sync.checksums import CHECKSUM_METADATA_KEY, HASH_CHUNK_SIZE
 from portolan_cli.sync.upload import (
     _setup_store_and_kwargs,
     parse_object_store_url,
 )
 
+if TYPE_CHECKING:
+    from obstore import Bytes, GetOptions, ObjectMeta
+
 # Type alias for all supported object stores (same as upload.py)
 ObjectStore = S3Store | GCSStore | AzureStore | HTTPStore | LocalStore | MemoryStore
 
+# Objects at least this large are fetched as concurrent ranged GETs rather than
+# one sequential stream.
+RANGED_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024  # 64MB
+
+# Size of one ranged part, and the unit a streamed download reserves from its
+# ByteBudget before pulling the next chunk off the wire.
+DOWNLOAD_PART_SIZE = 8 * 1024 * 1024  # 8MB
+
+# Default cap on bytes buffered in memory across every in-flight download.
+DEFAULT_DOWNLOAD_BUFFER_BYTES = 256 * 1024 * 1024  # 256MB
+
+
+class _Hasher(Protocol):
+    """The part of a ``hashlib`` hash object that downloads feed."""
+
+    def update(self, data: bytes | memoryview, /) -> None: ...
+
 
 # =============================================================================
 # Exceptions
@@ -205,77 +237,71 @@ def _get_local_path_for_file(
 # =============================================================================
 
 
-def _download_one_file(
+async def _download_one_file_async(
     store: ObjectStore,
     remote_key: str,
     local_path: Path,
     file_size: int,
     *,
+    budget: ByteBudget,
+    part_concurrency: int,
     verbose: bool = False,
-) -> tuple[Path, Exception | None, int]:
-    """Download a single file and return result tuple for parallel processing.
+) -> int:
+    """Download a single listed object for download_directory.
 
-    Per-file output only shown in verbose mode when used in
-    batch operations. Errors are always shown.
+    Streams into a ``.part`` file next to ``local_path`` and renames it into
+    place once size and checksum are verified, so a failed download never
+    leaves a truncated file behind or clobbers an existing one.
+
+    Per-file output only shown in verbose mode when used in batch operations.
 
     Args:
         store: Object store instance
         remote_key: Remote object key to download
         local_path: Local path to save the file
-        file_size: Expected file size in bytes
+        file_size: Size reported by the listing, in bytes
+        budget: In-flight byte budget shared by every concurrent download
+        part_concurrency: Concurrent ranged GETs for a large object
         verbose: If True, show per-file download/success messages.
 
     Returns:
-        Tuple of (local_path, error_or_none, bytes_downloaded)
-        Uses Path for consistency with UploadResult.
+        Bytes downloaded.
     """
-    try:
-        size_mb = file_size / (1024 * 1024)
-        start_time = time.time()
-
-        filename = local_path.name
-        # Per-file output only in verbose mode
-        if verbose:
-            info(f"Downloading {filename} ({size_mb:.2f} MB) <- {remote_key}")
+    size_mb = file_size / (1024 * 1024)
+    start_time = time.time()
 
-        # Ensure parent directory exists
-        local_path.parent.mkdir(parents=True, exist_ok=True)
+    filename = local_path.name
+    # Per-file output only in verbose mode
+    if verbose:
+        info(f"Downloading {filename} ({size_mb:.2f} MB) <- {remote_key}")
 
-        # Stream download to file with cleanup on failure
-        try:
-            response = obs.get(store, remote_key)
-            with open(local_path, "wb") as f:
-                for chunk in response:
-                    f.write(chunk)
-        except Exception:
-            # Clean up partial file on any download failure
-            if local_path.exists():
-                local_path.unlink()
-            raise
-
-        # Verify file integrity - actual size must match expected
-        actual_size = local_path.stat().st_size
-        if file_size > 0 and actual_size != file_size:
-            # Clean up corrupted file
-            local_path.unlink()
+    temp_path = local_path.with_name(local_path.name + ".part")
+    try:
+        written = await download_object_async(
+            store,
+            remote_key,
+            temp_path,
+            size_bytes=file_size,
+            budget=budget,
+            part_concurrency=part_concurrency,
+        )
+        # Verify file integrity - actual size must match the listing
+        if file_size > 0 and written != file_size:
             raise DownloadIntegrityError(
-                f"Size mismatch: expected {file_size} bytes, got {actual_size} bytes"
+                f"Size mismatch: expected {file_size} bytes, got {written} bytes"
             )
+        temp_path.replace(local_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
-        elapsed = time.time() - start_time
-        speed_mbps = size_mb / elapsed if elapsed > 0 else 0
+    elapsed = time.time() - start_time
+    speed_mbps = size_mb / elapsed if elapsed > 0 else 0
 
-        # Per-file output only in verbose mode
-        if verbose:
-            success(f"{filename} ({speed_mbps:.2f} MB/s)")
-        return local_path, None, actual_size
-    except Exception as e:
-        # Clean up partial file if it exists (for any uncaught exceptions)
-        if local_path.exists():
-            local_path.unlink()
-        # Errors are always shown
-        error(f"{local_path.name}: {e}")
-        return local_path, e, 0
+    # Per-file output only in verbose mode
+    if verbose:
+        success(f"{filename} ({speed_mbps:.2f} MB/s)")
+    return written
 
 
 def download_file(
@@ -465,9 +491,10 @@ def _execute_parallel_downloads(
     fail_fast: bool,
     overwrite: bool = True,
     *,
+    chunk_concurrency: int = 4,
     verbose: bool = False,
 ) -> list[tuple[Path, Exception | None, int]]:
-    """Execute parallel downloads using ThreadPoolExecutor.
+    """Execute parallel downloads on the async executor push uses.
 
     Per-file output controlled by verbose parameter.
 
@@ -479,6 +506,7 @@ def _execute_parallel_downloads(
         max_files: Max concurrent file downloads
         fail_fast: Stop on first error if True
         overwrite: If False, skip existing files
+        chunk_concurrency: Concurrent ranged GETs per large file
         verbose: If True, show per-file download messages.
 
     Returns:
@@ -511,66 +539,97 @@ def _execute_parallel_downloads(
     if not files_to_download:
         return results
 
-    # Type alias for download result future
-    DownloadResultFuture = Future[tuple[Path, Exception | None, int]]
-
-    if fail_fast:
-        # For fail_fast mode, submit futures incrementally to ensure we can stop
-        # after the first error without starting additional tasks.
-        with ThreadPoolExecutor(max_workers=max_files) as executor:
-            pending: dict[DownloadResultFuture, str] = {}
-            files_iter = iter(files_to_download)
-
-            # Submit initial batch up to max_files
-            for remote_key, file_size, local_path in files_iter:
-                future: DownloadResultFuture = executor.submit(
-                    _download_one_file, store, remote_key, local_path, file_size, verbose=verbose
-                )
-                pending[future] = remote_key
-                if len(pending) >= max_files:
-                    break
+    results.extend(
+        run_async(
+            _download_files_async(
+                store,
+                files_to_download,
+                max_files=max_files,
+                chunk_concurrency=chunk_concurrency,
+                fail_fast=fail_fast,
+                verbose=verbose,
+            )
+        )
+    )
+    return results
 
-            while pending:
-                # Wait for next completed future
-                done: DownloadResultFuture = next(iter(as_completed(pending)))
-                result = done.result()
-                results.append(result)
-                del pending[done]
-
-                # Stop on first error
-                if result[1] is not None:
-                    for pending_future in pending:
-                        pending_future.cancel()
-                    break
 
-                # Submit next file if available
-                try:
-                    remote_key, file_size, local_path = next(files_iter)
-                    new_future: DownloadResultFuture = executor.submit(
-                        _download_one_file,
-                        store,
-                        remote_key,
-                        local_path,
-                        file_size,
-                        verbose=verbose,
-                    )
-                    pending[new_future] = remote_key
-                except StopIteration:
-                    pass
-    else:
-        # For non-fail_fast mode, submit all futures upfront for maximum parallelism
-        with ThreadPoolExecutor(max_workers=max_files) as executor:
-            future_to_file = {
-                executor.submit(
-                    _download_one_file, store, remote_key, local_path, file_size, verbose=verbose
-                ): remote_key
-                for remote_key, file_size, local_path in files_to_download
-            }
-
-            for future in as_completed(future_to_file):
-                result = future.result()
-                results.append(result)
+async def _download_files_async(
+    store: ObjectStore,
+    files_to_download: list[tuple[str, int, Path]],
+    *,
+    max_files: int,
+    chunk_concurrency: int,
+    fail_fast: bool,
+    verbose: bool,
+) -> list[tuple[Path, Exception | None, int]]:
+    """Download files through AsyncIOExecutor with slow-start concurrency.
+
+    Concurrency starts at two files and ramps up to ``max_files`` as
+    downloads succeed, backing off on errors; the executor's circuit breaker
+    aborts the batch after repeated consecutive failures (Issue #344). Every
+    download draws on one ByteBudget, so memory stays bounded however many
+    files and ranged parts are in flight.
+
+    With ``fail_fast``, files not yet started when the first error occurs
+    are skipped and left out of the results.
+    """
+    by_key = {
+        remote_key: (file_size, local_path)
+        for remote_key, file_size, local_path in files_to_download
+    }
+    budget = ByteBudget(DEFAULT_DOWNLOAD_BUFFER_BYTES)
+    results: list[tuple[Path, Exception | None, int]] = []
+    failures: dict[str, Exception] = {}
 
+    async def download_one(remote_key: str) -> int | None:
+        if fail_fast and failures:
+            return None  # skipped: an earlier download already failed
+        file_size, local_path = by_key[remote_key]
+        try:
+            return await _download_one_file_async(
+                store,
+                remote_key,
+                local_path,
+                file_size,
+                budget=budget,
+                part_concurrency=chunk_concurrency,
+                verbose=verbose,
+            )
+        except Exception as e:
+            failures[remote_key] = e
+            raise
+
+    def on_complete(
+        remote_key: str, written: int | None, err: str | None, _done: int, _total: int
+    ) -> None:
+        local_path = by_key[remote_key][1]
+        if err is not None:
+            # Errors are always shown
+            error(f"{local_path.name}: {failures[remote_key]}")
+            results.append((local_path, failures[remote_key], 0))
+        elif written is not None:
+            results.append((local_path, None, written))
+
+    adaptive_manager = AdaptiveConcurrencyManager(
+        max_concurrency=max_files,
+        initial_concurrency=min(2, max_files),
+    )
+    executor = AsyncIOExecutor[int | None](
+        concurrency=adaptive_manager.current_concurrency,
+        circuit_breaker_threshold=5,
+        adaptive_manager=adaptive_manager,
+    )
+    try:
+        await executor.execute(items=list(by_key), operation=download_one, on_complete=on_complete)
+    except CircuitBreakerError as e:
+        error(f"Too many consecutive failures, aborting: {e}")
+        reported = {path for path, _, _ in results}
+        results.extend(
+            (local_path, e, 0)
+            for remote_key, (_, local_path) in by_key.items()
+            if remote_key in failures and local_path not in reported
+        )
     return results
 
 
@@ -592,6 +651,10 @@ def download_directory(
 ) -> DownloadResult:
     """Download a directory from S3/GCS/Azure with parallel downloads.
 
+    Files download concurrently on the same adaptive async executor push
+    uses. Each one streams to disk, large ones as ranged parts, and is checked
+    against its ``portolan-sha256`` tag while it streams when push set one.
+
     Per-file output controlled by verbose parameter.
     Progress is shown via summary messages at start/end.
 
@@ -601,7 +664,7 @@ def download_directory(
         pattern: Optional glob pattern for filtering files (e.g., "*.parquet")
         profile: AWS profile name (for S3 only)
         max_files: Max number of files to download in parallel (default: 4)
-        chunk_concurrency: Max concurrent chunks per file (default: 4)
+        chunk_concurrency: Max concurrent ranged GETs per large file (default: 4)
         fail_fast: If True, stop on first error; otherwise continue and report at end
         dry_run: If True, show what would be downloaded without actually downloading
         overwrite: If False, skip existing files (default: True)
@@ -630,15 +693,12 @@ def download_directory(
 
     bucket_url, prefix = parse_object_store_url(source)
 
-    store, kwargs = _setup_store_and_kwargs(
+    # chunk_concurrency is applied per file as ranged-GET parallelism;
+    # obstore.get itself takes no max_concurrency, so the put kwargs are unused.
+    store, _ = _setup_store_and_kwargs(
         bucket_url, profile, chunk_concurrency, s3_endpoint, s3_region, s3_use_ssl
     )
 
-    # Note: chunk_concurrency is stored in kwargs['max_concurrency'] but obstore.get
-    # doesn't support max_concurrency parameter. The kwargs are kept for potential
-    # future use with obstore enhancements.
-    _ = kwargs  # Mark as intentionally unused for now
-
     # List remote files
     files = _list_remote_files(store, prefix, pattern)
 
@@ -663,11 +723,19 @@ def download_directory(
 
     info(f"Found {len(files)} file(s) to download ({total_size_mb:.2f} MB total)")
 
-    # Ensure max_files is at least 1 to avoid ThreadPoolExecutor ValueError
+    # Ensure max_files is at least 1 so the executor can make progress
     max_files = max(1, max_files)
 
     results = _execute_parallel_downloads(
-        store, files, prefix, destination, max_files, fail_fast, overwrite, verbose=verbose
+        store,
+        files,
+        prefix,
+        destination,
+        max_files,
+        fail_fast,
+        overwrite,
+        chunk_concurrency=chunk_concurrency,
+        verbose=verbose,
     )
 
     # Calculate results
@@ -684,6 +752,264 @@ def download_directory(
     )
 
 
+# =============================================================================
+# Async Streaming Downloads
+# =============================================================================
+
+
+async def download_object_async(
+    store: ObjectStore,
+    remote_key: str,
+    dest: Path,
+    *,
+    size_bytes: int = 0,
+    budget: ByteBudget | None = None,
+    part_concurrency: int | None = None,
+    expected_sha256: str | None = None,
+) -> int:
+    """Stream one object to ``dest`` without holding it in memory.
+
+    Objects of at least ``RANGED_DOWNLOAD_THRESHOLD`` bytes are split into
+    ``DOWNLOAD_PART_SIZE`` ranges fetched ``part_concurrency`` at a time and
+    written at their offsets. Smaller objects are streamed sequentially. Either
+    way every chunk reserves its bytes from ``budget`` until it is written, so
+    memory stays bounded by the budget rather than by object size.
+
+    ``size_bytes`` only chooses the strategy: the length written is checked
+    against the size the store reports, so a stale hint (a versions.json entry
+    recorded before the file was regenerated) cannot truncate a ranged fetch.
+
+    The bytes are hashed as they are written and checked against
+    ``expected_sha256``, or else against the ``CHECKSUM_METADATA_KEY`` tag push
+    stores on every object. Untagged objects are verified by size only.
+
+    ``dest`` is written in place; callers that must not clobber an existing
+    file pass a temporary (``.part``) path and rename on success.
+
+    Args:
+        store: Object store instance.
+        remote_key: Remote object key.
+        dest: Local file to write.
+        size_bytes: Expected object size, or 0 if unknown. A hint at or
+            above ``RANGED_DOWNLOAD_THRESHOLD`` costs one HEAD request.
+        budget: Shared in-flight byte budget. Defaults to a private budget of
+            one part per concurrent range.
+        part_concurrency: Concurrent ranged GETs for a large object
+            (default: the chunk concurrency used by push).
+        expected_sha256: Hex SHA-256 the object must have. Defaults to the
+            object's own checksum tag, if any.
+
+    Returns:
+        Bytes written.
+
+    Raises:
+        DownloadIntegrityError: If the bytes written differ from the size the
+            store reports for the object, or do not hash to the expected digest.
+    """
+    parts = part_concurrency or get_default_chunk_concurrency()
+    if budget is None:
+        budget = ByteBudget(DOWNLOAD_PART_SIZE * parts)
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    remote_size: int | None = None
+    expected = expected_sha256
+    pin: GetOptions = {}
+    if size_bytes >= RANGED_DOWNLOAD_THRESHOLD:
+        head = await obs.get_async(store, remote_key, options={"head": True})
+        remote_size = int(head.meta["size"])
+        expected = expected or _checksum_tag(head.attributes)
+        pin = _pin_to(head.meta)
+
+    digest: str | None
+    if remote_size is not None and remote_size >= RANGED_DOWNLOAD_THRESHOLD:
+        written, digest = await _download_ranged_async(
+            store,
+            remote_key,
+            dest,
+            remote_size,
+            budget,
+            parts,
+            verify=expected is not None,
+            pin=pin,
+        )
+    else:
+        written, remote_size, expected, digest = await _download_streamed_async(
+            store, remote_key, dest, budget, expected
+        )
+
+    if written != remote_size:
+        raise DownloadIntegrityError(
+            f"Size mismatch: expected {remote_size} bytes, got {written} bytes"
+        )
+    if expected is not None and digest != expected:
+        raise DownloadIntegrityError(f"Checksum mismatch: expected {expected}, got {digest}")
+    return written
+
+
+def _pin_to(meta: ObjectMeta) -> GetOptions:
+    """GET options that only match the object version ``meta`` describes."""
+    pin: GetOptions = {}
+    if meta.get("e_tag"):
+        pin["if_match"] = meta["e_tag"]
+    if meta.get("version"):
+        pin["version"] = meta["version"]
+    return pin
+
+
+def _checksum_tag(attributes: Mapping[str, object]) -> str | None:
+    """The SHA-256 push tagged an object with, if it carries one."""
+    tag = attributes.get(CHECKSUM_METADATA_KEY)
+    return tag if isinstance(tag, str) else None
+
+
+async def _download_streamed_async(
+    store: ObjectStore,
+    remote_key: str,
+    dest: Path,
+    budget: ByteBudget,
+    expected_sha256: str | None,
+) -> tuple[int, int, str | None, str | None]:
+    """Sequentially stream an object, one budgeted chunk at a time.
+
+    Chunks are hashed alongside the write whenever a digest is known, from
+    the caller or from the object's checksum tag on the GET response.
+
+    Returns:
+        Tuple of (bytes_written, size_reported_by_store, expected_sha256,
+        sha256_of_bytes_written). The digests are None when not verifying.
+    """
+    response = await obs.get_async(store, remote_key)
+    remote_size = int(response.meta["size"])
+    expected = expected_sha256 or _checksum_tag(response.attributes)
+    hasher = hashlib.sha256() if expected is not None else None
+    stream = response.stream(min_chunk_size=DOWNLOAD_PART_SIZE)
+    written = 0
+    with open(dest, "wb") as f:
+        while True:
+            # Reserve before pulling the chunk: the reservation is what bounds
+            # how much of the object can sit in memory at once.
+            async with budget.reserve(DOWNLOAD_PART_SIZE):
+                try:
+                    chunk = await stream.__anext__()
+                except StopAsyncIteration:
+                    break
+                await asyncio.to_thread(_write_chunk, f, chunk, hasher)
+                written += len(chunk)
+    return written, remote_size, expected, hasher.hexdigest() if hasher else None
+
+
+def _write_chunk(f: BinaryIO, chunk: object, hasher: _Hasher | None) -> None:
+    """Write a chunk and feed it to ``hasher`` (one worker-thread hop for both)."""
+    view = memoryview(chunk)  # type: ignore[arg-type]
+    f.write(view)
+    if hasher is not None:
+        hasher.update(view)
+
+
+async def _download_ranged_async(
+    store: ObjectStore,
+    remote_key: str,
+    dest: Path,
+    size_bytes: int,
+    budget: ByteBudget,
+    part_concurrency: int,
+    *,
+    verify: bool = False,
+    pin: GetOptions | None = None,
+) -> tuple[int, str | None]:
+    """Fetch an object as concurrent ranged GETs written at their offsets.
+
+    With ``verify``, the file is hashed as it fills in: whenever the parts
+    written so far form a longer contiguous prefix, that prefix is read back
+    (from the page cache) and fed to the digest, so verification finishes
+    with the last part instead of re-reading the whole file afterwards.
+
+    ``pin`` (the ETag and version from the HEAD that sized the object) is sent
+    with every part, so an object replaced mid-download fails the GET instead
+    of yielding a file spliced from two versions.
+
+    Returns:
+        Tuple of (bytes_written, sha256_hex or None when not verifying).
+
+    Raises:
+        DownloadIntegrityError: If the object no longer matches ``pin``.
+    """
+    # Pre-size the file so every part can be written at its offset independently.
+    with open(dest, "wb") as f:
+        f.truncate(size_bytes)
+
+    semaphore = asyncio.Semaphore(part_concurrency)
+    hasher = hashlib.sha256() if verify else None
+    written_parts: dict[int, int] = {}  # start -> length, written but not yet hashed
+    hashed_upto = 0
+    hash_lock = asyncio.Lock()
+
+    async def advance_hash() -> None:
+        nonlocal hashed_upto
+        async with hash_lock:
+            while hashed_upto in written_parts:
+                length = written_parts.pop(hashed_upto)
+                await asyncio.to_thread(_hash_range, dest, hashed_upto, length, hasher)
+                hashed_upto += length
+
+    async def fetch_part(start: int) -> int:
+        end = min(start + DOWNLOAD_PART_SIZE, size_bytes)
+        async with semaphore, budget.reserve(end - start):
+            data = await _get_part_async(store, remote_key, start, end, pin or {})
+            await asyncio.to_thread(_write_at, dest, start, data)
+        if hasher is not None:
+            written_parts[start] = len(data)
+            await advance_hash()
+        return len(data)
+
+    tasks = [
+        asyncio.ensure_future(fetch_part(start))
+        for start in range(0, size_bytes, DOWNLOAD_PART_SIZE)
+    ]
+    try:
+        lengths = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return sum(lengths), hasher.hexdigest() if hasher else None
+
+
+async def _get_part_async(
+    store: ObjectStore, remote_key: str, start: int, end: int, pin: GetOptions
+) -> Bytes:
+    """GET bytes ``[start, end)`` of the object version ``pin`` names."""
+    try:
+        response = await obs.get_async(store, remote_key, options={**pin, "range": (start, end)})
+        return await response.bytes_async()
+    except Exception as e:
+        if "Precondition" in str(e) or "PreconditionError" in str(type(e).__name__):
+            raise DownloadIntegrityError(f"{remote_key} changed during download") from e
+        raise
+
+
+def _write_at(path: Path, offset: int, data: object) -> None:
+    """Write a buffer at ``offset`` (portable stand-in for ``os.pwrite``)."""
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        f.write(memoryview(data))  # type: ignore[arg-type]
+
+
+def _hash_range(path: Path, offset: int, length: int, hasher: _Hasher | None) -> None:
+    """Feed ``length`` bytes of ``path`` starting at ``offset`` to ``hasher``."""
+    if hasher is None:
+        return
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while length > 0:
+            block = f.read(min(length, HASH_CHUNK_SIZE))
+            if not block:
+                break
+            hasher.update(block)
+            length -= len(block)
+
+
 # =============================================================================
 # HTTP HEAD for Remote File Sizes (Issue #501)
 # =============================================================================
@@ -0,0 +1,347 @@
+"""Remote catalog manifest: every pushed collection described in one object.
+
+Discovering what a remote catalog holds otherwise means walking
+``catalog.json`` child links one request at a time and then fetching each
+collection's ``versions.json``. A catalog-wide push therefore also publishes
+``portolan-manifest.json`` at the catalog root, listing each collection with its
+version history and the size and SHA-256 of every object in its current
+version. ``clone``, ``status`` and ``pull`` read it with one GET.
+
+The root ``catalog.json`` points at the manifest through a
+``rel="portolan:manifest"`` link. Push writes the link and the manifest into
+the local catalog as well, so the uploaded catalog.json stays identical to the
+local one and its link never dangles. That also means any later upload of the
+root catalog.json carries the link, whoever makes it, so the link alone does
+not vouch for the manifest. The manifest therefore pins the ETag of every
+object it was built from: the root and intermediate ``catalog.json`` files and
+each collection's ``versions.json``. Readers HEAD those objects concurrently,
+one round trip, and fall back to the link walk when any of them has changed,
+for instance because an older Portolan release pushed one collection.
+
+A single-collection push of this release also overwrites the manifest, remote
+and local, with a retired marker (``retired_manifest_bytes``) before it
+uploads the root ``catalog.json``, so readers skip the HEADs altogether.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import obstore as obs
+
+from portolan_cli.async_utils import get_default_concurrency
+from portolan_cli.catalog import intermediate_catalog_ids
+from portolan_cli.sync.upload import ObjectStore, _setup_store_and_kwargs, parse_object_store_url
+
+__all__ = [
+    "MANIFEST_LINK_REL",
+    "REMOTE_MANIFEST_FILENAME",
+    "ManifestCollection",
+    "RemoteManifest",
+    "build_manifest",
+    "fetch_etags",
+    "link_manifest",
+    "pinned_keys",
+    "read_remote_manifest",
+    "retired_manifest_bytes",
+]
+
+logger = logging.getLogger(__name__)
+
+# Object name of the manifest, next to the root catalog.json.
+REMOTE_MANIFEST_FILENAME = "portolan-manifest.json"
+
+# Link relation in the uploaded root catalog.json that vouches for the manifest.
+MANIFEST_LINK_REL = "portolan:manifest"
+
+# Bumped whenever the manifest layout changes; readers ignore other versions.
+# Version 2 added the ETag pins; version 1 manifests cannot be checked.
+_MANIFEST_FORMAT_VERSION = 2
+
+
+@dataclass(frozen=True)
+class ManifestCollection:
+    """One collection's remote state as recorded in the manifest.
+
+    Attributes:
+        current_version: The collection's current version, or None if unset.
+        versions: Every published version, oldest first.
+        objects: Catalog-relative object key -> (size_bytes, sha256) for the
+            current version's assets.
+    """
+
+    current_version: str | None
+    versions: tuple[str, ...]
+    objects: dict[str, tuple[int, str]]
+
+
+@dataclass(frozen=True)
+class RemoteManifest:
+    """Parsed ``portolan-manifest.json``.
+
+    Attributes:
+        collections: Collection id -> its remote state.
+        etags: Catalog-relative key -> ETag of every object the manifest was
+            built from (see ``pinned_keys``). The manifest is current only while
+            all of them are unchanged.
+    """
+
+    collections: dict[str, ManifestCollection]
+    etags: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the on-bucket JSON layout."""
+        return {
+            "manifest_version": _MANIFEST_FORMAT_VERSION,
+            "etags": dict(sorted(self.etags.items())),
+            "collections": {
+                name: {
+                    "current_version": entry.current_version,
+                    "versions": list(entry.versions),
+                    "objects": {
+                        key: {"size_bytes": size, "sha256": sha256}
+                        for key, (size, sha256) in sorted(entry.objects.items())
+                    },
+                }
+                for name, entry in sorted(self.collections.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any) -> RemoteManifest:
+        """Parse the on-bucket JSON layout.
+
+        Raises:
+            ValueError: If ``data`` is not a manifest this release understands.
+        """
+        if not isinstance(data, dict) or data.get("manifest_version") != _MANIFEST_FORMAT_VERSION:
+            raise ValueError("Unsupported or missing manifest_version")
+        if data.get("retired") is True:
+            raise ValueError("Manifest has been retired")
+        raw_collections = data.get("collections")
+        if not isinstance(raw_collections, dict):
+            raise ValueError("Manifest 'collections' must be an object")
+
+        collections = {
+            name: _parse_collection_entry(name, raw) for name, raw in raw_collections.items()
+        }
+
+        etags = data.get("etags")
+        if not isinstance(etags, dict) or not all(isinstance(etag, str) for etag in etags.values()):
+            raise ValueError("Manifest 'etags' must map keys to strings")
+        unpinned = set(pinned_keys(list(collections))) - set(etags)
+        if unpinned:
+            raise ValueError(f"Manifest does not pin {sorted(unpinned)}")
+        return cls(collections, etags)
+
+
+def _parse_collection_entry(name: str, raw: Any) -> ManifestCollection:
+    """Parse one ``collections`` entry of the on-bucket layout.
+
+    Raises:
+        ValueError: If the entry is malformed.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError(f"Manifest entry for {name!r} must be an object")
+    current = raw.get("current_version")
+    versions = raw.get("versions", [])
+    raw_objects = raw.get("objects", {})
+    if current is not None and not isinstance(current, str):
+        raise ValueError(f"Invalid current_version for {name!r}")
+    if not isinstance(versions, list) or not all(isinstance(v, str) for v in versions):
+        raise ValueError(f"Invalid versions for {name!r}")
+    if not isinstance(raw_objects, dict):
+        raise ValueError(f"Invalid objects for {name!r}")
+    objects: dict[str, tuple[int, str]] = {}
+    for key, obj in raw_objects.items():
+        if not (
+            isinstance(obj, dict)
+            and isinstance(obj.get("size_bytes"), int)
+            and isinstance(obj.get("sha256"), str)
+        ):
+            raise ValueError(f"Invalid object entry {key!r} in {name!r}")
+        objects[key] = (obj["size_bytes"], obj["sha256"])
+    return ManifestCollection(current, tuple(versions), objects)
+
+
+def retired_manifest_bytes() -> bytes:
+    """Manifest content that every reader rejects, for pushes that cannot keep it current."""
+    return json.dumps(
+        {"manifest_version": _MANIFEST_FORMAT_VERSION, "retired": True}, separators=(",", ":")
+    ).encode()
+
+
+def pinned_keys(collections: list[str]) -> list[str]:
+    """Catalog-relative keys whose ETags a manifest for ``collections`` pins.
+
+    Any change to the set of collections rewrites one of these catalog.json
+    files, and any change to a collection rewrites its versions.json.
+    """
+    catalogs = {"catalog.json"}
+    for collection in collections:
+        catalogs.update(f"{sub}/catalog.json" for sub in intermediate_catalog_ids(collection))
+    return sorted(catalogs) + [f"{collection}/versions.json" for collection in sorted(collections)]
+
+
+def fetch_etags(store: ObjectStore, prefix: str, keys: list[str]) -> dict[str, str | None]:
+    """HEAD ``keys`` (relative to ``prefix``) concurrently and return their ETags.
+
+    Runs on a thread pool rather than an event loop, because push calls it from
+    inside one. Missing objects and stores that report no ETag map to None.
+    """
+
+    def head(key: str) -> str | None:
+        try:
+            meta = obs.head(store, f"{prefix}/{key}".lstrip("/"))
+        except FileNotFoundError:
+            return None
+        return meta.get("e_tag")
+
+    if not keys:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(keys), get_default_concurrency())) as executor:
+        return dict(zip(keys, executor.map(head, keys), strict=True))
+
+
+def build_manifest(
+    catalog_root: Path, collections: list[str], etags: dict[str, str] | None = None
+) -> RemoteManifest:
+    """Describe ``collections`` from their local ``versions.json``.
+
+    Called once every collection has been pushed, when local and remote agree.
+    ``etags`` are the remote ETags of ``pinned_keys(collections)``, fetched
+    after the upload.
+
+    Raises:
+        FileNotFoundError: If a collection has no versions.json.
+        ValueError: If a versions.json is not valid JSON.
+    """
+    entries: dict[str, ManifestCollection] = {}
+    for collection in collections:
+        versions_path = catalog_root / collection / "versions.json"
+        try:
+            data = json.loads(versions_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in {versions_path}: {e}") from e
+        entries[collection] = _collection_entry(data)
+    return RemoteManifest(entries, dict(etags or {}))
+
+
+def _collection_entry(versions_data: dict[str, Any]) -> ManifestCollection:
+    version_entries = [v for v in versions_data.get("versions", []) if isinstance(v, dict)]
+    names = tuple(v["version"] for v in version_entries if isinstance(v.get("version"), str))
+    current = versions_data.get("current_version")
+    current = current if isinstance(current, str) else (names[-1] if names else None)
+
+    # The current version is always stored with its full asset set.
+    current_entry = next(
+        (v for v in version_entries if v.get("version") == current),
+        version_entries[-1] if version_entries else {},
+    )
+    objects: dict[str, tuple[int, str]] = {}
+    for name, asset in current_entry.get("assets", {}).items():
+        href = asset.get("href", name)
+        size, sha256 = asset.get("size_bytes"), asset.get("sha256")
+        if isinstance(size, int) and isinstance(sha256, str):
+            objects[href] = (size, sha256)
+    return ManifestCollection(current, names, objects)
+
+
+def link_manifest(catalog_content: bytes) -> bytes:
+    """Return root ``catalog.json`` bytes with the manifest link added.
+
+    Output matches ``json_io.write_json_atomic``, so the result can be written
+    back to the local catalog.json. Content that is not a JSON object with a
+    ``links`` list is returned as is.
+    """
+    try:
+        catalog = json.loads(catalog_content)
+    except ValueError:
+        return catalog_content
+    if not isinstance(catalog, dict) or not isinstance(catalog.get("links", []), list):
+        return catalog_content
+
+    links = [
+        link
+        for link in catalog.get("links", [])
+        if not (isinstance(link, dict) and link.get("rel") == MANIFEST_LINK_REL)
+    ]
+    links.append(
+        {
+            "rel": MANIFEST_LINK_REL,
+            "href": f"./{REMOTE_MANIFEST_FILENAME}",
+            "type": "application/json",
+        }
+    )
+    catalog["links"] = links
+    return (json.dumps(catalog, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _linked_manifest_href(catalog_data: dict[str, Any]) -> str | None:
+    for link in catalog_data.get("links", []):
+        if isinstance(link, dict) and link.get("rel") == MANIFEST_LINK_REL:
+            href = link.get("href")
+            if isinstance(href, str) and href:
+                return href
+    return None
+
+
+def read_remote_manifest(
+    remote_url: str,
+    *,
+    profile: str | None = None,
+    catalog_data: dict[str, Any] | None = None,
+) -> RemoteManifest | None:
+    """Fetch the manifest the remote root ``catalog.json`` links to.
+
+    Args:
+        remote_url: Remote catalog URL (e.g., s3://bucket/catalog).
+        profile: AWS profile name (for S3).
+        catalog_data: The remote root catalog.json, if the caller already has
+            it; saves one GET.
+
+    Returns:
+        The manifest, or None when the catalog links none, it cannot be read or
+        parsed, or an object it pins has changed since it was written. Callers
+        then use their per-collection fallback.
+    """
+    base = remote_url.rstrip("/")
+    try:
+        if catalog_data is None:
+            catalog_data = _get_json(f"{base}/catalog.json", profile)
+        if not isinstance(catalog_data, dict):
+            return None
+        href = _linked_manifest_href(catalog_data)
+        if href is None:
+            return None
+        if "://" not in href:
+            href = f"{base}/{href.removeprefix('./')}"
+        manifest = RemoteManifest.from_dict(_get_json(href, profile))
+        stale = _stale_keys(base, manifest, profile)
+        if stale:
+            logger.debug("Remote manifest at %s is stale: %s changed", remote_url, stale)
+            return None
+        return manifest
+    except Exception as e:
+        logger.debug("No usable remote manifest at %s: %s", remote_url, e)
+        return None
+
+
+def _stale_keys(base: str, manifest: RemoteManifest, profile: str | None) -> list[str]:
+    """Pinned keys whose remote ETag no longer matches the manifest."""
+    bucket_url, catalog_key = parse_object_store_url(f"{base}/catalog.json")
+    store, _kwargs = _setup_store_and_kwargs(bucket_url, profile, chunk_concurrency=1)
+    prefix = catalog_key.removesuffix("catalog.json").rstrip("/")
+    current = fetch_etags(store, prefix, sorted(manifest.etags))
+    return [key for key, etag in manifest.etags.items() if current[key] != etag]
+
+
+def _get_json(url: str, profile: str | None) -> Any:
+    bucket_url, key = parse_object_store_url(url)
+    store, _kwargs = _setup_store_and_kwargs(bucket_url, profile, chunk_concurrency=1)
+    return json.loads(bytes(obs.get(store, key).bytes()).decode("utf-8"))
@@ -33,15 +33,23 @@ from typing import TYPE_CHECKING, Any
 import obstore as obs
 
 from portolan_cli.async_utils import (
+    ByteBudget,
     CircuitBreaker,
     CircuitBreakerError,
     get_default_concurrency,
 )
+from portolan_cli.catalog_index import refresh_catalog_index
 from portolan_cli.json_io import write_json_atomic
 from portolan_cli.output import detail, error, info, output_section, success, warn
 from portolan_cli.sync.checksums import compute_checksum
-from portolan_cli.sync.download import download_file, get_remote_file_size_async
+from portolan_cli.sync.download import (
+    DEFAULT_DOWNLOAD_BUFFER_BYTES,
+    download_file,
+    download_object_async,
+    get_remote_file_size_async,
+)
 from portolan_cli.sync.upload import _setup_store_and_kwargs, parse_object_store_url
+from portolan_cli.tracing import record_io, traced
 from portolan_cli.versions import (
     VersionsFile,
     _parse_versions_file,
@@ -642,17 +650,28 @@ async def _download_file_async(
     store: ObjectStore,
     remote_key: str,
     local_path: Path,
+    *,
+    size_bytes: int = 0,
+    budget: ByteBudget | None = None,
 ) -> tuple[bool, int]:
-    """Download a single file asynchronously.
+    """Download a single file asynchronously, streaming it to disk.
 
     Uses atomic write pattern: writes to a temp file first, then renames
     to the target path on success. This prevents data loss if download fails
     when a valid file already exists at local_path.
 
+    The object is never held whole in memory: it streams into the ``.part``
+    file chunk by chunk, or as concurrent ranged parts when it is large, with
+    every buffered chunk drawn from ``budget`` (see
+    :func:`~portolan_cli.sync.download.download_object_async`).
+
     Args:
         store: Object store instance.
         remote_key: Remote object key to download.
         local_path: Local path to save the file.
+        size_bytes: Expected size from versions.json (0 if unknown). Selects
+            ranged download for large objects and is verified after writing.
+        budget: In-flight byte budget shared by every concurrent download.
 
     Returns:
         Tuple of (success, bytes_downloaded).
@@ -661,21 +680,15 @@ async def _download_file_async(
     temp_path = local_path.with_name(local_path.name + ".part")
 
     try:
-        # Ensure parent directory exists
-        local_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Use obstore's async get
-        response = await obs.get_async(store, remote_key)
-        content = await response.bytes_async()
-
-        # Write to temp file first
-        temp_path.write_bytes(content)
+        written = await download_object_async(
+            store, remote_key, temp_path, size_bytes=size_bytes, budget=budget
+        )
 
         # Atomically replace target with temp file
         temp_path.replace(local_path)
 
-        return True, len(content)
-    except Exception:
+        return True, written
+    except BaseException:
         # Clean up temp file only (preserve original if it exists)
         if temp_path.exists():
             temp_path.unlink()
@@ -737,6 +750,7 @@ async def _download_assets_async(
     *,
     verbose: bool = False,
     json_mode: bool = False,
+    buffer_bytes: int = DEFAULT_DOWNLOAD_BUFFER_BYTES,
 ) -> tuple[int, int]:
     """Download assets concurrently using asyncio.
 
@@ -752,6 +766,7 @@ async def _download_assets_async(
         concurrency: Maximum concurrent downloads.
         verbose: If True, show per-file download messages.
         json_mode: If True, suppress progress output (for agent/batch usage).
+        buffer_bytes: Cap on bytes buffered in memory across all downloads.
 
     Returns:
         Tuple of (files_downloaded, files_failed).
@@ -767,6 +782,9 @@ async def _download_assets_async(
     # Semaphore for concurrency control
     semaphore = asyncio.Semaphore(concurrency)
     circuit_breaker = CircuitBreaker(failure_threshold=10)
+    # One budget across every download: peak buffered bytes stay constant no
+    # matter how many files run at once or how large they are.
+    budget = ByteBudget(buffer_bytes)
 
     downloaded = 0
     failed = 0
@@ -814,7 +832,9 @@ async def _download_assets_async(
 
                 for attempt in range(max_retries):
                     try:
-                        await _download_file_async(store, remote_key, local_path)
+                        await _download_file_async(
+                            store, remote_key, local_path, size_bytes=file_size, budget=budget
+                        )
                         circuit_breaker.record_success()
                         # Per-file output only in verbose mode
                         if verbose:
@@ -848,6 +868,7 @@ async def _download_assets_async(
                 if success_flag:
                     downloaded += 1
                     progress.advance(bytes_downloaded)
+                    record_io(bytes=bytes_downloaded)
                 else:
                     failed += 1
                     progress.advance(0)
@@ -1014,6 +1035,7 @@ async def _process_stac_file_sizes(
 # =============================================================================
 
 
+@traced("pull", measure=lambda r: (r.files_downloaded + r.files_restored, 0))
 async def pull_async(
     remote_url: str,
     local_root: Path,
@@ -1191,6 +1213,8 @@ async def pull_async(
     elif restore_count > 0:
         success(f"Restored {restore_count} missing file(s)")
 
+    refresh_catalog_index(local_root, [collection])
+
     return PullResult(
         success=True,
         files_downloaded=downloaded,
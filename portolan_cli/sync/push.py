@@ -5,7 +5,8 @@ This module provides the push functionality for Portolan catalogs:
 - Fetch remote versions.json (with etag for optimistic locking)
 - Diff: find local-only, remote-only, and common versions
 - Detect conflicts (remote-only versions indicate divergence)
-- Upload changed assets (manifest-last: assets first, then versions.json)
+- Upload changed assets (manifest-last: assets first, then versions.json),
+  skipping objects whose remote sha256 metadata already matches
 - Use etag-based optimistic locking for atomic updates
 
 Design Principles:
@@ -22,6 +23,7 @@ import fnmatch  # Module-level import for performance (used in hot path)
 import json
 import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -37,12 +39,27 @@ from portolan_cli.async_utils import (
 from portolan_cli.catalog import intermediate_catalog_ids
 from portolan_cli.constants import LEGACY_GLOB_FIELD
 from portolan_cli.derived_assets import is_optional_derivative
+from portolan_cli.json_io import write_text_atomic
 from portolan_cli.logo import LOGO_ASSETS_DIRNAME
 from portolan_cli.output import detail, error, info, output_section, success, warn
+from portolan_cli.sync.checksums import CHECKSUM_METADATA_KEY, compute_checksums
+from portolan_cli.sync.manifest import (
+    REMOTE_MANIFEST_FILENAME,
+    RemoteManifest,
+    build_manifest,
+    fetch_etags,
+    link_manifest,
+    pinned_keys,
+    retired_manifest_bytes,
+)
+from portolan_cli.sync.push_journal import PushJournal, local_stat
 from portolan_cli.sync.upload import ObjectStore, setup_store
 from portolan_cli.sync.upload_progress import UploadProgressReporter
+from portolan_cli.tracing import traced
+from portolan_cli.versions import expand_asset_deltas
 
 __all__ = [
+    "CHECKSUM_METADATA_KEY",
     "get_default_workers",
     "push",
     "push_async",
@@ -471,6 +488,7 @@ def _build_remote_asset_set(
         return set()
 
     remote_assets: set[tuple[str, str]] = set()
+    remote_versions_data = expand_asset_deltas(remote_versions_data)
     for version_entry in remote_versions_data.get("versions", []):
         for asset_name, asset_data in version_entry.get("assets", {}).items():
             href = asset_data.get("href", asset_name)
@@ -519,7 +537,7 @@ def _get_assets_to_upload(
     seen_hrefs: set[str] = set()
     skipped_count = 0
 
-    for version_entry in versions_data.get("versions", []):
+    for version_entry in expand_asset_deltas(versions_data).get("versions", []):
         version_str = version_entry.get("version")
         if version_str not in versions_to_push:
             continue
@@ -591,6 +609,15 @@ def _cleanup_uploaded_assets(store: ObjectStore, uploaded_keys: list[str]) -> No
             warn(f"Failed to delete {key} during rollback: {e}")
 
 
+def _roll_back_push(
+    store: ObjectStore, uploaded_keys: list[str], journal: PushJournal | None
+) -> None:
+    """Delete this push's uploads and drop them from the resume journal."""
+    _cleanup_uploaded_assets(store, uploaded_keys)
+    if journal is not None:
+        journal.forget(uploaded_keys)
+
+
 # =============================================================================
 # STAC Metadata File Discovery and Upload (Issue #252)
 # =============================================================================
@@ -834,7 +861,7 @@ def _load_versioned_asset_paths(catalog_root: Path, collection: str) -> set[str]
         return set()
 
     try:
-        data = json.loads(versions_file.read_text(encoding="utf-8"))
+        data = expand_asset_deltas(json.loads(versions_file.read_text(encoding="utf-8")))
         versioned_paths: set[str] = set()
 
         # Extract asset paths from all versions
@@ -850,7 +877,7 @@ def _load_versioned_asset_paths(catalog_root: Path, collection: str) -> set[str]
                 versioned_paths.add(asset_key)
 
         return versioned_paths
-    except (json.JSONDecodeError, KeyError, TypeError):
+    except (ValueError, KeyError, TypeError):
         # Invalid versions.json - return empty set, don't fail discovery
         return set()
 
@@ -1411,6 +1438,8 @@ async def _upload_assets_async(
     suppress_progress: bool = False,
     verbose: bool = False,
     adaptive: bool = True,
+    journal: PushJournal | None = None,
+    probe_remote: bool = True,
 ) -> tuple[int, list[str], list[str], UploadMetrics]:
     """Upload asset files to object storage with async concurrent uploads.
 
@@ -1420,6 +1449,15 @@ async def _upload_assets_async(
     to respect chunk_concurrency. For small files, uses obs.put_async()
     which is more efficient but doesn't support multipart.
 
+    Every object is tagged with its SHA-256 under ``CHECKSUM_METADATA_KEY``.
+    Before uploading, each asset's object is probed with a HEAD request, and
+    assets whose remote tag already equals the local digest are skipped: a
+    re-push after a versions.json rewrite only moves bytes that changed.
+
+    With a journal, each finished upload is recorded, and assets an earlier,
+    interrupted push already uploaded are skipped (and returned among the
+    uploaded keys) when their local file and remote object are unchanged.
+
     Args:
         store: Object store instance.
         catalog_root: Path to catalog root (for relative path calculation).
@@ -1431,6 +1469,9 @@ async def _upload_assets_async(
         json_mode: If True, suppress progress bar.
         suppress_progress: If True, suppress progress bar.
         verbose: If True, print per-file upload details.
+        journal: Resume journal for this push's destination, if any.
+        probe_remote: If False, skip the per-asset HEAD probe (nothing can be
+            at the destination yet, e.g. a first push with no journal).
 
     Returns:
         Tuple of (files_uploaded, errors, uploaded_keys, metrics).
@@ -1444,8 +1485,25 @@ async def _upload_assets_async(
 
     metrics = UploadMetrics()
 
+    def asset_key(asset_path: Path) -> str:
+        rel_path = asset_path.relative_to(catalog_root)
+        return f"{prefix}/{rel_path.as_posix()}".lstrip("/")
+
+    # Digests come from the checksum cache for anything `add` already hashed.
+    digests = compute_checksums(assets).digests if assets else {}
+
+    resumed_keys: list[str] = []
+    if assets and probe_remote:
+        assets, resumed_keys, unchanged = await _skip_assets_already_remote(
+            store, assets, asset_key, digests, journal=journal, concurrency=concurrency
+        )
+        if resumed_keys:
+            info(f"Resuming push: {len(resumed_keys)} asset(s) already uploaded, skipping")
+        if unchanged:
+            info(f"Skipping {unchanged} asset(s) whose remote copy has the same sha256")
+
     if not assets:
-        return 0, [], [], metrics
+        return len(resumed_keys), [], resumed_keys, metrics
 
     total = len(assets)
     total_bytes = sum(p.stat().st_size for p in assets)
@@ -1453,7 +1511,7 @@ async def _upload_assets_async(
     # Pre-cache file sizes to avoid double stat() calls
     file_sizes: dict[Path, int] = {p: p.stat().st_size for p in assets}
 
-    uploaded_keys: list[str] = []
+    uploaded_keys: list[str] = list(resumed_keys)
     errors_list: list[str] = []
 
     # Thread pool for large file uploads that need multipart concurrency
@@ -1464,16 +1522,24 @@ async def _upload_assets_async(
     ) -> tuple[str, int, float]:
         """Upload large file with multipart concurrency (sync, runs in thread)."""
         size_bytes = file_sizes[file_path]
+        stat = local_stat(file_path) if journal is not None else None
         start = time.perf_counter()
-        obs.put(store, target_key, file_path, max_concurrency=max_conc)
+        result = obs.put(
+            store,
+            target_key,
+            file_path,
+            max_concurrency=max_conc,
+            attributes={CHECKSUM_METADATA_KEY: digests[file_path]},
+        )
         duration = time.perf_counter() - start
+        if journal is not None and stat is not None:
+            journal.record(target_key, stat, _put_e_tag(result))
         return target_key, size_bytes, duration
 
     async def upload_one(asset_path_str: str) -> tuple[str, int, float]:
         """Upload a single asset, using appropriate method based on size."""
         asset_path = Path(asset_path_str)
-        rel_path = asset_path.relative_to(catalog_root)
-        target_key = f"{prefix}/{rel_path.as_posix()}".lstrip("/")
+        target_key = asset_key(asset_path)
 
         size_bytes = file_sizes[asset_path]
 
@@ -1489,10 +1555,18 @@ async def _upload_assets_async(
             )
         else:
             # Small file: use put_async (more efficient, no multipart needed)
+            stat = local_stat(asset_path) if journal is not None else None
             start = time.perf_counter()
             content = asset_path.read_bytes()
-            await obs.put_async(store, target_key, content)
+            result = await obs.put_async(
+                store,
+                target_key,
+                content,
+                attributes={CHECKSUM_METADATA_KEY: digests[asset_path]},
+            )
             duration = time.perf_counter() - start
+            if journal is not None and stat is not None:
+                journal.record(target_key, stat, _put_e_tag(result))
             return target_key, size_bytes, duration
 
     asset_strs = [str(p) for p in assets]
@@ -1559,6 +1633,70 @@ async def _upload_assets_async(
     return len(uploaded_keys), errors_list, uploaded_keys, metrics
 
 
+def _put_e_tag(result: Any) -> str | None:
+    """ETag from an obstore PutResult, tolerating stores/mocks that return none."""
+    if isinstance(result, dict):
+        e_tag = result.get("e_tag")
+        return e_tag if isinstance(e_tag, str) else None
+    return None
+
+
+async def _skip_assets_already_remote(
+    store: ObjectStore,
+    assets: list[Path],
+    asset_key: Callable[[Path], str],
+    digests: dict[Path, str],
+    *,
+    journal: PushJournal | None,
+    concurrency: int,
+) -> tuple[list[Path], list[str], int]:
+    """Drop assets whose bytes are already at their destination key.
+
+    One HEAD per asset (bounded by ``concurrency``) answers two questions:
+
+    - Resumed: the journal recorded this upload, the local ``(size, mtime_ns)``
+      still matches, and the object returns the recorded ETag (or the recorded
+      size when either side has no ETag). Such keys belong to this push and are
+      returned so a later rollback still covers them.
+    - Unchanged: the object's ``CHECKSUM_METADATA_KEY`` equals the local
+      SHA-256. These predate this push and are never rolled back.
+
+    A missing object or any HEAD failure means the asset is uploaded.
+
+    Returns:
+        Tuple of (assets_to_upload, resumed_keys, unchanged_count).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def classify(asset_path: Path) -> str:
+        key = asset_key(asset_path)
+        entry = journal.lookup(key, asset_path) if journal is not None else None
+        async with semaphore:
+            try:
+                head = await obs.get_async(store, key, options={"head": True})
+            except Exception:
+                return "upload"
+        meta = head.meta
+        if entry is not None:
+            size, _mtime_ns, e_tag = entry
+            remote_e_tag = meta.get("e_tag")
+            if e_tag is not None and remote_e_tag is not None:
+                if remote_e_tag == e_tag:
+                    return "resumed"
+            elif meta.get("size") == size:
+                return "resumed"
+        if head.attributes.get(CHECKSUM_METADATA_KEY) == digests[asset_path]:
+            return "unchanged"
+        return "upload"
+
+    verdicts = await asyncio.gather(*(classify(p) for p in assets))
+    pairs = list(zip(assets, verdicts, strict=True))
+    remaining = [p for p, verdict in pairs if verdict == "upload"]
+    resumed = [asset_key(p) for p, verdict in pairs if verdict == "resumed"]
+    unchanged = sum(1 for _, verdict in pairs if verdict == "unchanged")
+    return remaining, resumed, unchanged
+
+
 async def _upload_stac_files_async(
     store: ObjectStore,
     catalog_root: Path,
@@ -1680,7 +1818,13 @@ async def _upload_stac_files_async(
                     reporter.advance(bytes_uploaded=size)
                     log_verbose(collection_files[i], size)
 
-        # Wave 3: Upload catalog.json last (manifest-last pattern)
+        # Wave 3: Upload catalog.json last (manifest-last pattern). This push
+        # leaves other collections' remote manifest entries unverified, so a
+        # root catalog.json upload retires the manifest first, and the local
+        # copy with it.
+        catalog_files = await _retire_manifest_async(
+            store, catalog_root, prefix, catalog_files, errors
+        )
         for file_path in catalog_files:
             result = await upload_one(file_path)
             if result:
@@ -1692,6 +1836,35 @@ async def _upload_stac_files_async(
     return len(uploaded_keys), errors, uploaded_keys
 
 
+async def _retire_manifest_async(
+    store: ObjectStore,
+    catalog_root: Path,
+    prefix: str,
+    catalog_files: list[Path],
+    errors: list[str],
+) -> list[Path]:
+    """Retire the manifest, remote and local, before the root catalog.json goes up.
+
+    Returns the catalog files that may be uploaded: all of them, or none, with
+    the failure appended to ``errors``, if the remote manifest could not be
+    retired. Without a root catalog.json among them the manifest is left alone.
+    """
+    if catalog_root / "catalog.json" not in catalog_files:
+        return catalog_files
+    manifest_key = f"{prefix}/{REMOTE_MANIFEST_FILENAME}".lstrip("/")
+    try:
+        await obs.put_async(store, manifest_key, retired_manifest_bytes())
+    except Exception as e:
+        error_msg = f"Failed to retire {REMOTE_MANIFEST_FILENAME}: {e}"
+        errors.append(error_msg)
+        error(error_msg)
+        return []
+    local_manifest = catalog_root / REMOTE_MANIFEST_FILENAME
+    if local_manifest.exists():
+        write_text_atomic(local_manifest, retired_manifest_bytes().decode("utf-8"))
+    return catalog_files
+
+
 async def _upload_versions_json_async(
     store: ObjectStore,
     prefix: str,
@@ -1876,6 +2049,7 @@ async def _execute_push_uploads_async(
     include_catalog: bool = True,
     remote_data: dict[str, Any] | None = None,
     adaptive: bool = True,
+    journal: PushJournal | None = None,
 ) -> PushResult:
     """Execute the upload phase of push_async.
 
@@ -1889,6 +2063,8 @@ async def _execute_push_uploads_async(
         include_catalog: If True, upload catalog.json and root README.md.
         verbose: If True, print per-file upload details.
         remote_data: Remote versions.json for sha256 diffing (Issue #329).
+        journal: Resume journal. When set, assets uploaded before an asset
+            failure are kept so a re-run resumes instead of starting over.
 
     Returns:
         PushResult with success or failure status and metrics.
@@ -1912,11 +2088,22 @@ async def _execute_push_uploads_async(
         suppress_progress=suppress_progress,
         verbose=verbose,
         adaptive=adaptive,
+        journal=journal,
+        # A first push has nothing remote to compare against unless an earlier
+        # attempt was interrupted; skip one HEAD per asset in that case. --force
+        # re-uploads everything, so a corrupted remote object can be replaced.
+        probe_remote=not force
+        and (remote_data is not None or bool(journal is not None and len(journal))),
     )
 
     if upload_errors:
         error("Asset upload failed, aborting push")
-        _cleanup_uploaded_assets(store, uploaded_keys)
+        if journal is None:
+            _cleanup_uploaded_assets(store, uploaded_keys)
+        elif uploaded_keys:
+            # Nothing references these objects until versions.json is published,
+            # so keeping them costs nothing and lets the next push resume.
+            warn(f"Kept {len(uploaded_keys)} uploaded asset(s); re-run push to resume")
         return PushResult(
             success=False,
             files_uploaded=files_uploaded,
@@ -1934,7 +2121,7 @@ async def _execute_push_uploads_async(
         stac_files = _discover_stac_files(catalog_root, collection, include_catalog=include_catalog)
     except FileNotFoundError as e:
         error(str(e))
-        _cleanup_uploaded_assets(store, uploaded_keys)
+        _roll_back_push(store, uploaded_keys, journal)
         return PushResult(
             success=False,
             files_uploaded=files_uploaded,
@@ -1958,7 +2145,7 @@ async def _execute_push_uploads_async(
 
     if stac_errors:
         error("STAC metadata upload failed, aborting push")
-        _cleanup_uploaded_assets(store, uploaded_keys)
+        _roll_back_push(store, uploaded_keys, journal)
         return PushResult(
             success=False,
             files_uploaded=files_uploaded,
@@ -2000,10 +2187,10 @@ async def _execute_push_uploads_async(
             )
         success(msg)
     except PushConflictError as e:
-        _cleanup_uploaded_assets(store, uploaded_keys)
+        _roll_back_push(store, uploaded_keys, journal)
         raise PushConflictError("Remote changed during push, re-run push to try again") from e
     except Exception as e:
-        _cleanup_uploaded_assets(store, uploaded_keys)
+        _roll_back_push(store, uploaded_keys, journal)
         error(f"Failed to upload versions.json: {e}")
         return PushResult(
             success=False,
@@ -2015,6 +2202,10 @@ async def _execute_push_uploads_async(
             metrics=metrics,
         )
 
+    # Published: versions.json now references these assets.
+    if journal is not None:
+        journal.forget(uploaded_keys)
+
     # Upload READMEs last (async, parallel)
     readme_uploaded, readme_errors = await _upload_readmes_async(
         store, catalog_root, prefix, stac_files, concurrency=concurrency
@@ -2040,6 +2231,10 @@ async def _execute_push_uploads_async(
     )
 
 
+@traced(
+    "push",
+    measure=lambda r: (r.files_uploaded, r.metrics.total_bytes if r.metrics else 0),
+)
 async def push_async(
     catalog_root: Path,
     collection: str,
@@ -2141,25 +2336,32 @@ async def push_async(
             success=True, files_uploaded=0, versions_pushed=0, conflicts=[], errors=[]
         )
 
-    # Execute uploads (with remote data for sha256 diffing, Issue #329)
-    return await _execute_push_uploads_async(
-        store,
-        catalog_root,
-        prefix,
-        collection,
-        local_data,
-        diff,
-        etag,
-        concurrency=concurrency,
-        chunk_concurrency=chunk_concurrency,
-        json_mode=json_mode,
-        suppress_progress=suppress_progress,
-        verbose=verbose,
-        force=force,
-        include_catalog=include_catalog,
-        remote_data=remote_data,
-        adaptive=adaptive,
-    )
+    # Execute uploads (with remote data for sha256 diffing, Issue #329).
+    # The journal is flushed even when the push is interrupted, so the next
+    # run can skip what already reached the bucket.
+    journal = PushJournal(catalog_root, destination)
+    try:
+        return await _execute_push_uploads_async(
+            store,
+            catalog_root,
+            prefix,
+            collection,
+            local_data,
+            diff,
+            etag,
+            concurrency=concurrency,
+            chunk_concurrency=chunk_concurrency,
+            json_mode=json_mode,
+            suppress_progress=suppress_progress,
+            verbose=verbose,
+            force=force,
+            include_catalog=include_catalog,
+            remote_data=remote_data,
+            adaptive=adaptive,
+            journal=journal,
+        )
+    finally:
+        journal.flush()
 
 
 # =============================================================================
@@ -2351,6 +2553,103 @@ def _discover_intermediate_catalog_files(catalog_root: Path, collections: list[s
     return files
 
 
+def _report_root_files_dry_run(
+    catalog_root: Path, root_metadata: list[Path], intermediate_files: list[Path]
+) -> None:
+    """Report what ``_push_all_upload_root_files`` would upload."""
+    if (catalog_root / "README.md").exists():
+        info("[DRY RUN] Would upload README.md")
+    if root_metadata:
+        info(f"[DRY RUN] Would sync {len(root_metadata)} root metadata file(s)")
+        for f in root_metadata:
+            detail(f" {f.relative_to(catalog_root).as_posix()}")
+    info("[DRY RUN] Would upload catalog.json")
+    if intermediate_files:
+        info(f"[DRY RUN] Would upload {len(intermediate_files)} intermediate catalog file(s)")
+        for f in intermediate_files:
+            detail(f" {f.relative_to(catalog_root).as_posix()}")
+    info(f"[DRY RUN] Would upload {REMOTE_MANIFEST_FILENAME}")
+    if (catalog_root / "versions.json").exists():
+        info("[DRY RUN] Would upload versions.json")
+
+
+def _upload_catalogs_and_manifest(
+    store: ObjectStore,
+    prefix: str,
+    catalog_root: Path,
+    collections: list[str],
+    intermediate_files: list[Path],
+    stats: dict[str, Any],
+) -> None:
+    """Upload the root and intermediate catalogs, then the manifest that pins them.
+
+    Every collection was just pushed, so local versions.json files describe
+    the remote. The root catalog.json gets its manifest link locally first, so
+    the uploaded copy stays identical to the local one. The manifest goes up
+    last because it records the ETags of the catalogs and versions.json files
+    already on the remote (see ``sync.manifest``).
+    """
+    catalog_json = catalog_root / "catalog.json"
+    catalog_content = catalog_json.read_bytes()
+    manifest: RemoteManifest | None
+    try:
+        manifest = build_manifest(catalog_root, collections)
+    except (OSError, ValueError) as e:
+        warn(f"Skipping {REMOTE_MANIFEST_FILENAME}: {e}")
+        manifest = None
+    else:
+        linked_content = link_manifest(catalog_content)
+        if linked_content != catalog_content:
+            write_text_atomic(catalog_json, linked_content.decode("utf-8"))
+            catalog_content = linked_content
+
+    # Upload catalog.json (STAC metadata)
+    catalog_key = f"{prefix}/catalog.json".lstrip("/")
+    obs.put(store, catalog_key, catalog_content)
+    success("Uploaded catalog.json")
+    stats["total_files"] += 1
+
+    # Upload intermediate catalog.json / README.md for nested collections
+    # (Issue #547, #552) - before versions.json to preserve manifest-last.
+    for inter_file in intermediate_files:
+        inter_key = f"{prefix}/{inter_file.relative_to(catalog_root).as_posix()}".lstrip("/")
+        obs.put(store, inter_key, inter_file.read_bytes())
+        detail(f" Uploaded {inter_file.relative_to(catalog_root).as_posix()}")
+        stats["total_files"] += 1
+    if intermediate_files:
+        info(f"Uploaded {len(intermediate_files)} intermediate catalog file(s)")
+
+    if manifest is not None:
+        _upload_manifest(store, prefix, catalog_root, manifest, collections)
+
+
+def _upload_manifest(
+    store: ObjectStore,
+    prefix: str,
+    catalog_root: Path,
+    manifest: RemoteManifest,
+    collections: list[str],
+) -> None:
+    """Pin ``manifest`` to the remote ETags of its sources, then upload and save it."""
+    try:
+        etags = fetch_etags(store, prefix, pinned_keys(collections))
+    except Exception as e:
+        warn(f"Skipping {REMOTE_MANIFEST_FILENAME}: {e}")
+        return
+    unpinned = sorted(key for key, etag in etags.items() if etag is None)
+    if unpinned:
+        warn(f"Skipping {REMOTE_MANIFEST_FILENAME}: no ETag for {', '.join(unpinned)}")
+        return
+    pinned = RemoteManifest(
+        manifest.collections, {key: etag for key, etag in etags.items() if etag is not None}
+    )
+    manifest_key = f"{prefix}/{REMOTE_MANIFEST_FILENAME}".lstrip("/")
+    manifest_bytes = json.dumps(pinned.to_dict(), separators=(",", ":")).encode()
+    obs.put(store, manifest_key, manifest_bytes)
+    detail(f" Uploaded {REMOTE_MANIFEST_FILENAME}")
+    write_text_atomic(catalog_root / REMOTE_MANIFEST_FILENAME, manifest_bytes.decode("utf-8"))
+
+
 def _push_all_upload_root_files(
     catalog_root: Path,
     destination: str,
@@ -2369,6 +2668,11 @@ def _push_all_upload_root_files(
     4. Intermediate catalog.json / README.md for nested collections - Issue #547, #552
     5. versions.json (manifest, required - uploaded LAST per manifest-last atomicity)
 
+    ``portolan-manifest.json`` (see ``sync.manifest``) goes up after the
+    catalogs, whose ETags it pins. The root catalog.json links to it; both are
+    also written locally, so the uploaded catalog.json stays identical to the
+    local one and its link resolves in either tree.
+
     These are uploaded AFTER all collections succeed.
 
     Args:
@@ -2406,19 +2710,7 @@ def _push_all_upload_root_files(
     intermediate_files = _discover_intermediate_catalog_files(catalog_root, collections or [])
 
     if dry_run:
-        if root_readme.exists():
-            info("[DRY RUN] Would upload README.md")
-        if root_metadata:
-            info(f"[DRY RUN] Would sync {len(root_metadata)} root metadata file(s)")
-            for f in root_metadata:
-                detail(f" {f.relative_to(catalog_root).as_posix()}")
-        info("[DRY RUN] Would upload catalog.json")
-        if intermediate_files:
-            info(f"[DRY RUN] Would upload {len(intermediate_files)} intermediate catalog file(s)")
-            for f in intermediate_files:
-                detail(f" {f.relative_to(catalog_root).as_posix()}")
-        if root_versions.exists():
-            info("[DRY RUN] Would upload versions.json")
+        _report_root_files_dry_run(catalog_root, root_metadata, intermediate_files)
         return True
 
     try:
@@ -2445,21 +2737,9 @@ def _push_all_upload_root_files(
         if root_metadata:
             info(f"Synced {len(root_metadata)} root metadata file(s)")
 
-        # Upload catalog.json (STAC metadata)
-        catalog_key = f"{prefix}/catalog.json".lstrip("/")
-        obs.put(store, catalog_key, catalog_json.read_bytes())
-        success("Uploaded catalog.json")
-        stats["total_files"] += 1
-
-        # Upload intermediate catalog.json / README.md for nested collections
-        # (Issue #547, #552) - before versions.json to preserve manifest-last.
-        for inter_file in intermediate_files:
-            inter_key = f"{prefix}/{inter_file.relative_to(catalog_root).as_posix()}".lstrip("/")
-            obs.put(store, inter_key, inter_file.read_bytes())
-            detail(f" Uploaded {inter_file.relative_to(catalog_root).as_posix()}")
-            stats["total_files"] += 1
-        if intermediate_files:
-            info(f"Uploaded {len(intermediate_files)} intermediate catalog file(s)")
+        _upload_catalogs_and_manifest(
+            store, prefix, catalog_root, collections or [], intermediate_files, stats
+        )
 
         # Upload versions.json LAST (manifest-last atomicity)
         if root_versions.exists():
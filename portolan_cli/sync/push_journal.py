@@ -0,0 +1,206 @@
+"""Upload journal that lets an interrupted push resume where it stopped.
+
+``push`` uploads every changed asset before it publishes ``versions.json``
+(manifest-last), so a push killed half-way through a large collection leaves
+the already-uploaded objects in the bucket, unreferenced. Without a record of
+them the next run starts over from zero.
+
+The journal lives in ``.portolan/push-journal.json`` and remembers, per
+destination, each asset object that finished uploading together with the local
+file's ``(size, mtime_ns)`` at upload time and the ETag the store returned. A
+re-run skips an asset whose local file is unchanged and whose remote object
+still answers a HEAD with the recorded ETag (or size, for stores that return
+no ETag). Entries are dropped once ``versions.json`` is published or the
+uploads are rolled back, so the journal only ever describes pushes in flight.
+
+obstore completes or aborts each multipart upload inside a single ``put`` call
+and does not expose upload ids or part listings, so the unit of resumption is
+the asset object rather than the individual multipart part.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from portolan_cli.constants import PORTOLAN_DIR
+from portolan_cli.json_io import write_json_atomic
+
+__all__ = [
+    "JOURNAL_FLUSH_INTERVAL_SECONDS",
+    "PUSH_JOURNAL_FILENAME",
+    "PushJournal",
+    "local_stat",
+]
+
+logger = logging.getLogger(__name__)
+
+# Journal file, inside the catalog's .portolan/ directory.
+PUSH_JOURNAL_FILENAME = "push-journal.json"
+
+# Bumped whenever the journal layout changes; a mismatched file is ignored.
+_PUSH_JOURNAL_VERSION = 1
+
+# Completed uploads are written out at most this often while a push runs, and
+# always when it finishes. A hard kill loses at most this much progress.
+JOURNAL_FLUSH_INTERVAL_SECONDS = 5.0
+
+# (size, mtime_ns, e_tag) recorded for one uploaded object.
+_Entry = tuple[int, int, str | None]
+
+# One lock per journal file, shared by every PushJournal in the process:
+# push_all pushes collections concurrently and they all flush the same file.
+_file_locks: dict[Path, threading.Lock] = {}
+_file_locks_guard = threading.Lock()
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    with _file_locks_guard:
+        return _file_locks.setdefault(path, threading.Lock())
+
+
+def local_stat(path: Path) -> tuple[int, int]:
+    """``(size, mtime_ns)`` of ``path``, as recorded in the journal."""
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+class PushJournal:
+    """Completed asset uploads for one destination, persisted under ``.portolan/``.
+
+    Thread-safe: large assets upload from a thread pool and record from there.
+    """
+
+    def __init__(self, catalog_root: Path, destination: str) -> None:
+        self.path = catalog_root / PORTOLAN_DIR / PUSH_JOURNAL_FILENAME
+        self.destination = destination.rstrip("/")
+        self._entries: dict[str, _Entry] = _read_journal_file(self.path).get(self.destination, {})
+        self._added: dict[str, _Entry] = {}
+        self._removed: set[str] = set()
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def lookup(self, key: str, local_path: Path) -> _Entry | None:
+        """Return the entry for ``key`` if ``local_path`` is unchanged since upload."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        try:
+            if local_stat(local_path) != entry[:2]:
+                return None
+        except OSError:
+            return None
+        return entry
+
+    def record(self, key: str, stat: tuple[int, int], e_tag: str | None) -> None:
+        """Remember that ``key`` now holds the file whose stat was ``stat``.
+
+        Args:
+            key: Object key the asset was uploaded to.
+            stat: ``(size, mtime_ns)`` of the local file, taken before upload.
+            e_tag: ETag returned by the store, if any.
+        """
+        entry: _Entry = (stat[0], stat[1], e_tag)
+        with self._lock:
+            self._entries[key] = entry
+            self._added[key] = entry
+            self._removed.discard(key)
+            due = time.monotonic() - self._last_flush >= JOURNAL_FLUSH_INTERVAL_SECONDS
+        if due:
+            self.flush()
+
+    def forget(self, keys: Iterable[str]) -> None:
+        """Drop ``keys`` — published in ``versions.json`` or deleted by rollback."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                self._added.pop(key, None)
+                self._removed.add(key)
+
+    def flush(self) -> None:
+        """Write pending changes, merged over whatever is on disk now.
+
+        Other destinations, and keys of this destination recorded by a
+        concurrent push, are kept. The file is removed once it describes no
+        uploads at all. Skipped silently when ``.portolan/`` has gone away.
+        """
+        with self._lock:
+            added = dict(self._added)
+            removed = set(self._removed)
+            self._last_flush = time.monotonic()
+        if not added and not removed:
+            return
+        if not self.path.parent.is_dir():
+            return
+
+        with _lock_for(self.path):
+            journal = _read_journal_file(self.path)
+            entries = journal.setdefault(self.destination, {})
+            for key in removed:
+                entries.pop(key, None)
+            entries.update(added)
+            journal = {dest: keys for dest, keys in journal.items() if keys}
+            try:
+                if journal:
+                    write_json_atomic(self.path, _serialize(journal))
+                else:
+                    self.path.unlink(missing_ok=True)
+            except OSError as exc:
+                logger.debug("Could not write push journal %s: %s", self.path, exc)
+                return
+
+        with self._lock:
+            for key, entry in added.items():
+                if self._added.get(key) == entry:
+                    del self._added[key]
+            self._removed -= removed
+
+
+def _serialize(journal: dict[str, dict[str, _Entry]]) -> dict[str, Any]:
+    return {
+        "version": _PUSH_JOURNAL_VERSION,
+        "destinations": {
+            dest: {key: list(entry) for key, entry in sorted(keys.items())}
+            for dest, keys in sorted(journal.items())
+        },
+    }
+
+
+def _read_journal_file(path: Path) -> dict[str, dict[str, _Entry]]:
+    """Parse a journal file, treating a missing or malformed one as empty."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _PUSH_JOURNAL_VERSION:
+        return {}
+    destinations = data.get("destinations")
+    if not isinstance(destinations, dict):
+        return {}
+
+    journal: dict[str, dict[str, _Entry]] = {}
+    for dest, raw_entries in destinations.items():
+        if not isinstance(raw_entries, dict):
+            continue
+        entries: dict[str, _Entry] = {}
+        for key, value in raw_entries.items():
+            if (
+                isinstance(value, list)
+                and len(value) == 3
+                and all(isinstance(v, int) for v in value[:2])
+                and (value[2] is None or isinstance(value[2], str))
+            ):
+                entries[key] = (value[0], value[1], value[2])
+        if entries:
+            journal[dest] = entries
+    return journal
@@ -0,0 +1,219 @@
+"""Phase timing for ``portolan --profile-report``.
+
+Library hot paths are wrapped in :func:`traced` (or :func:`span`). While a
+trace is active, each span records its wall time, process CPU time, bytes and
+file counts, and the process's peak RSS when it ends; spans with the same
+name path are aggregated into one phase. With no active trace (the default)
+a span only checks a module global.
+
+Nesting follows the current context (``contextvars``), so asyncio tasks see
+their parent span. Work handed to a thread or process pool starts a new root
+phase in threads and is not seen at all in child processes. CPU time is for
+the whole process, so it includes every thread running during the span.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+from portolan_cli.json_io import write_json_atomic
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """One timed execution of a phase; counters are added while it runs."""
+
+    path: str
+    bytes: int = 0
+    files: int = 0
+
+    def add(self, *, files: int = 0, bytes: int = 0) -> None:  # noqa: A002
+        """Add to the span's file and byte counters."""
+        self.files += files
+        self.bytes += bytes
+
+
+@dataclass
+class PhaseStats:
+    """Aggregate of every span with the same name path.
+
+    Attributes:
+        phase: Span names from the outermost span, joined with ``/``.
+        calls: Number of spans aggregated.
+        wall_seconds: Summed wall-clock time.
+        cpu_seconds: Summed process CPU time (all threads).
+        bytes: Summed byte counters.
+        files: Summed file counters.
+        peak_rss_bytes: Highest process peak RSS seen when a span ended, or
+            None where the platform does not report it.
+    """
+
+    phase: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    bytes: int = 0
+    files: int = 0
+    peak_rss_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to JSON-compatible primitives."""
+        return {
+            "phase": self.phase,
+            "calls": self.calls,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "bytes": self.bytes,
+            "files": self.files,
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+
+class Trace:
+    """Phase statistics collected since :func:`start_trace`."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._phases: dict[str, PhaseStats] = {}
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def record(self, span: Span, wall_seconds: float, cpu_seconds: float) -> None:
+        """Fold a finished span into its phase."""
+        rss = peak_rss_bytes()
+        with self._lock:
+            stats = self._phases.get(span.path)
+            if stats is None:
+                stats = self._phases[span.path] = PhaseStats(span.path)
+            stats.calls += 1
+            stats.wall_seconds += wall_seconds
+            stats.cpu_seconds += cpu_seconds
+            stats.bytes += span.bytes
+            stats.files += span.files
+            if rss is not None:
+                stats.peak_rss_bytes = max(stats.peak_rss_bytes or 0, rss)
+
+    def to_dict(self, command: str | None = None) -> dict[str, Any]:
+        """Report for the whole run, phases in the order they first ended."""
+        with self._lock:
+            phases = [stats.to_dict() for stats in self._phases.values()]
+        return {
+            "command": command,
+            "wall_seconds": round(time.perf_counter() - self._wall_start, 6),
+            "cpu_seconds": round(time.process_time() - self._cpu_start, 6),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "phases": phases,
+        }
+
+
+_trace: Trace | None = None
+_span_stack: ContextVar[tuple[Span, ...]] = ContextVar("portolan_span_stack", default=())
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process, or None if unavailable (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+def start_trace() -> Trace:
+    """Start collecting spans for this process, replacing any active trace."""
+    global _trace
+    _trace = Trace()
+    return _trace
+
+
+def stop_trace() -> Trace | None:
+    """Stop collecting spans and return what was collected."""
+    global _trace
+    trace, _trace = _trace, None
+    return trace
+
+
+def write_report(path: Path, *, command: str | None = None) -> None:
+    """Stop the active trace and write its report as JSON to ``path``."""
+    trace = stop_trace()
+    if trace is not None:
+        write_json_atomic(path, trace.to_dict(command))
+
+
+@contextmanager
+def span(name: str) -> Iterator[Span]:
+    """Time the enclosed block as phase ``name`` (nested under the current span)."""
+    trace = _trace
+    if trace is None:
+        yield Span(name)
+        return
+    stack = _span_stack.get()
+    current = Span(f"{stack[-1].path}/{name}" if stack else name)
+    token = _span_stack.set((*stack, current))
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield current
+    finally:
+        _span_stack.reset(token)
+        trace.record(current, time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+
+def record_io(*, files: int = 0, bytes: int = 0) -> None:  # noqa: A002
+    """Add to the innermost active span's counters; no-op outside a trace."""
+    stack = _span_stack.get()
+    if stack:
+        stack[-1].add(files=files, bytes=bytes)
+
+
+def traced(
+    name: str, *, measure: Callable[[Any], tuple[int, int]] | None = None
+) -> Callable[[F], F]:
+    """Decorate a function (sync or async) so each call runs in ``span(name)``.
+
+    Args:
+        name: Phase name.
+        measure: Maps the function's return value to ``(files, bytes)``
+            added to the span.
+    """
+
+    def decorate(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name) as current:
+                    result = await fn(*args, **kwargs)
+                    if measure is not None and _trace is not None:
+                        files, nbytes = measure(result)
+                        current.add(files=files, bytes=nbytes)
+                    return result
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name) as current:
+                result = fn(*args, **kwargs)
+                if measure is not None and _trace is not None:
+                    files, nbytes = measure(result)
+                    current.add(files=files, bytes=nbytes)
+                return result
+
+        return cast(F, wrapper)
+
+    return decorate
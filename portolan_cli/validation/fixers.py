@@ -489,24 +489,33 @@ def _fix_assets(root: Path, dry_run: bool) -> list[FixResult]:
 def _fix_checksums(root: Path, dry_run: bool) -> list[FixResult]:
     """Recompute file:size and the file:checksum multihash from the asset bytes.
 
-    Streams through ``sync.checksums.compute_checksum`` rather than reading each
+    Streams through ``sync.checksums.compute_checksums`` rather than reading each
     asset whole: a COG is routinely gigabytes, and the whole point of this fixer
-    is that it runs over every asset in the catalog.
+    is that it runs over every asset in the catalog. Every asset is collected
+    first and hashed as one parallel batch, so the pass is bound by disk and
+    cores rather than by a single hashing thread.
     """
-    from portolan_cli.sync.checksums import file_fields
+    from portolan_cli.sync.checksums import compute_checksums, file_fields_from
 
-    results: list[FixResult] = []
-    for node in _graph(root).iter("collection", "item"):
-        changed = False
+    nodes = list(_graph(root).iter("collection", "item"))
+    targets: list[tuple[Node, dict[str, Any], Path]] = []
+    for node in nodes:
         for asset in _assets_of(node).values():
             path = _local_asset_path(node, asset)
-            if path is None:
-                continue
-            for name, value in file_fields(path).items():
-                if asset.get(name) != value:
-                    asset[name] = value
-                    changed = True
-        if changed:
+            if path is not None:
+                targets.append((node, asset, path))
+    digests = compute_checksums(path for _node, _asset, path in targets).digests
+
+    changed_nodes: set[int] = set()
+    for node, asset, path in targets:
+        for name, value in file_fields_from(digests[path], path.stat().st_size).items():
+            if asset.get(name) != value:
+                asset[name] = value
+                changed_nodes.add(id(node))
+
+    results: list[FixResult] = []
+    for node in nodes:
+        if id(node) in changed_nodes:
             _write_node(node, dry_run=dry_run)
             results.append(_updated(node, "Recomputed file:size and file:checksum from the bytes"))
     return results
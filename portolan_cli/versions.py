@@ -30,23 +30,52 @@ Structure:
             }
         ]
     }
+
+A file compacted by ``portolan version compact`` (spec 1.1.0) stores the
+full ``assets`` snapshot only for every ``VERSIONS_CHECKPOINT_INTERVAL``-th
+version, the current version and the last one. The versions in between store
+only what differs from the version before them:
+
+    "assets_delta": {
+        "base": "2.0.0",
+        "updated": {"data.parquet": {...}},
+        "removed": ["old.parquet"]
+    }
+
+so the file grows with the number of changes rather than versions x assets.
+Readers rebuild full snapshots; ``Version.assets`` is always complete. Releases
+that predate 1.1.0 cannot read deltas, so the layout is opt-in: other files
+keep every snapshot in full, and a file with an unknown ``spec_version`` is
+rejected rather than misread.
 """
 
 from __future__ import annotations
 
-import hashlib
 import json
+import mmap
 import re
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from portolan_cli.checksums import compute_checksums
 from portolan_cli.json_io import write_json_atomic
 
 # Spec version constant (MINOR #12)
 SPEC_VERSION = "1.0.0"
 
+# Spec version of files that opted into ``assets_delta`` entries (via
+# compact_versions); writes keep that layout for them.
+DELTA_SPEC_VERSION = "1.1.0"
+
+# versions.json spec versions this release reads.
+SUPPORTED_SPEC_VERSIONS = (SPEC_VERSION, DELTA_SPEC_VERSION)
+
+# A full snapshot is stored every this many versions, bounding how many deltas
+# rebuilding any one version has to apply.
+VERSIONS_CHECKPOINT_INTERVAL = 32
+
 
 @dataclass(frozen=True)
 class SchemaInfo:
@@ -61,10 +90,12 @@ class SchemaInfo:
     fingerprint: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Asset:
     """A single asset (file) within a version.
 
+    Slotted: a large collection holds one per tracked file.
+
     Attributes:
         sha256: SHA-256 checksum of the file content.
         size_bytes: File size in bytes.
@@ -132,6 +163,24 @@ class VersionsFile:
     versions: list[Version] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class VersionsHead:
+    """What a versions.json says about the present, without its history.
+
+    Attributes:
+        spec_version: Schema version for the versions.json format.
+        current_version: The current version string, or None.
+        latest: The last version, or None if there are none.
+        current: The version named by ``current_version``, or None if it
+            names none. Almost always the same object as ``latest``.
+    """
+
+    spec_version: str
+    current_version: str | None
+    latest: Version | None
+    current: Version | None
+
+
 def read_versions(path: Path) -> VersionsFile:
     """Read and parse a versions.json file.
 
@@ -174,48 +223,11 @@ def _parse_versions_file(data: dict[str, Any]) -> VersionsFile:
         versions_data = data["versions"]
     except KeyError as e:
         raise ValueError(f"Invalid versions.json schema: missing field {e}") from e
+    _check_spec_version(spec_version)
 
-    versions = []
+    versions: list[Version] = []
     for v in versions_data:
-        try:
-            assets = {
-                name: Asset(
-                    sha256=asset_data["sha256"],
-                    size_bytes=asset_data["size_bytes"],
-                    href=asset_data["href"],
-                    # Optional source tracking fields with defaults
-                    source_path=asset_data.get("source_path"),
-                    source_mtime=asset_data.get("source_mtime"),
-                    # Optional asset mtime for fast-path
-                    mtime=asset_data.get("mtime"),
-                    # Optional freshness heuristics
-                    feature_count=asset_data.get("feature_count"),
-                    schema_fingerprint=asset_data.get("schema_fingerprint"),
-                )
-                for name, asset_data in v["assets"].items()
-            }
-
-            # Parse optional schema
-            schema_data = v.get("schema")
-            schema = None
-            if schema_data is not None:
-                schema = SchemaInfo(
-                    type=schema_data["type"],
-                    fingerprint=schema_data["fingerprint"],
-                )
-
-            version = Version(
-                version=v["version"],
-                created=datetime.fromisoformat(v["created"].replace("Z", "+00:00")),
-                breaking=v["breaking"],
-                assets=assets,
-                changes=v["changes"],
-                schema=schema,
-                message=v.get("message"),
-            )
-            versions.append(version)
-        except (KeyError, TypeError) as e:
-            raise ValueError(f"Invalid versions.json schema: {e}") from e
+        versions.append(_parse_version(v, versions))
 
     return VersionsFile(
         spec_version=spec_version,
@@ -224,7 +236,221 @@ def _parse_versions_file(data: dict[str, Any]) -> VersionsFile:
     )
 
 
-def write_versions(path: Path, versions_file: VersionsFile) -> None:
+def _check_spec_version(spec_version: Any) -> None:
+    """Reject a versions.json written by a newer (or unknown) format.
+
+    Raises:
+        ValueError: If ``spec_version`` is not one this release reads.
+    """
+    if spec_version not in SUPPORTED_SPEC_VERSIONS:
+        supported = ", ".join(SUPPORTED_SPEC_VERSIONS)
+        raise ValueError(
+            f"Unsupported versions.json spec_version {spec_version!r} "
+            f"(this Portolan reads {supported}); upgrade Portolan to read it"
+        )
+
+
+def _parse_version(v: dict[str, Any], previous: list[Version]) -> Version:
+    """Parse one version entry; ``previous`` holds the entries before it.
+
+    Raises:
+        ValueError: If required fields are missing or invalid.
+    """
+    try:
+        if "assets_delta" in v:
+            assets = _apply_asset_delta(previous, v["assets_delta"])
+        else:
+            assets = {name: _parse_asset(data) for name, data in v["assets"].items()}
+
+        # Parse optional schema
+        schema_data = v.get("schema")
+        schema = None
+        if schema_data is not None:
+            schema = SchemaInfo(
+                type=schema_data["type"],
+                fingerprint=schema_data["fingerprint"],
+            )
+
+        return Version(
+            version=v["version"],
+            created=datetime.fromisoformat(v["created"].replace("Z", "+00:00")),
+            breaking=v["breaking"],
+            assets=assets,
+            changes=v["changes"],
+            schema=schema,
+            message=v.get("message"),
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid versions.json schema: {e}") from e
+
+
+def read_versions_head(path: Path) -> VersionsHead:
+    """Read the current and latest versions of a versions.json, skipping history.
+
+    For callers that only look at the present snapshot. Files laid out by
+    :func:`write_versions` are answered from their header and last entry
+    alone (see :func:`_read_head_from_layout`); any other file is read in
+    full.
+
+    Args:
+        path: Path to the versions.json file.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If the JSON is invalid or doesn't match the schema.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"versions.json not found: {path}")
+
+    head = _read_head_from_layout(path)
+    if head is not None:
+        return head
+
+    versions_file = read_versions(path)
+    versions = versions_file.versions
+    return VersionsHead(
+        spec_version=versions_file.spec_version,
+        current_version=versions_file.current_version,
+        latest=versions[-1] if versions else None,
+        current=next((v for v in versions if v.version == versions_file.current_version), None),
+    )
+
+
+# write_json_atomic indents by two spaces, so a top-level key starts a line
+# with two spaces and an entry of the top-level "versions" array with four.
+# JSON strings cannot hold a raw newline, so neither marker occurs in one.
+_VERSIONS_KEY_MARKER = b'\n  "versions": ['
+_VERSION_ENTRY_MARKER = b'\n    {\n      "version": '
+# The header keys precede "versions"; where they do not, read in full.
+_HEADER_SEARCH_BYTES = 64 * 1024
+
+
+def _read_head_from_layout(path: Path) -> VersionsHead | None:
+    """The head from the header and the last version entry, or None.
+
+    The file is memory-mapped and searched backwards for the last entry, so
+    only the header and that entry are read and parsed. None when the file is
+    not laid out as :func:`write_versions` writes it, when the last entry is
+    a delta, or when ``current_version`` names an earlier version; callers
+    then read the whole file.
+    """
+    try:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            versions_at = mm.find(_VERSIONS_KEY_MARKER, 0, _HEADER_SEARCH_BYTES)
+            entry_at = mm.rfind(_VERSION_ENTRY_MARKER)
+            if versions_at == -1 or entry_at < versions_at:
+                return None
+            header = json.loads(mm[:versions_at].decode("utf-8") + '"versions": []}')
+            tail = mm[entry_at:].decode("utf-8").rstrip()
+        # The last entry is followed only by the closing "]" and "}"
+        if not tail.endswith("}"):
+            return None
+        tail = tail[:-1].rstrip()
+        if not tail.endswith("]"):
+            return None
+        entry = json.loads(tail[:-1])
+        spec_version = header["spec_version"]
+        current_version = header["current_version"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if spec_version not in SUPPORTED_SPEC_VERSIONS:
+        return None
+    if not isinstance(entry, dict) or "assets" not in entry:
+        return None
+    if current_version is not None and entry.get("version") != current_version:
+        return None
+    latest = _parse_version(entry, [])
+    return VersionsHead(
+        spec_version=spec_version,
+        current_version=current_version,
+        latest=latest,
+        current=latest if current_version is not None else None,
+    )
+
+
+def _parse_asset(asset_data: dict[str, Any]) -> Asset:
+    return Asset(
+        sha256=asset_data["sha256"],
+        size_bytes=asset_data["size_bytes"],
+        href=asset_data["href"],
+        # Optional source tracking fields with defaults
+        source_path=asset_data.get("source_path"),
+        source_mtime=asset_data.get("source_mtime"),
+        # Optional asset mtime for fast-path
+        mtime=asset_data.get("mtime"),
+        # Optional freshness heuristics
+        feature_count=asset_data.get("feature_count"),
+        schema_fingerprint=asset_data.get("schema_fingerprint"),
+    )
+
+
+def _apply_asset_delta(previous: list[Version], delta: dict[str, Any]) -> dict[str, Asset]:
+    """Rebuild a snapshot from the version before it and an ``assets_delta``.
+
+    Raises:
+        ValueError: If the delta does not follow the version it names as base.
+    """
+    if not previous or previous[-1].version != delta["base"]:
+        raise ValueError(
+            f"Invalid versions.json schema: assets_delta base {delta['base']!r} "
+            "is not the preceding version"
+        )
+    assets = dict(previous[-1].assets)
+    assets.update((name, _parse_asset(data)) for name, data in delta["updated"].items())
+    for name in delta["removed"]:
+        assets.pop(name, None)
+    return assets
+
+
+def expand_asset_deltas(data: dict[str, Any]) -> dict[str, Any]:
+    """Raw versions.json data with every entry carrying its full ``assets``.
+
+    For callers that walk the JSON rather than :func:`read_versions`, which
+    tolerate a missing ``spec_version``. Entries share the asset dicts they
+    have in common; ``data`` is not modified.
+
+    Raises:
+        ValueError: If ``spec_version`` is present but unsupported, or an
+            ``assets_delta`` does not follow its base version.
+    """
+    if "spec_version" in data:
+        _check_spec_version(data["spec_version"])
+    versions = data.get("versions")
+    if not isinstance(versions, list) or not any(
+        isinstance(v, dict) and "assets_delta" in v for v in versions
+    ):
+        return data
+    expanded: list[Any] = []
+    assets: dict[str, Any] = {}
+    previous: str | None = None
+    for v in versions:
+        if isinstance(v, dict):
+            delta = v.get("assets_delta")
+            if isinstance(delta, dict):
+                if delta.get("base") != previous:
+                    raise ValueError(
+                        f"Invalid versions.json schema: assets_delta base "
+                        f"{delta.get('base')!r} is not the preceding version"
+                    )
+                assets = {**assets, **delta.get("updated", {})}
+                for name in delta.get("removed", []):
+                    assets.pop(name, None)
+                v = {key: value for key, value in v.items() if key != "assets_delta"}
+                v["assets"] = assets
+            else:
+                assets = v.get("assets", {})
+            previous = v.get("version")
+        expanded.append(v)
+    return {**data, "versions": expanded}
+
+
+def write_versions(
+    path: Path,
+    versions_file: VersionsFile,
+    *,
+    checkpoint_interval: int | None = None,
+) -> None:
     """Write a VersionsFile to disk as JSON atomically.
 
     Uses atomic write pattern (write to temp file, then rename) to prevent
@@ -235,8 +461,64 @@ def write_versions(path: Path, versions_file: VersionsFile) -> None:
     Args:
         path: Destination path for the versions.json file.
         versions_file: The VersionsFile to serialize.
+        checkpoint_interval: Store a full snapshot every this many versions;
+            1 stores every version in full, readable by every release. None
+            keeps the file's layout: deltas every ``VERSIONS_CHECKPOINT_INTERVAL``
+            versions for a ``DELTA_SPEC_VERSION`` file, full snapshots otherwise.
+    """
+    if checkpoint_interval is None:
+        delta_layout = versions_file.spec_version == DELTA_SPEC_VERSION
+        checkpoint_interval = VERSIONS_CHECKPOINT_INTERVAL if delta_layout else 1
+    write_json_atomic(path, _serialize_versions_file(versions_file, checkpoint_interval))
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    """Outcome of :func:`compact_versions`.
+
+    Attributes:
+        path: The versions.json that was rewritten.
+        version_count: Number of versions it holds.
+        bytes_before: File size before compaction.
+        bytes_after: File size after compaction.
+    """
+
+    path: Path
+    version_count: int
+    bytes_before: int
+    bytes_after: int
+
+
+def compact_versions(
+    path: Path, *, checkpoint_interval: int = VERSIONS_CHECKPOINT_INTERVAL
+) -> CompactionResult:
+    """Rewrite a versions.json with delta entries between full checkpoints.
+
+    History is kept whole: every version reads back with the same assets.
+    Files written by older releases store each version in full and shrink the
+    most. The file is marked ``DELTA_SPEC_VERSION``, so later writes keep the
+    layout; Portolan releases older than that spec cannot read it. An
+    interval of 1 turns the file back into full snapshots.
+
+    Args:
+        path: Path to the versions.json file.
+        checkpoint_interval: Store a full snapshot every this many versions.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If the file is invalid or ``checkpoint_interval`` < 1.
     """
-    write_json_atomic(path, _serialize_versions_file(versions_file))
+    if checkpoint_interval < 1:
+        raise ValueError(f"checkpoint_interval must be at least 1, got {checkpoint_interval}")
+    versions_file = read_versions(path)
+    bytes_before = path.stat().st_size
+    write_versions(path, versions_file, checkpoint_interval=checkpoint_interval)
+    return CompactionResult(
+        path=path,
+        version_count=len(versions_file.versions),
+        bytes_before=bytes_before,
+        bytes_after=path.stat().st_size,
+    )
 
 
 def _serialize_asset(asset: Asset) -> dict[str, Any]:
@@ -270,13 +552,15 @@ def _serialize_asset(asset: Asset) -> dict[str, Any]:
     return data
 
 
-def _serialize_version(v: Version) -> dict[str, Any]:
+def _serialize_version(v: Version, base: Version | None = None) -> dict[str, Any]:
     """Serialize a Version to a JSON-compatible dictionary.
 
     Only includes optional fields (schema, message) when they are not None.
 
     Args:
         v: The Version to serialize.
+        base: The preceding version, to store the assets as a delta against;
+            None stores the full snapshot.
 
     Returns:
         Dictionary suitable for JSON serialization.
@@ -285,9 +569,20 @@ def _serialize_version(v: Version) -> dict[str, Any]:
         "version": v.version,
         "created": v.created.isoformat().replace("+00:00", "Z"),
         "breaking": v.breaking,
-        "assets": {name: _serialize_asset(asset) for name, asset in v.assets.items()},
-        "changes": v.changes,
     }
+    if base is None:
+        data["assets"] = {name: _serialize_asset(asset) for name, asset in v.assets.items()}
+    else:
+        data["assets_delta"] = {
+            "base": base.version,
+            "updated": {
+                name: _serialize_asset(asset)
+                for name, asset in v.assets.items()
+                if base.assets.get(name) != asset
+            },
+            "removed": [name for name in base.assets if name not in v.assets],
+        }
+    data["changes"] = v.changes
     # Only include optional fields when present
     if v.schema is not None:
         data["schema"] = {
@@ -299,19 +594,34 @@ def _serialize_version(v: Version) -> dict[str, Any]:
     return data
 
 
-def _serialize_versions_file(versions_file: VersionsFile) -> dict[str, Any]:
+def _serialize_versions_file(
+    versions_file: VersionsFile, checkpoint_interval: int = VERSIONS_CHECKPOINT_INTERVAL
+) -> dict[str, Any]:
     """Serialize a VersionsFile to a JSON-compatible dictionary.
 
+    Checkpoints, the current version and the last version are stored in full;
+    the rest as deltas against the version before them. Any interval above 1
+    marks the file ``DELTA_SPEC_VERSION``.
+
     Args:
         versions_file: The VersionsFile to serialize.
+        checkpoint_interval: Store a full snapshot every this many versions.
 
     Returns:
         Dictionary suitable for JSON serialization.
     """
+    versions = versions_file.versions
+    last = len(versions) - 1
+    entries = [
+        _serialize_version(v)
+        if i % checkpoint_interval == 0 or i == last or v.version == versions_file.current_version
+        else _serialize_version(v, base=versions[i - 1])
+        for i, v in enumerate(versions)
+    ]
     return {
-        "spec_version": versions_file.spec_version,
+        "spec_version": DELTA_SPEC_VERSION if checkpoint_interval > 1 else SPEC_VERSION,
         "current_version": versions_file.current_version,
-        "versions": [_serialize_version(v) for v in versions_file.versions],
+        "versions": entries,
     }
 
 
@@ -331,7 +641,8 @@ def add_version(
     modifying the input.
 
     Each version is a complete SNAPSHOT of all assets at that point in time. New assets are merged with the previous version's assets,
-    and any assets in `removed` are excluded.
+    and any assets in `removed` are excluded. On disk most versions are
+    stored as deltas; see :func:`write_versions`.
 
     Args:
         versions_file: The existing VersionsFile.
@@ -511,18 +822,6 @@ def _compute_changes(versions_file: VersionsFile, new_assets: dict[str, Asset])
     return changes
 
 
-def _compute_sha256(path: Path) -> str:
-    """Stream a file in 64KB chunks and return its SHA-256 hex digest.
-
-    Chunked to avoid loading large PMTiles/thumbnail files fully into memory.
-    """
-    hasher = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):  # 64KB chunks
-            hasher.update(chunk)
-    return hasher.hexdigest()
-
-
 def _asset_href(asset_path: Path, catalog_root: Path, collection_path: Path) -> str:
     """The catalog-root-relative href recorded for a generated asset."""
     try:
@@ -625,11 +924,12 @@ def track_generated_assets(
     if not paths_to_track:
         return
 
+    digests = compute_checksums(paths_to_track).digests
     assets: dict[str, Asset] = {}
     for asset_path in paths_to_track:
         stat = asset_path.stat()
         assets[asset_path.name] = Asset(
-            sha256=_compute_sha256(asset_path),
+            sha256=digests[asset_path],
             size_bytes=stat.st_size,
             href=_asset_href(asset_path, catalog_root, collection_path),
             mtime=stat.st_mtime,
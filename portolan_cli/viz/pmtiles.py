@@ -34,6 +34,7 @@ from portolan_cli.errors import PortolanError
 from portolan_cli.json_io import write_json_atomic
 from portolan_cli.output import error, info, success, warn
 from portolan_cli.stac_parquet import stamp_file_fields, sync_file_extension
+from portolan_cli.tracing import traced
 from portolan_cli.versions import track_generated_assets
 
 # The PMTiles constants and pure asset/link classifiers now live in the
@@ -662,6 +663,7 @@ def _track_side_step_assets(
         warn(f"Failed to track generated assets in versions.json for {pmtiles_path.name}: {e}")
 
 
+@traced("generate_pmtiles", measure=lambda r: (len(r.generated), 0))
 def generate_pmtiles_for_collection(
     collection_path: Path,
     catalog_root: Path,
@@ -38,7 +38,7 @@ from portolan_cli.constants import (
 )
 from portolan_cli.json_io import write_json_atomic
 from portolan_cli.output import info
-from portolan_cli.stac_parquet import stamp_file_fields, sync_file_extension
+from portolan_cli.stac_parquet import stamp_file_fields_many, sync_file_extension
 from portolan_cli.utils import get_dict, get_list
 
 logger = logging.getLogger(__name__)
@@ -713,9 +713,8 @@ def register_style_assets(
         roles = [STYLE_ROLE]
         if style_info.key == default_key:
             roles.append(DEFAULT_ROLE)
-        asset = _merge_style_asset(assets.get(style_info.key), style_info, roles)
-        stamp_file_fields(asset, collection_path)
-        assets[style_info.key] = asset
+        assets[style_info.key] = _merge_style_asset(assets.get(style_info.key), style_info, roles)
+    stamp_file_fields_many((assets[s.key] for s in styles), collection_path)
 
     data["assets"] = assets
     data.pop(LEGACY_STYLE_MANIFEST_FIELD, None)
@@ -0,0 +1,53 @@
+"""Benchmarks for catalog-wide checksum passes.
+
+``compute_checksums`` hashes on a thread pool with multi-MiB reads. These
+benchmarks compare it against the serial per-file loop it replaces, so a
+regression back to single-core hashing shows up as a flat ratio.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from portolan_cli.sync.checksums import compute_checksum, compute_checksums
+
+_FILE_COUNT = 16
+_FILE_SIZE = 8 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def asset_files(tmp_path_factory: pytest.TempPathFactory) -> list[Path]:
+    """Sixteen 8 MiB files outside any catalog, so no digest cache interferes."""
+    root = tmp_path_factory.mktemp("checksum-bench")
+    paths = []
+    for index in range(_FILE_COUNT):
+        path = root / f"asset-{index}.bin"
+        path.write_bytes(os.urandom(_FILE_SIZE))
+        paths.append(path)
+    return paths
+
+
+class TestChecksumBenchmarks:
+    """Serial loop vs. parallel batch over the same files."""
+
+    @pytest.mark.benchmark(group="checksums")
+    def test_serial_compute_checksum(
+        self,
+        benchmark,  # type: ignore[no-untyped-def]
+        asset_files: list[Path],
+    ) -> None:
+        digests = benchmark(lambda: [compute_checksum(path) for path in asset_files])
+        assert len(digests) == _FILE_COUNT
+
+    @pytest.mark.benchmark(group="checksums")
+    def test_parallel_compute_checksums(
+        self,
+        benchmark,  # type: ignore[no-untyped-def]
+        asset_files: list[Path],
+    ) -> None:
+        batch = benchmark(compute_checksums, asset_files)
+        assert len(batch.digests) == _FILE_COUNT
+        assert batch.bytes_hashed == _FILE_COUNT * _FILE_SIZE
@@ -0,0 +1,226 @@
+"""Startup guards for the ``portolan`` entry point.
+
+cli.py imports the modules that pull in pyarrow, rasterio, geopandas and
+pystac inside the commands that need them. These tests run the entry point in
+a fresh interpreter with PORTOLAN_PROFILE_IMPORTS and check which heavy
+modules each command loaded, so a top-level import creeping back in fails
+regardless of how fast the machine is. A failure names the modules that cost
+the most.
+
+Cold starts are also held to a wall-time budget. Each budget covers the time
+spent on top of a bare ``python -c pass``, compared as medians over several
+runs, so interpreter start-up and one slow run on a busy CI runner do not
+count against it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+# Modules that dominate a cold start when imported.
+HEAVY_MODULES = ("pyarrow", "rasterio", "geopandas", "pystac", "matplotlib", "pyproj")
+
+# Heavy modules each everyday command may load on an empty catalog. Anything
+# else it loads is an import that escaped into module scope.
+COMMAND_HEAVY_IMPORTS: dict[str, frozenset[str]] = {
+    "init": frozenset({"pystac"}),
+    "list": frozenset(),
+    "status": frozenset(),
+    "push --dry-run": frozenset(),
+    "check": frozenset({"pyarrow", "rasterio", "geopandas", "pyproj"}),
+}
+
+# Seconds a cold `portolan --help` may take beyond `python -c pass`, generous
+# enough for slow CI runners.
+HELP_BUDGET_SECONDS = 1.5
+
+# The same for everyday commands on an empty catalog, where the run is almost
+# all import time.
+COMMAND_BUDGET_SECONDS: dict[str, float] = {
+    "init": 2.5,
+    "list": 2.5,
+    "status": 2.5,
+    "push --dry-run": 3.0,
+    "check": 4.0,
+}
+
+# Runs per timing; the median is compared with the budget.
+TIMED_RUNS = 5
+
+_ENTRY_POINT = "import sys; from portolan_cli import cli; sys.argv[0] = 'portolan'; cli()"
+
+
+def _portolan(
+    args: list[str], *, profile: Path | None = None, cwd: Path | None = None
+) -> subprocess.CompletedProcess[str]:
+    """Run ``portolan <args>`` in a fresh interpreter, profiling imports to ``profile``."""
+    env = dict(os.environ)
+    env.pop("PORTOLAN_PROFILE_IMPORTS", None)
+    if profile is not None:
+        env["PORTOLAN_PROFILE_IMPORTS"] = str(profile)
+    return subprocess.run(
+        [sys.executable, "-c", _ENTRY_POINT, *args],
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=120,
+        cwd=cwd,
+        env=env,
+    )
+
+
+def _median_seconds(
+    code: str, make_args: Callable[[], list[str]], cwd: Path | None = None
+) -> float:
+    """Median wall time of ``TIMED_RUNS`` fresh ``python -c <code> <args>`` runs."""
+    env = dict(os.environ)
+    env.pop("PORTOLAN_PROFILE_IMPORTS", None)
+    timings = []
+    for _ in range(TIMED_RUNS):
+        args = make_args()
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code, *args],
+            capture_output=True,
+            check=False,
+            timeout=120,
+            cwd=cwd,
+            env=env,
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@pytest.fixture(scope="module")
+def interpreter_seconds() -> float:
+    """Median cold start of a bare interpreter, the baseline budgets sit on."""
+    return _median_seconds("pass", list)
+
+
+def _assert_within_budget(
+    command: str,
+    make_args: Callable[[], list[str]],
+    *,
+    budget: float,
+    baseline: float,
+    profile: Path,
+    cwd: Path | None = None,
+) -> None:
+    """Fail if ``portolan <args>`` takes ``budget`` or more beyond ``baseline``.
+
+    ``make_args`` is called once per run, so commands such as ``init`` can be
+    given a fresh target each time.
+    """
+    # Warm the bytecode cache so the budget measures imports, not compilation.
+    _portolan(make_args(), cwd=cwd)
+    overhead = _median_seconds(_ENTRY_POINT, make_args, cwd=cwd) - baseline
+    if overhead >= budget:
+        _portolan(make_args(), cwd=cwd, profile=profile)
+        pytest.fail(
+            f"`portolan {command}` took {overhead:.2f}s beyond `python -c pass` "
+            f"(budget {budget}s); slowest imports: {_top_imports(profile)}"
+        )
+
+
+def _heavy_imports(profile: Path) -> set[str]:
+    report: dict[str, Any] = json.loads(profile.read_text(encoding="utf-8"))
+    loaded = {row["module"] for row in report["modules"]}
+    return {module for module in HEAVY_MODULES if module in loaded}
+
+
+def _top_imports(profile: Path, count: int = 10) -> str:
+    report: dict[str, Any] = json.loads(profile.read_text(encoding="utf-8"))
+    return ", ".join(
+        f"{row['module']} ({row['cumulative_seconds'] * 1000:.0f} ms)"
+        for row in sorted(report["modules"], key=lambda r: -r["cumulative_seconds"])[:count]
+    )
+
+
+@pytest.mark.benchmark
+class TestCliStartup:
+    def test_help_does_not_load_geospatial_stack(self, tmp_path: Path) -> None:
+        profile = tmp_path / "imports.json"
+
+        result = _portolan(["--help"], profile=profile)
+
+        assert result.returncode == 0, result.stderr
+        assert "Usage:" in result.stdout
+        assert _heavy_imports(profile) == set(), f"slowest imports: {_top_imports(profile)}"
+
+    def test_cold_help_within_budget(self, interpreter_seconds: float, tmp_path: Path) -> None:
+        _assert_within_budget(
+            "--help",
+            lambda: ["--help"],
+            budget=HELP_BUDGET_SECONDS,
+            baseline=interpreter_seconds,
+            profile=tmp_path / "imports.json",
+        )
+
+
+@pytest.mark.benchmark
+class TestCommandStartup:
+    @pytest.fixture
+    def catalog(self, tmp_path: Path) -> Path:
+        root = tmp_path / "catalog"
+        root.mkdir()
+        result = _portolan(
+            ["init", str(root), "--auto", "--license", "CC-BY-4.0"],
+            profile=tmp_path / "init.json",
+        )
+        assert result.returncode == 0, result.stderr
+        return root
+
+    @staticmethod
+    def _args(command: str, tmp_path: Path) -> list[str]:
+        if command == "init":
+            # A fresh directory per call: init refuses an existing catalog.
+            fresh = tmp_path / f"fresh{len(list(tmp_path.glob('fresh*')))}"
+            fresh.mkdir()
+            return ["init", str(fresh), "--auto", "--license", "CC-BY-4.0"]
+        return {
+            "list": ["list"],
+            "status": ["status"],
+            "push --dry-run": ["push", "s3://example-bucket/catalog", "--dry-run"],
+            "check": ["check"],
+        }[command]
+
+    @pytest.mark.parametrize("command", sorted(COMMAND_HEAVY_IMPORTS))
+    def test_loads_only_the_modules_it_needs(
+        self, command: str, catalog: Path, tmp_path: Path
+    ) -> None:
+        args = self._args(command, tmp_path)
+        profile = tmp_path / "imports.json"
+
+        result = _portolan(args, cwd=catalog, profile=profile)
+
+        # Exit codes vary (check reports findings on an empty catalog); a
+        # crash would stop before the command's imports.
+        assert "Traceback" not in result.stderr, result.stderr
+        unexpected = _heavy_imports(profile) - COMMAND_HEAVY_IMPORTS[command]
+        assert unexpected == set(), (
+            f"`portolan {command}` loaded {sorted(unexpected)}; "
+            f"slowest imports: {_top_imports(profile)}"
+        )
+
+    @pytest.mark.parametrize("command", sorted(COMMAND_BUDGET_SECONDS))
+    def test_cold_start_within_budget(
+        self, command: str, catalog: Path, tmp_path: Path, interpreter_seconds: float
+    ) -> None:
+        _assert_within_budget(
+            command,
+            lambda: self._args(command, tmp_path),
+            budget=COMMAND_BUDGET_SECONDS[command],
+            baseline=interpreter_seconds,
+            profile=tmp_path / "imports.json",
+            cwd=catalog,
+        )
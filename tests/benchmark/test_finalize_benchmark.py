@@ -0,0 +1,85 @@
+"""Benchmark adding one file to a collection that already holds many items.
+
+Compares finalizing through PySTAC (``PORTOLAN_FAST_FINALIZE=0``), which
+resolves and re-saves every existing item, with the default route, which reads
+items at rest as JSON and writes only the new one.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any
+
+import pystac
+import pytest
+
+from portolan_cli.add import add_files
+from portolan_cli.finalization import FAST_FINALIZE_ENV_VAR, _read_items_at_rest
+
+# Items already in the collection when each benchmarked add runs
+EXISTING_ITEMS = 200
+
+
+def _place(root: Path, item_id: str, raster: Path) -> Path:
+    item_dir = root / "demo" / item_id
+    item_dir.mkdir(parents=True, exist_ok=True)
+    return Path(shutil.copy(raster, item_dir / f"{item_id}.tif"))
+
+
+def _build_catalog(root: Path, raster: Path) -> Path:
+    """A catalog whose ``demo`` collection holds ``EXISTING_ITEMS`` items, all at rest."""
+    portolan_dir = root / ".portolan"
+    portolan_dir.mkdir(parents=True)
+    (portolan_dir / "metadata.yaml").write_text('license: "CC-BY-4.0"\n')
+    (portolan_dir / "config.yaml").write_text("# Portolan configuration\n")
+    (root / "catalog.json").write_text(
+        json.dumps(
+            {"type": "Catalog", "stac_version": "1.0.0", "id": "c", "description": "c", "links": []}
+        )
+    )
+    for i in range(EXISTING_ITEMS):
+        _place(root, f"r{i}", raster)
+    add_files(paths=[root / "demo"], catalog_root=root)
+
+    # Backdate the items so their verdicts are remembered, as they would be
+    # for a collection last edited more than a moment ago.
+    hour_ago = time.time() - 3600
+    for item_json in (root / "demo").glob("*/*.json"):
+        os.utime(item_json, (hour_ago, hour_ago))
+    collection_dir = root / "demo"
+    collection = pystac.Collection.from_file(str(collection_dir / "collection.json"))
+    assert _read_items_at_rest(collection, collection_dir, root) is not None
+    return root
+
+
+@pytest.mark.benchmark(group="finalize-add-one")
+@pytest.mark.parametrize("fast", ["0", "1"], ids=["through-pystac", "items-at-rest"])
+def test_add_one_item_to_large_collection(
+    benchmark: Any,
+    fast: str,
+    tmp_path: Path,
+    valid_singleband_cog: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root = _build_catalog(tmp_path / "catalog", valid_singleband_cog)
+    monkeypatch.setenv(FAST_FINALIZE_ENV_VAR, fast)
+    counter = itertools.count()
+
+    def setup() -> tuple[tuple[()], dict[str, Any]]:
+        new = _place(root, f"new{next(counter)}", valid_singleband_cog)
+        return (), {"paths": [new.parent], "catalog_root": root}
+
+    _, _, failures = benchmark.pedantic(add_files, setup=setup, rounds=5, iterations=1)
+
+    assert failures == []
+    item_links = [
+        link
+        for link in json.loads((root / "demo" / "collection.json").read_text())["links"]
+        if link["rel"] == "item"
+    ]
+    assert len(item_links) == EXISTING_ITEMS + 5
@@ -478,3 +478,71 @@ class TestScanManyDirectoriesPerformance:
             f"Expected no MIXED_FLAT_MULTIITEM issues for leaf-only structure, "
             f"got {len(mixed_issues)}"
         )
+
+
+# =============================================================================
+# Simulated Network Filesystem
+# =============================================================================
+
+# Round-trip latency added to every directory listing, as on NFS/SMB mounts.
+_SIMULATED_LISTING_LATENCY_S = 0.005
+
+
+@pytest.fixture(scope="session")
+def benchmark_dir_wide_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a 3-level tree of 1 + 8 + 64 + 128 directories with one file each."""
+    base = tmp_path_factory.mktemp("benchmark_wide_tree")
+    for a in range(8):
+        for b in range(8):
+            for c in range(2):
+                leaf = base / f"a_{a}" / f"b_{b}" / f"c_{c}"
+                leaf.mkdir(parents=True)
+                (leaf / "data.geojson").write_text('{"type": "FeatureCollection"}')
+    return base
+
+
+@pytest.fixture
+def high_latency_listings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make every ``os.scandir`` call pay a fixed network round trip."""
+    import os
+
+    real_scandir = os.scandir
+
+    def slow_scandir(path: str | os.PathLike[str] = ".") -> list[os.DirEntry[str]]:
+        time.sleep(_SIMULATED_LISTING_LATENCY_S)
+        with real_scandir(path) as entries:
+            return list(entries)
+
+    monkeypatch.setattr(os, "scandir", slow_scandir)
+
+
+@pytest.mark.benchmark
+class TestScanHighLatencyFilesystem:
+    """Prefetched directory listings hide per-listing latency on network mounts."""
+
+    @pytest.mark.usefixtures("high_latency_listings")
+    def test_parallel_walk_beats_sequential(self, benchmark_dir_wide_tree: Path) -> None:
+        start = time.perf_counter()
+        sequential = scan_directory(benchmark_dir_wide_tree, ScanOptions(workers=1))
+        time_sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = scan_directory(benchmark_dir_wide_tree, ScanOptions(workers=8))
+        time_parallel = time.perf_counter() - start
+
+        assert [f.path for f in parallel.ready] == [f.path for f in sequential.ready]
+        assert parallel.directories_scanned == sequential.directories_scanned == 201
+        # Sequential pays 201 round trips back to back (~1s); eight listing
+        # threads overlap them. Bound loosely so CI contention cannot flap it.
+        assert time_parallel < time_sequential / 2, (
+            f"Parallel walk ({time_parallel:.3f}s) should be well under half of "
+            f"sequential ({time_sequential:.3f}s)"
+        )
+
+    @pytest.mark.usefixtures("high_latency_listings")
+    def test_parallel_walk_benchmark(
+        self,
+        benchmark_dir_wide_tree: Path,
+        benchmark: Callable[..., float],
+    ) -> None:
+        benchmark(scan_directory, benchmark_dir_wide_tree, ScanOptions(workers=8))
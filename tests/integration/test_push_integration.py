@@ -1778,9 +1778,17 @@ class TestPushAssetDiffingIntegration:
         ) as mock_fetch:
             mock_fetch.return_value = (remote_versions, "etag123")
 
-            with patch(
-                "portolan_cli.sync.push.obs.put_async", new_callable=AsyncMock
-            ) as mock_put_call:
+            with (
+                patch(
+                    "portolan_cli.sync.push.obs.put_async", new_callable=AsyncMock
+                ) as mock_put_call,
+                # The new file is not in the bucket yet: the content probe finds nothing.
+                patch(
+                    "portolan_cli.sync.push.obs.get_async",
+                    new_callable=AsyncMock,
+                    side_effect=FileNotFoundError,
+                ),
+            ):
                 mock_put_call.side_effect = mock_put
 
                 result = await push_async(
@@ -25,6 +25,7 @@ import pytest
 from click.testing import CliRunner
 
 from portolan_cli.cli import cli
+from portolan_cli.versions import read_versions
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -576,13 +577,13 @@ class TestSnapshotModelAccumulation:
             )
             assert result.exit_code == 0, f"Add {i} failed: {result.output}"
 
-        versions_path = collection_dir / "versions.json"
-        versions_data = json.loads(versions_path.read_text())
+        # Middle versions are stored as deltas; read_versions rebuilds snapshots
+        versions = read_versions(collection_dir / "versions.json").versions
 
-        assert len(versions_data["versions"]) >= 3, "Expected at least 3 versions"
-        v1_assets = set(versions_data["versions"][0]["assets"].keys())
-        v2_assets = set(versions_data["versions"][1]["assets"].keys())
-        v3_assets = set(versions_data["versions"][2]["assets"].keys())
+        assert len(versions) >= 3, "Expected at least 3 versions"
+        v1_assets = set(versions[0].assets)
+        v2_assets = set(versions[1].assets)
+        v3_assets = set(versions[2].assets)
 
         assert v1_assets.issubset(v3_assets), "v3 missing v1 assets"
         assert v2_assets.issubset(v3_assets), "v3 missing v2 assets"
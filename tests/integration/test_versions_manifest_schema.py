@@ -14,6 +14,10 @@ There are TWO different versions.json structures:
 - Collection-level: ``spec_version``, ``current_version``, ``versions`` —
   described by ``versions.schema.json``.
 
+Files rewritten by ``portolan version compact`` (spec 1.1.0) may store a
+version as an ``assets_delta`` against the one before it instead of a full
+``assets`` snapshot; the schema accepts exactly one of the two per entry.
+
 The semantic invariants a JSON Schema cannot express (current-version
 consistency, change references, version uniqueness) are validated by the
 helpers below, and the negative tests keep both directions non-tautological.
@@ -132,6 +136,42 @@ def _add_points_collection(runner: CliRunner, fixture: Path, name: str = "points
     return collection_dir
 
 
+def _delta_manifest() -> dict[str, Any]:
+    """A valid spec 1.1.0 manifest whose second version is stored as a delta."""
+    asset = {"sha256": "a" * 64, "size_bytes": 1, "href": "c/data.parquet"}
+    return {
+        "spec_version": "1.1.0",
+        "current_version": "1.0.2",
+        "versions": [
+            {
+                "version": "1.0.0",
+                "created": "2024-01-15T10:30:00Z",
+                "breaking": False,
+                "assets": {"data.parquet": asset},
+                "changes": ["data.parquet"],
+            },
+            {
+                "version": "1.0.1",
+                "created": "2024-01-16T10:30:00Z",
+                "breaking": False,
+                "assets_delta": {
+                    "base": "1.0.0",
+                    "updated": {"data.parquet": {**asset, "sha256": "b" * 64}},
+                    "removed": [],
+                },
+                "changes": ["data.parquet"],
+            },
+            {
+                "version": "1.0.2",
+                "created": "2024-01-17T10:30:00Z",
+                "breaking": False,
+                "assets": {"data.parquet": {**asset, "sha256": "c" * 64}},
+                "changes": ["data.parquet"],
+            },
+        ],
+    }
+
+
 # =============================================================================
 # CLI output conforms to the schemas
 # =============================================================================
@@ -202,6 +242,47 @@ class TestCollectionVersionsSchemaCompliance:
             errors = _validate(data, versions_schema)
             assert not errors, "Schema validation failed:\n" + "\n".join(errors)
 
+    def test_compacted_versions_json_is_valid(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        valid_points_parquet: Path,
+        versions_schema: dict[str, Any],
+    ) -> None:
+        """A file rewritten by ``version compact`` holds ``assets_delta`` entries."""
+        from portolan_cli.versions import (
+            Asset,
+            add_version,
+            expand_asset_deltas,
+            read_versions,
+            write_versions,
+        )
+
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            collection_dir = _add_points_collection(runner, valid_points_parquet)
+            versions_path = collection_dir / "versions.json"
+            vf = read_versions(versions_path)
+            for n in range(1, 5):
+                extra = Asset(sha256=f"{n:064x}", size_bytes=n, href=f"points/extra-{n}.parquet")
+                vf = add_version(
+                    vf, version=f"1.0.{n}", assets={f"extra-{n}.parquet": extra}, breaking=False
+                )
+            write_versions(versions_path, vf)
+
+            result = runner.invoke(
+                cli, ["version", "compact", "points", "--checkpoint-interval", "2"]
+            )
+            assert result.exit_code == 0, f"compact failed: {result.output}"
+
+            data = json.loads(versions_path.read_text())
+            assert data["spec_version"] == "1.1.0"
+            assert any("assets_delta" in v for v in data["versions"])
+            errors = _validate(data, versions_schema)
+            assert not errors, "Schema validation failed:\n" + "\n".join(errors)
+            expanded = expand_asset_deltas(data)
+            errors = _check_changes_reference_assets(expanded)
+            assert not errors, "Invariant validation failed:\n" + "\n".join(errors)
+
 
 class TestVersionsSemanticInvariants:
     """CLI output satisfies the invariants a JSON Schema cannot express."""
@@ -232,6 +313,10 @@ class TestVersionsSemanticInvariants:
 class TestSchemaRejectsInvalid:
     """The schemas reject malformed manifests."""
 
+    def test_accepts_delta_manifest(self, versions_schema: dict[str, Any]) -> None:
+        errors = _validate(_delta_manifest(), versions_schema)
+        assert not errors, "Schema validation failed:\n" + "\n".join(errors)
+
     def test_rejects_missing_required(self, versions_schema: dict[str, Any]) -> None:
         errors = _validate({"spec_version": "1.0.0"}, versions_schema)
         assert errors, "schema accepted a manifest missing current_version/versions"
@@ -281,6 +366,26 @@ class TestSchemaRejectsInvalid:
         errors = _validate(invalid, versions_schema)
         assert errors, "schema accepted an invalid sha256"
 
+    def test_rejects_delta_entry_in_full_snapshot_file(
+        self, versions_schema: dict[str, Any]
+    ) -> None:
+        invalid = _delta_manifest()
+        invalid["spec_version"] = "1.0.0"
+        errors = _validate(invalid, versions_schema)
+        assert errors, "schema accepted assets_delta in a spec 1.0.0 file"
+
+    def test_rejects_entry_with_both_layouts(self, versions_schema: dict[str, Any]) -> None:
+        invalid = _delta_manifest()
+        invalid["versions"][1]["assets"] = {}
+        errors = _validate(invalid, versions_schema)
+        assert errors, "schema accepted an entry with both assets and assets_delta"
+
+    def test_rejects_delta_without_base(self, versions_schema: dict[str, Any]) -> None:
+        invalid = _delta_manifest()
+        del invalid["versions"][1]["assets_delta"]["base"]
+        errors = _validate(invalid, versions_schema)
+        assert errors, "schema accepted an assets_delta without a base"
+
 
 class TestInvariantCheckersRejectInvalid:
     """The semantic checkers reject violations."""
@@ -262,7 +262,7 @@ class TestCliOutputWithFailures:
             test_file = collection_dir / "test.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 # Return: 2 added, 0 skipped, 1 failure
                 mock_add.return_value = (
                     [
@@ -313,7 +313,7 @@ class TestCliOutputWithFailures:
             test_file = collection_dir / "test.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = (
                     [],  # no successful adds
                     [],  # skipped
@@ -353,7 +353,7 @@ class TestCliOutputWithFailures:
             test_file = collection_dir / "test.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = (
                     [
                         ItemInfo(
@@ -398,7 +398,7 @@ class TestCliOutputWithFailures:
             test_file = collection_dir / "test.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = (
                     [
                         ItemInfo(
@@ -492,7 +492,7 @@ class TestOutputEdgeCases:
             test_file = collection_dir / "test.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = (
                     [],  # no added
                     [
@@ -533,7 +533,7 @@ class TestOutputEdgeCases:
             test_file.write_text("{}")
 
             err_path = Path("census/data.parquet")
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = (
                     [],
                     [],
@@ -571,7 +571,7 @@ class TestOutputEdgeCases:
             test_file = collection_dir / "test.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = (
                     [],  # no successes
                     [],  # no skipped
@@ -0,0 +1,130 @@
+"""Unit tests for the pipelined add (prepare and finalize overlap).
+
+A collection is finalized on a background thread as soon as no file of it,
+or of a collection nested in or around it, is still being prepared.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from portolan_cli import add as add_module
+from portolan_cli.add import _completed_prepares, _overlaps_any, add_files
+
+
+def _catalog(root: Path, raster: Path, layout: dict[str, int]) -> Path:
+    portolan_dir = root / ".portolan"
+    portolan_dir.mkdir(parents=True)
+    (portolan_dir / "metadata.yaml").write_text('license: "CC-BY-4.0"\n')
+    (portolan_dir / "config.yaml").write_text("# Portolan configuration\n")
+    (root / "catalog.json").write_text(
+        json.dumps({"type": "Catalog", "stac_version": "1.0.0", "id": "c", "links": []})
+    )
+    for collection, count in layout.items():
+        for i in range(count):
+            item_dir = root / collection / f"r{i}"
+            item_dir.mkdir(parents=True)
+            shutil.copy(raster, item_dir / f"r{i}.tif")
+    return root
+
+
+def _wait_for(path: Path, timeout: float = 30.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+class TestPipeline:
+    @pytest.mark.unit
+    def test_finished_collection_is_written_while_next_prepares(
+        self, tmp_path: Path, valid_singleband_cog: Path
+    ) -> None:
+        root = _catalog(tmp_path, valid_singleband_cog, {"alpha": 2, "beta": 1})
+        prepare = add_module._prepare_single_file
+        seen_alpha: list[bool] = []
+
+        def _prepare(file_path: Path, coll_id: str, opts: Any) -> Any:
+            if coll_id == "beta":
+                seen_alpha.append(_wait_for(root / "alpha" / "collection.json"))
+            return prepare(file_path, coll_id, opts)
+
+        with patch.object(add_module, "_prepare_single_file", side_effect=_prepare):
+            added, _, failures = add_files(paths=[root / "alpha", root / "beta"], catalog_root=root)
+
+        assert failures == []
+        assert seen_alpha == [True]
+        assert sorted((i.collection_id, i.item_id) for i in added) == [
+            ("alpha", "r0"),
+            ("alpha", "r1"),
+            ("beta", "r0"),
+        ]
+        assert (root / "beta" / "collection.json").exists()
+
+    @pytest.mark.unit
+    def test_finalize_error_is_raised(self, tmp_path: Path, valid_singleband_cog: Path) -> None:
+        root = _catalog(tmp_path, valid_singleband_cog, {"alpha": 1})
+
+        with (
+            patch.object(add_module, "finalize_items", side_effect=ValueError("boom")),
+            pytest.raises(ValueError, match="boom"),
+        ):
+            add_files(paths=[root / "alpha"], catalog_root=root)
+
+
+class TestReadiness:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("collection", "outstanding", "expected"),
+        [
+            ("a", ["a"], True),
+            ("a", ["a/b"], True),
+            ("a/b", ["a"], True),
+            ("a", ["ab", "b"], False),
+            ("a/b", ["a/c"], False),
+            ("a", [], False),
+        ],
+    )
+    def test_overlaps_any(self, collection: str, outstanding: list[str], expected: bool) -> None:
+        assert _overlaps_any(collection, outstanding) is expected
+
+
+class _InstantPool:
+    """Executor stand-in that records how many futures are unconsumed."""
+
+    def __init__(self) -> None:
+        self.unconsumed = 0
+        self.peak = 0
+
+    def submit(self, fn: Any, *args: Any) -> Future[Any]:
+        self.unconsumed += 1
+        self.peak = max(self.peak, self.unconsumed)
+        future: Future[Any] = Future()
+        future.set_result(([], [], None))
+        return future
+
+
+class TestBoundedSubmission:
+    @pytest.mark.unit
+    def test_at_most_window_files_in_flight(self) -> None:
+        pool = _InstantPool()
+        files = [(Path(f"f{i}.tif"), "c") for i in range(20)]
+
+        yielded = []
+        for file_path, _, _ in _completed_prepares(pool, files, opts=None, window=3):  # type: ignore[arg-type]
+            pool.unconsumed -= 1
+            yielded.append(file_path)
+
+        assert sorted(yielded) == sorted(fp for fp, _ in files)
+        # The next file is submitted before the completed one is handed over.
+        assert pool.peak <= 3 + 1
@@ -0,0 +1,140 @@
+"""Unit tests for ``add --executor process`` (phase 2 on a process pool).
+
+Worker processes return picklable ``PreparedItem``s, so the catalog comes out
+the same as a serial add. A pool that cannot start falls back to preparing the
+remaining files serially, like ``convert._convert_files_parallel``.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from portolan_cli.add import add_files
+from portolan_cli.cli import cli
+
+
+def _catalog(root: Path, raster: Path, count: int) -> Path:
+    portolan_dir = root / ".portolan"
+    portolan_dir.mkdir(parents=True)
+    (portolan_dir / "metadata.yaml").write_text('license: "CC-BY-4.0"\n')
+    (portolan_dir / "config.yaml").write_text("# Portolan configuration\n")
+    (root / "catalog.json").write_text(
+        json.dumps({"type": "Catalog", "stac_version": "1.0.0", "id": "c", "links": []})
+    )
+    for i in range(count):
+        item_dir = root / "demo" / f"r{i}"
+        item_dir.mkdir(parents=True)
+        shutil.copy(raster, item_dir / f"r{i}.tif")
+    return root
+
+
+def _item_links(root: Path) -> list[str]:
+    collection = json.loads((root / "demo" / "collection.json").read_text())
+    return sorted(link["href"] for link in collection["links"] if link["rel"] == "item")
+
+
+class TestProcessExecutor:
+    @pytest.mark.unit
+    def test_matches_serial_add(self, tmp_path: Path, valid_singleband_cog: Path) -> None:
+        serial = _catalog(tmp_path / "serial", valid_singleband_cog, 3)
+        pooled = _catalog(tmp_path / "pooled", valid_singleband_cog, 3)
+
+        expected, _, _ = add_files(paths=[serial / "demo"], catalog_root=serial)
+        added, skipped, failures = add_files(
+            paths=[pooled / "demo"], catalog_root=pooled, workers=2, executor="process"
+        )
+
+        assert failures == []
+        assert sorted(i.item_id for i in added) == sorted(i.item_id for i in expected)
+        assert _item_links(pooled) == _item_links(serial) == [f"./r{i}/r{i}.json" for i in range(3)]
+        assert (pooled / "demo" / "r0" / "r0.json").exists()
+
+    @pytest.mark.unit
+    def test_broken_pool_falls_back_to_serial(
+        self, tmp_path: Path, valid_singleband_cog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import concurrent.futures
+        from concurrent.futures.process import BrokenProcessPool
+
+        class _BrokenPool:
+            """Stand-in ProcessPoolExecutor whose workers never start."""
+
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                pass
+
+            def __enter__(self) -> _BrokenPool:
+                return self
+
+            def __exit__(self, *args: object) -> bool:
+                return False
+
+            def submit(self, *args: object, **kwargs: object) -> object:
+                raise BrokenProcessPool("simulated worker startup failure")
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", _BrokenPool)
+        root = _catalog(tmp_path, valid_singleband_cog, 2)
+        progressed: list[Path] = []
+
+        added, _, failures = add_files(
+            paths=[root / "demo"],
+            catalog_root=root,
+            workers=2,
+            executor="process",
+            on_progress=progressed.append,
+        )
+
+        assert failures == []
+        assert sorted(i.item_id for i in added) == ["r0", "r1"]
+        assert len(progressed) == 2
+
+
+class TestExecutorOption:
+    @pytest.mark.unit
+    def test_passed_to_add_files(self, tmp_path: Path, valid_singleband_cog: Path) -> None:
+        root = _catalog(tmp_path, valid_singleband_cog, 1)
+        calls: list[dict[str, Any]] = []
+
+        def _fake_add_files(**kwargs: Any) -> tuple[list[Any], list[Any], list[Any]]:
+            calls.append(kwargs)
+            return [], [], []
+
+        with patch("portolan_cli.add.add_files", side_effect=_fake_add_files):
+            result = CliRunner().invoke(
+                cli,
+                [
+                    "add",
+                    str(root / "demo"),
+                    "--portolan-dir",
+                    str(root),
+                    "--workers",
+                    "2",
+                    "--executor",
+                    "process",
+                    "--json",
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert calls[0]["executor"] == "process"
+        assert calls[0]["workers"] == 2
+
+    @pytest.mark.unit
+    def test_workers_below_one_rejected(self, tmp_path: Path, valid_singleband_cog: Path) -> None:
+        root = _catalog(tmp_path, valid_singleband_cog, 1)
+
+        with patch("portolan_cli.add.add_files") as fake_add_files:
+            result = CliRunner().invoke(
+                cli,
+                ["add", str(root / "demo"), "--portolan-dir", str(root), "--workers", "0"],
+            )
+
+        assert result.exit_code == 1
+        assert "--workers must be at least 1" in result.output
+        fake_add_files.assert_not_called()
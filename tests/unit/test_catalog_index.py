@@ -0,0 +1,255 @@
+"""Unit tests for the local catalog index (``.portolan/catalog-index.sqlite``).
+
+``list``, ``info`` and ``status`` read collections, items and tracked assets
+from the index, which re-reads only the files whose ``(size, mtime_ns, inode)``
+stat moved since they were indexed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from portolan_cli import catalog_index
+from portolan_cli.catalog_index import (
+    CATALOG_INDEX_ENV_VAR,
+    CATALOG_INDEX_FILENAME,
+    CatalogIndex,
+    IndexedAsset,
+    open_catalog_index,
+    refresh_catalog_index,
+)
+from portolan_cli.json_io import read_json_files
+from portolan_cli.query import get_item_info, list_items
+from portolan_cli.status import get_collection_status
+
+pytestmark = pytest.mark.unit
+
+# Comfortably outside MTIME_TOLERANCE_SECONDS, so stats are trusted.
+_AN_HOUR_AGO = time.time() - 3600
+
+
+def _write_old(path: Path, data: Any) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+    os.utime(path, (_AN_HOUR_AGO, _AN_HOUR_AGO))
+    return path
+
+
+def _item(item_id: str, *, title: str | None = None, bbox: list[float] | None = None) -> Any:
+    return {
+        "type": "Feature",
+        "id": item_id,
+        "bbox": bbox or [0.0, 1.0, 2.0, 3.0],
+        "properties": {"datetime": "2024-01-01T00:00:00Z", "title": title},
+        "assets": {"data": {"href": f"./{item_id}.parquet"}},
+    }
+
+
+def _collection(item_ids: list[str], *, title: str = "Demo") -> Any:
+    links = [{"rel": "item", "href": f"./{i}/{i}.json"} for i in item_ids]
+    return {"type": "Collection", "id": "demo", "title": title, "links": links}
+
+
+def _versions(assets: dict[str, int]) -> Any:
+    return {
+        "spec_version": "1.0.0",
+        "current_version": "1.0.0",
+        "versions": [
+            {
+                "version": "1.0.0",
+                "created": "2024-01-01T00:00:00Z",
+                "breaking": False,
+                "changes": list(assets),
+                "assets": {
+                    name: {"sha256": "a" * 64, "size_bytes": size, "href": f"demo/{name}"}
+                    for name, size in assets.items()
+                },
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> Path:
+    (tmp_path / ".portolan").mkdir()
+    (tmp_path / ".portolan" / "config.yaml").write_text("{}\n")
+    _write_old(tmp_path / "catalog.json", {"type": "Catalog", "id": "root", "links": []})
+    for item_id in ("a", "b"):
+        _write_old(tmp_path / "demo" / item_id / f"{item_id}.json", _item(item_id))
+    _write_old(tmp_path / "demo" / "collection.json", _collection(["a", "b"]))
+    _write_old(tmp_path / "demo" / "versions.json", _versions({"a/a.parquet": 10}))
+    return tmp_path
+
+
+@pytest.fixture
+def index(catalog: Path) -> Iterator[CatalogIndex]:
+    opened = open_catalog_index(catalog)
+    assert opened is not None
+    with opened:
+        yield opened
+
+
+class TestReads:
+    def test_collection_facts(self, catalog: Path, index: CatalogIndex) -> None:
+        collection = index.collection("demo")
+
+        assert collection is not None
+        assert collection.title == "Demo"
+        assert collection.item_count == 2
+        assert collection.current_version == "1.0.0"
+        assert (collection.asset_count, collection.total_size_bytes) == (1, 10)
+
+    def test_items_in_link_order(self, catalog: Path, index: CatalogIndex) -> None:
+        items = index.items("demo")
+
+        assert items is not None
+        assert [(item.item_id, item.path) for item in items] == [
+            ("a", "a/a.json"),
+            ("b", "b/b.json"),
+        ]
+        assert items[0].bbox == [0.0, 1.0, 2.0, 3.0]
+        assert items[0].start_datetime == items[0].end_datetime == "2024-01-01T00:00:00Z"
+        assert items[0].asset_hrefs == ["./a.parquet"]
+
+    def test_assets_of_current_version(self, catalog: Path, index: CatalogIndex) -> None:
+        assert index.assets("demo") == {
+            "a/a.parquet": IndexedAsset("demo/a/a.parquet", 10, "a" * 64)
+        }
+
+    def test_unreadable_item_defers_to_files(self, catalog: Path, index: CatalogIndex) -> None:
+        (catalog / "demo" / "b" / "b.json").write_text("{not json")
+
+        assert index.items("demo") is None
+        assert index.collection("demo") is not None
+
+    def test_unknown_collection(self, catalog: Path, index: CatalogIndex) -> None:
+        assert index.collection("missing") is None
+        assert index.collection_ids() == []
+
+
+class TestStaleness:
+    def test_unchanged_items_are_not_reparsed(self, catalog: Path, index: CatalogIndex) -> None:
+        index.items("demo")
+        _write_old(catalog / "demo" / "collection.json", _collection(["a", "b"], title="New"))
+
+        with mock.patch.object(catalog_index, "read_json_files", wraps=read_json_files) as reader:
+            collection = index.collection("demo")
+            read = [path for call in reader.call_args_list for path in call.args[0]]
+
+        assert collection is not None and collection.title == "New"
+        assert read == []
+
+    def test_edited_item_is_picked_up(self, catalog: Path, index: CatalogIndex) -> None:
+        index.items("demo")
+        _write_old(catalog / "demo" / "b" / "b.json", _item("b", title="Renamed"))
+
+        items = index.items("demo")
+        item = index.item("demo", "b/b.json")
+
+        assert items is not None and items[1].title == "Renamed"
+        assert item is not None and item.title == "Renamed"
+
+    def test_edited_sub_catalog_is_picked_up(self, catalog: Path, index: CatalogIndex) -> None:
+        def sub_catalog(item_ids: list[str]) -> Any:
+            links = [{"rel": "item", "href": f"../{i}/{i}.json"} for i in item_ids]
+            return {"type": "Catalog", "id": "sub", "links": links}
+
+        for item_id in ("c", "d"):
+            _write_old(catalog / "demo" / item_id / f"{item_id}.json", _item(item_id))
+        _write_old(catalog / "demo" / "sub" / "catalog.json", sub_catalog(["c"]))
+        collection = _collection(["a", "b"])
+        collection["links"].append({"rel": "child", "href": "./sub/catalog.json"})
+        _write_old(catalog / "demo" / "collection.json", collection)
+        first = index.collection("demo")
+        assert first is not None and first.item_count == 3
+
+        _write_old(catalog / "demo" / "sub" / "catalog.json", sub_catalog(["c", "d"]))
+
+        second = index.collection("demo")
+        assert second is not None and second.item_count == 4
+
+    def test_deleted_collection_is_forgotten(self, catalog: Path, index: CatalogIndex) -> None:
+        index.collection("demo")
+        for name in ("collection.json", "versions.json"):
+            (catalog / "demo" / name).unlink()
+
+        assert index.collection("demo") is None
+        assert index.collection_ids() == []
+
+
+class TestOpening:
+    def test_disabled_by_env_var(self, catalog: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(CATALOG_INDEX_ENV_VAR, "0")
+
+        assert open_catalog_index(catalog) is None
+
+    def test_not_a_catalog(self, tmp_path: Path) -> None:
+        assert open_catalog_index(tmp_path) is None
+
+    def test_corrupt_database_is_rebuilt(self, catalog: Path) -> None:
+        (catalog / ".portolan" / CATALOG_INDEX_FILENAME).write_bytes(b"not a database" * 100)
+
+        index = open_catalog_index(catalog)
+
+        assert index is not None
+        with index:
+            assert index.collection("demo") is not None
+
+    def test_refresh_does_not_create_the_database(self, catalog: Path) -> None:
+        refresh_catalog_index(catalog, ["demo"])
+
+        assert not (catalog / ".portolan" / CATALOG_INDEX_FILENAME).exists()
+
+    def test_refresh_all_indexed_collections(self, catalog: Path, index: CatalogIndex) -> None:
+        index.collection("demo")
+
+        with mock.patch.object(catalog_index.CatalogIndex, "refresh") as refresh:
+            refresh_catalog_index(catalog, None)
+
+        refresh.assert_called_once_with("demo", force=True)
+
+
+@pytest.mark.usefixtures("index_mode")
+class TestReaders:
+    """Readers answer the same with and without the index."""
+
+    @pytest.fixture(params=["1", "0"], ids=["indexed", "files"])
+    def index_mode(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(CATALOG_INDEX_ENV_VAR, request.param)
+
+    def test_list_items(self, catalog: Path) -> None:
+        items = list_items(catalog)
+
+        assert [(i.item_id, i.collection_id, i.bbox) for i in items] == [
+            ("a", "demo", [0.0, 1.0, 2.0, 3.0]),
+            ("b", "demo", [0.0, 1.0, 2.0, 3.0]),
+        ]
+        assert items[0].asset_paths == ["./a.parquet"]
+
+    def test_get_item_info(self, catalog: Path) -> None:
+        info = get_item_info(catalog, "demo/b")
+
+        assert (info.item_id, info.collection_id, info.asset_paths) == (
+            "b",
+            "demo",
+            ["./b.parquet"],
+        )
+
+    def test_collection_status(self, catalog: Path) -> None:
+        index = open_catalog_index(catalog)
+        try:
+            status = get_collection_status(catalog, "demo", offline=True, index=index)
+        finally:
+            if index is not None:
+                index.close()
+
+        assert status.local_version == "1.0.0"
+        assert status.deleted_files == ["a/a.parquet"]
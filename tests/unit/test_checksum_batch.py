@@ -0,0 +1,87 @@
+"""Unit tests for ``checksums.compute_checksums``, the parallel hashing batch."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from portolan_cli import checksums
+from portolan_cli.checksums import compute_checksum, compute_checksums
+
+pytestmark = pytest.mark.unit
+
+
+def _files(tmp_path: Path, count: int) -> list[Path]:
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"asset-{index}.bin"
+        path.write_bytes(f"payload {index}".encode() * (index + 1))
+        paths.append(path)
+    return paths
+
+
+class TestComputeChecksums:
+    def test_matches_serial_digests(self, tmp_path: Path) -> None:
+        paths = _files(tmp_path, 12)
+
+        batch = compute_checksums(paths, max_workers=4)
+
+        assert batch.digests == {path: compute_checksum(path) for path in paths}
+
+    def test_keys_by_the_path_as_given(self, tmp_path: Path) -> None:
+        (tmp_path / "sub").mkdir()
+        target = tmp_path / "sub" / "data.bin"
+        target.write_bytes(b"data")
+        given = tmp_path / "sub" / ".." / "sub" / "data.bin"
+
+        batch = compute_checksums([given])
+
+        assert list(batch.digests) == [given]
+
+    def test_duplicates_are_hashed_once(self, tmp_path: Path) -> None:
+        (path,) = _files(tmp_path, 1)
+
+        batch = compute_checksums([path, path, path])
+
+        assert batch.digests == {path: hashlib.sha256(path.read_bytes()).hexdigest()}
+        assert batch.bytes_hashed == path.stat().st_size
+
+    def test_reports_bytes_and_throughput(self, tmp_path: Path) -> None:
+        paths = _files(tmp_path, 5)
+
+        batch = compute_checksums(paths, max_workers=2)
+
+        assert batch.bytes_hashed == sum(path.stat().st_size for path in paths)
+        assert batch.cache_hits == 0
+        assert batch.elapsed_seconds > 0
+        assert batch.throughput_bytes_per_second > 0
+
+    def test_empty_batch(self) -> None:
+        batch = compute_checksums([])
+
+        assert batch.digests == {}
+        assert batch.throughput_bytes_per_second == 0.0
+
+    def test_first_missing_path_raises(self, tmp_path: Path) -> None:
+        paths = _files(tmp_path, 2)
+
+        with pytest.raises(FileNotFoundError, match="missing.bin"):
+            compute_checksums([paths[0], tmp_path / "missing.bin", paths[1]])
+
+    def test_directory_is_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Not a regular file"):
+            compute_checksums([tmp_path])
+
+    def test_large_file_spans_several_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(checksums, "HASH_CHUNK_SIZE", 1024)
+        payload = bytes(range(256)) * 40  # 10 KiB -> ten reads
+        path = tmp_path / "large.bin"
+        path.write_bytes(payload)
+
+        batch = compute_checksums([path])
+
+        assert batch.digests[path] == hashlib.sha256(payload).hexdigest()
@@ -0,0 +1,159 @@
+"""Unit tests for the catalog-local SHA-256 digest cache in ``portolan_cli.checksums``.
+
+``compute_checksum`` serves a stored digest when a catalog file's
+``(size, mtime_ns, inode)`` is unchanged, so repeated ``check``/``push``/``status``
+runs re-read only the bytes that changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from portolan_cli import checksums
+from portolan_cli.checksums import (
+    CHECKSUM_CACHE_ENV_VAR,
+    CHECKSUM_CACHE_FILENAME,
+    clear_checksum_cache,
+    compute_checksum,
+    flush_checksum_cache,
+)
+
+pytestmark = pytest.mark.unit
+
+# Comfortably outside MTIME_TOLERANCE_SECONDS, so the file is cacheable.
+_AN_HOUR_AGO = time.time() - 3600
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    clear_checksum_cache()
+    yield
+    clear_checksum_cache()
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> Path:
+    (tmp_path / ".portolan").mkdir()
+    (tmp_path / ".portolan" / "config.yaml").write_text("{}\n")
+    return tmp_path
+
+
+def _write_old(path: Path, payload: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    os.utime(path, (_AN_HOUR_AGO, _AN_HOUR_AGO))
+    return path
+
+
+class TestCacheHits:
+    def test_unchanged_file_is_not_reread(self, catalog: Path) -> None:
+        asset = _write_old(catalog / "col" / "data.parquet", b"payload")
+        expected = hashlib.sha256(b"payload").hexdigest()
+
+        assert compute_checksum(asset) == expected
+        with mock.patch.object(checksums, "_hash_file") as hash_file:
+            assert compute_checksum(asset) == expected
+        hash_file.assert_not_called()
+
+    def test_changed_size_invalidates_entry(self, catalog: Path) -> None:
+        asset = _write_old(catalog / "col" / "data.parquet", b"one")
+        compute_checksum(asset)
+
+        _write_old(asset, b"longer payload")
+
+        assert compute_checksum(asset) == hashlib.sha256(b"longer payload").hexdigest()
+
+    def test_changed_mtime_invalidates_entry(self, catalog: Path) -> None:
+        asset = _write_old(catalog / "col" / "data.parquet", b"aaaa")
+        compute_checksum(asset)
+
+        asset.write_bytes(b"bbbb")  # same size, fresh mtime
+        os.utime(asset, (_AN_HOUR_AGO + 10, _AN_HOUR_AGO + 10))
+
+        assert compute_checksum(asset) == hashlib.sha256(b"bbbb").hexdigest()
+
+    def test_recently_modified_file_is_not_cached(self, catalog: Path) -> None:
+        # Inside the mtime tolerance window a same-tick rewrite would be
+        # invisible to the stat tuple, so nothing is recorded.
+        asset = catalog / "fresh.bin"
+        asset.write_bytes(b"fresh")
+
+        compute_checksum(asset)
+        with mock.patch.object(checksums, "_hash_file", return_value="0" * 64) as hash_file:
+            compute_checksum(asset)
+        hash_file.assert_called_once()
+
+
+class TestPersistence:
+    def test_flush_writes_cache_under_portolan_dir(self, catalog: Path) -> None:
+        asset = _write_old(catalog / "col" / "data.parquet", b"payload")
+        compute_checksum(asset)
+
+        flush_checksum_cache()
+
+        data = json.loads((catalog / ".portolan" / CHECKSUM_CACHE_FILENAME).read_text())
+        size, _mtime_ns, _inode, digest = data["entries"]["col/data.parquet"]
+        assert size == len(b"payload")
+        assert digest == hashlib.sha256(b"payload").hexdigest()
+
+    def test_persisted_entry_is_reused_by_a_new_process(self, catalog: Path) -> None:
+        asset = _write_old(catalog / "data.bin", b"payload")
+        compute_checksum(asset)
+        flush_checksum_cache()
+        clear_checksum_cache()  # what a fresh `portolan push` starts from
+
+        with mock.patch.object(checksums, "_hash_file") as hash_file:
+            assert compute_checksum(asset) == hashlib.sha256(b"payload").hexdigest()
+        hash_file.assert_not_called()
+
+    def test_corrupt_cache_file_is_ignored(self, catalog: Path) -> None:
+        (catalog / ".portolan" / CHECKSUM_CACHE_FILENAME).write_text("{not json")
+        asset = _write_old(catalog / "data.bin", b"payload")
+
+        assert compute_checksum(asset) == hashlib.sha256(b"payload").hexdigest()
+
+    def test_flush_merges_entries_written_by_another_process(self, catalog: Path) -> None:
+        first = _write_old(catalog / "a.bin", b"a")
+        second = _write_old(catalog / "b.bin", b"b")
+        compute_checksum(first)
+        flush_checksum_cache()
+        clear_checksum_cache()
+
+        compute_checksum(second)
+        flush_checksum_cache()
+
+        entries = json.loads((catalog / ".portolan" / CHECKSUM_CACHE_FILENAME).read_text())[
+            "entries"
+        ]
+        assert set(entries) == {"a.bin", "b.bin"}
+
+
+class TestScope:
+    def test_file_outside_a_catalog_is_never_cached(self, tmp_path: Path) -> None:
+        asset = _write_old(tmp_path / "loose.bin", b"loose")
+        compute_checksum(asset)
+        flush_checksum_cache()
+
+        assert not (tmp_path / ".portolan").exists()
+        with mock.patch.object(checksums, "_hash_file", return_value="0" * 64) as hash_file:
+            compute_checksum(asset)
+        hash_file.assert_called_once()
+
+    def test_env_var_disables_cache(self, catalog: Path) -> None:
+        asset = _write_old(catalog / "data.bin", b"payload")
+        compute_checksum(asset)
+
+        with (
+            mock.patch.dict(os.environ, {CHECKSUM_CACHE_ENV_VAR: "0"}),
+            mock.patch.object(checksums, "_hash_file", return_value="0" * 64) as hash_file,
+        ):
+            compute_checksum(asset)
+        hash_file.assert_called_once()
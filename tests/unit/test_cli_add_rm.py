@@ -65,7 +65,7 @@ class TestAdd:
             test_file = collection_dir / "census.geojson"
             test_file.write_text('{"type": "FeatureCollection", "features": []}')
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = (
                     [
                         ItemInfo(
@@ -102,7 +102,7 @@ class TestAdd:
             test_file = collection_dir / "satellite.tif"
             test_file.write_bytes(b"GeoTIFF content")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 runner.invoke(
@@ -130,7 +130,7 @@ class TestAdd:
             (collection_dir / "file1.geojson").write_text("{}")
             (collection_dir / "file2.geojson").write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 result = runner.invoke(
@@ -154,7 +154,7 @@ class TestAdd:
             test_file = collection_dir / "existing.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 # Return empty list to indicate nothing was added (all unchanged)
                 mock_add.return_value = ([], [test_file], [])
 
@@ -180,7 +180,7 @@ class TestAdd:
             test_file = collection_dir / "existing.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [test_file], [])
 
                 result = runner.invoke(
@@ -264,7 +264,7 @@ class TestAdd:
             test_file = collection_dir / "census.geojson"
             test_file.write_text('{"type": "FeatureCollection", "features": []}')
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = (
                     [
                         ItemInfo(
@@ -302,7 +302,7 @@ class TestAdd:
             test_file = collection_dir / "satellite.tif"
             test_file.write_bytes(b"GeoTIFF content")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 runner.invoke(
@@ -327,7 +327,7 @@ class TestAdd:
             test_file = collection_dir / "data.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 runner.invoke(
@@ -376,7 +376,7 @@ class TestAdd:
             file2 = coll2 / "data2.geojson"
             file2.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 result = runner.invoke(
@@ -413,7 +413,7 @@ class TestAdd:
             satellite = imagery / "satellite.tif"
             satellite.write_bytes(b"tiff")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 runner.invoke(
@@ -446,7 +446,7 @@ class TestAdd:
             file2 = coll / "data2.geojson"
             file2.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 # Two items added from the same collection
                 mock_add.return_value = (
                     [
@@ -495,7 +495,7 @@ class TestAdd:
             file2 = coll / "data2.geojson"
             file2.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.side_effect = ValueError("invalid geometry")
 
                 result = runner.invoke(
@@ -518,7 +518,7 @@ class TestAdd:
             file1 = coll / "data1.geojson"
             file1.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 result = runner.invoke(
@@ -548,7 +548,7 @@ class TestAdd:
             symlink_file = coll / "link_to_data1.geojson"
             symlink_file.symlink_to(real_file)
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 result = runner.invoke(
@@ -578,7 +578,7 @@ class TestAdd:
             file2 = coll / "data2.geojson"
             file2.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 # Pass one absolute path and one path that Click will resolve
@@ -833,7 +833,7 @@ class TestAddSidecarDetection:
             (collection_dir / "data.shx").write_bytes(b"shx")
             (collection_dir / "data.prj").write_text("EPSG:4326")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 result = runner.invoke(
@@ -858,7 +858,7 @@ class TestAddSidecarDetection:
             (collection_dir / "image.tif").write_bytes(b"tiff")
             (collection_dir / "image.tfw").write_text("1.0\n0.0\n0.0\n-1.0\n0.0\n0.0")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 result = runner.invoke(
@@ -891,7 +891,7 @@ class TestPathToCollectionResolution:
             test_file = nested_dir / "census.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 runner.invoke(
@@ -918,7 +918,7 @@ class TestPathToCollectionResolution:
             test_file = collection_dir / "satellite.tif"
             test_file.write_bytes(b"tiff")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = ([], [], [])
 
                 runner.invoke(
@@ -949,7 +949,7 @@ class TestAddJsonOutput:
             test_file = collection_dir / "test.geojson"
             test_file.write_text("{}")
 
-            with patch("portolan_cli.cli.add_files") as mock_add:
+            with patch("portolan_cli.add.add_files") as mock_add:
                 mock_add.return_value = (
                     [
                         ItemInfo(
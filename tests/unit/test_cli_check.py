@@ -220,14 +220,14 @@ class TestCheckPassFlags:
 
     @pytest.mark.unit
     def test_no_data_disables_the_data_pass(self, runner: CliRunner, valid_catalog: Path) -> None:
-        with patch("portolan_cli.cli.run_check") as mock_run:
+        with patch("portolan_cli.validation.run_check") as mock_run:
             mock_run.return_value = _empty_outcome()
             runner.invoke(cli, ["check", str(valid_catalog), "--no-data"])
         assert mock_run.call_args.kwargs["data"] is False
 
     @pytest.mark.unit
     def test_data_pass_is_on_by_default(self, runner: CliRunner, valid_catalog: Path) -> None:
-        with patch("portolan_cli.cli.run_check") as mock_run:
+        with patch("portolan_cli.validation.run_check") as mock_run:
             mock_run.return_value = _empty_outcome()
             runner.invoke(cli, ["check", str(valid_catalog)])
         assert mock_run.call_args.kwargs["data"] is True
@@ -236,7 +236,7 @@ class TestCheckPassFlags:
     def test_structural_is_on_by_default_and_disablable(
         self, runner: CliRunner, valid_catalog: Path
     ) -> None:
-        with patch("portolan_cli.cli.run_check") as mock_run:
+        with patch("portolan_cli.validation.run_check") as mock_run:
             mock_run.return_value = _empty_outcome()
             runner.invoke(cli, ["check", str(valid_catalog)])
             assert mock_run.call_args.kwargs["structural"] is True
@@ -248,7 +248,7 @@ class TestCheckPassFlags:
         self, runner: CliRunner, valid_catalog: Path
     ) -> None:
         """The profile schema pass restates hand-rule findings, so it is opt-in."""
-        with patch("portolan_cli.cli.run_check") as mock_run:
+        with patch("portolan_cli.validation.run_check") as mock_run:
             mock_run.return_value = _empty_outcome()
             runner.invoke(cli, ["check", str(valid_catalog)])
             assert mock_run.call_args.kwargs["schema"] is False
@@ -259,7 +259,7 @@ class TestCheckPassFlags:
     def test_live_is_off_by_default_and_enablable(
         self, runner: CliRunner, valid_catalog: Path
     ) -> None:
-        with patch("portolan_cli.cli.run_check") as mock_run:
+        with patch("portolan_cli.validation.run_check") as mock_run:
             mock_run.return_value = _empty_outcome()
             runner.invoke(cli, ["check", str(valid_catalog)])
             assert mock_run.call_args.kwargs["live"] is False
@@ -268,7 +268,7 @@ class TestCheckPassFlags:
 
     @pytest.mark.unit
     def test_url_is_threaded_through(self, runner: CliRunner, valid_catalog: Path) -> None:
-        with patch("portolan_cli.cli.run_check") as mock_run:
+        with patch("portolan_cli.validation.run_check") as mock_run:
             mock_run.return_value = _empty_outcome()
             runner.invoke(
                 cli, ["check", str(valid_catalog), "--url", "https://data.example.org/c/"]
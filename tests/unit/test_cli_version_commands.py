@@ -5,6 +5,7 @@ Covers:
 - ``portolan version list``
 - ``portolan version rollback``
 - ``portolan version prune``
+- ``portolan version compact``
 - ``_require_iceberg_backend`` — backend guard
 - ``_check_backend_push_support`` — push routing
 - ``_try_backend_pull`` — pull routing
@@ -760,6 +761,95 @@ class TestVersionPruneCommand:
         assert "prune failed badly" in result.output
 
 
+# ---------------------------------------------------------------------------
+# version compact
+# ---------------------------------------------------------------------------
+
+
+def _write_full_history(collection_dir: Path, count: int) -> None:
+    """A versions.json in the pre-delta layout: every version in full."""
+    assets = {
+        f"f{i}.parquet": {"sha256": f"{i:064x}", "size_bytes": i, "href": f"f{i}.parquet"}
+        for i in range(20)
+    }
+    versions = []
+    for n in range(count):
+        assets = {**assets, "f0.parquet": {**assets["f0.parquet"], "sha256": f"{n:064x}"}}
+        versions.append(
+            {
+                "version": f"1.0.{n}",
+                "created": "2024-01-01T00:00:00Z",
+                "breaking": False,
+                "assets": assets,
+                "changes": ["f0.parquet"],
+            }
+        )
+    collection_dir.mkdir(parents=True)
+    (collection_dir / "versions.json").write_text(
+        json.dumps(
+            {"spec_version": "1.0.0", "current_version": f"1.0.{count - 1}", "versions": versions}
+        )
+    )
+
+
+@pytest.mark.unit
+class TestVersionCompactCommand:
+    """Tests for ``portolan version compact``."""
+
+    def test_compacts_every_collection_json(self, runner: CliRunner, tmp_path: Path) -> None:
+        from portolan_cli.versions import read_versions
+
+        catalog_root = _make_file_catalog(tmp_path)
+        _write_full_history(catalog_root / "a", 10)
+        _write_full_history(catalog_root / "nested" / "b", 3)
+        before = read_versions(catalog_root / "a" / "versions.json")
+
+        result = runner.invoke(
+            cli, ["version", "compact", "--catalog", str(catalog_root), "--json"]
+        )
+
+        assert result.exit_code == 0, result.output
+        entries = json.loads(result.output)["data"]["collections"]
+        assert [(e["collection"], e["versions"]) for e in entries] == [
+            ("a", 10),
+            ("nested/b", 3),
+        ]
+        assert entries[0]["bytes_after"] < entries[0]["bytes_before"]
+        assert read_versions(catalog_root / "a" / "versions.json").versions == before.versions
+
+    def test_single_collection_human(self, runner: CliRunner, tmp_path: Path) -> None:
+        catalog_root = _make_file_catalog(tmp_path)
+        _write_full_history(catalog_root / "a", 4)
+
+        result = runner.invoke(
+            cli,
+            [
+                "version",
+                "compact",
+                "a",
+                "--checkpoint-interval",
+                "2",
+                "--catalog",
+                str(catalog_root),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Compacted 'a'" in result.output
+        data = json.loads((catalog_root / "a" / "versions.json").read_text())
+        assert ["assets" in v for v in data["versions"]] == [True, False, True, True]
+
+    def test_missing_versions_json_errors(self, runner: CliRunner, tmp_path: Path) -> None:
+        catalog_root = _make_file_catalog(tmp_path)
+
+        result = runner.invoke(
+            cli, ["version", "compact", "missing", "--catalog", str(catalog_root), "--json"]
+        )
+
+        assert result.exit_code == 1
+        assert json.loads(result.output)["errors"][0]["type"] == "FileNotFoundError"
+
+
 # ---------------------------------------------------------------------------
 # _check_backend_push_support
 # ---------------------------------------------------------------------------
@@ -16,12 +16,12 @@ from __future__ import annotations
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterator
+    from collections.abc import AsyncIterator, Generator, Iterator
 
 
 # =============================================================================
@@ -29,6 +29,19 @@ if TYPE_CHECKING:
 # =============================================================================
 
 
+def _async_response(data: bytes) -> MagicMock:
+    """Mock the GetResult obs.get_async returns: metadata plus an async chunk stream."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield data
+
+    response = MagicMock()
+    response.meta = {"size": len(data)}
+    response.attributes = {}
+    response.stream = lambda **_kwargs: chunks()
+    return response
+
+
 @pytest.fixture
 def temp_file(tmp_path: Path) -> Path:
     """Create a temporary file for download destination tests."""
@@ -347,10 +360,7 @@ class TestDownloadDirectory:
                 ]
 
                 # Mock get for each file - content must match size
-                mock_response = MagicMock()
-                mock_response.meta = {"size": file_size}
-                mock_response.__iter__ = lambda self: iter([test_data])
-                mock_obs.get.return_value = mock_response
+                mock_obs.get_async = AsyncMock(return_value=_async_response(test_data))
 
                 with patch.dict(
                     os.environ,
@@ -363,7 +373,7 @@ class TestDownloadDirectory:
 
                 assert result.success is True
                 assert result.files_downloaded == 3
-                assert mock_obs.get.call_count == 3
+                assert mock_obs.get_async.call_count == 3
 
     @pytest.mark.unit
     def test_download_directory_with_pattern(self, temp_download_dir: Path) -> None:
@@ -388,10 +398,7 @@ class TestDownloadDirectory:
                     ]
                 ]
 
-                mock_response = MagicMock()
-                mock_response.meta = {"size": file_size}
-                mock_response.__iter__ = lambda self: iter([test_data])
-                mock_obs.get.return_value = mock_response
+                mock_obs.get_async = AsyncMock(return_value=_async_response(test_data))
 
                 with patch.dict(
                     os.environ,
@@ -405,7 +412,7 @@ class TestDownloadDirectory:
 
                 assert result.success is True
                 assert result.files_downloaded == 2  # Only parquet files
-                assert mock_obs.get.call_count == 2
+                assert mock_obs.get_async.call_count == 2
 
     @pytest.mark.unit
     def test_download_directory_dry_run(self, temp_download_dir: Path) -> None:
@@ -477,7 +484,7 @@ class TestDownloadDirectory:
                 ]
 
                 # Mock get to fail
-                mock_obs.get.side_effect = OSError("Download failed")
+                mock_obs.get_async = AsyncMock(side_effect=OSError("Download failed"))
 
                 with patch.dict(
                     os.environ,
@@ -513,7 +520,7 @@ class TestDownloadDirectory:
                 ]
 
                 # Mock get to always fail
-                mock_obs.get.side_effect = OSError("Download failed")
+                mock_obs.get_async = AsyncMock(side_effect=OSError("Download failed"))
 
                 with patch.dict(
                     os.environ,
@@ -537,13 +544,10 @@ class TestDownloadDirectory:
         test_data = b"file content data"
         file_size = len(test_data)
 
-        def capture_download(store: object, key: str) -> MagicMock:
+        async def capture_download(store: object, key: str) -> MagicMock:
             # Track what paths would be downloaded
             _ = store  # Mark as used (vulture)
-            mock_response = MagicMock()
-            mock_response.meta = {"size": file_size}
-            mock_response.__iter__ = lambda self: iter([test_data])
-            return mock_response
+            return _async_response(test_data)
 
         with patch("portolan_cli.sync.download.obs") as mock_obs:
             with patch("portolan_cli.sync.download.S3Store") as mock_s3_store:
@@ -558,7 +562,7 @@ class TestDownloadDirectory:
                         {"path": "data/nested/deep/file3.parquet", "size": file_size},
                     ]
                 ]
-                mock_obs.get.side_effect = capture_download
+                mock_obs.get_async = AsyncMock(side_effect=capture_download)
 
                 with patch.dict(
                     os.environ,
@@ -861,30 +865,38 @@ class TestFileIntegrity:
                 assert not dest_file.exists()
 
     @pytest.mark.unit
-    def test_download_one_file_cleans_up_on_failure(self, temp_download_dir: Path) -> None:
-        """_download_one_file should clean up partial file on failure."""
-        from portolan_cli.sync.download import _download_one_file
+    async def test_download_one_file_cleans_up_on_failure(self, temp_download_dir: Path) -> None:
+        """_download_one_file_async should clean up partial file on failure."""
+        from portolan_cli.async_utils import ByteBudget
+        from portolan_cli.sync.download import _download_one_file_async
 
         local_path = temp_download_dir / "data.parquet"
         mock_store = MagicMock()
 
-        def fail_mid_stream() -> Generator[bytes, None, None]:
+        async def fail_mid_stream() -> AsyncIterator[bytes]:
             yield b"partial data"
             raise OSError("Network error")
 
         with patch("portolan_cli.sync.download.obs") as mock_obs:
             mock_response = MagicMock()
-            mock_response.__iter__ = lambda self: fail_mid_stream()
-            mock_obs.get.return_value = mock_response
-
-            remote_key, error, bytes_downloaded = _download_one_file(
-                mock_store, "path/to/file.parquet", local_path, 1000
-            )
-
-            assert error is not None
-            assert bytes_downloaded == 0
-            # Partial file should be cleaned up
+            mock_response.meta = {"size": 1000}
+            mock_response.attributes = {}
+            mock_response.stream = lambda **_kwargs: fail_mid_stream()
+            mock_obs.get_async = AsyncMock(return_value=mock_response)
+
+            with pytest.raises(OSError, match="Network error"):
+                await _download_one_file_async(
+                    mock_store,
+                    "path/to/file.parquet",
+                    local_path,
+                    1000,
+                    budget=ByteBudget(1024 * 1024),
+                    part_concurrency=1,
+                )
+
+            # Neither the target nor its .part file is left behind
             assert not local_path.exists()
+            assert list(temp_download_dir.iterdir()) == []
 
 
 # =============================================================================
@@ -972,11 +984,8 @@ class TestOverwriteProtection:
                     ]
                 ]
 
-                mock_response = MagicMock()
-                mock_response.meta = {"size": 200}
                 new_content = b"n" * 200
-                mock_response.__iter__ = lambda self: iter([new_content])
-                mock_obs.get.return_value = mock_response
+                mock_obs.get_async = AsyncMock(return_value=_async_response(new_content))
 
                 with patch.dict(
                     os.environ,
@@ -1069,10 +1078,7 @@ class TestPathTraversalProtection:
                     ]
                 ]
 
-                mock_response = MagicMock()
-                mock_response.meta = {"size": file_size}
-                mock_response.__iter__ = lambda self: iter([test_data])
-                mock_obs.get.return_value = mock_response
+                mock_obs.get_async = AsyncMock(return_value=_async_response(test_data))
 
                 with patch.dict(
                     os.environ,
@@ -1237,18 +1243,15 @@ class TestFailFastSubmitNextFile:
         # Must be list of list (generator behavior)
         mock_files = [[{"path": f"data/file{i}.parquet", "size": 100} for i in range(5)]]
 
-        def mock_get(store: object, key: str) -> MagicMock:
-            response = MagicMock()
-            response.meta = {"size": 100}
-            response.__iter__ = lambda self: iter([b"x" * 100])
-            return response
+        async def mock_get(store: object, key: str) -> MagicMock:
+            return _async_response(b"x" * 100)
 
         with patch("portolan_cli.sync.download.obs") as mock_obs:
             with patch("portolan_cli.sync.download.S3Store") as mock_s3_store:
                 mock_store = MagicMock()
                 mock_s3_store.return_value = mock_store
                 mock_obs.list.return_value = mock_files
-                mock_obs.get.side_effect = mock_get
+                mock_obs.get_async = AsyncMock(side_effect=mock_get)
 
                 with patch.dict(
                     os.environ,
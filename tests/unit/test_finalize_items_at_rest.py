@@ -0,0 +1,291 @@
+"""Unit tests for finalizing a collection without re-saving its existing items.
+
+Items already on disk in the form a PySTAC save writes them are summarized from
+their JSON and left alone; the catalog comes out the same as through PySTAC.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pystac
+import pytest
+
+from portolan_cli import finalization
+from portolan_cli.add import add_files
+from portolan_cli.finalization import (
+    AT_REST_INDEX_FILENAME,
+    FAST_FINALIZE_ENV_VAR,
+    _read_items_at_rest,
+)
+
+pytestmark = pytest.mark.unit
+
+_RASTERS = Path(__file__).parent.parent / "fixtures" / "raster" / "valid"
+
+
+def _catalog(root: Path, raster: Path, count: int) -> Path:
+    portolan_dir = root / ".portolan"
+    portolan_dir.mkdir(parents=True)
+    (portolan_dir / "metadata.yaml").write_text('license: "CC-BY-4.0"\n')
+    (portolan_dir / "config.yaml").write_text("# Portolan configuration\n")
+    (root / "catalog.json").write_text(
+        json.dumps(
+            {"type": "Catalog", "stac_version": "1.0.0", "id": "c", "description": "c", "links": []}
+        )
+    )
+    for i in range(count):
+        _place(root, f"r{i}", raster)
+    add_files(paths=[root / "demo"], catalog_root=root)
+    return root
+
+
+def _place(root: Path, item_id: str, raster: Path) -> Path:
+    item_dir = root / "demo" / item_id
+    item_dir.mkdir(parents=True, exist_ok=True)
+    return Path(shutil.copy(raster, item_dir / f"{item_id}.tif"))
+
+
+def _tree(root: Path) -> dict[str, Any]:
+    """Every STAC JSON document under ``root`` but ``versions.json``."""
+    return {
+        str(path.relative_to(root)): json.loads(path.read_text())
+        for path in sorted(root.rglob("*.json"))
+        if ".portolan" not in path.parts and path.name != "versions.json"
+    }
+
+
+def _add_both_ways(
+    tmp_path: Path,
+    base: Path,
+    item_id: str,
+    monkeypatch: pytest.MonkeyPatch,
+    collection: str = "demo",
+) -> tuple[Path, Path]:
+    """Add ``<collection>/<item_id>`` to two copies of ``base``, through PySTAC and not."""
+    copies = []
+    for mode in ("0", "1"):
+        root = tmp_path / f"mode{mode}"
+        shutil.copytree(base, root)
+        monkeypatch.setenv(FAST_FINALIZE_ENV_VAR, mode)
+        _, _, failures = add_files(paths=[root / collection / item_id], catalog_root=root)
+        assert failures == []
+        copies.append(root)
+    return copies[0], copies[1]
+
+
+class TestSameCatalog:
+    def test_new_item(
+        self, tmp_path: Path, valid_singleband_cog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        base = _catalog(tmp_path / "base", valid_singleband_cog, 3)
+        _place(base, "new", _RASTERS / "rgb.tif")
+
+        through_pystac, fast = _add_both_ways(tmp_path, base, "new", monkeypatch)
+
+        assert _tree(fast) == _tree(through_pystac)
+        links = json.loads((fast / "demo" / "collection.json").read_text())["links"]
+        assert [link["href"] for link in links if link["rel"] == "item"] == [
+            "./r0/r0.json",
+            "./r1/r1.json",
+            "./r2/r2.json",
+            "./new/new.json",
+        ]
+
+    def test_existing_items_are_not_rewritten(
+        self, tmp_path: Path, valid_singleband_cog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        root = _catalog(tmp_path, valid_singleband_cog, 2)
+        existing = root / "demo" / "r0" / "r0.json"
+        before = existing.stat().st_mtime_ns
+        _place(root, "new", valid_singleband_cog)
+
+        monkeypatch.setenv(FAST_FINALIZE_ENV_VAR, "1")
+        add_files(paths=[root / "demo" / "new"], catalog_root=root)
+
+        assert existing.stat().st_mtime_ns == before
+
+    def test_replaced_file(
+        self, tmp_path: Path, valid_singleband_cog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        base = _catalog(tmp_path / "base", valid_singleband_cog, 3)
+        _place(base, "r1", _RASTERS / "float32.tif")
+
+        through_pystac, fast = _add_both_ways(tmp_path, base, "r1", monkeypatch)
+
+        assert _tree(fast) == _tree(through_pystac)
+
+    def test_item_that_needs_migrating(
+        self, tmp_path: Path, valid_singleband_cog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        base = _catalog(tmp_path / "base", valid_singleband_cog, 2)
+        stale = base / "demo" / "r0" / "r0.json"
+        stale.write_text(
+            stale.read_text().replace('"stac_version": "1.1.0"', '"stac_version": "1.0.0"')
+        )
+        _place(base, "new", valid_singleband_cog)
+
+        through_pystac, fast = _add_both_ways(tmp_path, base, "new", monkeypatch)
+
+        assert _tree(fast) == _tree(through_pystac)
+        assert json.loads((fast / "demo" / "r0" / "r0.json").read_text())["stac_version"] == "1.1.0"
+
+    def test_nested_collection(
+        self, tmp_path: Path, valid_singleband_cog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        base = _catalog(tmp_path / "base", valid_singleband_cog, 1)
+        nested = base / "region" / "demo"
+        for item_id in ("r0", "r1", "r2"):
+            (nested / item_id).mkdir(parents=True)
+            shutil.copy(valid_singleband_cog, nested / item_id / f"{item_id}.tif")
+        add_files(paths=[nested / "r0", nested / "r1"], catalog_root=base)
+
+        through_pystac, fast = _add_both_ways(
+            tmp_path, base, "r2", monkeypatch, collection="region/demo"
+        )
+
+        assert _tree(fast) == _tree(through_pystac)
+
+
+def _edit_links(edit: Callable[[list[dict[str, Any]]], None]) -> Callable[[dict[str, Any]], None]:
+    return lambda item: edit(item["links"])
+
+
+class TestReadItemsAtRest:
+    @pytest.fixture
+    def catalog(self, tmp_path: Path, valid_singleband_cog: Path) -> Path:
+        return _catalog(tmp_path, valid_singleband_cog, 2)
+
+    def _read(self, catalog: Path) -> dict[str, dict[str, Any]] | None:
+        collection_dir = catalog / "demo"
+        collection = pystac.Collection.from_file(str(collection_dir / "collection.json"))
+        return _read_items_at_rest(collection, collection_dir, catalog)
+
+    def test_items_written_by_add_are_at_rest(self, catalog: Path) -> None:
+        items = self._read(catalog)
+
+        assert items is not None
+        assert sorted(items) == ["./r0/r0.json", "./r1/r1.json"]
+        assert items["./r0/r0.json"]["id"] == "r0"
+
+    @pytest.mark.parametrize(
+        "edit",
+        [
+            pytest.param(lambda item: item.update(stac_version="1.0.0"), id="stac-version"),
+            pytest.param(lambda item: item.pop("stac_extensions"), id="no-extensions-list"),
+            pytest.param(
+                lambda item: item["properties"].update(datetime="2024-01-01T00:00:00.000Z"),
+                id="datetime-format",
+            ),
+            pytest.param(
+                lambda item: item["properties"].update({"proj:epsg": 4326}), id="proj-epsg"
+            ),
+            pytest.param(lambda item: item.update(collection="other"), id="collection-id"),
+            pytest.param(_edit_links(lambda links: links.reverse()), id="parent-not-last"),
+            pytest.param(
+                _edit_links(lambda links: links[0].update(href="../collection.json")),
+                id="root-link",
+            ),
+            pytest.param(
+                _edit_links(lambda links: links.append({"rel": "self", "href": "./r0.json"})),
+                id="self-link",
+            ),
+        ],
+    )
+    def test_item_a_save_would_change(
+        self, catalog: Path, edit: Callable[[dict[str, Any]], None]
+    ) -> None:
+        path = catalog / "demo" / "r0" / "r0.json"
+        item = json.loads(path.read_text())
+        edit(item)
+        path.write_text(json.dumps(item))
+
+        assert self._read(catalog) is None
+
+    def test_unreadable_item(self, catalog: Path) -> None:
+        (catalog / "demo" / "r0" / "r0.json").write_text("{not json")
+
+        assert self._read(catalog) is None
+
+    def test_disabled(self, catalog: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(FAST_FINALIZE_ENV_VAR, "0")
+
+        assert self._read(catalog) is None
+
+
+def _age(paths: list[Path]) -> None:
+    """Backdate ``paths`` an hour, so their stat is trusted."""
+    hour_ago = time.time() - 3600
+    for path in paths:
+        os.utime(path, (hour_ago, hour_ago))
+
+
+class TestAtRestIndex:
+    @pytest.fixture
+    def catalog(self, tmp_path: Path, valid_singleband_cog: Path) -> Path:
+        root = _catalog(tmp_path, valid_singleband_cog, 2)
+        _age(sorted((root / "demo").glob("*/*.json")))
+        return root
+
+    def _read(self, catalog: Path, title: str | None = None) -> dict[str, dict[str, Any]] | None:
+        collection_dir = catalog / "demo"
+        collection = pystac.Collection.from_file(str(collection_dir / "collection.json"))
+        if title is not None:
+            collection.title = title
+        return _read_items_at_rest(collection, collection_dir, catalog)
+
+    def _forbid_checks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail(*_args: Any) -> bool:
+            raise AssertionError("item was checked again")
+
+        monkeypatch.setattr(finalization, "_saves_unchanged", fail)
+
+    def test_verified_items_are_not_checked_again(
+        self, catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        first = self._read(catalog)
+        self._forbid_checks(monkeypatch)
+
+        assert self._read(catalog) == first
+        index = json.loads((catalog / "demo" / ".portolan" / AT_REST_INDEX_FILENAME).read_text())
+        assert sorted(index["items"]) == ["./r0/r0.json", "./r1/r1.json"]
+
+    def test_edited_item_is_checked_again(self, catalog: Path) -> None:
+        self._read(catalog)
+        path = catalog / "demo" / "r0" / "r0.json"
+        item = json.loads(path.read_text())
+        item["links"].reverse()
+        path.write_text(json.dumps(item))
+        _age([path])
+
+        assert self._read(catalog) is None
+
+    def test_recently_written_item_is_not_remembered(self, catalog: Path) -> None:
+        path = catalog / "demo" / "r0" / "r0.json"
+        os.utime(path)
+
+        assert self._read(catalog) is not None
+        index = json.loads((catalog / "demo" / ".portolan" / AT_REST_INDEX_FILENAME).read_text())
+        assert sorted(index["items"]) == ["./r1/r1.json"]
+
+    def test_retitled_collection_voids_the_index(
+        self, catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._read(catalog)
+        checked: list[Path] = []
+        saves_unchanged = finalization._saves_unchanged
+
+        def spy(data: Any, item_path: Path, *args: Any) -> bool:
+            checked.append(item_path)
+            return saves_unchanged(data, item_path, *args)
+
+        monkeypatch.setattr(finalization, "_saves_unchanged", spy)
+
+        assert self._read(catalog, title="Renamed") is None
+        assert checked
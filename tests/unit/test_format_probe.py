@@ -0,0 +1,176 @@
+"""Unit tests for formats.probe(), the single-open format inspection record.
+
+probe() opens a file once to tell Parquet/GeoParquet, TIFF/COG and GeoJSON
+apart, and caches the immutable result while the file's stat is unchanged.
+The existing predicates (is_valid_parquet, is_geoparquet, ...) are thin views
+over it and must answer exactly as before.
+"""
+
+from __future__ import annotations
+
+import builtins
+import os
+import shutil
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from portolan_cli import formats
+from portolan_cli.formats import (
+    FileSignature,
+    FormatProbe,
+    FormatType,
+    _detect_json_type,
+    get_cloud_native_status,
+    is_cloud_optimized_geotiff,
+    is_geoparquet,
+    is_valid_parquet,
+    probe,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _settle(path: Path) -> Path:
+    stamp = time.time() - 60
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+@pytest.fixture
+def opens(monkeypatch: pytest.MonkeyPatch) -> Counter[str]:
+    """Count every open() of a file, by name."""
+    counts: Counter[str] = Counter()
+    real_open = builtins.open
+
+    def counting_open(file: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(file, (str, Path)):
+            counts[Path(file).name] += 1
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    return counts
+
+
+@pytest.fixture
+def geoparquet(tmp_path: Path, valid_points_parquet: Path) -> Path:
+    return _settle(Path(shutil.copy(valid_points_parquet, tmp_path / "points.parquet")))
+
+
+class TestProbe:
+    def test_geoparquet(self, geoparquet: Path) -> None:
+        assert probe(geoparquet) == FormatProbe(
+            FileSignature.PARQUET, valid_parquet=True, geoparquet=True
+        )
+
+    def test_plain_parquet(self, tmp_path: Path) -> None:
+        path = tmp_path / "table.parquet"
+        pq.write_table(pa.table({"id": [1, 2, 3]}), path)
+
+        result = probe(path)
+
+        assert (result.valid_parquet, result.geoparquet) == (True, False)
+
+    def test_corrupt_parquet(self, tmp_path: Path) -> None:
+        path = tmp_path / "broken.parquet"
+        path.write_bytes(b"PAR1" + b"\x00" * 64)
+
+        assert probe(path) == FormatProbe(FileSignature.PARQUET)
+
+    def test_cog(self, valid_rgb_cog: Path, non_cog_tif: Path) -> None:
+        assert probe(valid_rgb_cog) == FormatProbe(FileSignature.TIFF, cog=True)
+        assert probe(non_cog_tif) == FormatProbe(FileSignature.TIFF, cog=False)
+
+    def test_cog_validated_on_first_access(
+        self, tmp_path: Path, valid_rgb_cog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = _settle(Path(shutil.copy(valid_rgb_cog, tmp_path / "scene.tif")))
+        calls: list[Path] = []
+
+        def validate(path: Path, *, quiet: bool) -> bool:
+            calls.append(path)
+            return True
+
+        monkeypatch.setattr(formats, "_validate_cog", validate)
+
+        result = probe(path)
+        assert result.signature == FileSignature.TIFF
+        assert calls == []
+
+        assert result.cog is True
+        assert probe(path).cog is True
+        assert calls == [path]
+
+    def test_geojson_in_json(self, tmp_path: Path) -> None:
+        geojson = tmp_path / "roads.json"
+        geojson.write_text('{"type": "FeatureCollection", "features": []}')
+        stac = tmp_path / "item.json"
+        stac.write_text('{"type": "Feature", "stac_version": "1.1.0"}')
+
+        assert probe(geojson).json_type == FormatType.VECTOR
+        assert probe(stac).json_type == FormatType.UNKNOWN
+
+    def test_multibyte_character_across_the_sniff_window(self, tmp_path: Path) -> None:
+        path = tmp_path / "roads.json"
+        padding = "x" * (formats._PROBE_HEAD_BYTES - 1)
+        path.write_text('{"type":"Feature","p":"' + padding + 'é"}', encoding="utf-8")
+
+        assert probe(path).json_type == FormatType.VECTOR
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        assert probe(tmp_path / "gone.parquet") == FormatProbe(FileSignature.OTHER)
+
+    def test_round_trips_through_dict(self, valid_rgb_cog: Path) -> None:
+        result = probe(valid_rgb_cog)
+
+        assert FormatProbe.from_dict(result.to_dict()) == result
+
+
+class TestSingleOpen:
+    def test_parquet_classification_opens_once(self, geoparquet: Path, opens: Counter[str]) -> None:
+        assert is_valid_parquet(geoparquet)
+        assert is_geoparquet(geoparquet)
+        assert get_cloud_native_status(geoparquet).display_name == "GeoParquet"
+
+        assert opens[geoparquet.name] == 1
+
+    def test_changed_file_is_probed_again(self, tmp_path: Path) -> None:
+        path = tmp_path / "notes.json"
+        path.write_text('{"hello": "world"}')
+        _settle(path)
+        assert _detect_json_type(path) == FormatType.UNKNOWN
+
+        path.write_text('{"type": "Point", "coordinates": [0, 0]}')
+        _settle(path)
+
+        assert _detect_json_type(path) == FormatType.VECTOR
+
+    def test_recently_modified_file_is_not_cached(
+        self, tmp_path: Path, opens: Counter[str]
+    ) -> None:
+        path = tmp_path / "fresh.json"
+        path.write_text("{}")
+
+        probe(path)
+        probe(path)
+
+        assert opens["fresh.json"] == 2
+
+    def test_loud_cog_check_bypasses_cache(
+        self, valid_rgb_cog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[bool] = []
+
+        def validate(path: Path, *, quiet: bool) -> bool:
+            calls.append(quiet)
+            return True
+
+        monkeypatch.setattr(formats, "_validate_cog", validate)
+
+        assert is_cloud_optimized_geotiff(valid_rgb_cog, quiet=False)
+        assert calls == [False]
@@ -0,0 +1,113 @@
+"""Unit tests for the PORTOLAN_PROFILE_IMPORTS import profiler."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+import types
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from portolan_cli import import_profile
+from portolan_cli.import_profile import ImportProfiler, format_report, install_from_env
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """A fake clock the profiled modules advance as they execute."""
+    fake = types.ModuleType("profiled_clock")
+    fake.now = 0.0  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "profiled_clock", fake)
+    return fake
+
+
+@pytest.fixture
+def modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """A throwaway package: outer imports inner, both removed afterwards.
+
+    inner's body takes 5 fake seconds; outer's own body takes 1 after it.
+    """
+    package = tmp_path / "profiled_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "outer.py").write_text(
+        "import profiled_pkg.inner\nimport profiled_clock\nprofiled_clock.now += 1.0\nVALUE = 1\n"
+    )
+    (package / "inner.py").write_text("import profiled_clock\nprofiled_clock.now += 5.0\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in [m for m in sys.modules if m.startswith("profiled_pkg")]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def profiler(clock: types.ModuleType) -> Iterator[ImportProfiler]:
+    installed = ImportProfiler(clock=lambda: float(clock.now))
+    sys.meta_path.insert(0, installed)
+    yield installed
+    sys.meta_path.remove(installed)
+
+
+class TestImportProfiler:
+    @pytest.mark.usefixtures("modules")
+    def test_times_nested_imports(self, profiler: ImportProfiler) -> None:
+        outer = importlib.import_module("profiled_pkg.outer")
+
+        records = {r.module: r for r in profiler.records}
+        assert outer.VALUE == 1
+        assert records["profiled_pkg.inner"].self_seconds == 5.0
+        # The 5 seconds are inner's own time, not outer's
+        assert records["profiled_pkg.outer"].cumulative_seconds == 6.0
+        assert records["profiled_pkg.outer"].self_seconds == 1.0
+        assert records["profiled_pkg"].cumulative_seconds == 0.0
+
+    @pytest.mark.usefixtures("modules")
+    def test_report_orders_by_self_time(self, profiler: ImportProfiler) -> None:
+        importlib.import_module("profiled_pkg.outer")
+
+        report = profiler.report("portolan list")
+
+        assert report["command"] == "portolan list"
+        assert [row["module"] for row in report["modules"]] == [
+            "profiled_pkg.inner",
+            "profiled_pkg.outer",
+            "profiled_pkg",
+        ]
+        assert report["total_seconds"] == 6.0
+        lines = format_report(report, top_n=1)
+        assert lines[0].startswith("Import profile for `portolan list`")
+        assert lines[-1].endswith("profiled_pkg.inner")
+
+
+class TestInstallFromEnv:
+    @pytest.mark.parametrize("value", ["", "0", "false", "off"])
+    def test_off(self, value: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PORTOLAN_PROFILE_IMPORTS", value)
+
+        assert install_from_env() is None
+
+    def test_json_report_written_at_exit(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        destination = tmp_path / "imports.json"
+        registered: list[tuple[object, ...]] = []
+        monkeypatch.setenv("PORTOLAN_PROFILE_IMPORTS", str(destination))
+        monkeypatch.setattr(
+            import_profile.atexit, "register", lambda *args: registered.append(args)
+        )
+
+        profiler = install_from_env()
+        try:
+            assert profiler is not None
+            assert install_from_env() is None  # already installed
+        finally:
+            sys.meta_path.remove(profiler)
+        write, *args = registered[0]
+        write(*args)  # type: ignore[operator]
+
+        assert json.loads(destination.read_text())["command"].startswith("portolan")
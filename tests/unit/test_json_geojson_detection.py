@@ -316,6 +316,19 @@ class TestJsonGeoJsonRobustness:
         assert len(skipped) == 1
         assert skipped[0].category == FileCategory.STAC_METADATA
 
+    def test_portolan_manifest_is_skipped_as_metadata(self, tmp_path: Path) -> None:
+        """portolan-manifest.json, written by push next to catalog.json, is metadata."""
+        from portolan_cli.scan.classify import FileCategory
+        from portolan_cli.scan.core import scan_directory
+
+        (tmp_path / "portolan-manifest.json").write_text('{"manifest_version": 1}')
+
+        result = scan_directory(tmp_path)
+        skipped = [s for s in result.skipped if s.path.name == "portolan-manifest.json"]
+
+        assert len(skipped) == 1
+        assert skipped[0].category == FileCategory.STAC_METADATA
+
     def test_json_with_null_bytes_is_skipped(self, tmp_path: Path) -> None:
         """A .json file with embedded null bytes should be skipped."""
         from portolan_cli.scan.core import scan_directory
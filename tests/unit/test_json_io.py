@@ -1,21 +1,29 @@
-"""Unit tests for the shared atomic JSON writer (``portolan_cli.json_io``).
+"""Unit tests for the shared JSON reader and atomic writer (``portolan_cli.json_io``).
 
 Every STAC/Portolan JSON write funnels through :func:`write_json_atomic`, so the
 guarantees tested here — atomicity, unescaped unicode, trailing newline — hold
 for ``catalog.json``, ``collection.json``, ``item.json``, and ``versions.json``
-alike.
+alike. Catalog-wide reads go through :func:`read_json_files`.
 """
 
 from __future__ import annotations
 
+import itertools
 import json
+import math
 import os
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
-from portolan_cli.json_io import write_json_atomic, write_text_atomic
+from portolan_cli.json_io import (
+    loads_json,
+    read_json_files,
+    write_json_atomic,
+    write_text_atomic,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -128,6 +136,75 @@ class TestWriteTextAtomic:
         assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
 
 
+class TestReadJsonFiles:
+    """The threaded loader behind catalog-wide item traversal."""
+
+    @staticmethod
+    def _items(directory: Path, count: int) -> list[Path]:
+        paths = []
+        for index in range(count):
+            path = directory / f"item-{index}.json"
+            write_json_atomic(path, {"id": f"item-{index}", "title": "Córdoba"})
+            paths.append(path)
+        return paths
+
+    def test_yields_documents_in_input_order(self, tmp_path: Path) -> None:
+        paths = self._items(tmp_path, 50)
+
+        loaded = list(read_json_files(reversed(paths), max_workers=4))
+
+        assert [path for path, _ in loaded] == list(reversed(paths))
+        assert [doc["id"] for _, doc in loaded] == [f"item-{i}" for i in reversed(range(50))]
+        assert loaded[0][1]["title"] == "Córdoba"
+
+    def test_reads_ahead_a_bounded_window(self, tmp_path: Path) -> None:
+        paths = self._items(tmp_path, 4)
+        pulled: list[Path] = []
+
+        def endless() -> Iterator[Path]:
+            for path in itertools.cycle(paths):
+                pulled.append(path)
+                yield path
+
+        stream = read_json_files(endless(), max_workers=2)
+        first = [doc["id"] for _, doc in itertools.islice(stream, 3)]
+        stream.close()
+
+        assert first == ["item-0", "item-1", "item-2"]
+        assert len(pulled) < 20
+
+    def test_strict_raises_at_the_bad_file(self, tmp_path: Path) -> None:
+        good = self._items(tmp_path, 2)
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json", encoding="utf-8")
+        seen: list[Path] = []
+
+        with pytest.raises(json.JSONDecodeError):
+            for path, _doc in read_json_files([*good, bad, *good], max_workers=3):
+                seen.append(path)
+
+        assert seen == good
+
+    def test_lenient_yields_none_for_unreadable_files(self, tmp_path: Path) -> None:
+        (good,) = self._items(tmp_path, 1)
+        bad = tmp_path / "bad.json"
+        bad.write_bytes(b"\xff\xfe{")
+        missing = tmp_path / "missing.json"
+
+        loaded = dict(read_json_files([bad, good, missing], max_workers=2, strict=False))
+
+        assert loaded == {bad: None, good: {"id": "item-0", "title": "Córdoba"}, missing: None}
+
+    def test_decoding_matches_the_standard_library(self) -> None:
+        """Inputs the fast decoder refuses still decode as :func:`json.loads` would."""
+        assert loads_json(b'{"big": 123456789012345678901234567890}') == {
+            "big": 123456789012345678901234567890
+        }
+        assert math.isnan(loads_json(b'{"v": NaN}')["v"])
+        with pytest.raises(json.JSONDecodeError):
+            loads_json(b"[1,")
+
+
 def _collection_dict(collection_id: str = "roads", title: str = "Roads") -> dict[str, object]:
     return {
         "type": "Collection",
@@ -112,7 +112,9 @@ async def test_pull_async_downloads_concurrently(
     max_concurrent = 0
     download_events: list[tuple[str, str]] = []  # (filename, event_type)
 
-    async def mock_download_file_async(store: Any, key: str, path: Path) -> tuple[bool, int]:
+    async def mock_download_file_async(
+        store: Any, key: str, path: Path, **_kwargs: Any
+    ) -> tuple[bool, int]:
         """Mock download that tracks concurrency."""
         nonlocal concurrent_count, max_concurrent
 
@@ -189,7 +191,9 @@ async def test_pull_async_respects_concurrency_limit(
     concurrency_violations: list[int] = []
     concurrency_limit = 3
 
-    async def mock_download_file_async(store: Any, key: str, path: Path) -> tuple[bool, int]:
+    async def mock_download_file_async(
+        store: Any, key: str, path: Path, **_kwargs: Any
+    ) -> tuple[bool, int]:
         """Mock download that strictly checks concurrency."""
         nonlocal concurrent_count, max_concurrent
 
@@ -262,7 +266,9 @@ async def test_pull_async_handles_rate_limit(
     """
     call_count = 0
 
-    async def mock_download_with_rate_limit(store: Any, key: str, path: Path) -> tuple[bool, int]:
+    async def mock_download_with_rate_limit(
+        store: Any, key: str, path: Path, **_kwargs: Any
+    ) -> tuple[bool, int]:
         """Mock that returns rate limit errors initially."""
         nonlocal call_count
         call_count += 1
@@ -328,7 +334,9 @@ async def test_pull_async_circuit_breaker_on_failures(
     """
     call_count = 0
 
-    async def mock_download_always_fails(store: Any, key: str, path: Path) -> tuple[bool, int]:
+    async def mock_download_always_fails(
+        store: Any, key: str, path: Path, **_kwargs: Any
+    ) -> tuple[bool, int]:
         """Mock that always fails."""
         nonlocal call_count
         call_count += 1
@@ -436,7 +444,9 @@ async def test_pull_async_reports_progress(
     2. Progress shows completed/total counts
     """
 
-    async def mock_download_file_async(store: Any, key: str, path: Path) -> tuple[bool, int]:
+    async def mock_download_file_async(
+        store: Any, key: str, path: Path, **_kwargs: Any
+    ) -> tuple[bool, int]:
         return True, 1000
 
     with (
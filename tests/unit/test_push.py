@@ -559,6 +559,44 @@ class TestPush:
 
         assert result.success is True
 
+    @pytest.mark.unit
+    def test_push_with_force_does_not_skip_matching_assets(self, local_catalog: Path) -> None:
+        """--force re-uploads assets even if their remote sha256 already matches."""
+        from portolan_cli.sync.push import push
+
+        with patch(
+            "portolan_cli.sync.push._fetch_remote_versions_async", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = (
+                {
+                    "spec_version": "1.0.0",
+                    "current_version": "1.0.0",
+                    "versions": [{"version": "1.0.0", "created": "2024-01-01T00:00:00Z"}],
+                },
+                "etag-123",
+            )
+
+            with (
+                patch(
+                    "portolan_cli.sync.push._upload_assets_async", new_callable=AsyncMock
+                ) as mock_upload_assets,
+                patch(
+                    "portolan_cli.sync.push._upload_stac_files_async", new_callable=AsyncMock
+                ) as mock_upload_stac,
+                patch("portolan_cli.sync.push._upload_versions_json_async", new_callable=AsyncMock),
+            ):
+                mock_upload_assets.return_value = (1, [], ["catalog/data.parquet"], UploadMetrics())
+                mock_upload_stac.return_value = (2, [], ["stac/collection.json"])
+
+                push(
+                    catalog_root=local_catalog,
+                    collection="test",
+                    destination="s3://mybucket/catalog",
+                    force=True,
+                )
+
+        assert mock_upload_assets.call_args.kwargs["probe_remote"] is False
+
     @pytest.mark.unit
     def test_push_first_time_no_remote(self, local_catalog: Path) -> None:
         """First push (no remote versions.json) should succeed."""
@@ -0,0 +1,89 @@
+"""Unit tests for content-addressed delta push.
+
+Push tags every uploaded object with its SHA-256 and skips assets whose remote
+tag already matches, so a re-publish after a versions.json rewrite only moves
+changed bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from unittest.mock import patch
+
+import obstore as obs
+import pytest
+from obstore.store import MemoryStore
+
+from portolan_cli.sync.push import CHECKSUM_METADATA_KEY, _upload_assets_async
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def assets(tmp_path: Path) -> list[Path]:
+    paths = []
+    for name in ("a.parquet", "b.parquet"):
+        path = tmp_path / "col" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(name.encode() * 64)
+        paths.append(path)
+    return paths
+
+
+def _tag(store: MemoryStore, key: str) -> str | None:
+    return obs.get(store, key, options={"head": True}).attributes.get(CHECKSUM_METADATA_KEY)
+
+
+class TestChecksumTagging:
+    async def test_uploaded_objects_carry_their_sha256(
+        self, tmp_path: Path, assets: list[Path]
+    ) -> None:
+        store = MemoryStore()
+
+        await _upload_assets_async(store, tmp_path, "cat", assets, suppress_progress=True)
+
+        assert _tag(store, "cat/col/a.parquet") == hashlib.sha256(b"a.parquet" * 64).hexdigest()
+
+    async def test_multipart_objects_are_tagged_too(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        big = tmp_path / "big.tif"
+        big.write_bytes(b"\0" * (5 * 1024 * 1024 + 1))
+        store = MemoryStore()
+
+        await _upload_assets_async(store, tmp_path, "", [big], suppress_progress=True)
+
+        assert _tag(store, "big.tif") == hashlib.sha256(big.read_bytes()).hexdigest()
+
+
+class TestDeltaSkip:
+    async def test_matching_remote_checksum_is_not_reuploaded(
+        self, tmp_path: Path, assets: list[Path]
+    ) -> None:
+        store = MemoryStore()
+        await _upload_assets_async(store, tmp_path, "cat", assets, suppress_progress=True)
+        assets[1].write_bytes(b"changed")
+
+        with patch("portolan_cli.sync.push.obs.put_async", wraps=obs.put_async) as put:
+            count, errors, keys, _ = await _upload_assets_async(
+                store, tmp_path, "cat", assets, suppress_progress=True
+            )
+
+        assert errors == []
+        assert [call.args[1] for call in put.call_args_list] == ["cat/col/b.parquet"]
+        # Pre-existing objects are not this push's uploads: a rollback must not delete them.
+        assert (count, keys) == (1, ["cat/col/b.parquet"])
+
+    async def test_untagged_remote_object_is_reuploaded(
+        self, tmp_path: Path, assets: list[Path]
+    ) -> None:
+        store = MemoryStore()
+        obs.put(store, "cat/col/a.parquet", assets[0].read_bytes())  # pushed by an older release
+
+        count, _, _, _ = await _upload_assets_async(
+            store, tmp_path, "cat", assets[:1], suppress_progress=True
+        )
+
+        assert count == 1
+        assert _tag(store, "cat/col/a.parquet") is not None
@@ -11,6 +11,7 @@ any client walking ``child`` links remotely. These tests pin the fix.
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -123,6 +124,17 @@ class TestDiscoverIntermediateCatalogFiles:
         assert _discover_intermediate_catalog_files(tmp_path, ["demographics"]) == []
 
 
+@pytest.fixture
+def remote_etags() -> Iterator[None]:
+    """Answer the manifest's ETag HEADs, since the uploads they follow are mocked."""
+    with patch(
+        "portolan_cli.sync.push.fetch_etags",
+        side_effect=lambda _store, _prefix, keys: dict.fromkeys(keys, "etag"),
+    ):
+        yield
+
+
+@pytest.mark.usefixtures("remote_etags")
 class TestCatalogWidePushIntermediateCatalogs:
     """push_all_collections must upload intermediate catalog.json (Issue #547, #552)."""
 
@@ -0,0 +1,168 @@
+"""Unit tests for the resumable-push journal (``sync.push_journal``).
+
+An interrupted push used to start over from zero. Finished asset uploads are
+now recorded in ``.portolan/push-journal.json`` so the next run skips them.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import obstore as obs
+import pytest
+from obstore.store import MemoryStore
+
+from portolan_cli.sync.push import _upload_assets_async
+from portolan_cli.sync.push_journal import PUSH_JOURNAL_FILENAME, PushJournal, local_stat
+
+pytestmark = pytest.mark.unit
+
+DEST = "s3://bucket/catalog"
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> Path:
+    (tmp_path / ".portolan").mkdir()
+    for name in ("a.parquet", "b.parquet", "c.parquet"):
+        path = tmp_path / "col" / "item" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(name.encode() * 100)
+    return tmp_path
+
+
+def _assets(catalog: Path) -> list[Path]:
+    return sorted((catalog / "col" / "item").glob("*.parquet"))
+
+
+class TestPushJournal:
+    def test_recorded_upload_survives_a_new_process(self, catalog: Path) -> None:
+        asset = _assets(catalog)[0]
+        journal = PushJournal(catalog, DEST)
+        journal.record("catalog/col/item/a.parquet", local_stat(asset), '"etag-1"')
+        journal.flush()
+
+        reloaded = PushJournal(catalog, DEST + "/")
+
+        entry = reloaded.lookup("catalog/col/item/a.parquet", asset)
+        assert entry is not None
+        assert entry[2] == '"etag-1"'
+
+    def test_modified_local_file_is_not_trusted(self, catalog: Path) -> None:
+        asset = _assets(catalog)[0]
+        journal = PushJournal(catalog, DEST)
+        journal.record("k", local_stat(asset), None)
+
+        asset.write_bytes(b"rewritten after the interrupted push")
+
+        assert journal.lookup("k", asset) is None
+
+    def test_other_destinations_are_kept(self, catalog: Path) -> None:
+        asset = _assets(catalog)[0]
+        other = PushJournal(catalog, "gs://elsewhere")
+        other.record("k", local_stat(asset), None)
+        other.flush()
+
+        journal = PushJournal(catalog, DEST)
+        journal.record("k", local_stat(asset), None)
+        journal.flush()
+        journal.forget(["k"])
+        journal.flush()
+
+        data = json.loads((catalog / ".portolan" / PUSH_JOURNAL_FILENAME).read_text())
+        assert list(data["destinations"]) == ["gs://elsewhere"]
+
+    def test_file_is_removed_once_nothing_is_in_flight(self, catalog: Path) -> None:
+        asset = _assets(catalog)[0]
+        journal = PushJournal(catalog, DEST)
+        journal.record("k", local_stat(asset), None)
+        journal.flush()
+
+        journal.forget(["k"])
+        journal.flush()
+
+        assert not (catalog / ".portolan" / PUSH_JOURNAL_FILENAME).exists()
+
+    def test_corrupt_journal_is_ignored(self, catalog: Path) -> None:
+        (catalog / ".portolan" / PUSH_JOURNAL_FILENAME).write_text("{not json")
+
+        assert len(PushJournal(catalog, DEST)) == 0
+
+
+class TestResumedUpload:
+    async def test_rerun_skips_assets_already_in_the_bucket(self, catalog: Path) -> None:
+        store = MemoryStore()
+        assets = _assets(catalog)
+        journal = PushJournal(catalog, DEST)
+        await _upload_assets_async(
+            store, catalog, "catalog", assets[:2], suppress_progress=True, journal=journal
+        )
+        journal.flush()  # the interrupted run stops here
+
+        with patch("portolan_cli.sync.push.obs.put_async", wraps=obs.put_async) as put:
+            count, errors, keys, _ = await _upload_assets_async(
+                store,
+                catalog,
+                "catalog",
+                assets,
+                suppress_progress=True,
+                journal=PushJournal(catalog, DEST),
+            )
+
+        assert errors == []
+        assert count == 3
+        assert sorted(keys) == [f"catalog/col/item/{n}.parquet" for n in "abc"]
+        assert [call.args[1] for call in put.call_args_list] == ["catalog/col/item/c.parquet"]
+
+    async def test_object_missing_remotely_is_uploaded_again(self, catalog: Path) -> None:
+        store = MemoryStore()
+        asset = _assets(catalog)[0]
+        journal = PushJournal(catalog, DEST)
+        await _upload_assets_async(
+            store, catalog, "catalog", [asset], suppress_progress=True, journal=journal
+        )
+        obs.delete(store, "catalog/col/item/a.parquet")
+
+        await _upload_assets_async(
+            store, catalog, "catalog", [asset], suppress_progress=True, journal=journal
+        )
+
+        assert obs.get(store, "catalog/col/item/a.parquet").bytes() == asset.read_bytes()
+
+    async def test_failed_assets_are_not_journaled(self, catalog: Path) -> None:
+        store = MemoryStore()
+        assets = _assets(catalog)
+        journal = PushJournal(catalog, DEST)
+        real_put_async = obs.put_async
+
+        async def flaky_put(store_arg: object, key: str, content: bytes, **kw: object) -> object:
+            if key.endswith("b.parquet"):
+                raise ConnectionError("reset by peer")
+            return await real_put_async(store_arg, key, content, **kw)  # type: ignore[arg-type]
+
+        with patch("portolan_cli.sync.push.obs.put_async", side_effect=flaky_put):
+            _, errors, keys, _ = await _upload_assets_async(
+                store,
+                catalog,
+                "catalog",
+                assets,
+                suppress_progress=True,
+                adaptive=False,
+                journal=journal,
+            )
+
+        assert len(errors) == 1
+        assert journal.lookup("catalog/col/item/b.parquet", assets[1]) is None
+        assert journal.lookup("catalog/col/item/a.parquet", assets[0]) is not None
+        assert len(keys) == 2
+
+    async def test_without_journal_behaviour_is_unchanged(self, catalog: Path) -> None:
+        with patch("portolan_cli.sync.push.obs.put_async", new_callable=AsyncMock) as put:
+            count, errors, _, _ = await _upload_assets_async(
+                MemoryStore(), catalog, "catalog", _assets(catalog), suppress_progress=True
+            )
+
+        assert (count, errors) == (3, [])
+        assert put.await_count == 3
+        assert not (catalog / ".portolan" / PUSH_JOURNAL_FILENAME).exists()
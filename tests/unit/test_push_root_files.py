@@ -8,6 +8,7 @@ root README.md and versions.json were being skipped.
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -93,6 +94,17 @@ def _create_collection(catalog_root: Path, name: str, with_readme: bool = False)
         (collection_dir / "README.md").write_text(f"# {name}\n\nCollection README.\n")
 
 
+@pytest.fixture
+def remote_etags() -> Iterator[None]:
+    """Answer the manifest's ETag HEADs, since the uploads they follow are mocked."""
+    with patch(
+        "portolan_cli.sync.push.fetch_etags",
+        side_effect=lambda _store, _prefix, keys: dict.fromkeys(keys, "etag"),
+    ):
+        yield
+
+
+@pytest.mark.usefixtures("remote_etags")
 class TestPushAllCollectionsRootFiles:
     """Tests for root-level file uploads in push_all_collections (Issue #357)."""
 
@@ -0,0 +1,296 @@
+"""Unit tests for ``search_items`` and ``portolan query``.
+
+Searches answer the same from the catalog index, from an items.parquet
+mirror and from the item JSONs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+from click.testing import CliRunner
+
+from portolan_cli import query
+from portolan_cli.catalog_index import CATALOG_INDEX_ENV_VAR, open_catalog_index
+from portolan_cli.cli import _parse_query_datetime, cli
+from portolan_cli.json_io import read_json_files
+from portolan_cli.query import search_items
+
+pytestmark = pytest.mark.unit
+
+_AN_HOUR_AGO = time.time() - 3600
+
+
+def _write_old(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+    os.utime(path, (_AN_HOUR_AGO, _AN_HOUR_AGO))
+
+
+def _item(item_id: str, bbox: list[float], properties: dict[str, Any]) -> Any:
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": item_id,
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [bbox[0], bbox[1]],
+                    [bbox[2], bbox[1]],
+                    [bbox[2], bbox[3]],
+                    [bbox[0], bbox[3]],
+                    [bbox[0], bbox[1]],
+                ]
+            ],
+        },
+        "bbox": bbox,
+        "properties": properties,
+        "links": [],
+        "assets": {"data": {"href": f"./{item_id}.parquet"}},
+    }
+
+
+_ITEMS = {
+    "a": _item("a", [0.0, 0.0, 1.0, 1.0], {"datetime": "2024-01-01T00:00:00Z", "gsd": 10}),
+    "b": _item("b", [10.0, 10.0, 11.0, 11.0], {"datetime": "2024-06-01T00:00:00Z", "gsd": 20}),
+    "c": _item(
+        "c",
+        [0.5, 0.5, 2.0, 2.0],
+        {
+            "datetime": None,
+            "start_datetime": "2023-12-01T00:00:00Z",
+            "end_datetime": "2024-02-01T00:00:00Z",
+            "gsd": 10,
+        },
+    ),
+}
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> Path:
+    (tmp_path / ".portolan").mkdir()
+    (tmp_path / ".portolan" / "config.yaml").write_text("{}\n")
+    _write_old(
+        tmp_path / "catalog.json",
+        {
+            "type": "Catalog",
+            "id": "root",
+            "links": [{"rel": "child", "href": "./regions/catalog.json"}],
+        },
+    )
+    _write_old(
+        tmp_path / "regions" / "catalog.json",
+        {
+            "type": "Catalog",
+            "id": "regions",
+            "links": [{"rel": "child", "href": "./demo/collection.json"}],
+        },
+    )
+    collection_dir = tmp_path / "regions" / "demo"
+    for item_id, item in _ITEMS.items():
+        _write_old(collection_dir / item_id / f"{item_id}.json", item)
+    links = [{"rel": "item", "href": f"./{i}/{i}.json"} for i in _ITEMS]
+    _write_old(
+        collection_dir / "collection.json",
+        {"type": "Collection", "id": "demo", "links": links},
+    )
+    return tmp_path
+
+
+def _ids(catalog: Path, **filters: Any) -> list[str]:
+    return [item.item_id for item in search_items(catalog, **filters)]
+
+
+@pytest.fixture(params=["index", "parquet", "files"])
+def source(request: pytest.FixtureRequest, catalog: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param != "index":
+        monkeypatch.setenv(CATALOG_INDEX_ENV_VAR, "0")
+    if request.param == "parquet":
+        pytest.importorskip("stac_geoparquet")
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        generate_items_parquet(catalog / "regions" / "demo")
+    return str(request.param)
+
+
+class TestFilters:
+    def test_no_filters_match_everything(self, catalog: Path, source: str) -> None:
+        assert _ids(catalog) == ["a", "b", "c"]
+
+    def test_bbox_intersects(self, catalog: Path, source: str) -> None:
+        assert _ids(catalog, bbox=(0.8, 0.8, 0.9, 0.9)) == ["a", "c"]
+        assert _ids(catalog, bbox=(1.5, 1.5, 5.0, 5.0)) == ["c"]
+
+    def test_bbox_touching_edge_matches(self, catalog: Path, source: str) -> None:
+        assert _ids(catalog, bbox=(11.0, 11.0, 12.0, 12.0)) == ["b"]
+
+    def test_datetime_range_overlaps(self, catalog: Path, source: str) -> None:
+        start = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        end = datetime(2024, 7, 1, tzinfo=timezone.utc)
+
+        assert _ids(catalog, start=start, end=end) == ["b", "c"]
+        assert _ids(catalog, end=datetime(2023, 12, 31)) == ["c"]
+
+    def test_properties_equal(self, catalog: Path, source: str) -> None:
+        assert _ids(catalog, properties={"gsd": 10}) == ["a", "c"]
+        assert _ids(catalog, properties={"gsd": 10}, bbox=(1.5, 1.5, 5.0, 5.0)) == ["c"]
+        assert _ids(catalog, properties={"platform": "x"}) == []
+
+    def test_collection_filter_uses_catalog_relative_path(self, catalog: Path, source: str) -> None:
+        assert _ids(catalog, collection_id="regions/demo") == ["a", "b", "c"]
+        assert _ids(catalog, collection_id="demo") == []
+
+    def test_result_fields(self, catalog: Path, source: str) -> None:
+        [item] = search_items(catalog, bbox=(10.5, 10.5, 10.6, 10.6))
+
+        assert item.collection_id == "regions/demo"
+        assert item.bbox == [10.0, 10.0, 11.0, 11.0]
+        assert item.datetime == datetime(2024, 6, 1, tzinfo=timezone.utc)
+        assert item.asset_paths == ["./b.parquet"]
+
+
+class TestSources:
+    def test_index_reads_no_item_json_once_built(self, catalog: Path) -> None:
+        search_items(catalog)
+
+        with mock.patch.object(query, "read_json_files", wraps=read_json_files) as reader:
+            assert _ids(catalog, bbox=(0.8, 0.8, 0.9, 0.9)) == ["a", "c"]
+
+        reader.assert_not_called()
+
+    def test_edited_match_is_rechecked(self, catalog: Path) -> None:
+        search_items(catalog)
+        moved = _item("a", [50.0, 50.0, 51.0, 51.0], {"datetime": "2024-01-01T00:00:00Z"})
+        _write_old(catalog / "regions" / "demo" / "a" / "a.json", moved)
+
+        assert _ids(catalog, bbox=(0.8, 0.8, 0.9, 0.9)) == ["c"]
+
+    def test_edited_item_starts_matching(self, catalog: Path) -> None:
+        search_items(catalog)
+        moved = _item("a", [50.0, 50.0, 51.0, 51.0], {"datetime": "2024-01-01T00:00:00Z"})
+        _write_old(catalog / "regions" / "demo" / "a" / "a.json", moved)
+
+        assert _ids(catalog, bbox=(50.0, 50.0, 51.0, 51.0)) == ["a"]
+
+    def test_parquet_mirror_skips_item_json(
+        self, catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pytest.importorskip("stac_geoparquet")
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        monkeypatch.setenv(CATALOG_INDEX_ENV_VAR, "0")
+        generate_items_parquet(catalog / "regions" / "demo")
+
+        with mock.patch.object(query, "read_json_files", wraps=read_json_files) as reader:
+            assert _ids(catalog, bbox=(0.8, 0.8, 0.9, 0.9)) == ["a", "c"]
+
+        reader.assert_not_called()
+
+    def test_stale_parquet_mirror_is_ignored(
+        self, catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pytest.importorskip("stac_geoparquet")
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        monkeypatch.setenv(CATALOG_INDEX_ENV_VAR, "0")
+        parquet_path = generate_items_parquet(catalog / "regions" / "demo")
+        os.utime(parquet_path, (_AN_HOUR_AGO - 60, _AN_HOUR_AGO - 60))
+        moved = _item("b", [0.0, 0.0, 1.0, 1.0], {"datetime": "2024-06-01T00:00:00Z"})
+        _write_old(catalog / "regions" / "demo" / "b" / "b.json", moved)
+
+        assert _ids(catalog, bbox=(0.8, 0.8, 0.9, 0.9)) == ["a", "b", "c"]
+
+    def test_unreadable_item_is_skipped(self, catalog: Path, source: str) -> None:
+        (catalog / "regions" / "demo" / "b" / "b.json").write_text("{not json")
+
+        assert _ids(catalog) == ["a", "c"]
+
+    def test_no_catalog(self, tmp_path: Path) -> None:
+        assert search_items(tmp_path) == []
+
+
+class TestIndexSchema:
+    def test_older_index_is_rebuilt(self, catalog: Path) -> None:
+        import sqlite3
+
+        path = catalog / ".portolan" / "catalog-index.sqlite"
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE items (path TEXT)")
+        connection.execute("PRAGMA user_version = 1")
+        connection.commit()
+        connection.close()
+
+        index = open_catalog_index(catalog)
+        assert index is not None
+        with index:
+            matches = index.search("regions/demo", bbox=(0.8, 0.8, 0.9, 0.9))
+
+        assert matches is not None
+        assert [item.item_id for item in matches] == ["a", "c"]
+
+
+class TestQueryCommand:
+    def test_json_output(self, catalog: Path) -> None:
+        result = CliRunner().invoke(
+            cli,
+            [
+                "query",
+                "--catalog",
+                str(catalog),
+                "--bbox",
+                "0.8,0.8,0.9,0.9",
+                "--datetime",
+                "2024-01-01/..",
+                "--filter",
+                "gsd=10",
+                "--json",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)["data"]
+        assert data["count"] == 2
+        assert [(i["collection"], i["id"]) for i in data["items"]] == [
+            ("regions/demo", "a"),
+            ("regions/demo", "c"),
+        ]
+
+    def test_human_output(self, catalog: Path) -> None:
+        result = CliRunner().invoke(cli, ["query", "--catalog", str(catalog), "--filter", "gsd=20"])
+
+        assert result.exit_code == 0, result.output
+        assert "regions/demo/b" in result.output
+        assert "regions/demo/a" not in result.output
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["--bbox", "0,0,1"],
+            ["--bbox", "a,b,c,d"],
+            ["--datetime", "2024-13-01"],
+            ["--filter", "gsd"],
+        ],
+    )
+    def test_invalid_arguments(self, catalog: Path, args: list[str]) -> None:
+        result = CliRunner().invoke(cli, ["query", "--catalog", str(catalog), *args, "--json"])
+
+        assert result.exit_code == 1
+        assert json.loads(result.output)["errors"][0]["type"] == "UsageError"
+
+    def test_date_only_end_covers_the_day(self) -> None:
+        start, end = _parse_query_datetime("2024-01-01")
+
+        assert start == datetime(2024, 1, 1)
+        assert end == datetime(2024, 1, 1, 23, 59, 59, 999999)
+        assert _parse_query_datetime("../2024-01-01T12:00:00Z") == (
+            None,
+            datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+        )
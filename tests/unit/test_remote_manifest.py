@@ -0,0 +1,301 @@
+"""Unit tests for the remote catalog manifest (portolan-manifest.json).
+
+A catalog-wide push publishes one manifest describing every collection, and
+links it from the root catalog.json. Readers use it in place of the recursive
+catalog walk, and fall back to the walk when the link is absent, the manifest
+was retired by a single-collection push, or an object it pins has changed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import obstore as obs
+import pytest
+from obstore.store import MemoryStore
+
+from portolan_cli.sync import manifest as manifest_mod
+from portolan_cli.sync.core import list_remote_collections
+from portolan_cli.sync.manifest import (
+    MANIFEST_LINK_REL,
+    REMOTE_MANIFEST_FILENAME,
+    ManifestCollection,
+    RemoteManifest,
+    build_manifest,
+    fetch_etags,
+    link_manifest,
+    pinned_keys,
+    read_remote_manifest,
+    retired_manifest_bytes,
+)
+from portolan_cli.sync.push import _push_all_upload_root_files, _upload_stac_files_async
+
+pytestmark = pytest.mark.unit
+
+
+def _write_versions(catalog_root: Path, collection: str) -> None:
+    path = catalog_root / collection / "versions.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    asset_v1 = {"sha256": "a" * 64, "size_bytes": 10, "href": f"{collection}/data.parquet"}
+    asset_v2 = {"sha256": "b" * 64, "size_bytes": 12, "href": f"{collection}/data.parquet"}
+    path.write_text(
+        json.dumps(
+            {
+                "spec_version": "1.0.0",
+                "current_version": "1.1.0",
+                "versions": [
+                    {"version": "1.0.0", "assets": {"data.parquet": asset_v1}},
+                    {"version": "1.1.0", "assets": {"data.parquet": asset_v2}},
+                ],
+            }
+        )
+    )
+
+
+def _catalog(links: list[dict[str, Any]] | None = None) -> dict[str, Any]:
+    return {"type": "Catalog", "id": "root", "links": links or []}
+
+
+def _publish(store: MemoryStore, collections: list[str]) -> RemoteManifest:
+    """Put a linked root catalog, versions.json files and a pinned manifest under ``cat/``."""
+    obs.put(store, "cat/catalog.json", link_manifest(json.dumps(_catalog()).encode()))
+    for collection in collections:
+        obs.put(store, f"cat/{collection}/versions.json", b'{"versions": []}')
+    keys = pinned_keys(collections)
+    for key in keys:
+        if key.endswith("/catalog.json"):
+            obs.put(store, f"cat/{key}", json.dumps(_catalog()).encode())
+    etags = fetch_etags(store, "cat", keys)
+    manifest = RemoteManifest(
+        {name: ManifestCollection("1.0.0", ("1.0.0",), {}) for name in collections},
+        {key: etag for key, etag in etags.items() if etag is not None},
+    )
+    obs.put(store, f"cat/{REMOTE_MANIFEST_FILENAME}", json.dumps(manifest.to_dict()).encode())
+    return manifest
+
+
+class TestManifestSerialization:
+    def test_roundtrip(self) -> None:
+        manifest = RemoteManifest(
+            {
+                "demo": ManifestCollection(
+                    "2.0.0", ("1.0.0", "2.0.0"), {"demo/x.tif": (5, "f" * 64)}
+                )
+            },
+            {"catalog.json": "e1", "demo/versions.json": "e2"},
+        )
+
+        assert RemoteManifest.from_dict(json.loads(json.dumps(manifest.to_dict()))) == manifest
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            [],
+            {"collections": {}},
+            {"manifest_version": 99, "collections": {}, "etags": {"catalog.json": "e"}},
+            {"manifest_version": 2, "collections": [], "etags": {"catalog.json": "e"}},
+            {"manifest_version": 2, "collections": {"a": {"versions": "1.0.0"}}},
+            {"manifest_version": 2, "collections": {"a": {"objects": {"k": {"size_bytes": 1}}}}},
+            # Version 1 predates the ETag pins and cannot be checked.
+            {"manifest_version": 1, "collections": {}},
+            {"manifest_version": 2, "collections": {}},
+            {"manifest_version": 2, "collections": {}, "etags": {"catalog.json": 1}},
+            # Every collection's versions.json must be pinned.
+            {"manifest_version": 2, "collections": {"a": {}}, "etags": {"catalog.json": "e"}},
+        ],
+    )
+    def test_rejects_malformed_input(self, data: Any) -> None:
+        with pytest.raises(ValueError):
+            RemoteManifest.from_dict(data)
+
+
+class TestBuildManifest:
+    def test_describes_current_version_assets(self, tmp_path: Path) -> None:
+        _write_versions(tmp_path, "climate/heat")
+
+        manifest = build_manifest(tmp_path, ["climate/heat"])
+
+        entry = manifest.collections["climate/heat"]
+        assert entry.current_version == "1.1.0"
+        assert entry.versions == ("1.0.0", "1.1.0")
+        assert entry.objects == {"climate/heat/data.parquet": (12, "b" * 64)}
+
+    def test_missing_versions_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            build_manifest(tmp_path, ["absent"])
+
+
+class TestLinkManifest:
+    def test_adds_link_once(self) -> None:
+        content = json.dumps(_catalog([{"rel": "child", "href": "./a/collection.json"}])).encode()
+
+        linked = link_manifest(link_manifest(content))
+
+        links = json.loads(linked)["links"]
+        assert [link["rel"] for link in links] == ["child", MANIFEST_LINK_REL]
+        assert links[1]["href"] == f"./{REMOTE_MANIFEST_FILENAME}"
+
+    def test_leaves_non_catalog_content_alone(self) -> None:
+        assert link_manifest(b"not json") == b"not json"
+
+
+class TestReadRemoteManifest:
+    @pytest.fixture
+    def store(self, monkeypatch: pytest.MonkeyPatch) -> MemoryStore:
+        store = MemoryStore()
+        monkeypatch.setattr(manifest_mod, "_setup_store_and_kwargs", lambda *_a, **_k: (store, {}))
+        return store
+
+    def test_follows_catalog_link(self, store: MemoryStore) -> None:
+        manifest = _publish(store, ["demo", "climate/heat"])
+
+        assert read_remote_manifest("s3://bucket/cat") == manifest
+
+    def test_unlinked_manifest_is_ignored(self, store: MemoryStore) -> None:
+        _publish(store, ["demo"])
+        obs.put(store, "cat/catalog.json", json.dumps(_catalog()).encode())
+
+        assert read_remote_manifest("s3://bucket/cat") is None
+
+    def test_retired_manifest_is_ignored(self, store: MemoryStore) -> None:
+        _publish(store, ["demo"])
+        obs.put(store, f"cat/{REMOTE_MANIFEST_FILENAME}", retired_manifest_bytes())
+
+        assert read_remote_manifest("s3://bucket/cat") is None
+
+    @pytest.mark.parametrize(
+        "changed",
+        ["catalog.json", "climate/catalog.json", "demo/versions.json"],
+        ids=["root-catalog", "intermediate-catalog", "versions"],
+    )
+    def test_manifest_with_changed_source_is_ignored(
+        self, store: MemoryStore, changed: str
+    ) -> None:
+        # A push that does not maintain the manifest (an older release pushing
+        # one collection) uploads the linked root catalog.json unchanged in
+        # content but rewrites what the manifest describes.
+        _publish(store, ["demo", "climate/heat"])
+        content = bytes(obs.get(store, f"cat/{changed}").bytes())
+        obs.put(store, f"cat/{changed}", content)
+
+        assert read_remote_manifest("s3://bucket/cat") is None
+
+    def test_unreadable_manifest_returns_none(self, store: MemoryStore) -> None:
+        catalog = json.loads(link_manifest(json.dumps(_catalog()).encode()))
+
+        assert read_remote_manifest("s3://bucket/cat", catalog_data=catalog) is None
+
+
+class TestListRemoteCollections:
+    @staticmethod
+    def _manifest() -> RemoteManifest:
+        return RemoteManifest(
+            {
+                "a": ManifestCollection("1.0.0", ("1.0.0",), {}),
+                "nested/b": ManifestCollection("1.0.0", ("1.0.0",), {}),
+            },
+            dict.fromkeys(pinned_keys(["a", "nested/b"]), "etag"),
+        )
+
+    def test_uses_manifest_instead_of_walking(self) -> None:
+        linked = json.loads(link_manifest(json.dumps(_catalog()).encode()))
+
+        with (
+            patch(
+                "portolan_cli.sync.core._fetch_remote_catalog_json", return_value=linked
+            ) as fetch,
+            patch.object(manifest_mod, "_get_json", return_value=self._manifest().to_dict()),
+            patch.object(manifest_mod, "_stale_keys", return_value=[]),
+        ):
+            collections = list_remote_collections("s3://bucket/cat")
+
+        assert sorted(collections) == ["a", "nested/b"]
+        fetch.assert_called_once()
+
+    def test_walks_when_manifest_is_stale(self) -> None:
+        root = _catalog([{"rel": "child", "href": "./a/collection.json"}])
+        linked = json.loads(link_manifest(json.dumps(root).encode()))
+
+        with (
+            patch("portolan_cli.sync.core._fetch_remote_catalog_json", return_value=linked),
+            patch.object(manifest_mod, "_get_json", return_value=self._manifest().to_dict()),
+            patch.object(manifest_mod, "_stale_keys", return_value=["catalog.json"]),
+        ):
+            collections = list_remote_collections("s3://bucket/cat")
+
+        assert collections == ["a"]
+
+    def test_falls_back_to_walk_without_link(self) -> None:
+        root = _catalog([{"rel": "child", "href": "./a/collection.json"}])
+
+        with patch("portolan_cli.sync.core._fetch_remote_catalog_json", return_value=root) as fetch:
+            collections = list_remote_collections("s3://bucket/cat")
+
+        assert collections == ["a"]
+        fetch.assert_called_once()
+
+
+class TestPushPublishesManifest:
+    def test_manifest_pins_uploaded_catalog(self, tmp_path: Path) -> None:
+        (tmp_path / "catalog.json").write_text(json.dumps(_catalog()))
+        _write_versions(tmp_path, "demo")
+        store = MemoryStore()
+        # The collection push already uploaded versions.json.
+        obs.put(store, "cat/demo/versions.json", (tmp_path / "demo" / "versions.json").read_bytes())
+        order: list[str] = []
+        real_put = obs.put
+
+        def recording_put(s: Any, key: str, data: Any, **kwargs: Any) -> Any:
+            order.append(key)
+            return real_put(s, key, data, **kwargs)
+
+        stats = {"failed": 0, "successful": 1, "total_files": 0}
+        with (
+            patch("portolan_cli.sync.push.setup_store", return_value=(store, "cat")),
+            patch("portolan_cli.sync.push.obs.put", side_effect=recording_put),
+        ):
+            assert _push_all_upload_root_files(
+                tmp_path, "s3://bucket/cat", None, None, False, stats, ["demo"]
+            )
+
+        manifest_key = f"cat/{REMOTE_MANIFEST_FILENAME}"
+        assert order.index("cat/catalog.json") < order.index(manifest_key)
+        uploaded = RemoteManifest.from_dict(json.loads(bytes(obs.get(store, manifest_key).bytes())))
+        assert uploaded.collections["demo"].current_version == "1.1.0"
+        assert uploaded.etags == fetch_etags(store, "cat", pinned_keys(["demo"]))
+        uploaded_catalog = bytes(obs.get(store, "cat/catalog.json").bytes())
+        catalog = json.loads(uploaded_catalog)
+        assert any(link["rel"] == MANIFEST_LINK_REL for link in catalog["links"])
+        assert (tmp_path / "catalog.json").read_bytes() == uploaded_catalog
+        # The local link resolves: the manifest is written next to catalog.json.
+        local_manifest = tmp_path / REMOTE_MANIFEST_FILENAME
+        assert local_manifest.read_bytes() == bytes(obs.get(store, manifest_key).bytes())
+
+    def test_single_collection_push_retires_manifest(self, tmp_path: Path) -> None:
+        (tmp_path / "catalog.json").write_text(json.dumps(_catalog()))
+        (tmp_path / REMOTE_MANIFEST_FILENAME).write_text("{}")
+        store = MemoryStore()
+        obs.put(store, f"cat/{REMOTE_MANIFEST_FILENAME}", b"{}")
+        order: list[str] = []
+        real_put_async = obs.put_async
+
+        async def recording_put_async(s: Any, key: str, data: Any, **kwargs: Any) -> Any:
+            order.append(key)
+            return await real_put_async(s, key, data, **kwargs)
+
+        with patch("portolan_cli.sync.push.obs.put_async", side_effect=recording_put_async):
+            _count, errors, _keys = asyncio.run(
+                _upload_stac_files_async(
+                    store, tmp_path, "cat", {"catalog": [tmp_path / "catalog.json"]}
+                )
+            )
+
+        assert errors == []
+        manifest_key = f"cat/{REMOTE_MANIFEST_FILENAME}"
+        assert order == [manifest_key, "cat/catalog.json"]
+        assert bytes(obs.get(store, manifest_key).bytes()) == retired_manifest_bytes()
+        assert (tmp_path / REMOTE_MANIFEST_FILENAME).read_bytes() == retired_manifest_bytes()
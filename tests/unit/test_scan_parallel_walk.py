@@ -0,0 +1,138 @@
+"""Unit tests for the prefetching directory walker in scan_directory.
+
+With ``workers > 1`` directory listings run on a thread pool ahead of the
+depth-first walk. Everything observable (file order, issues, depth limits,
+symlink-loop reports) must match the sequential walk exactly.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from portolan_cli.scan.core import ScanOptions, ScanResult, _discover_files, _ScanContext
+from portolan_cli.scan.core import scan_directory as scan
+
+pytestmark = pytest.mark.unit
+
+GEOJSON = '{"type": "FeatureCollection", "features": []}'
+
+
+def _ordered(result: ScanResult) -> tuple[Any, ...]:
+    return (
+        [f.relative_path for f in result.ready],
+        [str(s if isinstance(s, Path) else s.path) for s in result.skipped],
+        [(i.relative_path, i.issue_type) for i in result.issues],
+        result.directories_scanned,
+    )
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for i in range(6):
+        for j in range(3):
+            leaf = tmp_path / f"region_{i}" / f"area {j}" / "deep"
+            leaf.mkdir(parents=True)
+            (leaf.parent / f"roads_{j}.geojson").write_text(GEOJSON)
+            (leaf / "empty.geojson").write_text("")
+            (leaf / "notes.txt").write_text("x")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "secret.geojson").write_text(GEOJSON)
+    (tmp_path / "top.geojson").write_text(GEOJSON)
+    return tmp_path
+
+
+class TestParallelWalkMatchesSequential:
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"max_depth": 1},
+            {"recursive": False},
+            {"include_hidden": True},
+        ],
+    )
+    def test_same_results_in_same_order(self, tree: Path, options: dict[str, Any]) -> None:
+        sequential = scan(tree, ScanOptions(workers=1, **options))
+        parallel = scan(tree, ScanOptions(workers=8, **options))
+
+        assert _ordered(parallel) == _ordered(sequential)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+    def test_symlink_loop_reported_identically(self, tree: Path) -> None:
+        (tree / "region_0" / "loop").symlink_to(tree / "region_0", target_is_directory=True)
+
+        sequential = scan(tree, ScanOptions(workers=1, follow_symlinks=True))
+        parallel = scan(tree, ScanOptions(workers=8, follow_symlinks=True))
+
+        assert _ordered(parallel) == _ordered(sequential)
+
+    @pytest.mark.skipif(
+        sys.platform == "win32" or os.geteuid() == 0,
+        reason="needs POSIX permissions enforced for the current user",
+    )
+    def test_permission_denied_reported_identically(self, tree: Path) -> None:
+        locked = tree / "region_2"
+        locked.chmod(0o000)
+        try:
+            sequential = scan(tree, ScanOptions(workers=1))
+            parallel = scan(tree, ScanOptions(workers=8))
+        finally:
+            locked.chmod(0o755)
+
+        assert _ordered(parallel) == _ordered(sequential)
+
+
+class TestPrefetching:
+    def test_each_directory_listed_once_off_the_walking_thread(
+        self, tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: Counter[Path] = Counter()
+        threads: set[str] = set()
+        real_scandir = os.scandir
+
+        def spy(path: Any = ".") -> Any:
+            calls[Path(path)] += 1
+            threads.add(threading.current_thread().name)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", spy)
+
+        result = scan(tree, ScanOptions(workers=4))
+
+        assert result.directories_scanned == len(calls)
+        assert set(calls.values()) == {1}
+        assert any(name.startswith("scan-list") for name in threads)
+
+    def test_depth_limit_stops_prefetch(self, tree: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        listed: list[Path] = []
+        real_scandir = os.scandir
+
+        def spy(path: Any = ".") -> Any:
+            listed.append(Path(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", spy)
+
+        scan(tree, ScanOptions(workers=4, max_depth=1))
+
+        assert max(len(p.relative_to(tree).parts) for p in listed) == 1
+
+    def test_abandoned_walk_shuts_down(self, tree: Path) -> None:
+        ctx = _ScanContext(root=tree, options=ScanOptions(workers=4))
+        walk = _discover_files(ctx)
+
+        next(walk)
+        walk.close()
+
+        assert not [t for t in threading.enumerate() if t.name.startswith("scan-list")]
+
+    def test_rejects_zero_workers(self) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            ScanOptions(workers=0)
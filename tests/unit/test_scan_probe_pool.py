@@ -0,0 +1,120 @@
+"""Unit tests for the process-pool content inspection stage of scan_directory.
+
+With ``probe_workers > 1`` Parquet and TIFF probes run on a worker pool while
+discovery keeps streaming files into a bounded window. The scan result (file
+order, classification, cloud-native status) must match an inline scan exactly.
+"""
+
+from __future__ import annotations
+
+import shutil
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from portolan_cli.scan import core
+from portolan_cli.scan.core import ScanOptions, ScanResult
+from portolan_cli.scan.core import scan_directory as scan
+
+pytestmark = pytest.mark.unit
+
+GEOJSON = '{"type": "FeatureCollection", "features": []}'
+
+
+def _ordered(result: ScanResult) -> tuple[Any, ...]:
+    return (
+        [(f.relative_path, f.format_status, f.format_display_name) for f in result.ready],
+        [str(s if isinstance(s, Path) else s.path) for s in result.skipped],
+        [(i.relative_path, i.issue_type) for i in result.issues],
+    )
+
+
+@pytest.fixture
+def tree(
+    tmp_path: Path, valid_points_parquet: Path, valid_rgb_cog: Path, non_cog_tif: Path
+) -> Path:
+    for i in range(3):
+        area = tmp_path / f"area_{i}"
+        area.mkdir()
+        shutil.copy(valid_points_parquet, area / "buildings.parquet")
+        shutil.copy(valid_rgb_cog, area / "image.tif")
+        shutil.copy(non_cog_tif, area / "legacy.tiff")
+        pq.write_table(pa.table({"id": [1, 2]}), area / "table.parquet")
+        (area / "broken.parquet").write_bytes(b"PAR1" + b"\x00" * 64)
+        (area / "roads.geojson").write_text(GEOJSON)
+        (area / "notes.json").write_text('{"hello": "world"}')
+    return tmp_path
+
+
+@pytest.fixture
+def pool_from_first_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(core, "_PROBE_POOL_MIN_FILES", 1)
+
+
+class _BrokenExecutor(Executor):
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Future[Any]:
+        raise BrokenProcessPool("no /dev/shm")
+
+
+@pytest.mark.usefixtures("pool_from_first_file")
+class TestProbePool:
+    def test_same_results_in_same_order(self, tree: Path) -> None:
+        inline = scan(tree, ScanOptions(probe_workers=1))
+        pooled = scan(tree, ScanOptions(probe_workers=2))
+
+        assert _ordered(pooled) == _ordered(inline)
+
+    def test_probes_run_on_the_pool(self, tree: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        threads: list[str] = []
+        real_probe = core.probe
+
+        def spy(path: Path) -> Any:
+            threads.append(threading.current_thread().name)
+            return real_probe(path)
+
+        monkeypatch.setattr(core, "probe", spy)
+        monkeypatch.setattr(
+            core,
+            "_start_probe_pool",
+            lambda workers: ThreadPoolExecutor(workers, thread_name_prefix="scan-probe"),
+        )
+
+        scan(tree, ScanOptions(probe_workers=2))
+
+        # Three .parquet and two TIFFs per area; .json sniffing stays inline
+        assert len([t for t in threads if t.startswith("scan-probe")]) == 15
+        assert threads.count(threading.current_thread().name) == 3
+
+    def test_broken_pool_falls_back_to_inline(
+        self, tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(core, "_start_probe_pool", lambda workers: _BrokenExecutor())
+
+        inline = scan(tree, ScanOptions(probe_workers=1))
+        fallback = scan(tree, ScanOptions(probe_workers=2))
+
+        assert _ordered(fallback) == _ordered(inline)
+
+
+class TestPoolStartup:
+    def test_small_scan_does_not_spawn_a_pool(
+        self, tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def refuse(workers: int) -> Executor:
+            raise AssertionError("probe pool started for a small scan")
+
+        monkeypatch.setattr(core, "_start_probe_pool", refuse)
+
+        result = scan(tree, ScanOptions(probe_workers=4))
+
+        assert len(result.ready) == 12
+
+    def test_rejects_zero_probe_workers(self) -> None:
+        with pytest.raises(ValueError, match="probe_workers"):
+            ScanOptions(probe_workers=0)
@@ -0,0 +1,188 @@
+"""Unit tests for incremental scanning (.portolan/scan-snapshot.json).
+
+A scan with ``incremental=True`` records each directory's listing and each
+file's format-probe results. The next scan replays listings of directories
+whose mtime is unchanged and skips probes of files whose (size, mtime) is
+unchanged, and must report exactly what a full scan would.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from portolan_cli import formats
+from portolan_cli.scan.core import ScanOptions, ScanResult, scan_directory
+from portolan_cli.scan.snapshot import SCAN_SNAPSHOT_FILENAME, resolve_incremental
+
+pytestmark = pytest.mark.unit
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+GEOJSON = '{"type": "FeatureCollection", "features": []}'
+
+
+def _age(root: Path, seconds: float = 60.0) -> None:
+    """Backdate every path under ``root`` so the snapshot trusts its mtime."""
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        _backdate(*(Path(dirpath) / name for name in [*filenames, *dirnames]), seconds=seconds)
+    _backdate(root, seconds=seconds)
+
+
+def _backdate(*paths: Path, seconds: float) -> None:
+    stamp = time.time() - seconds
+    for path in paths:
+        os.utime(path, (stamp, stamp))
+
+
+def _summary(result: ScanResult) -> tuple[Any, ...]:
+    return (
+        sorted((f.relative_path, f.format_status, f.format_display_name) for f in result.ready),
+        sorted(str(s if isinstance(s, Path) else s.path) for s in result.skipped),
+        sorted((i.relative_path, i.issue_type) for i in result.issues),
+        result.directories_scanned,
+    )
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> Path:
+    (tmp_path / ".portolan").mkdir()
+    (tmp_path / ".portolan" / "config.yaml").write_text("{}\n")
+    (tmp_path / "catalog.json").write_text('{"type": "Catalog", "id": "c", "links": []}')
+    (tmp_path / "roads").mkdir()
+    (tmp_path / "roads" / "roads.geojson").write_text(GEOJSON)
+    (tmp_path / "parks" / "north").mkdir(parents=True)
+    (tmp_path / "parks" / "north" / "parks.json").write_text(GEOJSON)
+    (tmp_path / "parks" / "notes.json").write_text('{"hello": "world"}')
+    (tmp_path / "tables").mkdir()
+    shutil.copy(FIXTURES / "simple.parquet", tmp_path / "tables" / "simple.parquet")
+    _age(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def probes(monkeypatch: pytest.MonkeyPatch) -> Counter[str]:
+    """Count the content probes and directory listings a scan performs."""
+    counts: Counter[str] = Counter()
+
+    def counting(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            counts[name] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(formats, "_probe_file", counting("open", formats._probe_file))
+    # Only the snapshot may spare a file open, not the per-process probe cache.
+    monkeypatch.setattr(formats, "_PROBE_CACHE_MAX_ENTRIES", 0)
+    monkeypatch.setattr("os.scandir", counting("scandir", os.scandir))
+    return counts
+
+
+INCREMENTAL = ScanOptions(incremental=True)
+
+
+class TestIncrementalScan:
+    def test_repeat_scan_skips_probes_and_listings(
+        self, catalog: Path, probes: Counter[str]
+    ) -> None:
+        first = scan_directory(catalog, INCREMENTAL)
+        # simple.parquet, parks.json and notes.json (.geojson is not inspected)
+        assert probes["open"] == 3
+        assert (catalog / ".portolan" / SCAN_SNAPSHOT_FILENAME).is_file()
+
+        probes.clear()
+        second = scan_directory(catalog, INCREMENTAL)
+
+        assert sum(probes.values()) == 0
+        assert _summary(second) == _summary(first)
+
+    def test_matches_full_scan(self, catalog: Path) -> None:
+        scan_directory(catalog, INCREMENTAL)
+
+        assert _summary(scan_directory(catalog, INCREMENTAL)) == _summary(scan_directory(catalog))
+
+    def test_modified_file_is_reprobed(self, catalog: Path, probes: Counter[str]) -> None:
+        scan_directory(catalog, INCREMENTAL)
+        notes = catalog / "parks" / "notes.json"
+        notes.write_text(GEOJSON)
+        _backdate(notes, seconds=30)
+
+        probes.clear()
+        result = scan_directory(catalog, INCREMENTAL)
+
+        assert probes["open"] == 1
+        assert "parks/notes.json" in {f.relative_path for f in result.ready}
+
+    def test_new_file_in_unchanged_tree_is_found(self, catalog: Path, probes: Counter[str]) -> None:
+        scan_directory(catalog, INCREMENTAL)
+        north = catalog / "parks" / "north"
+        (north / "extra.geojson").write_text(GEOJSON)
+        _backdate(north / "extra.geojson", north, seconds=30)
+
+        probes.clear()
+        result = scan_directory(catalog, INCREMENTAL)
+
+        assert probes["scandir"] == 1
+        assert "parks/north/extra.geojson" in {f.relative_path for f in result.ready}
+        assert _summary(result) == _summary(scan_directory(catalog))
+
+    def test_removed_paths_are_pruned(self, catalog: Path) -> None:
+        scan_directory(catalog, INCREMENTAL)
+        shutil.rmtree(catalog / "tables")
+        _backdate(catalog, seconds=30)
+
+        scan_directory(catalog, INCREMENTAL)
+
+        snapshot = json.loads((catalog / ".portolan" / SCAN_SNAPSHOT_FILENAME).read_text())
+        assert "tables" not in snapshot["directories"]
+        assert "tables/simple.parquet" not in snapshot["files"]
+
+    def test_recently_modified_paths_are_not_recorded(
+        self, catalog: Path, probes: Counter[str]
+    ) -> None:
+        (catalog / "parks" / "notes.json").write_text(GEOJSON)
+
+        scan_directory(catalog, INCREMENTAL)
+        probes.clear()
+        scan_directory(catalog, INCREMENTAL)
+
+        assert probes["open"] == 1
+        snapshot = json.loads((catalog / ".portolan" / SCAN_SNAPSHOT_FILENAME).read_text())
+        assert "parks/notes.json" not in snapshot["files"]
+
+    def test_outside_a_catalog_scans_in_full(self, tmp_path: Path) -> None:
+        (tmp_path / "roads.geojson").write_text(GEOJSON)
+
+        result = scan_directory(tmp_path, INCREMENTAL)
+
+        assert [f.relative_path for f in result.ready] == ["roads.geojson"]
+        assert not (tmp_path / ".portolan").exists()
+
+    def test_full_scan_leaves_no_snapshot(self, catalog: Path) -> None:
+        scan_directory(catalog)
+
+        assert not (catalog / ".portolan" / SCAN_SNAPSHOT_FILENAME).exists()
+
+
+class TestResolveIncremental:
+    def test_off_by_default(self, catalog: Path) -> None:
+        assert resolve_incremental(catalog) is False
+
+    def test_reads_catalog_config(self, catalog: Path) -> None:
+        (catalog / ".portolan" / "config.yaml").write_text("scan.incremental: true\n")
+
+        assert resolve_incremental(catalog) is True
+        assert resolve_incremental(catalog, cli_value=False) is False
+
+    def test_reads_environment(self, catalog: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PORTOLAN_SCAN_INCREMENTAL", "true")
+
+        assert resolve_incremental(catalog) is True
@@ -516,6 +516,239 @@ class TestGenerateItemsParquet:
         with pytest.raises(ValueError, match="No items found"):
             generate_items_parquet(collection_dir)
 
+    @pytest.mark.unit
+    def test_items_are_written_one_row_group_per_batch(
+        self, collection_with_many_items: Path
+    ) -> None:
+        """Items stream through in batches, so memory is bounded by batch_size."""
+        import pyarrow.parquet as pq
+
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        parquet_path = generate_items_parquet(collection_with_many_items, batch_size=40)
+
+        metadata = pq.read_metadata(parquet_path)
+        assert metadata.num_rows == 150
+        assert metadata.num_row_groups == 4
+        assert b"geo" in metadata.metadata
+
+    @pytest.mark.unit
+    def test_schema_covers_properties_only_in_a_later_batch(
+        self, collection_with_many_items: Path
+    ) -> None:
+        """The schema is inferred over every item, not just the first batch."""
+        import pyarrow.parquet as pq
+
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        last_item = collection_with_many_items / "tile-0149" / "tile-0149.json"
+        item = json.loads(last_item.read_text())
+        item["properties"]["eo:cloud_cover"] = 12.5
+        last_item.write_text(json.dumps(item))
+
+        parquet_path = generate_items_parquet(collection_with_many_items, batch_size=40)
+
+        cloud_cover = pq.read_table(parquet_path).column("eo:cloud_cover").to_pylist()
+        assert cloud_cover[-1] == 12.5
+        assert cloud_cover[:-1] == [None] * 149
+
+    @pytest.mark.unit
+    def test_failed_generation_keeps_the_previous_mirror(self, collection_with_items: Path) -> None:
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        parquet_path = generate_items_parquet(collection_with_items)
+        previous = parquet_path.read_bytes()
+        (collection_with_items / "scene-004" / "scene-004.json").write_text("{not json")
+
+        with pytest.raises(json.JSONDecodeError):
+            generate_items_parquet(collection_with_items)
+
+        assert parquet_path.read_bytes() == previous
+        assert sorted(p.name for p in collection_with_items.glob("*parquet*")) == ["items.parquet"]
+
+
+def _clone_tile(collection_dir: Path, source_id: str, item_id: str) -> None:
+    """Link a copy of an existing tile under a new id."""
+    item = json.loads((collection_dir / source_id / f"{source_id}.json").read_text())
+    item["id"] = item_id
+    (collection_dir / item_id).mkdir()
+    (collection_dir / item_id / f"{item_id}.json").write_text(json.dumps(item))
+    collection_path = collection_dir / "collection.json"
+    data = json.loads(collection_path.read_text())
+    data["links"].append({"rel": "item", "href": f"./{item_id}/{item_id}.json"})
+    collection_path.write_text(json.dumps(data))
+
+
+class TestIncrementalMirror:
+    """Regeneration re-serializes only the row groups whose items changed."""
+
+    @pytest.fixture
+    def converted(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Item directories whose JSON is converted, across calls."""
+        from portolan_cli import stac_parquet
+
+        seen: list[str] = []
+        real = stac_parquet._write_items_ndjson
+
+        def spy(item_paths: list[Path], ndjson_path: Path) -> None:
+            item_paths = list(item_paths)
+            seen.extend(path.parent.name for path in item_paths)
+            real(item_paths, ndjson_path)
+
+        monkeypatch.setattr(stac_parquet, "_write_items_ndjson", spy)
+        return seen
+
+    @pytest.mark.unit
+    def test_unchanged_collection_is_not_rewritten(
+        self, collection_with_many_items: Path, converted: list[str]
+    ) -> None:
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        parquet_path = generate_items_parquet(collection_with_many_items, batch_size=40)
+        before = parquet_path.stat()
+        converted.clear()
+
+        generate_items_parquet(collection_with_many_items, batch_size=40)
+
+        after = parquet_path.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        assert converted == []
+
+    @pytest.mark.unit
+    def test_added_item_converts_only_the_tail_row_group(
+        self, collection_with_many_items: Path, converted: list[str]
+    ) -> None:
+        import pyarrow.parquet as pq
+
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        generate_items_parquet(collection_with_many_items, batch_size=40)
+        converted.clear()
+        _clone_tile(collection_with_many_items, "tile-0000", "tile-0150")
+
+        parquet_path = generate_items_parquet(collection_with_many_items, batch_size=40)
+
+        # 40 + 40 + 40 copied as Arrow data; the 30-row tail is refilled
+        assert converted == [f"tile-{i:04d}" for i in range(120, 151)]
+        assert [pq.read_metadata(parquet_path).row_group(n).num_rows for n in range(4)] == [
+            40,
+            40,
+            40,
+            31,
+        ]
+        ids = pq.read_table(parquet_path, columns=["id"]).column("id").to_pylist()
+        assert ids == [f"tile-{i:04d}" for i in range(151)]
+
+    @pytest.mark.unit
+    def test_edited_and_removed_items_rewrite_from_the_first_change(
+        self, collection_with_many_items: Path, converted: list[str], tmp_path: Path
+    ) -> None:
+        import shutil
+
+        import pyarrow.parquet as pq
+
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        generate_items_parquet(collection_with_many_items, batch_size=20)
+        converted.clear()
+        edited = collection_with_many_items / "tile-0125" / "tile-0125.json"
+        item = json.loads(edited.read_text())
+        item["properties"]["datetime"] = "2025-06-01T00:00:00Z"
+        edited.write_text(json.dumps(item))
+        collection_path = collection_with_many_items / "collection.json"
+        collection = json.loads(collection_path.read_text())
+        collection["links"] = [
+            link for link in collection["links"] if "tile-0135" not in link["href"]
+        ]
+        collection_path.write_text(json.dumps(collection))
+        rebuilt = tmp_path / "rebuilt"
+        shutil.copytree(collection_with_many_items, rebuilt)
+        shutil.rmtree(rebuilt / ".portolan")
+
+        parquet_path = generate_items_parquet(collection_with_many_items, batch_size=20)
+
+        # Groups 0-5 are copied; everything from the edited group 6 on is converted
+        assert converted == [f"tile-{i:04d}" for i in range(120, 150) if i != 135]
+        expected = pq.read_table(generate_items_parquet(rebuilt, batch_size=20))
+        table = pq.read_table(parquet_path)
+        assert table["id"].to_pylist() == expected["id"].to_pylist()
+        assert table.equals(expected)
+        sizes = [pq.read_metadata(parquet_path).row_group(n).num_rows for n in range(8)]
+        assert sizes == [20] * 7 + [9]
+        assert parquet_path.read_bytes() == (rebuilt / parquet_path.name).read_bytes()
+
+    @pytest.mark.unit
+    def test_new_property_falls_back_to_a_full_rebuild(
+        self, collection_with_many_items: Path, converted: list[str]
+    ) -> None:
+        import pyarrow.parquet as pq
+
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        generate_items_parquet(collection_with_many_items, batch_size=40)
+        converted.clear()
+        edited = collection_with_many_items / "tile-0149" / "tile-0149.json"
+        item = json.loads(edited.read_text())
+        item["properties"]["eo:cloud_cover"] = 12.5
+        edited.write_text(json.dumps(item))
+
+        parquet_path = generate_items_parquet(collection_with_many_items, batch_size=40)
+
+        assert "eo:cloud_cover" in pq.read_schema(parquet_path).names
+        assert pq.read_metadata(parquet_path).num_rows == 150
+        assert len(converted) == 30 + 150  # tail attempt, then the rebuild
+
+    @pytest.mark.unit
+    def test_property_of_a_removed_item_is_dropped(
+        self, collection_with_many_items: Path, converted: list[str], tmp_path: Path
+    ) -> None:
+        import shutil
+
+        import pyarrow.parquet as pq
+
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        edited = collection_with_many_items / "tile-0149" / "tile-0149.json"
+        item = json.loads(edited.read_text())
+        item["properties"]["foo"] = "only here"
+        edited.write_text(json.dumps(item))
+        generate_items_parquet(collection_with_many_items, batch_size=20)
+        converted.clear()
+        collection_path = collection_with_many_items / "collection.json"
+        collection = json.loads(collection_path.read_text())
+        collection["links"] = [
+            link for link in collection["links"] if "tile-0149" not in link["href"]
+        ]
+        collection_path.write_text(json.dumps(collection))
+        rebuilt = tmp_path / "rebuilt"
+        shutil.copytree(collection_with_many_items, rebuilt)
+        shutil.rmtree(rebuilt / ".portolan")
+
+        parquet_path = generate_items_parquet(collection_with_many_items, batch_size=20)
+
+        assert "foo" not in pq.read_schema(parquet_path).names
+        assert len(converted) == 9 + 149  # tail attempt, then the rebuild
+        expected = generate_items_parquet(rebuilt, batch_size=20)
+        assert parquet_path.read_bytes() == expected.read_bytes()
+
+    @pytest.mark.unit
+    def test_mirror_replaced_outside_portolan_is_rebuilt(
+        self, collection_with_many_items: Path, converted: list[str]
+    ) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from portolan_cli.stac_parquet import generate_items_parquet
+
+        parquet_path = generate_items_parquet(collection_with_many_items, batch_size=40)
+        pq.write_table(pa.table({"id": ["stray"]}), parquet_path)
+        converted.clear()
+
+        generate_items_parquet(collection_with_many_items, batch_size=40)
+
+        assert len(converted) == 150
+        assert pq.read_metadata(parquet_path).num_rows == 150
+
 
 # =============================================================================
 # Test: Collection Link Management
@@ -1575,3 +1808,38 @@ class TestGenerateParquetMirrors:
                 verbose=False,
             )
         assert not (collection_with_items / "items.parquet").exists()
+
+
+class TestStampFileFieldsMany:
+    """The batch form stamps each asset by the same rules as the single form."""
+
+    @pytest.mark.unit
+    def test_stamps_strips_and_skips_in_one_pass(self, tmp_path: Path) -> None:
+        import hashlib
+
+        from portolan_cli.stac_parquet import stamp_file_fields_many
+
+        (tmp_path / "a.json").write_bytes(b"style a")
+        (tmp_path / "b.json").write_bytes(b"style b")
+        present_a = {"href": "./a.json"}
+        present_b = {"href": "./b.json"}
+        vanished = {"href": "./gone.json", "file:size": 1, "file:checksum": "1220" + "0" * 64}
+        remote = {"href": "s3://bucket/c.json", "file:size": 7}
+
+        changed = stamp_file_fields_many([present_a, present_b, vanished, remote], tmp_path)
+
+        assert changed is True
+        assert present_a["file:checksum"] == f"1220{hashlib.sha256(b'style a').hexdigest()}"
+        assert present_b["file:size"] == len(b"style b")
+        assert "file:size" not in vanished
+        assert remote == {"href": "s3://bucket/c.json", "file:size": 7}
+
+    @pytest.mark.unit
+    def test_reports_no_change_when_fields_are_current(self, tmp_path: Path) -> None:
+        from portolan_cli.stac_parquet import stamp_file_fields, stamp_file_fields_many
+
+        (tmp_path / "a.json").write_bytes(b"style a")
+        asset = {"href": "./a.json"}
+        stamp_file_fields(asset, tmp_path)
+
+        assert stamp_file_fields_many([asset], tmp_path) is False
@@ -0,0 +1,319 @@
+"""Unit tests for bounded-memory pull downloads.
+
+``pull`` used to ``bytes_async()`` every object into RAM, so fifty concurrent
+multi-GB COGs exhausted memory. Downloads now stream into the ``.part`` file
+through a shared :class:`~portolan_cli.async_utils.ByteBudget`, and large
+objects arrive as concurrent ranged parts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+import obstore as obs
+import pytest
+from obstore.store import MemoryStore
+
+from portolan_cli.async_utils import ByteBudget
+from portolan_cli.sync import download
+from portolan_cli.sync.checksums import CHECKSUM_METADATA_KEY
+from portolan_cli.sync.download import DownloadIntegrityError, download_object_async
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def small_parts(monkeypatch: pytest.MonkeyPatch) -> int:
+    """Shrink parts and the ranged threshold so tests exercise them cheaply."""
+    monkeypatch.setattr(download, "DOWNLOAD_PART_SIZE", 1024)
+    monkeypatch.setattr(download, "RANGED_DOWNLOAD_THRESHOLD", 4096)
+    return 1024
+
+
+# =============================================================================
+# ByteBudget
+# =============================================================================
+
+
+class TestByteBudget:
+    async def test_reservations_never_exceed_capacity(self) -> None:
+        budget = ByteBudget(100)
+
+        async def hold(nbytes: int) -> None:
+            async with budget.reserve(nbytes):
+                assert budget.in_flight <= budget.capacity
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(hold(40) for _ in range(10)))
+
+        assert budget.peak_in_flight <= 100
+        assert budget.in_flight == 0
+
+    async def test_oversized_request_is_clamped(self) -> None:
+        budget = ByteBudget(10)
+
+        async with budget.reserve(1_000) as granted:
+            assert granted == 10
+
+        assert budget.in_flight == 0
+
+    async def test_waiter_resumes_after_release(self) -> None:
+        budget = ByteBudget(10)
+        granted = await budget.acquire(10)
+        waiter = asyncio.ensure_future(budget.acquire(5))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await budget.release(granted)
+
+        assert await waiter == 5
+
+    def test_rejects_non_positive_capacity(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            ByteBudget(0)
+
+
+# =============================================================================
+# download_object_async
+# =============================================================================
+
+
+class TestDownloadObjectAsync:
+    async def test_streams_small_object(self, tmp_path: Path, small_parts: int) -> None:
+        store = MemoryStore()
+        payload = os.urandom(3000)
+        obs.put(store, "data/small.bin", payload)
+        dest = tmp_path / "small.bin"
+
+        written = await download_object_async(store, "data/small.bin", dest)
+
+        assert written == len(payload)
+        assert dest.read_bytes() == payload
+
+    async def test_large_object_uses_ranged_parts(
+        self, tmp_path: Path, small_parts: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = MemoryStore()
+        payload = os.urandom(10 * small_parts + 17)
+        obs.put(store, "data/large.tif", payload)
+        dest = tmp_path / "large.tif"
+        ranges: list[tuple[int, int]] = []
+        real_get = obs.get_async
+
+        async def spy(store_arg: object, key: str, *, options: dict[str, Any]) -> object:
+            if "range" in options:
+                ranges.append(options["range"])
+            return await real_get(store_arg, key, options=options)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(download.obs, "get_async", spy)
+        budget = ByteBudget(2 * small_parts)
+
+        written = await download_object_async(
+            store, "data/large.tif", dest, size_bytes=len(payload), budget=budget
+        )
+
+        assert written == len(payload)
+        assert dest.read_bytes() == payload
+        assert len(ranges) == 11
+        assert budget.peak_in_flight <= 2 * small_parts
+
+    async def test_stale_size_hint_does_not_truncate(
+        self, tmp_path: Path, small_parts: int
+    ) -> None:
+        # versions.json may predate a regenerated file; the store's size wins.
+        store = MemoryStore()
+        payload = os.urandom(8 * small_parts)
+        obs.put(store, "data/mirror.parquet", payload)
+        dest = tmp_path / "mirror.parquet"
+
+        written = await download_object_async(
+            store, "data/mirror.parquet", dest, size_bytes=5 * small_parts
+        )
+
+        assert written == len(payload)
+        assert dest.read_bytes() == payload
+
+    async def test_short_stream_raises_integrity_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        class _Truncated:
+            meta = {"size": 100}
+            attributes: dict[str, str] = {}
+
+            def stream(self, **_kwargs: int) -> object:
+                async def chunks():  # type: ignore[no-untyped-def]
+                    yield b"x" * 10
+
+                return chunks()
+
+        async def fake_get_async(store: object, key: str) -> _Truncated:
+            return _Truncated()
+
+        monkeypatch.setattr(download.obs, "get_async", fake_get_async)
+
+        with pytest.raises(DownloadIntegrityError, match="expected 100 bytes, got 10"):
+            await download_object_async(MemoryStore(), "k", tmp_path / "out.bin")
+
+
+class TestInlineChecksum:
+    """Objects tagged by push are verified against their SHA-256 while streaming."""
+
+    @staticmethod
+    def _put_tagged(store: MemoryStore, key: str, payload: bytes, digest: str) -> None:
+        obs.put(store, key, payload, attributes={CHECKSUM_METADATA_KEY: digest})
+
+    async def test_streamed_object_matching_tag(self, tmp_path: Path) -> None:
+        store = MemoryStore()
+        payload = os.urandom(3000)
+        self._put_tagged(store, "k", payload, hashlib.sha256(payload).hexdigest())
+
+        assert await download_object_async(store, "k", tmp_path / "out") == len(payload)
+
+    @pytest.mark.parametrize("size_hint", [0, 10 * 1024], ids=["streamed", "ranged"])
+    async def test_tampered_object_is_rejected(
+        self, tmp_path: Path, small_parts: int, size_hint: int
+    ) -> None:
+        store = MemoryStore()
+        payload = os.urandom(10 * small_parts)
+        self._put_tagged(store, "k", payload, hashlib.sha256(b"other bytes").hexdigest())
+
+        with pytest.raises(DownloadIntegrityError, match="Checksum mismatch"):
+            await download_object_async(store, "k", tmp_path / "out", size_bytes=size_hint)
+
+    async def test_ranged_object_hashed_in_order(
+        self, tmp_path: Path, small_parts: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Parts finish out of order; the digest must still cover bytes in order.
+        store = MemoryStore()
+        payload = os.urandom(10 * small_parts + 17)
+        self._put_tagged(store, "k", payload, hashlib.sha256(payload).hexdigest())
+        real_get = obs.get_async
+
+        async def reversed_ranges(
+            store_arg: object, key: str, *, options: dict[str, Any]
+        ) -> object:
+            if "range" in options:
+                start = options["range"][0]
+                await asyncio.sleep(0.001 * (len(payload) - start) / small_parts)
+            return await real_get(store_arg, key, options=options)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(download.obs, "get_async", reversed_ranges)
+
+        written = await download_object_async(
+            store, "k", tmp_path / "out", size_bytes=len(payload), part_concurrency=4
+        )
+
+        assert written == len(payload)
+
+    async def test_object_replaced_mid_download_fails(
+        self, tmp_path: Path, small_parts: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Every part is pinned to the HEAD's ETag, so parts fetched after the
+        # object is overwritten cannot be spliced onto parts of the old one.
+        store = MemoryStore()
+        payload = os.urandom(4 * small_parts)
+        obs.put(store, "k", payload)
+        real_get = obs.get_async
+
+        async def overwrite_after_first_part(
+            store_arg: object, key: str, *, options: dict[str, Any]
+        ) -> object:
+            response = await real_get(store_arg, key, options=options)  # type: ignore[arg-type]
+            if options.get("range", (None,))[0] == 0:
+                obs.put(store, "k", os.urandom(len(payload)))
+            return response
+
+        monkeypatch.setattr(download.obs, "get_async", overwrite_after_first_part)
+
+        with pytest.raises(DownloadIntegrityError, match="changed during download"):
+            await download_object_async(
+                store, "k", tmp_path / "out", size_bytes=len(payload), part_concurrency=1
+            )
+
+    async def test_explicit_expected_digest_wins(self, tmp_path: Path) -> None:
+        store = MemoryStore()
+        obs.put(store, "k", b"untagged")
+
+        with pytest.raises(DownloadIntegrityError, match="Checksum mismatch"):
+            await download_object_async(store, "k", tmp_path / "out", expected_sha256="0" * 64)
+
+
+class TestDownloadDirectoryAsync:
+    @pytest.fixture
+    def store(self, monkeypatch: pytest.MonkeyPatch) -> MemoryStore:
+        store = MemoryStore()
+        monkeypatch.setattr(download, "_setup_store_and_kwargs", lambda *_a, **_k: (store, {}))
+        return store
+
+    def test_downloads_small_and_ranged_files(
+        self, tmp_path: Path, store: MemoryStore, small_parts: int
+    ) -> None:
+        payloads = {f"data/f{i}.bin": os.urandom(700 * i + 1) for i in range(8)}
+        payloads["data/nested/big.tif"] = os.urandom(9 * small_parts)
+        for key, payload in payloads.items():
+            obs.put(
+                store,
+                key,
+                payload,
+                attributes={CHECKSUM_METADATA_KEY: hashlib.sha256(payload).hexdigest()},
+            )
+
+        result = download.download_directory("s3://bucket/data/", tmp_path / "out", max_files=3)
+
+        assert result.success
+        assert result.files_downloaded == len(payloads)
+        for key, payload in payloads.items():
+            assert (tmp_path / "out" / key.removeprefix("data/")).read_bytes() == payload
+        assert not list((tmp_path / "out").rglob("*.part"))
+
+    def test_corrupt_object_reported_and_not_written(
+        self, tmp_path: Path, store: MemoryStore
+    ) -> None:
+        obs.put(store, "data/good.bin", b"good")
+        obs.put(
+            store,
+            "data/bad.bin",
+            b"bad",
+            attributes={CHECKSUM_METADATA_KEY: hashlib.sha256(b"expected").hexdigest()},
+        )
+
+        result = download.download_directory("s3://bucket/data/", tmp_path / "out")
+
+        assert not result.success
+        assert result.files_downloaded == 1
+        assert [path.name for path, _ in result.errors] == ["bad.bin"]
+        assert isinstance(result.errors[0][1], DownloadIntegrityError)
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["good.bin"]
+
+
+class TestPullDownloadFileAsync:
+    async def test_writes_through_part_file_and_replaces(self, tmp_path: Path) -> None:
+        from portolan_cli.sync.pull import _download_file_async
+
+        store = MemoryStore()
+        obs.put(store, "col/data.parquet", b"new bytes")
+        target = tmp_path / "col" / "data.parquet"
+        target.parent.mkdir()
+        target.write_bytes(b"old")
+
+        ok, size = await _download_file_async(store, "col/data.parquet", target, size_bytes=9)
+
+        assert (ok, size) == (True, 9)
+        assert target.read_bytes() == b"new bytes"
+        assert not target.with_name("data.parquet.part").exists()
+
+    async def test_failure_keeps_original_and_removes_part(self, tmp_path: Path) -> None:
+        from portolan_cli.sync.pull import _download_file_async
+
+        target = tmp_path / "data.parquet"
+        target.write_bytes(b"original")
+
+        with pytest.raises(Exception):  # noqa: B017 - obstore raises its own NotFound
+            await _download_file_async(MemoryStore(), "missing.parquet", target)
+
+        assert target.read_bytes() == b"original"
+        assert not target.with_name("data.parquet.part").exists()
@@ -1446,6 +1446,80 @@ class TestListRemoteCollectionsNestedCatalogs:
         assert collections == ["climate/hittekaart"]
 
 
+class TestRemoteDiscoveryConcurrency:
+    """Breadth-first discovery fetches each catalog level concurrently."""
+
+    @staticmethod
+    def _wide_tree(width: int) -> dict[str, dict[str, Any]]:
+        catalogs: dict[str, dict[str, Any]] = {
+            "root": {
+                "type": "Catalog",
+                "links": [{"rel": "child", "href": f"./r{i}/catalog.json"} for i in range(width)],
+            }
+        }
+        for i in range(width):
+            catalogs[f"r{i}"] = {
+                "type": "Catalog",
+                "links": [{"rel": "child", "href": "./data/collection.json"}],
+            }
+        return catalogs
+
+    @pytest.mark.unit
+    def test_level_fetched_concurrently_and_reported(self) -> None:
+        """Sibling subcatalogs overlap in flight; stats count requests and levels."""
+        import threading
+        import time
+
+        from portolan_cli.sync.core import discover_remote_collections
+
+        catalogs = self._wide_tree(6)
+        lock = threading.Lock()
+        in_flight = {"now": 0, "max": 0}
+
+        def mock_fetch(remote_url: str, **kwargs: Any) -> dict[str, Any]:
+            name = remote_url.rstrip("/").rsplit("/", 1)[-1]
+            if name == "catalog":
+                return catalogs["root"]
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            return catalogs[name]
+
+        with patch("portolan_cli.sync.core._fetch_remote_catalog_json", side_effect=mock_fetch):
+            discovery = discover_remote_collections("s3://bucket/catalog", concurrency=4)
+
+        assert in_flight["max"] > 1
+        assert in_flight["max"] <= 4
+        assert discovery.requests == 7  # root + 6 subcatalogs
+        assert discovery.levels == 2
+        assert not discovery.from_manifest
+
+    @pytest.mark.unit
+    def test_results_keep_depth_first_link_order(self) -> None:
+        """Completion order of concurrent fetches does not reorder collections."""
+        import time
+
+        from portolan_cli.sync.core import list_remote_collections
+
+        catalogs = self._wide_tree(4)
+        catalogs["root"]["links"].insert(1, {"rel": "child", "href": "./flat/collection.json"})
+
+        def mock_fetch(remote_url: str, **kwargs: Any) -> dict[str, Any]:
+            name = remote_url.rstrip("/").rsplit("/", 1)[-1]
+            if name == "catalog":
+                return catalogs["root"]
+            time.sleep(0.01 * (4 - int(name[1:])))  # later siblings finish first
+            return catalogs[name]
+
+        with patch("portolan_cli.sync.core._fetch_remote_catalog_json", side_effect=mock_fetch):
+            collections = list_remote_collections("s3://bucket/catalog")
+
+        assert collections == ["r0/data", "flat", "r1/data", "r2/data", "r3/data"]
+
+
 class TestCloneNestedCatalogs:
     """Integration-style tests for clone() with nested catalog structures."""
 
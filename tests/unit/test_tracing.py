@@ -0,0 +1,103 @@
+"""Unit tests for phase tracing behind ``portolan --profile-report``."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from portolan_cli import tracing
+from portolan_cli.tracing import record_io, span, start_trace, stop_trace, traced
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def trace() -> Iterator[tracing.Trace]:
+    yield start_trace()
+    stop_trace()
+
+
+def _phases(trace: tracing.Trace) -> dict[str, dict[str, object]]:
+    return {row["phase"]: row for row in trace.to_dict()["phases"]}
+
+
+class TestSpans:
+    def test_nested_spans_are_separate_phases(self, trace: tracing.Trace) -> None:
+        with span("add"):
+            with span("metadata") as inner:
+                inner.add(files=2, bytes=10)
+            with span("metadata"):
+                record_io(files=1, bytes=5)
+
+        phases = _phases(trace)
+        assert list(phases) == ["add/metadata", "add"]
+        assert phases["add/metadata"]["calls"] == 2
+        assert phases["add/metadata"]["files"] == 3
+        assert phases["add/metadata"]["bytes"] == 15
+        assert phases["add"]["files"] == 0
+
+    def test_no_trace_records_nothing(self) -> None:
+        assert stop_trace() is None
+
+        with span("scan") as current:
+            record_io(files=1)
+
+        assert current.path == "scan"
+        assert stop_trace() is None
+
+
+class TestTraced:
+    def test_measure_counts_return_value(self, trace: tracing.Trace) -> None:
+        @traced("scan", measure=lambda paths: (len(paths), 100))
+        def scan() -> list[str]:
+            return ["a", "b"]
+
+        assert scan() == ["a", "b"]
+
+        phase = _phases(trace)["scan"]
+        assert (phase["calls"], phase["files"], phase["bytes"]) == (1, 2, 100)
+
+    def test_async_function_keeps_nesting(self, trace: tracing.Trace) -> None:
+        @traced("download")
+        async def download() -> None:
+            record_io(bytes=42)
+
+        @traced("pull")
+        async def pull() -> None:
+            await asyncio.gather(download(), download())
+
+        asyncio.run(pull())
+
+        phases = _phases(trace)
+        assert phases["pull/download"]["calls"] == 2
+        assert phases["pull/download"]["bytes"] == 84
+        assert phases["pull"]["wall_seconds"] >= phases["pull/download"]["wall_seconds"] / 2
+
+    def test_exception_still_records(self, trace: tracing.Trace) -> None:
+        @traced("push")
+        def push() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            push()
+
+        assert _phases(trace)["push"]["calls"] == 1
+
+
+def test_write_report(tmp_path: Path) -> None:
+    start_trace()
+    with span("convert"):
+        pass
+    destination = tmp_path / "profile.json"
+
+    tracing.write_report(destination, command="convert")
+
+    report = json.loads(destination.read_text())
+    assert report["command"] == "convert"
+    assert [row["phase"] for row in report["phases"]] == ["convert"]
+    assert set(report) >= {"wall_seconds", "cpu_seconds", "peak_rss_bytes"}
+    assert stop_trace() is None
@@ -15,11 +15,15 @@ from typing import TYPE_CHECKING
 import pytest
 
 from portolan_cli.versions import (
+    DELTA_SPEC_VERSION,
     Asset,
     Version,
     VersionsFile,
     add_version,
+    compact_versions,
+    expand_asset_deltas,
     read_versions,
+    read_versions_head,
     write_versions,
 )
 
@@ -1642,3 +1646,251 @@ class TestSnapshotModel:
             assert latest_assets == all_assets_added, (
                 f"After adding {name}: expected {all_assets_added}, got {latest_assets}"
             )
+
+
+def _history(count: int) -> VersionsFile:
+    """``count`` versions over ten assets: each updates one, v3 removes one."""
+    vf = VersionsFile(spec_version="1.0.0", current_version=None, versions=[])
+    base = {
+        f"f{i}.parquet": Asset(sha256=_sha256(f"f{i}"), size_bytes=i, href=f"c/f{i}.parquet")
+        for i in range(10)
+    }
+    vf = add_version(vf, version="1.0.0", assets=base, breaking=False)
+    for n in range(1, count):
+        name = f"f{n % 10}.parquet"
+        changed = Asset(sha256=_sha256(f"{name}-{n}"), size_bytes=n, href=f"c/{name}")
+        vf = add_version(
+            vf,
+            version=f"1.0.{n}",
+            assets={name: changed},
+            breaking=False,
+            removed={"f9.parquet"} if n == 3 else None,
+        )
+    return vf
+
+
+class TestDeltaEncoding:
+    """Compacted versions.json stores deltas between full checkpoints (spec 1.1.0)."""
+
+    @pytest.mark.unit
+    def test_round_trip_rebuilds_every_snapshot(self, tmp_path: Path) -> None:
+        vf = _history(12)
+        path = tmp_path / "versions.json"
+
+        write_versions(path, vf, checkpoint_interval=4)
+
+        assert read_versions(path).versions == vf.versions
+
+    @pytest.mark.unit
+    def test_checkpoints_and_latest_are_full(self, tmp_path: Path) -> None:
+        path = tmp_path / "versions.json"
+
+        write_versions(path, _history(10), checkpoint_interval=4)
+        data = json.loads(path.read_text())
+
+        full = [i for i, v in enumerate(data["versions"]) if "assets" in v]
+        assert full == [0, 4, 8, 9]
+        assert data["spec_version"] == DELTA_SPEC_VERSION
+        assert data["versions"][3]["assets_delta"] == {
+            "base": "1.0.2",
+            "updated": {
+                "f3.parquet": {
+                    "sha256": _sha256("f3.parquet-3"),
+                    "size_bytes": 3,
+                    "href": "c/f3.parquet",
+                }
+            },
+            "removed": ["f9.parquet"],
+        }
+
+    @pytest.mark.unit
+    def test_current_version_is_stored_full(self, tmp_path: Path) -> None:
+        vf = _history(6)
+        vf.current_version = "1.0.2"
+        path = tmp_path / "versions.json"
+
+        write_versions(path, vf, checkpoint_interval=4)
+        data = json.loads(path.read_text())
+
+        assert "assets" in data["versions"][2]
+        assert "assets_delta" in data["versions"][3]
+
+    @pytest.mark.unit
+    def test_default_write_stays_full_snapshots(self, tmp_path: Path) -> None:
+        path = tmp_path / "versions.json"
+
+        write_versions(path, _history(40))
+        data = json.loads(path.read_text())
+
+        assert data["spec_version"] == "1.0.0"
+        assert all("assets" in v for v in data["versions"])
+
+    @pytest.mark.unit
+    def test_compacted_file_keeps_delta_layout(self, tmp_path: Path) -> None:
+        path = tmp_path / "versions.json"
+        write_versions(path, _history(40), checkpoint_interval=1)
+        compact_versions(path)
+
+        changed = Asset(sha256=_sha256("f0-40"), size_bytes=40, href="c/f0.parquet")
+        vf = add_version(
+            read_versions(path), version="1.0.40", assets={"f0.parquet": changed}, breaking=False
+        )
+        write_versions(path, vf)
+        data = json.loads(path.read_text())
+
+        assert data["spec_version"] == DELTA_SPEC_VERSION
+        assert "assets_delta" in data["versions"][1]
+
+    @pytest.mark.unit
+    def test_compact_interval_one_restores_full_snapshots(self, tmp_path: Path) -> None:
+        path = tmp_path / "versions.json"
+        write_versions(path, _history(10), checkpoint_interval=4)
+
+        compact_versions(path, checkpoint_interval=1)
+        data = json.loads(path.read_text())
+
+        assert data["spec_version"] == "1.0.0"
+        assert all("assets" in v for v in data["versions"])
+
+    @pytest.mark.unit
+    def test_unknown_spec_version_is_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "versions.json"
+        write_versions(path, _history(3))
+        data = json.loads(path.read_text())
+        data["spec_version"] = "2.0.0"
+        path.write_text(json.dumps(data))
+
+        with pytest.raises(ValueError, match="Unsupported versions.json spec_version '2.0.0'"):
+            read_versions(path)
+        with pytest.raises(ValueError, match="Unsupported versions.json spec_version"):
+            read_versions_head(path)
+        with pytest.raises(ValueError, match="Unsupported versions.json spec_version"):
+            expand_asset_deltas(data)
+
+    @pytest.mark.unit
+    def test_delta_after_wrong_base_is_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "versions.json"
+        write_versions(path, _history(3), checkpoint_interval=4)
+        data = json.loads(path.read_text())
+        data["versions"][1]["assets_delta"]["base"] = "0.9.0"
+        path.write_text(json.dumps(data))
+
+        with pytest.raises(ValueError, match="assets_delta base"):
+            read_versions(path)
+        with pytest.raises(ValueError, match="assets_delta base"):
+            expand_asset_deltas(data)
+
+    @pytest.mark.unit
+    def test_expand_matches_full_snapshots(self, tmp_path: Path) -> None:
+        vf = _history(9)
+        compact_path = tmp_path / "compact.json"
+        full_path = tmp_path / "full.json"
+        write_versions(compact_path, vf, checkpoint_interval=4)
+        write_versions(full_path, vf, checkpoint_interval=1)
+
+        expanded = expand_asset_deltas(json.loads(compact_path.read_text()))
+        full = json.loads(full_path.read_text())
+
+        assert [v["assets"] for v in expanded["versions"]] == [
+            v["assets"] for v in full["versions"]
+        ]
+        assert not any("assets_delta" in v for v in expanded["versions"])
+
+    @pytest.mark.unit
+    def test_compact_shrinks_full_snapshot_file(self, tmp_path: Path) -> None:
+        vf = _history(40)
+        path = tmp_path / "versions.json"
+        write_versions(path, vf, checkpoint_interval=1)
+
+        result = compact_versions(path)
+
+        assert result.version_count == 40
+        assert result.bytes_after < result.bytes_before / 2
+        assert result.bytes_after == path.stat().st_size
+        assert read_versions(path).versions == vf.versions
+
+    @pytest.mark.unit
+    def test_compact_rejects_bad_interval(self, tmp_path: Path) -> None:
+        path = tmp_path / "versions.json"
+        write_versions(path, _history(2))
+
+        with pytest.raises(ValueError, match="checkpoint_interval"):
+            compact_versions(path, checkpoint_interval=0)
+
+
+class TestReadVersionsHead:
+    """read_versions_head answers from the header and last entry alone."""
+
+    @pytest.mark.unit
+    def test_matches_full_read(self, tmp_path: Path) -> None:
+        vf = _history(12)
+        path = tmp_path / "versions.json"
+        write_versions(path, vf, checkpoint_interval=4)
+
+        head = read_versions_head(path)
+
+        assert head.spec_version == DELTA_SPEC_VERSION
+        assert head.current_version == "1.0.11"
+        assert head.latest == vf.versions[-1]
+        assert head.current is head.latest
+
+    @pytest.mark.unit
+    def test_history_is_not_parsed(self, tmp_path: Path) -> None:
+        path = tmp_path / "versions.json"
+        write_versions(path, _history(5))
+        text = path.read_text()
+        first_created = text.index('"created": "') + len('"created": "')
+        path.write_text(text[:first_created] + "not a date" + text[first_created + 10 :])
+
+        with pytest.raises(ValueError):
+            read_versions(path)
+        assert read_versions_head(path).current_version == "1.0.4"
+
+    @pytest.mark.unit
+    def test_other_layouts_are_read_in_full(self, tmp_path: Path) -> None:
+        vf = _history(5)
+        path = tmp_path / "versions.json"
+        write_versions(path, vf)
+        path.write_text(json.dumps(json.loads(path.read_text())))
+
+        head = read_versions_head(path)
+
+        assert head.latest == vf.versions[-1]
+        assert head.current == vf.versions[-1]
+
+    @pytest.mark.unit
+    def test_current_before_latest(self, tmp_path: Path) -> None:
+        vf = _history(6)
+        vf.current_version = "1.0.2"
+        path = tmp_path / "versions.json"
+        write_versions(path, vf, checkpoint_interval=4)
+
+        head = read_versions_head(path)
+
+        assert head.current == vf.versions[2]
+        assert head.latest == vf.versions[-1]
+
+    @pytest.mark.unit
+    def test_empty_and_missing(self, tmp_path: Path) -> None:
+        path = tmp_path / "versions.json"
+        write_versions(path, VersionsFile(spec_version="1.0.0", current_version=None))
+
+        head = read_versions_head(path)
+
+        assert (head.current_version, head.latest, head.current) == (None, None, None)
+        with pytest.raises(FileNotFoundError):
+            read_versions_head(tmp_path / "missing.json")
+
+    @pytest.mark.unit
+    def test_invalid_json_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "versions.json"
+        path.write_text("{not json")
+
+        with pytest.raises(ValueError):
+            read_versions_head(path)
+
+    @pytest.mark.unit
+    def test_asset_has_no_instance_dict(self) -> None:
+        asset = Asset(sha256="a" * 64, size_bytes=1, href="c/a.parquet")
+
+        assert not hasattr(asset, "__dict__")